@@ -0,0 +1,120 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Microbenchmark for converting numeric array values to and from gRPC
+messages.
+
+Compares the element-by-element conversion (``np.reshape`` on the repeated
+field when reading, ``flatten()`` into the field when writing) with the
+bulk conversions in ``_array_convert``.
+
+Run with ``python benchmarks/bench_array_convert.py``.
+"""
+
+import argparse
+import timeit
+from typing import Callable, List, Tuple
+
+from ansys.api.modelcenter.v0.variable_value_messages_pb2 import (
+    ArrayDimensions,
+    BooleanArrayValue,
+    DoubleArrayValue,
+    IntegerArrayValue,
+)
+import numpy as np
+
+from ansys.modelcenter.workflow.grpc_modelcenter._array_convert import (
+    convert_grpc_array_to_numpy,
+    convert_numpy_to_grpc_array,
+)
+
+
+def _best_time(function: Callable[[], object], repeat: int) -> float:
+    """Get the best time of ``repeat`` calls, in seconds."""
+    return min(timeit.repeat(function, number=1, repeat=repeat))
+
+
+def _make_values(message_type: type, size: int) -> np.ndarray:
+    generator = np.random.default_rng(0)
+    if message_type is DoubleArrayValue:
+        return generator.random(size)
+    elif message_type is IntegerArrayValue:
+        return generator.integers(-(2**31), 2**31, size=size)
+    else:
+        return generator.random(size) > 0.5
+
+
+def run(max_exponent: int, repeat: int) -> List[Tuple[str, int, float, float, float, float]]:
+    """Time each conversion for arrays of 10^3 to 10^``max_exponent``
+    elements.
+
+    Returns
+    -------
+    List[Tuple[str, int, float, float, float, float]]
+        Message type, size, then the old and new read times and the old and
+        new write times, in seconds.
+    """
+    results = []
+    for message_type in (DoubleArrayValue, IntegerArrayValue, BooleanArrayValue):
+        for exponent in range(3, max_exponent + 1):
+            size = 10**exponent
+            values = _make_values(message_type, size)
+            message = convert_numpy_to_grpc_array(message_type, values)
+            old_read = _best_time(lambda: np.reshape(message.values, message.dims.dims), repeat)
+            new_read = _best_time(lambda: convert_grpc_array_to_numpy(message), repeat)
+            old_write = _best_time(
+                lambda: message_type(
+                    values=values.flatten(), dims=ArrayDimensions(dims=values.shape)
+                ),
+                repeat,
+            )
+            new_write = _best_time(
+                lambda: convert_numpy_to_grpc_array(message_type, values), repeat
+            )
+            results.append((message_type.__name__, size, old_read, new_read, old_write, new_write))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--max-exponent", type=int, default=7, help="Largest array size, as a power of 10."
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Timings to take the best of.")
+    arguments = parser.parse_args()
+
+    print(
+        f"{'type':<18} {'size':>10} {'read old':>10} {'read new':>10} {'speedup':>8}"
+        f" {'write old':>10} {'write new':>10} {'speedup':>8}"
+    )
+    for name, size, old_read, new_read, old_write, new_write in run(
+        arguments.max_exponent, arguments.repeat
+    ):
+        print(
+            f"{name:<18} {size:>10} {old_read:>10.5f} {new_read:>10.5f}"
+            f" {old_read / new_read:>7.1f}x {old_write:>10.5f} {new_write:>10.5f}"
+            f" {old_write / new_write:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark of the time taken to import the gRPC implementation package.
+
+Runs each import statement in a fresh interpreter with ``python -X
+importtime`` and reports the best total time over several runs, along with
+the modules that took the longest to load themselves.
+
+Run with ``python benchmarks/bench_import_time.py``.
+"""
+
+import argparse
+import subprocess  # nosec B404
+import sys
+from typing import Dict, List, Tuple
+
+STATEMENTS: List[str] = [
+    "import ansys.modelcenter.workflow.grpc_modelcenter",
+    "from ansys.modelcenter.workflow.grpc_modelcenter import Format",
+    "from ansys.modelcenter.workflow.grpc_modelcenter import Engine",
+]
+"""Import statements to time."""
+
+
+def _run(statement: str) -> List[Tuple[str, int, int]]:
+    """Run a statement in a fresh interpreter and get the name, own time,
+    and cumulative time of each module it loaded, in microseconds."""
+    # The interpreter is our own and the statement comes from this file.
+    completed = subprocess.run(  # nosec B603
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules: List[Tuple[str, int, int]] = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_time, cumulative, name = line[len("import time:") :].split("|")
+        if not self_time.strip().isdigit():
+            # Header line.
+            continue
+        modules.append((name.rstrip(), int(self_time), int(cumulative)))
+    return modules
+
+
+def measure(statement: str) -> Tuple[int, Dict[str, int]]:
+    """Run an import statement in a fresh interpreter.
+
+    Modules that the interpreter loads at startup are left out.
+
+    Returns
+    -------
+    Tuple[int, Dict[str, int]]
+        Total time of the statement's imports, then the time each module
+        took to load itself, in microseconds.
+    """
+    startup = {name.strip() for name, _, _ in _run("pass")}
+    self_times: Dict[str, int] = {}
+    total: int = 0
+    for name, self_time, cumulative in _run(statement):
+        if name.strip() in startup:
+            continue
+        self_times[name.strip()] = self_time
+        if not name.startswith("  "):
+            # Not indented, so imported directly by the statement.
+            total += cumulative
+    return total, self_times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Runs to take the best of.")
+    parser.add_argument("--top", type=int, default=5, help="Slowest modules to list.")
+    arguments = parser.parse_args()
+
+    for statement in STATEMENTS:
+        runs = [measure(statement) for _ in range(arguments.repeat)]
+        total, self_times = min(runs, key=lambda run: run[0])
+        print(f"{statement}: {total / 1000:.1f} ms")
+        slowest = sorted(self_times.items(), key=lambda item: item[1], reverse=True)
+        for name, self_time in slowest[: arguments.top]:
+            print(f"    {self_time / 1000:>8.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark for reading and writing a reference array property at many
+indices.
+
+Compares a loop over ``get_state_at``/``set_value_at`` with the bulk
+``get_states_at``/``set_values_at`` methods. The calls go to an in-process
+fake stub that waits a fixed latency per call, standing in for the round
+trip to ModelCenter, and answers ``future()`` calls from a thread pool the
+way a gRPC channel keeps several calls in flight.
+
+Run with ``python benchmarks/bench_reference_property.py``.
+"""
+
+import argparse
+from concurrent.futures import Future, ThreadPoolExecutor
+import time
+from typing import Callable, List, Tuple
+
+from ansys.api.modelcenter.v0.element_messages_pb2 import ElementId
+import ansys.api.modelcenter.v0.variable_value_messages_pb2 as var_msgs
+import ansys.tools.variableinterop as atvi
+import numpy as np
+
+from ansys.modelcenter.workflow.grpc_modelcenter.reference_property import ReferenceArrayProperty
+
+
+class _DelayedCall:
+    """Stub method that takes ``latency`` seconds to answer."""
+
+    def __init__(self, answer: Callable, latency: float, executor: ThreadPoolExecutor):
+        self._answer = answer
+        self._latency = latency
+        self._executor = executor
+
+    def _respond(self, request):
+        time.sleep(self._latency)
+        return self._answer(request)
+
+    def __call__(self, request, **kwargs):
+        return self._respond(request)
+
+    def future(self, request, **kwargs) -> Future:
+        return self._executor.submit(self._respond, request)
+
+
+class _FakeStub:
+    """Stand-in for the workflow stub, holding one value per index."""
+
+    def __init__(self, length: int, latency: float, executor: ThreadPoolExecutor):
+        self._values = [
+            var_msgs.VariableValue(double_value=float(index)) for index in range(length)
+        ]
+        self.ReferenceArrayGetLength = _DelayedCall(
+            lambda request: var_msgs.IntegerValue(value=len(self._values)), latency, executor
+        )
+        self.ReferencePropertyGetValue = _DelayedCall(
+            lambda request: var_msgs.VariableState(
+                value=self._values[request.index], is_valid=True
+            ),
+            latency,
+            executor,
+        )
+        self.ReferencePropertySetValue = _DelayedCall(self._set_value, latency, executor)
+
+    def _set_value(self, request):
+        self._values[request.target_prop.index] = request.new_value
+        return var_msgs.SetVariableValueResponse(was_changed=True)
+
+
+class _FakeEngine:
+    """Stand-in for the engine, with only what the property uses."""
+
+    is_local = True
+    _retry_policy = None
+
+
+def run(length: int, latency: float, max_in_flight: int) -> List[Tuple[str, float]]:
+    """Time reading and writing every index of a reference array property.
+
+    Returns
+    -------
+    List[Tuple[str, float]]
+        Description and elapsed time in seconds of each approach.
+    """
+    with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+        stub = _FakeStub(length, latency, executor)
+
+        class _FakeProperty(ReferenceArrayProperty):
+            def _create_client(self, engine) -> _FakeStub:
+                return stub
+
+        prop = _FakeProperty(ElementId(id_string="REF-1"), "weight", _FakeEngine())
+        values = np.arange(length, dtype=np.float64) * 2.0
+
+        def timed(function: Callable[[], object]) -> float:
+            start = time.perf_counter()
+            function()
+            return time.perf_counter() - start
+
+        def read_loop() -> None:
+            [prop.get_state_at(index) for index in range(length)]
+
+        def write_loop() -> None:
+            for index in range(length):
+                prop.set_value_at(index, atvi.VariableState(atvi.RealValue(values[index]), True))
+
+        return [
+            ("get_state_at loop", timed(read_loop)),
+            ("get_states_at", timed(lambda: prop.get_states_at(max_in_flight=max_in_flight))),
+            ("set_value_at loop", timed(write_loop)),
+            (
+                "set_values_at",
+                timed(lambda: prop.set_values_at(None, values, max_in_flight=max_in_flight)),
+            ),
+        ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--length", type=int, default=500, help="Number of indices.")
+    parser.add_argument(
+        "--latency", type=float, default=0.001, help="Simulated round trip per call, in seconds."
+    )
+    parser.add_argument(
+        "--max-in-flight", type=int, default=16, help="Calls the bulk methods keep in flight."
+    )
+    arguments = parser.parse_args()
+
+    for description, elapsed in run(arguments.length, arguments.latency, arguments.max_in_flight):
+        print(f"{description:<20} {elapsed * 1000:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
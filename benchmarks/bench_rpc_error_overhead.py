@@ -0,0 +1,105 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Microbenchmark for the client-side overhead of ``interpret_rpc_error``.
+
+Calls a workflow element property against an in-process fake stub, so the
+timings contain no network or server time. The decorated property is
+compared with the same function undecorated, and with the stub called
+directly.
+
+Run with ``python benchmarks/bench_rpc_error_overhead.py``.
+"""
+
+import argparse
+import inspect
+import timeit
+from typing import Callable, List, Tuple
+
+from ansys.api.modelcenter.v0.element_messages_pb2 import ElementId, ElementName
+
+from ansys.modelcenter.workflow.grpc_modelcenter.real_datapin import RealDatapin
+
+
+class _FakeStub:
+    """Stand-in for the workflow stub that answers without any I/O."""
+
+    def __init__(self) -> None:
+        self._name = ElementName(name="Model.x")
+
+    def ElementGetName(self, request: ElementId) -> ElementName:
+        return self._name
+
+
+class _FakeDatapin(RealDatapin):
+    """Datapin wired to a ``_FakeStub`` instead of an engine's channel."""
+
+    def _create_client(self, engine) -> _FakeStub:
+        return _FakeStub()
+
+
+def _best_time_per_call(function: Callable[[], object], number: int, repeat: int) -> float:
+    """Get the best time per call of ``repeat`` runs of ``number`` calls, in
+    nanoseconds."""
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number * 1e9
+
+
+def run(number: int, repeat: int) -> List[Tuple[str, float]]:
+    """Time a round of element property calls.
+
+    Returns
+    -------
+    List[Tuple[str, float]]
+        Description and time per call in nanoseconds of the direct stub
+        call, the undecorated property getter, and the decorated property.
+    """
+    datapin = _FakeDatapin(ElementId(id_string="VAR-1"), None)
+    stub = datapin._client
+    element_id = datapin._element_id
+    decorated = type(datapin).name.fget
+    undecorated = inspect.unwrap(decorated)
+    return [
+        (
+            "stub call",
+            _best_time_per_call(lambda: stub.ElementGetName(element_id).name, number, repeat),
+        ),
+        ("undecorated getter", _best_time_per_call(lambda: undecorated(datapin), number, repeat)),
+        ("decorated getter", _best_time_per_call(lambda: decorated(datapin), number, repeat)),
+        ("property access", _best_time_per_call(lambda: datapin.name, number, repeat)),
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=200_000, help="Calls per timing.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timings to take the best of.")
+    arguments = parser.parse_args()
+
+    results = run(arguments.number, arguments.repeat)
+    for description, per_call in results:
+        print(f"{description:<20} {per_call:>8.1f} ns/call")
+    overhead = results[2][1] - results[1][1]
+    print(f"{'decorator overhead':<20} {overhead:>8.1f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
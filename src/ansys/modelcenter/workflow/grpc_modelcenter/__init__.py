@@ -26,32 +26,112 @@ This implementation finds a local installation of ModelCenter, launches
 it, and attempts to communicate with it with gRPC.
 """
 
-from .abstract_workflow_element import UnsupportedWorkflowElement
-from .assembly import Assembly
-from .boolean_datapin import BooleanArrayDatapin, BooleanDatapin
-from .component import (
-    Component,
-    ComponentDownloadValuesFailedError,
-    ComponentReconnectionFailedError,
-)
-from .datapin_link import DatapinLink
-from .driver_component import DriverComponent
-from .engine import Engine, WorkflowAlreadyLoadedError
-from .file_datapin import FileArrayDatapin, FileDatapin
-from .format import Format
-from .group import Group
-from .grpc_error_interpretation import (
-    EngineDisconnectedError,
-    InvalidInstanceError,
-    UnexpectedEngineError,
-)
-from .integer_datapin import IntegerArrayDatapin, IntegerDatapin
-from .mcd_process import EngineLicensingFailedException, MCDProcess
-from .real_datapin import RealArrayDatapin, RealDatapin
-from .reference_datapin import ReferenceArrayDatapin, ReferenceDatapin
-from .reference_datapin_metadata import ReferenceDatapinMetadata
-from .reference_property import ReferenceArrayProperty, ReferenceProperty
-from .string_datapin import StringArrayDatapin, StringDatapin
-from .unsupported_type_datapin import DatapinWithUnsupportedTypeException, UnsupportedTypeDatapin
-from .var_value_convert import ValueTypeNotSupportedError
-from .workflow import Workflow
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from .abstract_workflow_element import UnsupportedWorkflowElement
+    from .assembly import Assembly
+    from .boolean_datapin import BooleanArrayDatapin, BooleanDatapin
+    from .call_options import CallOptions, ChannelOptions
+    from .component import (
+        Component,
+        ComponentDownloadValuesFailedError,
+        ComponentReconnectionFailedError,
+    )
+    from .datapin_index import DatapinIndex
+    from .datapin_link import DatapinLink
+    from .dependency_graph import DependencyGraph
+    from .driver_component import DriverComponent
+    from .engine import Engine, WorkflowAlreadyLoadedError
+    from .engine_pool import EnginePool
+    from .file_datapin import FileArrayDatapin, FileDatapin
+    from .format import Format
+    from .group import Group
+    from .grpc_error_interpretation import (
+        EngineDisconnectedError,
+        InvalidInstanceError,
+        UnexpectedEngineError,
+    )
+    from .integer_datapin import IntegerArrayDatapin, IntegerDatapin
+    from .mcd_process import EngineLicensingFailedException, MCDProcess
+    from .real_datapin import RealArrayDatapin, RealDatapin
+    from .reference_datapin import ReferenceArrayDatapin, ReferenceDatapin
+    from .reference_datapin_metadata import ReferenceDatapinMetadata
+    from .reference_property import ReferenceArrayProperty, ReferenceProperty
+    from .retry import RetryPolicy, RetryStatistics
+    from .string_datapin import StringArrayDatapin, StringDatapin
+    from .unsupported_type_datapin import (
+        DatapinWithUnsupportedTypeException,
+        UnsupportedTypeDatapin,
+    )
+    from .var_value_convert import ValueTypeNotSupportedError
+    from .workflow import SetValuesError, Workflow
+    from .workflow_snapshot import WorkflowSnapshot
+
+# The implementation modules import gRPC, NumPy, and the variable interop
+# library, which together take most of a second to load. The public names
+# are resolved on first use so that importing the package stays cheap.
+_LAZY_IMPORTS: Dict[str, str] = {
+    "UnsupportedWorkflowElement": ".abstract_workflow_element",
+    "Assembly": ".assembly",
+    "BooleanArrayDatapin": ".boolean_datapin",
+    "BooleanDatapin": ".boolean_datapin",
+    "CallOptions": ".call_options",
+    "ChannelOptions": ".call_options",
+    "Component": ".component",
+    "ComponentDownloadValuesFailedError": ".component",
+    "ComponentReconnectionFailedError": ".component",
+    "DatapinIndex": ".datapin_index",
+    "DatapinLink": ".datapin_link",
+    "DependencyGraph": ".dependency_graph",
+    "DriverComponent": ".driver_component",
+    "Engine": ".engine",
+    "WorkflowAlreadyLoadedError": ".engine",
+    "EnginePool": ".engine_pool",
+    "FileArrayDatapin": ".file_datapin",
+    "FileDatapin": ".file_datapin",
+    "Format": ".format",
+    "Group": ".group",
+    "EngineDisconnectedError": ".grpc_error_interpretation",
+    "InvalidInstanceError": ".grpc_error_interpretation",
+    "UnexpectedEngineError": ".grpc_error_interpretation",
+    "IntegerArrayDatapin": ".integer_datapin",
+    "IntegerDatapin": ".integer_datapin",
+    "EngineLicensingFailedException": ".mcd_process",
+    "MCDProcess": ".mcd_process",
+    "RealArrayDatapin": ".real_datapin",
+    "RealDatapin": ".real_datapin",
+    "ReferenceArrayDatapin": ".reference_datapin",
+    "ReferenceDatapin": ".reference_datapin",
+    "ReferenceDatapinMetadata": ".reference_datapin_metadata",
+    "ReferenceArrayProperty": ".reference_property",
+    "ReferenceProperty": ".reference_property",
+    "RetryPolicy": ".retry",
+    "RetryStatistics": ".retry",
+    "StringArrayDatapin": ".string_datapin",
+    "StringDatapin": ".string_datapin",
+    "DatapinWithUnsupportedTypeException": ".unsupported_type_datapin",
+    "UnsupportedTypeDatapin": ".unsupported_type_datapin",
+    "ValueTypeNotSupportedError": ".var_value_convert",
+    "SetValuesError": ".workflow",
+    "Workflow": ".workflow",
+    "WorkflowSnapshot": ".workflow_snapshot",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the module that defines a public name on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List the public names along with the names already loaded."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -0,0 +1,379 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Provides fast conversions between NumPy arrays and the numeric array
+messages of the ModelCenter gRPC API.
+
+Reading a repeated scalar field one element at a time, or filling one
+from an ndarray one element at a time, costs a Python object per element.
+For the fixed-width types (real and Boolean), these helpers instead move
+the packed wire bytes of the ``values`` field to and from the ndarray
+buffer in bulk. Integers are varint-encoded on the wire, so they are
+moved with a single ``fromiter`` or ``tolist`` pass instead.
+
+Arrays can also be converted in chunks of flat (row-major) index ranges,
+so that very large values can be produced or consumed incrementally.
+"""
+
+from typing import (
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from ansys.api.modelcenter.v0.variable_value_messages_pb2 import (
+    BooleanArrayValue,
+    DoubleArrayValue,
+    IntegerArrayValue,
+)
+import numpy as np
+from numpy.typing import ArrayLike
+
+DEFAULT_CHUNK_SIZE: int = 1 << 16
+"""Default number of elements per chunk for chunked array transfers."""
+
+NumericArrayMessage = Union[BooleanArrayValue, DoubleArrayValue, IntegerArrayValue]
+"""Array messages that these helpers can convert."""
+
+NumericArrayMessageType = TypeVar(
+    "NumericArrayMessageType", BooleanArrayValue, DoubleArrayValue, IntegerArrayValue
+)
+
+
+class ArrayChunk(NamedTuple):
+    """Holds one chunk of a numeric array."""
+
+    shape: Tuple[int, ...]
+    """Dimensions of the whole array."""
+    start: int
+    """Flat (row-major) index of the first value in the chunk."""
+    values: np.ndarray
+    """Values in the chunk, as a one-dimensional array."""
+
+
+_WIRE_TYPE_VARINT: int = 0
+_WIRE_TYPE_FIXED64: int = 1
+_WIRE_TYPE_LENGTH_DELIMITED: int = 2
+_WIRE_TYPE_FIXED32: int = 5
+
+_VALUES_FIELD_NUMBER: int = DoubleArrayValue.DESCRIPTOR.fields_by_name["values"].number
+
+_VALUE_DTYPES: Mapping[Type, np.dtype] = {
+    BooleanArrayValue: np.dtype(np.bool_),
+    DoubleArrayValue: np.dtype(np.float64),
+    IntegerArrayValue: np.dtype(np.int64),
+}
+"""NumPy type of the values of each array message type."""
+
+_PACKED_WIRE_DTYPES: Mapping[Type, np.dtype] = {
+    BooleanArrayValue: np.dtype(np.uint8),
+    DoubleArrayValue: np.dtype("<f8"),
+}
+"""Wire layout of the packed ``values`` field, for the message types where
+each element has a fixed width."""
+
+
+def _read_varint(buffer: bytes, position: int) -> Tuple[int, int]:
+    """Read a varint from a buffer.
+
+    Returns
+    -------
+    Tuple[int, int]
+        Value that was read and the position just after it.
+    """
+    result: int = 0
+    shift: int = 0
+    while True:
+        byte: int = buffer[position]
+        position += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, position
+        shift += 7
+
+
+def _encode_varint(value: int) -> bytes:
+    """Encode a non-negative integer as a varint."""
+    encoded = bytearray()
+    while value >= 0x80:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def _get_packed_values(serialized: bytes) -> Optional[memoryview]:
+    """Get the payload of the packed ``values`` field from a serialized
+    array message.
+
+    Returns
+    -------
+    Optional[memoryview]
+        Concatenated payload of the field, or ``None`` if the values were
+        not packed and have to be read from the message instead. If the
+        field was written in one piece, as it normally is, this is a view
+        of ``serialized`` rather than a copy.
+    """
+    view = memoryview(serialized)
+    chunks: List[memoryview] = []
+    position: int = 0
+    while position < len(serialized):
+        tag, position = _read_varint(serialized, position)
+        field_number: int = tag >> 3
+        wire_type: int = tag & 0x07
+        if wire_type == _WIRE_TYPE_LENGTH_DELIMITED:
+            length, position = _read_varint(serialized, position)
+            if field_number == _VALUES_FIELD_NUMBER:
+                chunks.append(view[position : position + length])
+            position += length
+        elif field_number == _VALUES_FIELD_NUMBER:
+            return None
+        elif wire_type == _WIRE_TYPE_VARINT:
+            _, position = _read_varint(serialized, position)
+        elif wire_type == _WIRE_TYPE_FIXED64:
+            position += 8
+        elif wire_type == _WIRE_TYPE_FIXED32:
+            position += 4
+        else:
+            return None
+    if len(chunks) == 1:
+        return chunks[0]
+    return memoryview(b"".join(chunks))
+
+
+def _get_packed_payload(message: NumericArrayMessage) -> Optional[memoryview]:
+    """Get the wire bytes of a message's values, if they can be read as a
+    buffer.
+
+    The message is serialized once, and the payload is normally a view of
+    that serialized copy, so reading the values this way holds one extra
+    copy of them in wire form.
+
+    Returns
+    -------
+    Optional[memoryview]
+        Payload of the packed ``values`` field, or ``None`` if the values
+        have to be read from the message field instead.
+    """
+    wire_dtype: Optional[np.dtype] = _PACKED_WIRE_DTYPES.get(type(message))
+    count: int = len(message.values)
+    if wire_dtype is None or count == 0:
+        return None
+    payload: Optional[memoryview] = _get_packed_values(message.SerializeToString())
+    # A payload of an unexpected size means a non-canonical encoding, such
+    # as a multi-byte varint Boolean, so the values are read directly.
+    if payload is None or len(payload) != count * wire_dtype.itemsize:
+        return None
+    return payload
+
+
+def _iter_raw_chunks(message: NumericArrayMessage, chunk_size: int) -> Iterator[np.ndarray]:
+    """Iterate over a message's values in flat chunks, without converting
+    them from their wire type.
+
+    The chunks may be read-only views of the serialized message.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+    count: int = len(message.values)
+    payload: Optional[memoryview] = _get_packed_payload(message)
+    for start in range(0, count, chunk_size):
+        stop: int = min(start + chunk_size, count)
+        if payload is not None:
+            wire_dtype: np.dtype = _PACKED_WIRE_DTYPES[type(message)]
+            yield np.frombuffer(
+                payload, dtype=wire_dtype, count=stop - start, offset=start * wire_dtype.itemsize
+            )
+        else:
+            yield np.fromiter(
+                message.values[start:stop], dtype=_VALUE_DTYPES[type(message)], count=stop - start
+            )
+
+
+def iter_grpc_array_chunks(
+    message: NumericArrayMessage, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[ArrayChunk]:
+    """Iterate over the values of a numeric array message in chunks.
+
+    Only one chunk is converted to a NumPy array at a time, so the whole
+    array is never held as an ndarray. For the fixed-width types, the
+    message is serialized once and each chunk is read from that copy.
+
+    Parameters
+    ----------
+    message : NumericArrayMessage
+        ``BooleanArrayValue``, ``DoubleArrayValue`` or
+        ``IntegerArrayValue`` message to read.
+    chunk_size : int, optional
+        Maximum number of elements in each chunk.
+
+    Returns
+    -------
+    Iterator[ArrayChunk]
+        Chunks of the values, in row-major order.
+    """
+    shape: Tuple[int, ...] = tuple(message.dims.dims)
+    dtype: np.dtype = _VALUE_DTYPES[type(message)]
+    start: int = 0
+    for raw in _iter_raw_chunks(message, chunk_size):
+        yield ArrayChunk(shape, start, raw.astype(dtype))
+        start += raw.size
+
+
+def convert_grpc_array_to_numpy(
+    message: NumericArrayMessage,
+    out: Optional[np.ndarray] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> np.ndarray:
+    """Convert a numeric array message to a NumPy array.
+
+    Parameters
+    ----------
+    message : NumericArrayMessage
+        ``BooleanArrayValue``, ``DoubleArrayValue`` or
+        ``IntegerArrayValue`` message to convert.
+    out : np.ndarray, optional
+        Preallocated C-contiguous array to fill. It must have the
+        message's dimensions. If not given, a new array is allocated.
+    chunk_size : int, optional
+        Maximum number of elements to convert at a time.
+
+    Returns
+    -------
+    np.ndarray
+        Writable array with the message's values and dimensions. This is
+        ``out`` if it was given.
+    """
+    shape: Tuple[int, ...] = tuple(message.dims.dims)
+    dtype: np.dtype = _VALUE_DTYPES[type(message)]
+    if out is None:
+        payload: Optional[memoryview] = _get_packed_payload(message)
+        if payload is not None:
+            # A single conversion of the whole buffer is the fastest way to
+            # get a new array.
+            wire_dtype: np.dtype = _PACKED_WIRE_DTYPES[type(message)]
+            return np.frombuffer(payload, dtype=wire_dtype).astype(dtype).reshape(shape)
+        out = np.empty(shape, dtype=dtype)
+    elif out.shape != shape or not out.flags.c_contiguous or not out.flags.writeable:
+        raise ValueError(
+            f"The output array must be a writable C-contiguous array of shape {shape}."
+        )
+    flat: np.ndarray = out.reshape(-1)
+    start: int = 0
+    for raw in _iter_raw_chunks(message, chunk_size):
+        np.copyto(flat[start : start + raw.size], raw, casting="unsafe")
+        start += raw.size
+    return out
+
+
+def convert_numpy_chunks_to_grpc_array(
+    message_type: Type[NumericArrayMessageType],
+    shape: Sequence[int],
+    chunks: Iterable[ArrayLike],
+) -> NumericArrayMessageType:
+    """Build a numeric array message from the chunks of an array.
+
+    For the fixed-width types, the chunks are copied straight into a
+    preallocated wire buffer, so the whole array is never held as an
+    ndarray.
+
+    Parameters
+    ----------
+    message_type : Type[NumericArrayMessageType]
+        ``BooleanArrayValue``, ``DoubleArrayValue`` or
+        ``IntegerArrayValue``.
+    shape : Sequence[int]
+        Dimensions of the whole array.
+    chunks : Iterable[ArrayLike]
+        Values of the array, in row-major order. Each chunk is flattened,
+        and the chunks may be of any size.
+
+    Returns
+    -------
+    NumericArrayMessageType
+        Message with the values and dimensions.
+
+    Raises
+    ------
+    ValueError
+        If the chunks do not hold exactly as many values as ``shape``
+        describes.
+    """
+    count: int = int(np.prod(shape, dtype=np.int64))
+    message: NumericArrayMessageType
+    position: int = 0
+    wire_dtype: Optional[np.dtype] = _PACKED_WIRE_DTYPES.get(message_type)
+    if wire_dtype is not None and count > 0:
+        tag: int = (_VALUES_FIELD_NUMBER << 3) | _WIRE_TYPE_LENGTH_DELIMITED
+        header: bytes = _encode_varint(tag) + _encode_varint(count * wire_dtype.itemsize)
+        buffer = bytearray(len(header) + count * wire_dtype.itemsize)
+        buffer[: len(header)] = header
+        wire_values: np.ndarray = np.frombuffer(buffer, dtype=wire_dtype, offset=len(header))
+        for chunk in chunks:
+            flat_chunk: np.ndarray = np.ravel(chunk)
+            if position + flat_chunk.size > count:
+                raise ValueError(f"The chunks hold more than the {count} values in the array.")
+            wire_values[position : position + flat_chunk.size] = flat_chunk
+            position += flat_chunk.size
+        message = message_type.FromString(buffer)
+    else:
+        message = message_type()
+        for chunk in chunks:
+            flat_chunk = np.ravel(chunk)
+            if position + flat_chunk.size > count:
+                raise ValueError(f"The chunks hold more than the {count} values in the array.")
+            message.values.extend(flat_chunk.tolist())
+            position += flat_chunk.size
+    if position != count:
+        raise ValueError(f"The chunks hold {position} values, but the array has {count}.")
+    message.dims.dims.extend(shape)
+    return message
+
+
+def convert_numpy_to_grpc_array(
+    message_type: Type[NumericArrayMessageType], values: np.ndarray
+) -> NumericArrayMessageType:
+    """Convert a NumPy array to a numeric array message.
+
+    Parameters
+    ----------
+    message_type : Type[NumericArrayMessageType]
+        ``BooleanArrayValue``, ``DoubleArrayValue`` or
+        ``IntegerArrayValue``.
+    values : np.ndarray
+        Array to convert.
+
+    Returns
+    -------
+    NumericArrayMessageType
+        Message with the array's values, in row-major order, and
+        dimensions.
+    """
+    return convert_numpy_chunks_to_grpc_array(message_type, values.shape, [values])
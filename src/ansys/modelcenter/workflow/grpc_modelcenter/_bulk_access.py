@@ -0,0 +1,161 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Provides helpers shared by methods that read or write many indexed values
+at once."""
+
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Union
+
+import ansys.api.modelcenter.v0.variable_value_messages_pb2 as var_msgs
+import ansys.engineeringworkflow.api as aew_api
+import ansys.tools.variableinterop as atvi
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .var_value_convert import convert_grpc_value_to_atvi, convert_numpy_column_to_interop
+
+IndexSelection = Optional[Union[Iterable[int], slice, np.ndarray]]
+"""Indices to operate on: ``None`` for all, a slice, a sequence of indices,
+or a boolean mask."""
+
+SCALAR_REFERENCE_VALUE_TYPES = (
+    atvi.BooleanValue,
+    atvi.RealValue,
+    atvi.IntegerValue,
+    atvi.StringValue,
+    atvi.FileValue,
+)
+"""Value types that a single reference can be set to."""
+
+
+def resolve_indices(indices: IndexSelection, get_length: Callable[[], int]) -> List[int]:
+    """Turn an index selection into a list of non-negative indices.
+
+    Parameters
+    ----------
+    indices : IndexSelection
+        Selection to resolve. ``None`` selects every index. A boolean NumPy
+        array is a mask over the indices.
+    get_length : Callable[[], int]
+        Function that gets the length of the array. It is only called if
+        the selection needs the length to be resolved.
+
+    Returns
+    -------
+    List[int]
+        Selected indices, in order.
+    """
+    if indices is None:
+        return list(range(get_length()))
+    if isinstance(indices, slice):
+        return list(range(*indices.indices(get_length())))
+    if isinstance(indices, np.ndarray) and indices.dtype == np.bool_:
+        return np.flatnonzero(indices).tolist()
+    resolved: List[int] = [int(one_index) for one_index in np.asarray(indices).ravel()]
+    if any(one_index < 0 for one_index in resolved):
+        length = get_length()
+        resolved = [one_index + length if one_index < 0 else one_index for one_index in resolved]
+    return resolved
+
+
+def collect_values(
+    values: Union[ArrayLike, Sequence[Union[atvi.IVariableValue, atvi.VariableState]]],
+) -> List[atvi.IVariableValue]:
+    """Convert the values given to a bulk set into interop values.
+
+    Parameters
+    ----------
+    values : Union[ArrayLike, Sequence[Union[atvi.IVariableValue, atvi.VariableState]]]
+        NumPy column, or a sequence of values or states.
+
+    Returns
+    -------
+    List[atvi.IVariableValue]
+        One value per entry, or per row of a multi-dimensional column.
+    """
+    if isinstance(values, np.ndarray):
+        return convert_numpy_column_to_interop(values)
+    items: List[Any] = list(values)
+    column = np.empty(len(items), dtype=object)
+    for position, value in enumerate(items):
+        column[position] = value.value if isinstance(value, atvi.VariableState) else value
+    return convert_numpy_column_to_interop(column)
+
+
+def collect_scalar_values(
+    values: Union[ArrayLike, Sequence[Union[atvi.IVariableValue, atvi.VariableState]]],
+) -> List[atvi.IVariableValue]:
+    """Convert the values given to a bulk set of references into scalar
+    interop values.
+
+    Parameters
+    ----------
+    values : Union[ArrayLike, Sequence[Union[atvi.IVariableValue, atvi.VariableState]]]
+        One-dimensional NumPy column, or a sequence of values or states.
+
+    Returns
+    -------
+    List[atvi.IVariableValue]
+        One scalar value per entry.
+
+    Raises
+    ------
+    atvi.IncompatibleTypesException
+        If any value is not a scalar boolean, integer, real, string, or
+        file value.
+    """
+    interop_values = collect_values(values)
+    for interop_value in interop_values:
+        if not isinstance(interop_value, SCALAR_REFERENCE_VALUE_TYPES):
+            raise atvi.IncompatibleTypesException(
+                interop_value.variable_type, atvi.VariableType.UNKNOWN
+            )
+    return interop_values
+
+
+def convert_grpc_states(
+    responses: Iterable[var_msgs.VariableState], engine_is_local: bool
+) -> List[atvi.VariableState]:
+    """Convert the responses of several value reads to interop states.
+
+    Parameters
+    ----------
+    responses : Iterable[var_msgs.VariableState]
+        Responses to convert.
+    engine_is_local : bool
+        Whether the engine is running on the local machine.
+
+    Returns
+    -------
+    List[atvi.VariableState]
+        Equivalent interop states.
+    """
+    states: List[atvi.VariableState] = []
+    for response in responses:
+        try:
+            interop_value = convert_grpc_value_to_atvi(response.value, engine_is_local)
+        except ValueError as convert_failure:
+            raise aew_api.EngineInternalError(
+                "Unexpected failure occurred converting gRPC value response."
+            ) from convert_failure
+        states.append(atvi.VariableState(value=interop_value, is_valid=response.is_valid))
+    return states
@@ -0,0 +1,95 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Provides helpers for reading datapin states."""
+
+from typing import Dict, Mapping
+
+from ansys.api.modelcenter.v0.grpc_modelcenter_workflow_pb2_grpc import (
+    ModelCenterWorkflowServiceStub,
+)
+from ansys.api.modelcenter.v0.variable_value_messages_pb2 import VariableState
+from ansys.api.modelcenter.v0.workflow_messages_pb2 import ElementIdOrName
+import ansys.engineeringworkflow.api as aew_api
+import ansys.tools.variableinterop as atvi
+
+from ._pipeline import DEFAULT_MAX_IN_FLIGHT, pipeline_calls
+from .var_value_convert import convert_grpc_value_to_atvi
+
+
+def convert_grpc_state_to_atvi(
+    response: VariableState, engine_is_local: bool
+) -> atvi.VariableState:
+    """Convert the state of a datapin from a ``VariableGetState`` response.
+
+    Parameters
+    ----------
+    response : VariableState
+        Response from ``VariableGetState``.
+    engine_is_local : bool
+        Whether the engine is running on the local machine.
+
+    Returns
+    -------
+    atvi.VariableState
+        Equivalent interop state.
+    """
+    interop_value: atvi.IVariableValue
+    try:
+        interop_value = convert_grpc_value_to_atvi(response.value, engine_is_local)
+    except ValueError as convert_failure:
+        raise aew_api.EngineInternalError(
+            "Unexpected failure occurred converting gRPC value response."
+        ) from convert_failure
+    return atvi.VariableState(value=interop_value, is_valid=response.is_valid)
+
+
+def get_datapin_states(
+    client: ModelCenterWorkflowServiceStub,
+    targets: Mapping[str, ElementIdOrName],
+    engine_is_local: bool,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+) -> Dict[str, atvi.VariableState]:
+    """Read the states of several datapins with concurrent ``VariableGetState``
+    calls.
+
+    Parameters
+    ----------
+    client : ModelCenterWorkflowServiceStub
+        Client to make the calls with.
+    targets : Mapping[str, ElementIdOrName]
+        Datapins to read, keyed by the name to return each state under.
+    engine_is_local : bool
+        Whether the engine is running on the local machine.
+    max_in_flight : int
+        Maximum number of calls to have outstanding at once.
+
+    Returns
+    -------
+    Dict[str, atvi.VariableState]
+        States of the datapins, keyed as in ``targets``.
+    """
+    responses = pipeline_calls(client.VariableGetState, targets.values(), max_in_flight)
+    return {
+        key: convert_grpc_state_to_atvi(response, engine_is_local)
+        for key, response in zip(targets.keys(), responses)
+    }
@@ -0,0 +1,134 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Defines the cache of element name lookups used by ``Workflow``."""
+
+from typing import TYPE_CHECKING, Dict, Optional
+
+import ansys.api.modelcenter.v0.workflow_messages_pb2 as workflow_msg
+
+if TYPE_CHECKING:
+    from .engine import Engine
+
+
+class ElementNameCache:
+    """Caches the elements that full names resolve to within a workflow.
+
+    The cache is disabled by default. While it is enabled, looking up an
+    element by a name that was looked up before does not make a call to
+    the engine. Entries are dropped whenever this client changes the
+    structure of a workflow on the same engine, for example by renaming,
+    adding, moving, or removing an element. Changes made in other ways,
+    such as by another client or by the ModelCenter user interface, are
+    not detected; call ``invalidate()`` after them.
+    """
+
+    def __init__(self, engine: "Engine"):
+        """Initialize an instance.
+
+        Parameters
+        ----------
+        engine : Engine
+            Engine that the workflow belongs to.
+        """
+        self._engine = engine
+        self._entries: Dict[str, workflow_msg.ElementInfo] = {}
+        self._generation: int = engine._structure_generation
+        self._enabled: bool = False
+        self._hits: int = 0
+        self._misses: int = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether lookups are cached.
+
+        Disabling the cache also empties it.
+        """
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        self._enabled = value
+        if not value:
+            self._entries.clear()
+
+    @property
+    def hits(self) -> int:
+        """Number of lookups answered from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of lookups made while enabled that were not cached."""
+        return self._misses
+
+    def __len__(self) -> int:
+        """Get the number of cached names."""
+        return len(self._entries)
+
+    def invalidate(self) -> None:
+        """Drop all cached entries.
+
+        The hit and miss counters are not reset.
+        """
+        self._entries.clear()
+
+    def get(self, name: str) -> Optional[workflow_msg.ElementInfo]:
+        """Get the cached element for a full name.
+
+        Parameters
+        ----------
+        name : str
+            Full name of the element.
+
+        Returns
+        -------
+        Optional[workflow_msg.ElementInfo]
+            Cached element, or ``None`` if the name is not cached or the
+            cache is disabled.
+        """
+        if not self._enabled:
+            return None
+        if self._generation != self._engine._structure_generation:
+            self._entries.clear()
+            self._generation = self._engine._structure_generation
+        info: Optional[workflow_msg.ElementInfo] = self._entries.get(name)
+        if info is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return info
+
+    def put(self, name: str, info: workflow_msg.ElementInfo) -> None:
+        """Cache the element that a full name resolved to.
+
+        Nothing is stored while the cache is disabled.
+
+        Parameters
+        ----------
+        name : str
+            Full name of the element.
+        info : workflow_msg.ElementInfo
+            Element that the name resolved to.
+        """
+        if self._enabled and self._generation == self._engine._structure_generation:
+            self._entries[name] = info
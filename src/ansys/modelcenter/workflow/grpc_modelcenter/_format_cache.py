@@ -0,0 +1,61 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Defines the engine-scoped cache of conversions made by the format
+service."""
+
+from typing import Any, Hashable, Tuple
+
+from ._lru_cache import LruCache
+
+DEFAULT_FORMAT_CACHE_SIZE: int = 4096
+"""Default maximum number of conversions that are cached."""
+
+FormatCacheKey = Tuple[str, str, Hashable]
+"""Conversion name, format string, and original value that a converted
+value is cached under."""
+
+
+class FormatCache(LruCache[FormatCacheKey, Any]):
+    """Caches the values converted by the format service of one engine.
+
+    The cache is disabled by default. While it is enabled, the array
+    conversion methods of ``Format`` do not call the engine for a value
+    that was converted before in the same format. Once the cache holds
+    ``max_size`` entries, adding an entry evicts the least recently used
+    one. Setting a preference through this client empties the cache,
+    because preferences can change how values are shown. Changes made in
+    other ways, such as by the ModelCenter user interface, are not
+    detected; call ``invalidate()`` after them.
+
+    Conversions that ``Format`` makes locally are not cached.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_FORMAT_CACHE_SIZE):
+        """Initialize an instance.
+
+        Parameters
+        ----------
+        max_size : int, optional
+            Maximum number of entries to keep.
+        """
+        super().__init__(max_size)
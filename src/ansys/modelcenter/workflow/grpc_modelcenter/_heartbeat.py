@@ -0,0 +1,291 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Defines the scheduler that sends heartbeat messages for every engine in
+the process."""
+
+import heapq
+import itertools
+from threading import Condition, Thread, current_thread
+import time
+from typing import Any, Callable, Iterator, List, NamedTuple, Optional, Tuple
+
+from ansys.api.modelcenter.v0.engine_messages_pb2 import HeartbeatRequest
+import grpc
+
+_HEARTBEAT_MARGIN: float = 0.95
+"""Fraction of the heartbeat interval to wait between heartbeats, so that
+each one arrives a little before the server expects it."""
+
+
+class HeartbeatStatistics(NamedTuple):
+    """Counts of the heartbeat messages sent for one engine."""
+
+    sent: int
+    """Number of heartbeat messages sent."""
+    missed: int
+    """Number of heartbeat messages that failed or timed out."""
+    consecutive_missed: int
+    """Number of heartbeat messages that failed or timed out since the last
+    one that succeeded."""
+
+
+class HeartbeatRegistration:
+    """Tracks the heartbeat messages sent for one engine.
+
+    Instances are created by ``HeartbeatScheduler.register()``.
+    """
+
+    def __init__(
+        self,
+        stub: Any,
+        interval: float,
+        allowed_misses: int,
+        on_unresponsive: Optional[Callable[[], None]],
+    ):
+        """Initialize an instance.
+
+        Parameters
+        ----------
+        stub : Any
+            Engine service stub to send the heartbeat messages with.
+        interval : float
+            Number of seconds within which the server expects each message.
+        allowed_misses : int
+            Number of consecutive misses after which the server is
+            considered to have stopped responding.
+        on_unresponsive : Optional[Callable[[], None]]
+            Function to call when the server stops responding.
+        """
+        self._stub = stub
+        self._interval: float = interval
+        self._allowed_misses: int = allowed_misses
+        self._on_unresponsive: Optional[Callable[[], None]] = on_unresponsive
+        self._is_active: bool = True
+        self._is_sending: bool = False
+        self._sent: int = 0
+        self._missed: int = 0
+        self._consecutive_missed: int = 0
+
+    @property
+    def statistics(self) -> HeartbeatStatistics:
+        """Counts of the heartbeat messages sent so far."""
+        return HeartbeatStatistics(self._sent, self._missed, self._consecutive_missed)
+
+
+class HeartbeatScheduler:
+    """Sends heartbeat messages for any number of engines from one thread.
+
+    Each registered engine's next heartbeat is kept in a heap ordered by
+    deadline. The thread sleeps until the earliest deadline, sends the
+    message on the engine's own channel, and schedules the next one. Calls
+    are started without waiting for their responses where the stub
+    supports it, so a server that hangs does not delay the others. Their
+    outcomes may be recorded on gRPC's threads, but ``on_unresponsive``
+    callbacks are always made on the scheduler's thread. The thread stops
+    while there is nothing registered.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an instance."""
+        self._condition = Condition()
+        self._heap: List[Tuple[float, int, HeartbeatRegistration]] = []
+        self._sequence: Iterator[int] = itertools.count()
+        self._thread: Optional[Thread] = None
+        self._unresponsive: List[HeartbeatRegistration] = []
+
+    def register(
+        self,
+        stub: Any,
+        interval_ms: float,
+        allowed_misses: int = 3,
+        on_unresponsive: Optional[Callable[[], None]] = None,
+    ) -> HeartbeatRegistration:
+        """Start sending heartbeat messages with a stub.
+
+        The first message is sent straight away.
+
+        Parameters
+        ----------
+        stub : Any
+            Engine service stub to send the heartbeat messages with.
+        interval_ms : float
+            Number of milliseconds within which the server expects each
+            message.
+        allowed_misses : int, optional
+            Number of consecutive misses after which ``on_unresponsive`` is
+            called. It is called again only after a message succeeds.
+        on_unresponsive : Optional[Callable[[], None]], optional
+            Function to call when the server stops responding. It is called
+            on the scheduler's thread, so it should return quickly.
+
+        Returns
+        -------
+        HeartbeatRegistration
+            Registration to pass to ``unregister()``.
+        """
+        registration = HeartbeatRegistration(
+            stub, float(interval_ms) / 1000, allowed_misses, on_unresponsive
+        )
+        with self._condition:
+            self._schedule(registration, time.monotonic())
+            if self._thread is None:
+                self._thread = Thread(target=self._run, name="heartbeat", daemon=True)
+                self._thread.start()
+        return registration
+
+    def unregister(self, registration: HeartbeatRegistration) -> None:
+        """Stop sending heartbeat messages for a registration.
+
+        No message is sent for the registration once this returns.
+
+        Parameters
+        ----------
+        registration : HeartbeatRegistration
+            Registration returned by ``register()``.
+        """
+        with self._condition:
+            registration._is_active = False
+            if self._thread is not current_thread():
+                self._condition.wait_for(lambda: not registration._is_sending)
+            self._condition.notify_all()
+
+    def _schedule(self, registration: HeartbeatRegistration, deadline: float) -> None:
+        """Add a registration's next heartbeat to the heap.
+
+        The caller must hold ``self._condition``.
+        """
+        heapq.heappush(self._heap, (deadline, next(self._sequence), registration))
+        self._condition.notify_all()
+
+    def _run(self) -> None:
+        """Send heartbeat messages as they come due."""
+        with self._condition:
+            while True:
+                if len(self._unresponsive) > 0:
+                    self._notify_unresponsive()
+                    continue
+                # Drop the registrations that were unregistered.
+                while len(self._heap) > 0 and not self._heap[0][2]._is_active:
+                    heapq.heappop(self._heap)
+                if len(self._heap) == 0:
+                    self._thread = None
+                    return
+                deadline, _, registration = self._heap[0]
+                remaining: float = deadline - time.monotonic()
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+                heapq.heappop(self._heap)
+                registration._is_sending = True
+                self._condition.release()
+                try:
+                    self._send(registration)
+                finally:
+                    self._condition.acquire()
+                    registration._is_sending = False
+                    self._condition.notify_all()
+                if registration._is_active:
+                    self._schedule(
+                        registration, time.monotonic() + registration._interval * _HEARTBEAT_MARGIN
+                    )
+
+    def _notify_unresponsive(self) -> None:
+        """Call the ``on_unresponsive`` callbacks that are due.
+
+        The caller must hold ``self._condition``. It is released while the
+        callbacks run, so that they may unregister.
+        """
+        registrations: List[HeartbeatRegistration] = self._unresponsive
+        self._unresponsive = []
+        self._condition.release()
+        try:
+            for registration in registrations:
+                if registration._is_active and registration._on_unresponsive is not None:
+                    try:
+                        registration._on_unresponsive()
+                    except Exception:  # nosec B110
+                        # A failing callback must not stop the thread that
+                        # every engine shares.
+                        pass
+        finally:
+            self._condition.acquire()
+
+    def _send(self, registration: HeartbeatRegistration) -> None:
+        """Send one heartbeat message.
+
+        The call is started without waiting for the response, and times out
+        after one interval. If the call object does not support
+        ``future()`` (for example, a test double), it is made directly
+        instead.
+        """
+        call = registration._stub.Heartbeat
+        start_call: Optional[Callable] = getattr(call, "future", None)
+        registration._sent += 1
+        if start_call is None:
+            try:
+                call(HeartbeatRequest())
+            except Exception:
+                # Any failure is a missed heartbeat; it must not stop the
+                # thread that every engine shares.
+                self._record(registration, False)
+            else:
+                self._record(registration, True)
+            return
+
+        def on_done(finished: grpc.Future) -> None:
+            self._record(registration, not finished.cancelled() and finished.exception() is None)
+
+        try:
+            start_call(HeartbeatRequest(), timeout=registration._interval).add_done_callback(
+                on_done
+            )
+        except Exception:
+            self._record(registration, False)
+
+    def _record(self, registration: HeartbeatRegistration, succeeded: bool) -> None:
+        """Record the outcome of a heartbeat message.
+
+        This may run on a gRPC thread, so a due ``on_unresponsive`` callback
+        is handed to the scheduler's thread rather than called here.
+        """
+        with self._condition:
+            if succeeded:
+                registration._consecutive_missed = 0
+                return
+            registration._missed += 1
+            registration._consecutive_missed += 1
+            if (
+                registration._is_active
+                and registration._on_unresponsive is not None
+                and registration._consecutive_missed == registration._allowed_misses
+            ):
+                self._unresponsive.append(registration)
+                self._condition.notify_all()
+
+
+_scheduler = HeartbeatScheduler()
+
+
+def get_heartbeat_scheduler() -> HeartbeatScheduler:
+    """Get the heartbeat scheduler shared by every engine in the process."""
+    return _scheduler
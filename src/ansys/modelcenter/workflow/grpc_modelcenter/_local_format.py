@@ -0,0 +1,238 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Provides a client-side implementation of the common ModelCenter number
+formats.
+
+The **Number**, **Currency**, **Percentage**, and **Scientific** format
+families described on ``IFormat.format`` are fully determined by their
+format strings, so values can be converted to and from them without a
+round trip to the format service. Other formats (``General``, fractions,
+and dates) are not handled here, and neither is any text that does not
+parse cleanly. In those cases these helpers return ``None`` and the
+caller should fall back to the server.
+
+Real values are first rounded to 15 significant digits, and then to the
+number of decimal places shown, with ties rounded away from zero. For
+example, 2.675 is shown as ``2.68`` in the ``0.00`` format, even though
+the nearest double is slightly below 2.675.
+"""
+
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation, localcontext
+import re
+from typing import NamedTuple, Optional, Union
+
+from numpy import float64, iinfo, int64
+
+MAX_DECIMALS: int = 30
+"""Maximum number of decimal places a number format can specify."""
+
+_DIGITS_PATTERN = re.compile(r"0(?:\.(0{1,%d}))?" % MAX_DECIMALS)
+_NUMBER_PATTERN = re.compile(r"(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
+_GROUPED_NUMBER_PATTERN = re.compile(r"\d{1,3}(?:,\d{3})*(?:\.\d*)?")
+_INT64_INFO = iinfo(int64)
+# Beyond this, the digits shown for a double depend on the implementation.
+_MAX_FIXED_MAGNITUDE = Decimal(10) ** 15
+# Enough precision to hold any double exactly, with 30 decimal places.
+_PRECISION: int = 1100
+
+
+class NumberFormat(NamedTuple):
+    """Parsed form of a format string that can be applied locally."""
+
+    decimals: int
+    """Number of decimal places to show."""
+    thousands_separator: bool = False
+    """Whether to group the integer digits in thousands."""
+    negative_braces: bool = False
+    """Whether to show negative values in braces instead of with a sign."""
+    currency: bool = False
+    """Whether to prefix values with a ``$`` symbol."""
+    percent: bool = False
+    """Whether to show values multiplied by 100, followed by a ``%`` symbol."""
+    scientific: bool = False
+    """Whether to show values in scientific notation."""
+
+    def format_value(self, value: Union[int, float]) -> Optional[str]:
+        """Convert a value to a string in this format.
+
+        Parameters
+        ----------
+        value : Union[int, float]
+            Value to convert. Real values are rounded to 15 significant
+            digits first; integers are used exactly.
+
+        Returns
+        -------
+        Optional[str]
+            Formatted value, or ``None`` if the value is not finite, or
+            is too large to show in full without scientific notation.
+        """
+        number = Decimal(format(value, ".15g")) if isinstance(value, float) else Decimal(value)
+        if not number.is_finite():
+            return None
+        with localcontext() as context:
+            context.prec = _PRECISION
+            context.rounding = ROUND_HALF_UP
+            if self.percent:
+                number *= 100
+            if not self.scientific and abs(number) >= _MAX_FIXED_MAGNITUDE:
+                return None
+            if self.scientific:
+                body = self._format_scientific(abs(number))
+            else:
+                rounded = abs(number).quantize(Decimal(1).scaleb(-self.decimals))
+                body = format(rounded, ",f" if self.thousands_separator else "f")
+                if rounded.is_zero():
+                    number = rounded
+        if self.currency:
+            body = "$" + body
+        if self.percent:
+            body += "%"
+        if number < 0:
+            return "(" + body + ")" if self.negative_braces else "-" + body
+        return body
+
+    def parse_value(self, string: str) -> Optional[Decimal]:
+        """Convert a string in this format to a value.
+
+        Parameters
+        ----------
+        string : str
+            String to convert.
+
+        Returns
+        -------
+        Optional[Decimal]
+            Value of the string, or ``None`` if the string cannot be
+            parsed unambiguously.
+        """
+        text = string.strip()
+        negative = False
+        if len(text) > 1 and text[0] == "(" and text[-1] == ")":
+            negative = True
+            text = text[1:-1].strip()
+        if self.percent:
+            if not text.endswith("%"):
+                return None
+            text = text[:-1].rstrip()
+        if text.startswith("-"):
+            if negative:
+                return None
+            negative = True
+            text = text[1:]
+        if self.currency and text.startswith("$"):
+            text = text[1:]
+        if self.thousands_separator and "," in text:
+            if _GROUPED_NUMBER_PATTERN.fullmatch(text) is None:
+                return None
+            text = text.replace(",", "")
+        if _NUMBER_PATTERN.fullmatch(text) is None:
+            return None
+        with localcontext() as context:
+            context.prec = _PRECISION
+            value = Decimal(text)
+            if self.percent:
+                value /= 100
+            return -value if negative else value
+
+    def _format_scientific(self, number: Decimal) -> str:
+        """Format a non-negative value in scientific notation."""
+        if number.is_zero():
+            mantissa, exponent = "0" + ("." + "0" * self.decimals if self.decimals else ""), 0
+        else:
+            mantissa, _, exponent_text = format(number, ".%dE" % self.decimals).partition("E")
+            exponent = int(exponent_text)
+        return "%sE%s%02d" % (mantissa, "-" if exponent < 0 else "+", abs(exponent))
+
+
+def parse_number_format(fmt: str) -> Optional[NumberFormat]:
+    """Parse a format string into a format that can be applied locally.
+
+    Parameters
+    ----------
+    fmt : str
+        Format string, as accepted by ``IFormat.format``.
+
+    Returns
+    -------
+    Optional[NumberFormat]
+        Parsed format, or ``None`` if the string is not a **Number**,
+        **Currency**, **Percentage**, or **Scientific** format.
+    """
+    text = fmt.strip()
+    negative_braces = len(text) > 1 and text[0] == "(" and text[-1] == ")"
+    if negative_braces:
+        text = text[1:-1]
+    currency = text.startswith("$")
+    if currency:
+        text = text[1:]
+    percent = text.endswith("%")
+    if percent:
+        text = text[:-1]
+    scientific = text.endswith("E+00")
+    if scientific:
+        text = text[:-4]
+    thousands_separator = text.startswith("#,##")
+    if thousands_separator:
+        text = text[4:]
+
+    match = _DIGITS_PATTERN.fullmatch(text)
+    if match is None:
+        return None
+    if percent and (negative_braces or currency or thousands_separator or scientific):
+        return None
+    if scientific and (negative_braces or currency or thousands_separator):
+        return None
+    return NumberFormat(
+        decimals=len(match.group(1) or ""),
+        thousands_separator=thousands_separator or currency,
+        negative_braces=negative_braces,
+        currency=currency,
+        percent=percent,
+        scientific=scientific,
+    )
+
+
+def parse_real(number_format: NumberFormat, string: str) -> Optional[float64]:
+    """Convert a string in the given format to a real value, if possible."""
+    value = number_format.parse_value(string)
+    if value is None:
+        return None
+    try:
+        return float64(float(value))
+    except (InvalidOperation, OverflowError):
+        return None
+
+
+def parse_integer(number_format: NumberFormat, string: str) -> Optional[int]:
+    """Convert a string in the given format to an integer, if it holds
+    one exactly."""
+    if number_format.percent:
+        return None
+    value = number_format.parse_value(string)
+    if value is None or value != value.to_integral_value():
+        return None
+    integer = int(value)
+    if integer < _INT64_INFO.min or integer > _INT64_INFO.max:
+        return None
+    return integer
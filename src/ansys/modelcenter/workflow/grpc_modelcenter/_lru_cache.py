@@ -0,0 +1,167 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Defines the least recently used cache that the engine-scoped caches
+share."""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Generic, Hashable, Optional, TypeVar
+
+KeyType = TypeVar("KeyType", bound=Hashable)
+ValueType = TypeVar("ValueType")
+
+
+class LruCache(Generic[KeyType, ValueType]):
+    """Caches values, evicting the least recently used one when full.
+
+    The cache is disabled by default. While it is disabled, nothing is
+    stored and every lookup misses without being counted. Subclasses can
+    override ``_copy()`` to copy values on the way in and on the way out.
+    """
+
+    def __init__(self, max_size: int):
+        """Initialize an instance.
+
+        Parameters
+        ----------
+        max_size : int
+            Maximum number of entries to keep.
+        """
+        self._check_max_size(max_size)
+        self._max_size: int = max_size
+        self._entries: "OrderedDict[KeyType, ValueType]" = OrderedDict()
+        self._lock = Lock()
+        self._enabled: bool = False
+        self._hits: int = 0
+        self._misses: int = 0
+
+    @staticmethod
+    def _check_max_size(max_size: int) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1.")
+
+    @property
+    def enabled(self) -> bool:
+        """Whether values are cached.
+
+        Disabling the cache also empties it.
+        """
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        self._enabled = value
+        if not value:
+            self.invalidate()
+
+    @property
+    def max_size(self) -> int:
+        """Maximum number of entries to keep.
+
+        Reducing it evicts the least recently used entries that no longer
+        fit.
+        """
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value: int) -> None:
+        self._check_max_size(value)
+        with self._lock:
+            self._max_size = value
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    @property
+    def hits(self) -> int:
+        """Number of lookups answered from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of lookups made while enabled that were not cached."""
+        return self._misses
+
+    def __len__(self) -> int:
+        """Get the number of cached entries."""
+        return len(self._entries)
+
+    def invalidate(self) -> None:
+        """Drop all cached entries.
+
+        The hit and miss counters are not reset.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def get(self, key: KeyType) -> Optional[ValueType]:
+        """Get a cached value.
+
+        Parameters
+        ----------
+        key : KeyType
+            Key the value is cached under.
+
+        Returns
+        -------
+        Optional[ValueType]
+            Cached value, or ``None`` if it is not cached or the cache is
+            disabled.
+        """
+        if not self._enabled:
+            return None
+        with self._lock:
+            value: Optional[ValueType] = self._entries.get(key)
+            if value is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._entries.move_to_end(key)
+        return self._copy(value)
+
+    def put(self, key: KeyType, value: ValueType) -> None:
+        """Cache a value.
+
+        Nothing is stored while the cache is disabled.
+
+        Parameters
+        ----------
+        key : KeyType
+            Key to cache the value under.
+        value : ValueType
+            Value to cache.
+        """
+        if not self._enabled:
+            return
+        copy: ValueType = self._copy(value)
+        with self._lock:
+            self._entries[key] = copy
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def _copy(self, value: ValueType) -> ValueType:
+        """Copy a value on its way into or out of the cache.
+
+        The default keeps the value itself, which suits immutable values.
+        """
+        return value
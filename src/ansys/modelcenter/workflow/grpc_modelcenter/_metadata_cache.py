@@ -0,0 +1,129 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Defines the engine-scoped cache of datapin metadata."""
+
+import functools
+from typing import Callable, Hashable, Optional, Tuple, TypeVar
+
+import ansys.tools.variableinterop as atvi
+from overrides import overrides
+
+from ._lru_cache import LruCache
+
+DEFAULT_METADATA_CACHE_SIZE: int = 1024
+"""Default maximum number of datapins whose metadata is cached."""
+
+MetadataCacheKey = Tuple[str, Hashable]
+"""Element ID and datapin type that metadata is cached under."""
+
+MetadataType = TypeVar("MetadataType", bound=atvi.CommonVariableMetadata)
+
+
+class MetadataCache(LruCache[MetadataCacheKey, atvi.CommonVariableMetadata]):
+    """Caches the metadata of datapins on one engine.
+
+    The cache is disabled by default. While it is enabled, getting the
+    metadata of a datapin whose metadata was fetched before does not make
+    a call to the engine. Setting a datapin's metadata through this client
+    drops its entry. Once the cache holds ``max_size`` entries, adding an
+    entry evicts the least recently used one. Changes made in other ways,
+    such as by another client or by the ModelCenter user interface, are
+    not detected; call ``invalidate()`` after them.
+
+    Metadata objects are copied on the way in and on the way out, so
+    callers may modify the objects they get without affecting the cache.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_METADATA_CACHE_SIZE):
+        """Initialize an instance.
+
+        Parameters
+        ----------
+        max_size : int, optional
+            Maximum number of entries to keep.
+        """
+        super().__init__(max_size)
+
+    @overrides
+    def invalidate(self, element_id: Optional[str] = None) -> None:
+        """Drop cached entries.
+
+        The hit and miss counters are not reset.
+
+        Parameters
+        ----------
+        element_id : str, optional
+            ID of the datapin whose entries to drop. If not given, all
+            entries are dropped.
+        """
+        with self._lock:
+            if element_id is None:
+                self._entries.clear()
+            else:
+                for key in [key for key in self._entries if key[0] == element_id]:
+                    del self._entries[key]
+
+    @overrides
+    def _copy(self, value: atvi.CommonVariableMetadata) -> atvi.CommonVariableMetadata:
+        return value.clone()
+
+
+def cached_metadata(
+    get_metadata: Callable[..., MetadataType],
+) -> Callable[..., MetadataType]:
+    """Decorate a datapin's ``get_metadata`` method so that it uses the
+    engine's metadata cache.
+
+    Entries are keyed by the datapin's element ID and class.
+    """
+
+    @functools.wraps(get_metadata)
+    def wrapper(self) -> MetadataType:
+        cache: MetadataCache = self._engine.metadata_cache
+        key: MetadataCacheKey = (self._element_id.id_string, type(self))
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+        metadata: MetadataType = get_metadata(self)
+        cache.put(key, metadata)
+        return metadata
+
+    return wrapper
+
+
+def invalidates_metadata(set_metadata: Callable[..., None]) -> Callable[..., None]:
+    """Decorate a datapin's ``set_metadata`` method so that it drops the
+    datapin's entries from the engine's metadata cache.
+
+    The entries are dropped even if setting the metadata fails, because
+    the metadata on the engine may then be unknown.
+    """
+
+    @functools.wraps(set_metadata)
+    def wrapper(self, *args, **kwargs) -> None:
+        try:
+            set_metadata(self, *args, **kwargs)
+        finally:
+            self._engine.metadata_cache.invalidate(self._element_id.id_string)
+
+    return wrapper
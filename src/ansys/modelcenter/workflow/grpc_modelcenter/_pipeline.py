@@ -0,0 +1,99 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Provides helpers for issuing many unary gRPC calls without waiting on each
+round trip in turn."""
+
+from collections import deque
+from typing import Any, Callable, Deque, Iterable, Iterator, Optional
+
+import grpc
+
+DEFAULT_MAX_IN_FLIGHT: int = 16
+"""Default number of calls that bulk operations allow to be outstanding at once."""
+
+
+def pipeline_calls(
+    grpc_call: Callable,
+    requests: Iterable[Any],
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    return_exceptions: bool = False,
+) -> Iterator[Any]:
+    """Issue a unary gRPC call once per request, keeping several calls in
+    flight.
+
+    Responses are yielded in the same order as the requests. If the call
+    object does not support ``future()`` (for example, a test double),
+    the calls are made one at a time instead.
+
+    Parameters
+    ----------
+    grpc_call : Callable
+        Unary stub method to invoke, for example ``stub.VariableGetState``.
+    requests : Iterable[Any]
+        Request messages to send. The iterable is consumed lazily, so
+        requests can be built while earlier calls are still in flight.
+    max_in_flight : int
+        Maximum number of calls that may be outstanding at once.
+    return_exceptions : bool
+        Whether to yield the ``grpc.RpcError`` of a failed call in place of
+        its response, instead of raising it. The other calls carry on.
+
+    Returns
+    -------
+    Iterator[Any]
+        Response messages, in request order.
+
+    Raises
+    ------
+    grpc.RpcError
+        If any call fails and ``return_exceptions`` is ``False``. Calls
+        that are still outstanding are cancelled.
+    """
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be at least 1.")
+
+    def get_result(call: Callable, *args: Any) -> Any:
+        if not return_exceptions:
+            return call(*args)
+        try:
+            return call(*args)
+        except grpc.RpcError as rpc_error:
+            return rpc_error
+
+    start_call: Optional[Callable] = getattr(grpc_call, "future", None)
+    if start_call is None:
+        for request in requests:
+            yield get_result(grpc_call, request)
+        return
+
+    in_flight: Deque = deque()
+    try:
+        for request in requests:
+            if len(in_flight) >= max_in_flight:
+                yield get_result(in_flight.popleft().result)
+            in_flight.append(start_call(request))
+        while len(in_flight) > 0:
+            yield get_result(in_flight.popleft().result)
+    finally:
+        for outstanding in in_flight:
+            outstanding.cancel()
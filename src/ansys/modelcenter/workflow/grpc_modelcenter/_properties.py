@@ -0,0 +1,95 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Provides helpers for reading the properties of several elements."""
+
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from ansys.api.modelcenter.v0.custom_metadata_messages_pb2 import MetadataGetValueRequest
+from ansys.api.modelcenter.v0.element_messages_pb2 import ElementId
+from ansys.api.modelcenter.v0.grpc_modelcenter_workflow_pb2_grpc import (
+    ModelCenterWorkflowServiceStub,
+)
+import ansys.engineeringworkflow.api as aew_api
+
+from ._pipeline import DEFAULT_MAX_IN_FLIGHT, pipeline_calls
+from .var_value_convert import convert_grpc_value_to_atvi
+
+
+def get_element_properties(
+    client: ModelCenterWorkflowServiceStub,
+    targets: Mapping[str, ElementId],
+    engine_is_local: bool,
+    property_names: Optional[Iterable[str]] = None,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+) -> Dict[str, Dict[str, aew_api.Property]]:
+    """Read the properties of several elements with concurrent calls.
+
+    Parameters
+    ----------
+    client : ModelCenterWorkflowServiceStub
+        Client to make the calls with.
+    targets : Mapping[str, ElementId]
+        Elements to read, keyed by the name to return their properties
+        under.
+    engine_is_local : bool
+        Whether the engine is running on the local machine.
+    property_names : Optional[Iterable[str]]
+        Names of the properties to read from every element. If ``None``,
+        every property of each element is read.
+    max_in_flight : int
+        Maximum number of calls to have outstanding at once.
+
+    Returns
+    -------
+    Dict[str, Dict[str, aew_api.Property]]
+        Properties of each element keyed by property name, keyed as in
+        ``targets``.
+    """
+    names_by_key: Dict[str, List[str]]
+    if property_names is None:
+        responses = pipeline_calls(
+            client.PropertyOwnerGetProperties, targets.values(), max_in_flight
+        )
+        names_by_key = {
+            key: list(response.names) for key, response in zip(targets.keys(), responses)
+        }
+    else:
+        names = list(property_names)
+        names_by_key = {key: names for key in targets.keys()}
+
+    reads: List[Tuple[str, str]] = [
+        (key, name) for key, names in names_by_key.items() for name in names
+    ]
+    values = pipeline_calls(
+        client.PropertyOwnerGetPropertyValue,
+        (MetadataGetValueRequest(id=targets[key], property_name=name) for key, name in reads),
+        max_in_flight,
+    )
+    properties: Dict[str, Dict[str, aew_api.Property]] = {key: {} for key in targets.keys()}
+    for (key, name), value in zip(reads, values):
+        properties[key][name] = aew_api.Property(
+            parent_element_id=targets[key].id_string,
+            property_name=name,
+            property_value=convert_grpc_value_to_atvi(value, engine_is_local),
+        )
+    return properties
@@ -23,4 +23,4 @@
 """Visitor patterns implemented in
 ansys.modelcenter.workflow.grpc_modelcenter."""
 
-from .variable_value_visitor import VariableValueVisitor
+from .variable_value_visitor import SetValueRequestVisitor, VariableValueVisitor
@@ -21,7 +21,7 @@
 # SOFTWARE.
 
 from contextlib import ExitStack
-from typing import Callable, Type
+from typing import Any, Tuple, Type
 
 import ansys.api.modelcenter.v0.element_messages_pb2 as element_msg
 from ansys.api.modelcenter.v0.grpc_modelcenter_workflow_pb2_grpc import (
@@ -33,150 +33,153 @@ import ansys.tools.variableinterop as atvi
 import numpy as np
 from overrides import overrides
 
+from ansys.modelcenter.workflow.grpc_modelcenter._array_convert import convert_numpy_to_grpc_array
 from ansys.modelcenter.workflow.grpc_modelcenter.var_value_convert import ValueTypeNotSupportedError
 
+SetValueRequest = Tuple[str, Any]
+"""Name of the stub method to call and the request message to send to it."""
 
-class VariableValueVisitor(atvi.IVariableValueVisitor[bool]):
-    """Provides the visitor for setting datapin values with the ModelCenter
-    gRPC API."""
+
+class SetValueRequestVisitor(atvi.IVariableValueVisitor[SetValueRequest]):
+    """Provides the visitor for building the request that sets a datapin value
+    with the ModelCenter gRPC API.
+
+    The visitor does not send the request, so the same request can be
+    sent with a synchronous stub, an asynchronous stub, or as part of a
+    batch.
+    """
 
     def __init__(
         self,
         var_id: element_msg.ElementId,
-        stub: ModelCenterWorkflowServiceStub,
         engine_is_local: bool,
+        local_file_context_stack: ExitStack,
     ):
-        """Create a VariableValueVisitor.
+        """Create a SetValueRequestVisitor.
 
         Parameters
         ----------
         var_id : element_msg.ElementId
             ID of the datapin to set.
-        stub : ModelCenterWorkflowServiceStub
-            gRPC stub to use.
         engine_is_local : bool
             Whether the engine is running locally or on a remote machine.
+        local_file_context_stack : ExitStack
+            Exit stack to open local file content contexts in. These must
+            stay open until the request has been sent. It is the caller's
+            responsibility to close or exit this object.
         """
         self._var_id = var_id
-        self._stub = stub
         self._engine_is_local = engine_is_local
+        self._local_file_context_stack = local_file_context_stack
 
     @overrides
-    def visit_integer(self, value: atvi.IntegerValue) -> bool:
+    def visit_integer(self, value: atvi.IntegerValue) -> SetValueRequest:
         return self._scalar_request(
-            value, var_val_msg.SetIntegerValueRequest, int, self._stub.IntegerVariableSetValue
+            value, var_val_msg.SetIntegerValueRequest, int, "IntegerVariableSetValue"
         )
 
     @overrides
-    def visit_real(self, value: atvi.RealValue) -> bool:
+    def visit_real(self, value: atvi.RealValue) -> SetValueRequest:
         return self._scalar_request(
-            value, var_val_msg.SetDoubleValueRequest, float, self._stub.DoubleVariableSetValue
+            value, var_val_msg.SetDoubleValueRequest, float, "DoubleVariableSetValue"
         )
 
     @overrides
-    def visit_boolean(self, value: atvi.BooleanValue) -> bool:
+    def visit_boolean(self, value: atvi.BooleanValue) -> SetValueRequest:
         return self._scalar_request(
-            value, var_val_msg.SetBooleanValueRequest, bool, self._stub.BooleanVariableSetValue
+            value, var_val_msg.SetBooleanValueRequest, bool, "BooleanVariableSetValue"
         )
 
     @overrides
-    def visit_string(self, value: atvi.StringValue) -> bool:
+    def visit_string(self, value: atvi.StringValue) -> SetValueRequest:
         return self._scalar_request(
-            value, var_val_msg.SetStringValueRequest, str, self._stub.StringVariableSetValue
+            value, var_val_msg.SetStringValueRequest, str, "StringVariableSetValue"
         )
 
     @overrides
-    def visit_file(self, value: atvi.FileValue) -> bool:
+    def visit_file(self, value: atvi.FileValue) -> SetValueRequest:
         if self._engine_is_local:
-            with value.get_reference_to_actual_content_file() as local_pin:
-                value_in_request = var_val_msg.FileValue()
-                if local_pin.content_path is not None:
-                    value_in_request.content_path = str(local_pin.content_path)
-                request = var_val_msg.SetFileValueRequest(
-                    target=self._var_id, new_value=value_in_request
-                )
-                response = self._stub.FileVariableSetValue(request)
-                return response.was_changed
+            local_pin: atvi.LocalFileContentContext = self._local_file_context_stack.enter_context(
+                value.get_reference_to_actual_content_file()
+            )
+            value_in_request = var_val_msg.FileValue()
+            if local_pin.content_path is not None:
+                value_in_request.content_path = str(local_pin.content_path)
+            request = var_val_msg.SetFileValueRequest(
+                target=self._var_id, new_value=value_in_request
+            )
+            return "FileVariableSetValue", request
         else:
             raise ValueTypeNotSupportedError(
                 "Setting file values is not currently supported for " "remote engines."
             )
 
     @overrides
-    def visit_integer_array(self, value: atvi.IntegerArrayValue) -> bool:
+    def visit_integer_array(self, value: atvi.IntegerArrayValue) -> SetValueRequest:
         return self._array_request(
             value,
             var_val_msg.SetIntegerArrayValueRequest,
             var_val_msg.IntegerArrayValue,
-            self._stub.IntegerArraySetValue,
+            "IntegerArraySetValue",
         )
 
     @overrides
-    def visit_real_array(self, value: atvi.RealArrayValue) -> bool:
+    def visit_real_array(self, value: atvi.RealArrayValue) -> SetValueRequest:
         return self._array_request(
             value,
             var_val_msg.SetDoubleArrayValueRequest,
             var_val_msg.DoubleArrayValue,
-            self._stub.DoubleArraySetValue,
+            "DoubleArraySetValue",
         )
 
     @overrides
-    def visit_boolean_array(self, value: atvi.BooleanArrayValue) -> bool:
+    def visit_boolean_array(self, value: atvi.BooleanArrayValue) -> SetValueRequest:
         return self._array_request(
             value,
             var_val_msg.SetBooleanArrayValueRequest,
             var_val_msg.BooleanArrayValue,
-            self._stub.BooleanArraySetValue,
+            "BooleanArraySetValue",
         )
 
     @overrides
-    def visit_string_array(self, value: atvi.StringArrayValue) -> bool:
+    def visit_string_array(self, value: atvi.StringArrayValue) -> SetValueRequest:
         return self._array_request(
             value,
             var_val_msg.SetStringArrayValueRequest,
             var_val_msg.StringArrayValue,
-            self._stub.StringArraySetValue,
+            "StringArraySetValue",
         )
 
     @overrides
-    def visit_file_array(self, value: atvi.FileArrayValue) -> bool:
+    def visit_file_array(self, value: atvi.FileArrayValue) -> SetValueRequest:
         if self._engine_is_local:
-            with ExitStack() as local_content_copy_stack:
-                request = var_val_msg.SetFileArrayValueRequest(
-                    target=self._var_id,
-                    new_value=var_val_msg.FileArrayValue(
-                        dims=var_val_msg.ArrayDimensions(dims=value.get_lengths())
-                    ),
-                )
-                one_file_value: atvi.FileValue
-                for one_file_value in value.flatten():
-                    one_local_content: atvi.LocalFileContentContext = (
-                        local_content_copy_stack.enter_context(
-                            one_file_value.get_reference_to_actual_content_file()
-                        )
-                    )
-                    one_grpc_file_value = var_val_msg.FileValue()
-                    if one_local_content.content_path is not None:
-                        one_grpc_file_value.content_path = str(one_local_content.content_path)
-                    request.new_value.values.add(content_path=one_local_content.content_path)
-                response = self._stub.FileArraySetValue(request)
-                return response.was_changed
-            # This line should only be reachable if one of the context managers in
-            # local_content_copy_stack suppress an exception, which they should not
-            # be doing.
-            raise aew_api.EngineInternalError(
-                "Reached an unexpected state. A local file content context may be suppressing an "
-                "exception. Report this error on the PyModelCenter repository's Issues page."
+            request = var_val_msg.SetFileArrayValueRequest(
+                target=self._var_id,
+                new_value=var_val_msg.FileArrayValue(
+                    dims=var_val_msg.ArrayDimensions(dims=value.get_lengths())
+                ),
             )
+            one_file_value: atvi.FileValue
+            for one_file_value in value.flatten():
+                one_local_content: atvi.LocalFileContentContext = (
+                    self._local_file_context_stack.enter_context(
+                        one_file_value.get_reference_to_actual_content_file()
+                    )
+                )
+                one_grpc_file_value = var_val_msg.FileValue()
+                if one_local_content.content_path is not None:
+                    one_grpc_file_value.content_path = str(one_local_content.content_path)
+                request.new_value.values.add(content_path=one_local_content.content_path)
+            return "FileArraySetValue", request
         else:
             raise ValueTypeNotSupportedError(
                 "Setting file array values is not currently " "supported for remote engines."
             )
 
     def _scalar_request(
-        self, value: atvi.IVariableValue, request_type: Type, value_type: Type, grpc_call: Callable
-    ) -> bool:
-        """Use this helper method to send a gRPC request for setting scalar
+        self, value: atvi.IVariableValue, request_type: Type, value_type: Type, grpc_call: str
+    ) -> SetValueRequest:
+        """Use this helper method to build a gRPC request for setting scalar
         values.
 
         Parameters
@@ -188,27 +191,26 @@ class VariableValueVisitor(atvi.IVariableValueVisitor[bool]):
         value_type : Type
             Type of the value to set, from protobuf. For example, ``int`` or
             ``float``.
-        grpc_call : Callable
-            Method to use to make the gRPC call. For example,
+        grpc_call : str
+            Name of the stub method the request is for. For example,
             ``IntegerVariableSetValue``.
 
         Returns
         -------
-        bool
-            was_changed from the response message.
+        SetValueRequest
+            Name of the stub method and the request to send to it.
         """
         request = request_type(target=self._var_id, new_value=value_type(value))
-        response = grpc_call(request)
-        return response.was_changed
+        return grpc_call, request
 
     def _array_request(
         self,
         value: atvi.CommonArrayValue,
         request_type: Type,
         value_type: Type,
-        grpc_call: Callable,
-    ):
-        """Use this helper method to send a gRPC request for setting array
+        grpc_call: str,
+    ) -> SetValueRequest:
+        """Use this helper method to build a gRPC request for setting array
         values.
 
         Parameters
@@ -220,21 +222,118 @@ class VariableValueVisitor(atvi.IVariableValueVisitor[bool]):
         value_type: Type
             Type of the value to set, from protobuf. For example,
             ``IntegerArrayValue`` or ``DoubleArrayValue``.
-        grpc_call: Callable
-            Method to use to make the gRPC call. For example,
+        grpc_call: str
+            Name of the stub method the request is for. For example,
             ``IntegerArraySetValue``.
 
         Returns
         -------
-        bool
-            was_changed from the response message.
+        SetValueRequest
+            Name of the stub method and the request to send to it.
         """
-        set_value = value_type(values=value.flatten(), dims=self._dims(value))
+        if value_type is var_val_msg.StringArrayValue:
+            set_value = value_type(values=value.flatten(), dims=self._dims(value))
+        else:
+            set_value = convert_numpy_to_grpc_array(value_type, value)
         request = request_type(target=self._var_id, new_value=set_value)
-        response = grpc_call(request)
-        return response.was_changed
+        return grpc_call, request
 
     @staticmethod
     def _dims(array: atvi.CommonArrayValue) -> var_val_msg.ArrayDimensions:
         """Use this helper method to get array dimensions (protobuf)."""
         return var_val_msg.ArrayDimensions(dims=np.array(array.get_lengths()).flatten())
+
+
+class VariableValueVisitor(atvi.IVariableValueVisitor[bool]):
+    """Provides the visitor for setting datapin values with the ModelCenter
+    gRPC API."""
+
+    def __init__(
+        self,
+        var_id: element_msg.ElementId,
+        stub: ModelCenterWorkflowServiceStub,
+        engine_is_local: bool,
+    ):
+        """Create a VariableValueVisitor.
+
+        Parameters
+        ----------
+        var_id : element_msg.ElementId
+            ID of the datapin to set.
+        stub : ModelCenterWorkflowServiceStub
+            gRPC stub to use.
+        engine_is_local : bool
+            Whether the engine is running locally or on a remote machine.
+        """
+        self._var_id = var_id
+        self._stub = stub
+        self._engine_is_local = engine_is_local
+
+    @overrides
+    def visit_integer(self, value: atvi.IntegerValue) -> bool:
+        return self._send(value)
+
+    @overrides
+    def visit_real(self, value: atvi.RealValue) -> bool:
+        return self._send(value)
+
+    @overrides
+    def visit_boolean(self, value: atvi.BooleanValue) -> bool:
+        return self._send(value)
+
+    @overrides
+    def visit_string(self, value: atvi.StringValue) -> bool:
+        return self._send(value)
+
+    @overrides
+    def visit_file(self, value: atvi.FileValue) -> bool:
+        return self._send(value)
+
+    @overrides
+    def visit_integer_array(self, value: atvi.IntegerArrayValue) -> bool:
+        return self._send(value)
+
+    @overrides
+    def visit_real_array(self, value: atvi.RealArrayValue) -> bool:
+        return self._send(value)
+
+    @overrides
+    def visit_boolean_array(self, value: atvi.BooleanArrayValue) -> bool:
+        return self._send(value)
+
+    @overrides
+    def visit_string_array(self, value: atvi.StringArrayValue) -> bool:
+        return self._send(value)
+
+    @overrides
+    def visit_file_array(self, value: atvi.FileArrayValue) -> bool:
+        return self._send(value)
+
+    def _send(self, value: atvi.IVariableValue) -> bool:
+        """Build the request for the given value and send it.
+
+        Parameters
+        ----------
+        value : atvi.IVariableValue
+            New value to set.
+
+        Returns
+        -------
+        bool
+            was_changed from the response message.
+        """
+        with ExitStack() as local_file_context_stack:
+            grpc_call, request = value.accept(
+                SetValueRequestVisitor(
+                    self._var_id, self._engine_is_local, local_file_context_stack
+                )
+            )
+            response = getattr(self._stub, grpc_call)(request)
+            return response.was_changed
+        # This line should only be reachable if one of the context managers in
+        # local_file_context_stack suppress an exception, which they should not
+        # be doing.
+        raise aew_api.EngineInternalError(
+            "Reached an unexpected state. A local file content context may be suppressing an "
+            "exception. Report this error on the PyModelCenter repository's Issues page."
+        )
@@ -50,14 +50,14 @@ class AbstractAssemblyChild(abstract_wfe.AbstractWorkflowElement, mc_api.IAssemb
         super(AbstractAssemblyChild, self).__init__(element_id=element_id, engine=engine)
 
     @property
-    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
     @overrides
     def index_in_parent(self) -> int:
         response = self._client.ElementGetIndexInParent(self._element_id)
         return response.index
 
     @property
-    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
     @overrides
     def parent_assembly(self) -> Optional[mc_api.IAssembly]:
         result = self.get_parent_element()
@@ -70,7 +70,7 @@ class AbstractAssemblyChild(abstract_wfe.AbstractWorkflowElement, mc_api.IAssemb
             return result
 
     @property
-    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
     def control_type(self) -> str:
         """Control type of the item.
 
@@ -82,7 +82,7 @@ class AbstractAssemblyChild(abstract_wfe.AbstractWorkflowElement, mc_api.IAssemb
         result = self._client.RegistryGetControlType(self._element_id)
         return result.type
 
-    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
     @overrides
     def get_analysis_view_position(self) -> Tuple[int, int]:
         response = self._client.AssemblyGetAnalysisViewPosition(self._element_id)
@@ -72,7 +72,7 @@ class AbstractControlStatement(
         """
         super(AbstractControlStatement, self).__init__(element_id=element_id, engine=engine)
 
-    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
     @overrides
     def get_elements(self) -> Mapping[str, aew_api.IElement]:
         result = self._client.AssemblyGetAssembliesAndComponents(self._element_id)
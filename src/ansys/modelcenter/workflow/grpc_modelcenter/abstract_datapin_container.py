@@ -23,12 +23,16 @@
 """Defines the abstract base class for the datapin container."""
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Mapping
+from typing import TYPE_CHECKING, Dict, Iterable, List, Mapping, Optional, Union
 
+import ansys.tools.variableinterop as atvi
+import numpy as np
 from overrides import overrides
 
 import ansys.modelcenter.workflow.api as mc_api
 
+from ._datapin_states import get_datapin_states
+from ._pipeline import DEFAULT_MAX_IN_FLIGHT, pipeline_calls
 from .abstract_workflow_element import AbstractWorkflowElement
 from .create_datapin import create_datapin
 
@@ -36,10 +40,12 @@ if TYPE_CHECKING:
     from .engine import Engine
     from .group import Group
 
-from ansys.api.modelcenter.v0.element_messages_pb2 import ElementId
+from ansys.api.modelcenter.v0.element_messages_pb2 import ElementId, ElementName
 from ansys.api.modelcenter.v0.variable_value_messages_pb2 import VariableInfo
+from ansys.api.modelcenter.v0.workflow_messages_pb2 import ElementIdOrName, NamedElementWorkflow
 
-from .grpc_error_interpretation import WRAP_TARGET_NOT_FOUND, interpret_rpc_error
+from .grpc_error_interpretation import WRAP_INVALID_ARG, WRAP_TARGET_NOT_FOUND, interpret_rpc_error
+from .var_value_convert import convert_interop_states_to_structured
 
 
 class AbstractGRPCDatapinContainer(AbstractWorkflowElement, mc_api.IGroupOwner, ABC):
@@ -78,7 +84,7 @@ class AbstractGRPCDatapinContainer(AbstractWorkflowElement, mc_api.IGroupOwner,
         """
         super(AbstractGRPCDatapinContainer, self).__init__(element_id=element_id, engine=engine)
 
-    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
     @overrides
     def get_groups(self) -> Mapping[str, mc_api.IGroup]:
         # LTTODO: alter gRPC response so that short names are included in the first place.
@@ -89,7 +95,7 @@ class AbstractGRPCDatapinContainer(AbstractWorkflowElement, mc_api.IGroupOwner,
         one_group: "Group"
         return {one_group.name: one_group for one_group in groups}
 
-    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
     @overrides
     def get_datapins(self) -> Mapping[str, mc_api.IDatapin]:
         # LTTODO: alter gRPC response so that short names are included in the first place.
@@ -101,3 +107,64 @@ class AbstractGRPCDatapinContainer(AbstractWorkflowElement, mc_api.IGroupOwner,
         ]
         one_variable: mc_api.IDatapin
         return {one_variable.name: one_variable for one_variable in variables}
+
+    @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND, **WRAP_INVALID_ARG}, idempotent=True)
+    def get_datapin_states(
+        self,
+        datapins: Optional[Iterable[Union[str, mc_api.IDatapin]]] = None,
+        as_structured: bool = False,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ) -> Union[Dict[str, atvi.VariableState], np.ma.MaskedArray]:
+        """Get the states of several child datapins at once.
+
+        The states are requested without waiting for each earlier request
+        to return, with at most ``max_in_flight`` requests outstanding.
+
+        Parameters
+        ----------
+        datapins : Optional[Iterable[Union[str, mc_api.IDatapin]]], optional
+            Datapins to read, given as names relative to this element or as
+            datapin objects. By default, all child datapins are read.
+        as_structured : bool, optional
+            Whether to return a NumPy structured record instead of a
+            dictionary. This is only possible if every datapin is a scalar
+            real or integer. The default is ``False``.
+        max_in_flight : int, optional
+            Maximum number of requests to have outstanding at once.
+
+        Returns
+        -------
+        Union[Dict[str, atvi.VariableState], np.ma.MaskedArray]
+            States of the datapins, keyed by name relative to this element.
+            If ``as_structured`` is ``True``, a zero-dimensional masked
+            array with one field per datapin, with invalid values masked.
+        """
+        targets: Dict[str, ElementIdOrName] = {}
+        unnamed_ids: List[ElementId] = []
+        if datapins is None:
+            for one_var_info in self._client.RegistryGetVariables(self._element_id).variables:
+                if one_var_info.short_name != "":
+                    targets[one_var_info.short_name] = ElementIdOrName(target_id=one_var_info.id)
+                else:
+                    unnamed_ids.append(one_var_info.id)
+        else:
+            pins: List[Union[str, mc_api.IDatapin]] = list(datapins)
+            unnamed_ids = [
+                ElementId(id_string=pin.element_id) for pin in pins if not isinstance(pin, str)
+            ]
+            named_pins: List[str] = [pin for pin in pins if isinstance(pin, str)]
+            if len(named_pins) > 0:
+                own_name: str = self.full_name
+                for name in named_pins:
+                    targets[name] = ElementIdOrName(
+                        target_name=NamedElementWorkflow(
+                            element_full_name=ElementName(name=f"{own_name}.{name}")
+                        )
+                    )
+        short_names: Iterable[ElementName] = pipeline_calls(
+            self._client.ElementGetName, unnamed_ids, max_in_flight
+        )
+        for pin_id, short_name in zip(unnamed_ids, short_names):
+            targets[short_name.name] = ElementIdOrName(target_id=pin_id)
+        states = get_datapin_states(self._client, targets, self._engine.is_local, max_in_flight)
+        return convert_interop_states_to_structured(states) if as_structured else states
@@ -69,3 +69,4 @@ class AbstractRenamableElement(abstract_wfe.AbstractWorkflowElement, mc_api.IRen
         self._client.AssemblyRename(
             RenameRequest(target_assembly=self._element_id, new_name=ElementName(name=new_name))
         )
+        self._engine._notify_structure_changed()
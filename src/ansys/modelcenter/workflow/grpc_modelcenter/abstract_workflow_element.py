@@ -23,12 +23,11 @@
 """Defines the abstract base class for gRPC-backed workflow elements."""
 
 from abc import ABC
-from typing import TYPE_CHECKING, AbstractSet, Mapping, Optional
+from typing import TYPE_CHECKING, AbstractSet, Iterable, Mapping, Optional
 
 import ansys.engineeringworkflow.api as aew_api
 from ansys.engineeringworkflow.api import Property
 import ansys.tools.variableinterop as atvi
-import grpc
 from overrides import overrides
 
 import ansys.modelcenter.workflow.grpc_modelcenter.element_wrapper as elem_wrapper
@@ -46,6 +45,8 @@ from ansys.api.modelcenter.v0.grpc_modelcenter_workflow_pb2_grpc import (
 )
 from ansys.api.modelcenter.v0.variable_value_messages_pb2 import VariableValue
 
+from ._pipeline import DEFAULT_MAX_IN_FLIGHT
+from ._properties import get_element_properties
 from .grpc_error_interpretation import WRAP_INVALID_ARG, WRAP_TARGET_NOT_FOUND, interpret_rpc_error
 from .var_value_convert import convert_grpc_value_to_atvi, convert_interop_value_to_grpc
 
@@ -53,8 +54,9 @@ from .var_value_convert import convert_grpc_value_to_atvi, convert_interop_value
 class AbstractWorkflowElement(aew_api.IElement, ABC):
     """Defines the abstract base class for gRPC-backed workflow elements."""
 
-    def _create_client(self, channel: grpc.Channel) -> ModelCenterWorkflowServiceStub:
-        return ModelCenterWorkflowServiceStub(channel)  # pragma: no cover
+    def _create_client(self, engine: "Engine") -> ModelCenterWorkflowServiceStub:
+        """Get the engine's shared workflow client."""
+        return engine._get_shared_stub(ModelCenterWorkflowServiceStub)
 
     def __init__(self, element_id: ElementId, engine: "Engine"):
         """Initialize an instance.
@@ -67,7 +69,7 @@ class AbstractWorkflowElement(aew_api.IElement, ABC):
             Engine that created the element.
         """
         self._engine = engine
-        self._client: ModelCenterWorkflowServiceStub = self._create_client(engine.channel)
+        self._client: ModelCenterWorkflowServiceStub = self._create_client(engine)
         self._element_id: ElementId = element_id
 
     @property
@@ -76,27 +78,27 @@ class AbstractWorkflowElement(aew_api.IElement, ABC):
         return self._element_id.id_string
 
     @property
-    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
     @overrides
     def parent_element_id(self) -> str:
         result = self._client.ElementGetParentElement(self._element_id)
         return result.id.id_string
 
     @property
-    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
     @overrides
     def name(self) -> str:
         result = self._client.ElementGetName(self._element_id)
         return result.name
 
     @property
-    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
     @overrides
     def full_name(self) -> str:
         result = self._client.ElementGetFullName(self._element_id)
         return result.name
 
-    @interpret_rpc_error({**WRAP_INVALID_ARG, **WRAP_TARGET_NOT_FOUND})
+    @interpret_rpc_error({**WRAP_INVALID_ARG, **WRAP_TARGET_NOT_FOUND}, idempotent=True)
     @overrides
     def get_property(self, property_name: str) -> aew_api.Property:
         grpc_value: VariableValue = self._client.PropertyOwnerGetPropertyValue(
@@ -109,17 +111,45 @@ class AbstractWorkflowElement(aew_api.IElement, ABC):
             property_value=atvi_value,
         )
 
-    @interpret_rpc_error({**WRAP_INVALID_ARG, **WRAP_TARGET_NOT_FOUND})
+    @interpret_rpc_error({**WRAP_INVALID_ARG, **WRAP_TARGET_NOT_FOUND}, idempotent=True)
     @overrides
     def get_property_names(self) -> AbstractSet[str]:
         response = self._client.PropertyOwnerGetProperties(self._element_id)
         return set([name for name in response.names])
 
-    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @interpret_rpc_error({**WRAP_INVALID_ARG, **WRAP_TARGET_NOT_FOUND}, idempotent=True)
     @overrides
-    def get_properties(self) -> Mapping[str, Property]:
-        response = self._client.PropertyOwnerGetProperties(self._element_id)
-        return {name: self.get_property(property_name=name) for name in response.names}
+    def get_properties(
+        self,
+        property_names: Optional[Iterable[str]] = None,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ) -> Mapping[str, Property]:
+        """Get the properties of the element.
+
+        The property values are requested without waiting for each earlier
+        request to return, with at most ``max_in_flight`` requests
+        outstanding.
+
+        Parameters
+        ----------
+        property_names : Optional[Iterable[str]], optional
+            Names of the properties to get. The default is every property
+            of the element.
+        max_in_flight : int, optional
+            Maximum number of requests to have outstanding at once.
+
+        Returns
+        -------
+        Mapping[str, Property]
+            Properties of the element, keyed by name.
+        """
+        return get_element_properties(
+            self._client,
+            {self._element_id.id_string: self._element_id},
+            self._engine.is_local,
+            property_names,
+            max_in_flight,
+        )[self._element_id.id_string]
 
     @interpret_rpc_error({**WRAP_INVALID_ARG, **WRAP_TARGET_NOT_FOUND})
     @overrides
@@ -133,7 +163,7 @@ class AbstractWorkflowElement(aew_api.IElement, ABC):
             )
         )
 
-    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
     @overrides
     def get_parent_element(self) -> Optional[aew_api.IElement]:
         result = self._client.ElementGetParentElement(self._element_id)
@@ -0,0 +1,48 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Implements an asyncio version of the gRPC-based ModelCenter Workflow API.
+
+The classes in this package provide a subset of ``Engine``, ``Workflow``,
+and the datapin classes, with coroutines that use ``grpc.aio`` channels.
+Many calls can be in flight at once from a single event loop without
+dedicating a thread to each call.
+
+The subset covers running workflows and reading and writing datapins:
+
+- ``AsyncEngine`` starts ModelCenter, creates and loads workflows, and
+  gets preferences, units, and server information.
+- ``AsyncWorkflow`` runs, halts, and saves the workflow, and gets datapins
+  and their states by name.
+- ``AsyncDatapin`` handles the state, metadata, properties, and
+  dependencies of datapins of every type, including reference datapins.
+
+Components, assemblies, links, and formatters are not available. Editing
+the structure of a workflow, ``AsyncEngine.get_formatter()``, and
+``AsyncDatapin.get_parent_element()`` have no asyncio versions. Use the
+synchronous classes for them. Properties of the synchronous classes that
+make calls to the engine, such as ``name``, are ``get_`` coroutines here.
+"""
+
+from .datapin import AsyncDatapin
+from .engine import AsyncEngine
+from .workflow import AsyncWorkflow
@@ -0,0 +1,620 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Defines the asyncio datapin."""
+
+import asyncio
+from contextlib import ExitStack
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Type,
+)
+
+from ansys.api.modelcenter.v0.custom_metadata_messages_pb2 import (
+    MetadataGetValueRequest,
+    MetadataSetValueRequest,
+)
+import ansys.api.modelcenter.v0.element_messages_pb2 as element_msg
+from ansys.api.modelcenter.v0.grpc_modelcenter_workflow_pb2_grpc import (
+    ModelCenterWorkflowServiceStub,
+)
+import ansys.api.modelcenter.v0.variable_value_messages_pb2 as var_val_msg
+from ansys.api.modelcenter.v0.workflow_messages_pb2 import ElementIdOrName
+import ansys.engineeringworkflow.api as aew_api
+import ansys.tools.variableinterop as atvi
+
+from .._bulk_access import SCALAR_REFERENCE_VALUE_TYPES
+from .._datapin_states import convert_grpc_state_to_atvi
+from .._visitors import SetValueRequestVisitor
+from ..grpc_error_interpretation import (
+    WRAP_INVALID_ARG,
+    WRAP_OUT_OF_BOUNDS,
+    WRAP_TARGET_NOT_FOUND,
+    interpret_rpc_error,
+)
+from ..reference_datapin_metadata import ReferenceDatapinMetadata
+from ..var_metadata_convert import (
+    convert_grpc_boolean_array_metadata,
+    convert_grpc_boolean_metadata,
+    convert_grpc_file_array_metadata,
+    convert_grpc_file_metadata,
+    convert_grpc_integer_array_metadata,
+    convert_grpc_integer_metadata,
+    convert_grpc_real_array_metadata,
+    convert_grpc_real_metadata,
+    convert_grpc_reference_metadata,
+    convert_grpc_string_array_metadata,
+    convert_grpc_string_metadata,
+    fill_boolean_metadata_message,
+    fill_file_metadata_message,
+    fill_integer_metadata_message,
+    fill_real_metadata_message,
+    fill_reference_metadata_message,
+    fill_string_metadata_message,
+)
+from ..var_value_convert import (
+    convert_grpc_value_to_atvi,
+    convert_interop_value_to_grpc,
+    grpc_type_enum_to_interop_type,
+)
+
+if TYPE_CHECKING:
+    from .engine import AsyncEngine
+
+
+class _DatapinTypeInfo(NamedTuple):
+    """Describes how to handle the values and metadata of one datapin type."""
+
+    value_type: Optional[Type[atvi.IVariableValue]]
+    """Interop type that new values are coerced to, or ``None`` for
+    reference datapins, whose values are not coerced."""
+    metadata_type: Type[atvi.CommonVariableMetadata]
+    """Interop type of the datapin's metadata."""
+    get_metadata_call: str
+    """Name of the stub method that gets the metadata."""
+    convert_metadata: Callable[[Any], atvi.CommonVariableMetadata]
+    """Converts the gRPC metadata message to the interop type."""
+    set_metadata_call: str
+    """Name of the stub method that sets the metadata."""
+    set_metadata_request: Type
+    """Type of the request message for setting the metadata."""
+    fill_metadata: Callable[[Any, Any], None]
+    """Fills out the gRPC metadata message from the interop type."""
+
+
+_DATAPIN_TYPE_INFO: Mapping[int, _DatapinTypeInfo] = {
+    var_val_msg.VARIABLE_TYPE_BOOLEAN: _DatapinTypeInfo(
+        atvi.BooleanValue,
+        atvi.BooleanMetadata,
+        "BooleanVariableGetMetadata",
+        convert_grpc_boolean_metadata,
+        "BooleanVariableSetMetadata",
+        var_val_msg.SetBooleanVariableMetadataRequest,
+        fill_boolean_metadata_message,
+    ),
+    var_val_msg.VARIABLE_TYPE_INTEGER: _DatapinTypeInfo(
+        atvi.IntegerValue,
+        atvi.IntegerMetadata,
+        "IntegerVariableGetMetadata",
+        convert_grpc_integer_metadata,
+        "IntegerVariableSetMetadata",
+        var_val_msg.SetIntegerVariableMetadataRequest,
+        fill_integer_metadata_message,
+    ),
+    var_val_msg.VARIABLE_TYPE_REAL: _DatapinTypeInfo(
+        atvi.RealValue,
+        atvi.RealMetadata,
+        "DoubleVariableGetMetadata",
+        convert_grpc_real_metadata,
+        "DoubleVariableSetMetadata",
+        var_val_msg.SetDoubleVariableMetadataRequest,
+        fill_real_metadata_message,
+    ),
+    var_val_msg.VARIABLE_TYPE_STRING: _DatapinTypeInfo(
+        atvi.StringValue,
+        atvi.StringMetadata,
+        "StringVariableGetMetadata",
+        convert_grpc_string_metadata,
+        "StringVariableSetMetadata",
+        var_val_msg.SetStringVariableMetadataRequest,
+        fill_string_metadata_message,
+    ),
+    var_val_msg.VARIABLE_TYPE_FILE: _DatapinTypeInfo(
+        atvi.FileValue,
+        atvi.FileMetadata,
+        "FileVariableGetMetadata",
+        convert_grpc_file_metadata,
+        "FileVariableSetMetadata",
+        var_val_msg.SetFileVariableMetadataRequest,
+        fill_file_metadata_message,
+    ),
+    var_val_msg.VARIABLE_TYPE_BOOLEAN_ARRAY: _DatapinTypeInfo(
+        atvi.BooleanArrayValue,
+        atvi.BooleanArrayMetadata,
+        "BooleanVariableGetMetadata",
+        convert_grpc_boolean_array_metadata,
+        "BooleanVariableSetMetadata",
+        var_val_msg.SetBooleanVariableMetadataRequest,
+        fill_boolean_metadata_message,
+    ),
+    var_val_msg.VARIABLE_TYPE_INTEGER_ARRAY: _DatapinTypeInfo(
+        atvi.IntegerArrayValue,
+        atvi.IntegerArrayMetadata,
+        "IntegerVariableGetMetadata",
+        convert_grpc_integer_array_metadata,
+        "IntegerVariableSetMetadata",
+        var_val_msg.SetIntegerVariableMetadataRequest,
+        fill_integer_metadata_message,
+    ),
+    var_val_msg.VARIABLE_TYPE_REAL_ARRAY: _DatapinTypeInfo(
+        atvi.RealArrayValue,
+        atvi.RealArrayMetadata,
+        "DoubleVariableGetMetadata",
+        convert_grpc_real_array_metadata,
+        "DoubleVariableSetMetadata",
+        var_val_msg.SetDoubleVariableMetadataRequest,
+        fill_real_metadata_message,
+    ),
+    var_val_msg.VARIABLE_TYPE_STRING_ARRAY: _DatapinTypeInfo(
+        atvi.StringArrayValue,
+        atvi.StringArrayMetadata,
+        "StringVariableGetMetadata",
+        convert_grpc_string_array_metadata,
+        "StringVariableSetMetadata",
+        var_val_msg.SetStringVariableMetadataRequest,
+        fill_string_metadata_message,
+    ),
+    var_val_msg.VARIABLE_TYPE_FILE_ARRAY: _DatapinTypeInfo(
+        atvi.FileArrayValue,
+        atvi.FileArrayMetadata,
+        "FileVariableGetMetadata",
+        convert_grpc_file_array_metadata,
+        "FileVariableSetMetadata",
+        var_val_msg.SetFileVariableMetadataRequest,
+        fill_file_metadata_message,
+    ),
+    var_val_msg.VARIABLE_TYPE_REFERENCE: _DatapinTypeInfo(
+        None,
+        ReferenceDatapinMetadata,
+        "ReferenceVariableGetMetadata",
+        convert_grpc_reference_metadata,
+        "ReferenceVariableSetMetadata",
+        var_val_msg.SetReferenceVariableMetadataRequest,
+        fill_reference_metadata_message,
+    ),
+    var_val_msg.VARIABLE_TYPE_REFERENCE_ARRAY: _DatapinTypeInfo(
+        None,
+        ReferenceDatapinMetadata,
+        "ReferenceVariableGetMetadata",
+        convert_grpc_reference_metadata,
+        "ReferenceVariableSetMetadata",
+        var_val_msg.SetReferenceVariableMetadataRequest,
+        fill_reference_metadata_message,
+    ),
+}
+"""Handling for each supported datapin type, keyed by gRPC type."""
+
+
+class AsyncDatapin:
+    """Provides an asyncio version of the datapin classes.
+
+    A single class handles every datapin type, including reference
+    datapins. As with ``ReferenceDatapin`` and ``ReferenceArrayDatapin``,
+    the state of a reference datapin is set without coercion: a scalar
+    reference takes a scalar value and a reference array takes a
+    ``RealArrayValue``.
+
+    Properties of the datapin classes that make calls to the engine are
+    coroutines here: ``get_name()``, ``get_full_name()``, and
+    ``get_parent_element_id()``. ``get_parent_element()`` is not
+    provided, because there are no asyncio versions of components and
+    assemblies.
+
+    .. note::
+        This class should not be directly instantiated by clients. Get an ``AsyncWorkflow``
+        object from a started ``AsyncEngine`` instance and use it to get a valid instance of
+        this object.
+    """
+
+    def __init__(
+        self,
+        element_id: element_msg.ElementId,
+        var_type: var_val_msg.VariableType,
+        engine: "AsyncEngine",
+    ):
+        """Initialize an instance.
+
+        Parameters
+        ----------
+        element_id : ElementId
+            ID of the datapin.
+        var_type : VariableType
+            gRPC type of the datapin.
+        engine : AsyncEngine
+            Engine that the datapin belongs to.
+        """
+        self._element_id = element_id
+        self._var_type = var_type
+        self._engine = engine
+        self._client: ModelCenterWorkflowServiceStub = self._create_client(engine)
+
+    def _create_client(self, engine: "AsyncEngine") -> ModelCenterWorkflowServiceStub:
+        """Get the engine's shared workflow client."""
+        return engine._get_shared_stub(ModelCenterWorkflowServiceStub)
+
+    def __eq__(self, other):
+        return isinstance(other, AsyncDatapin) and self.element_id == other.element_id
+
+    def __hash__(self):
+        return hash(self.element_id)
+
+    @property
+    def element_id(self) -> str:
+        """ID of the datapin."""
+        return self._element_id.id_string
+
+    @property
+    def value_type(self) -> atvi.VariableType:
+        """Interop type of the datapin's value.
+
+        The type is known when the datapin is looked up, so this does not
+        make a call to the engine.
+        """
+        return grpc_type_enum_to_interop_type(self._var_type)
+
+    def _get_type_info(self) -> _DatapinTypeInfo:
+        """Get the handling for this datapin's type."""
+        type_info: Optional[_DatapinTypeInfo] = _DATAPIN_TYPE_INFO.get(self._var_type)
+        if type_info is None:
+            raise aew_api.EngineInternalError(
+                f"Datapins of type {self._var_type} are not supported by the asyncio API."
+            )
+        return type_info
+
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
+    async def get_name(self) -> str:
+        """Get the short name of the datapin.
+
+        Returns
+        -------
+        str
+            Name of the datapin.
+        """
+        result = await self._client.ElementGetName(self._element_id)
+        return result.name
+
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
+    async def get_full_name(self) -> str:
+        """Get the full name of the datapin.
+
+        Returns
+        -------
+        str
+            Full name of the datapin, including the names of its parents.
+        """
+        result = await self._client.ElementGetFullName(self._element_id)
+        return result.name
+
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
+    async def get_parent_element_id(self) -> str:
+        """Get the ID of the element that the datapin belongs to.
+
+        Returns
+        -------
+        str
+            ID of the parent element.
+        """
+        result = await self._client.ElementGetParentElement(self._element_id)
+        return result.id.id_string
+
+    @interpret_rpc_error({**WRAP_INVALID_ARG, **WRAP_TARGET_NOT_FOUND}, idempotent=True)
+    async def get_property(self, property_name: str) -> aew_api.Property:
+        """Get a property of the datapin.
+
+        Parameters
+        ----------
+        property_name : str
+            Name of the property.
+
+        Returns
+        -------
+        aew_api.Property
+            The property.
+        """
+        grpc_value = await self._client.PropertyOwnerGetPropertyValue(
+            MetadataGetValueRequest(id=self._element_id, property_name=property_name)
+        )
+        return aew_api.Property(
+            parent_element_id=self._element_id.id_string,
+            property_name=property_name,
+            property_value=convert_grpc_value_to_atvi(grpc_value, self._engine.is_local),
+        )
+
+    @interpret_rpc_error({**WRAP_INVALID_ARG, **WRAP_TARGET_NOT_FOUND}, idempotent=True)
+    async def get_property_names(self) -> AbstractSet[str]:
+        """Get the names of the properties of the datapin.
+
+        Returns
+        -------
+        AbstractSet[str]
+            Names of the properties.
+        """
+        response = await self._client.PropertyOwnerGetProperties(self._element_id)
+        return set(response.names)
+
+    async def get_properties(
+        self, property_names: Optional[Iterable[str]] = None
+    ) -> Mapping[str, aew_api.Property]:
+        """Get the properties of the datapin.
+
+        The property values are requested concurrently.
+
+        Parameters
+        ----------
+        property_names : Optional[Iterable[str]], optional
+            Names of the properties to get. The default is every property
+            of the datapin.
+
+        Returns
+        -------
+        Mapping[str, aew_api.Property]
+            Properties of the datapin, keyed by name.
+        """
+        names: List[str] = list(
+            await self.get_property_names() if property_names is None else property_names
+        )
+        properties: List[aew_api.Property] = await asyncio.gather(
+            *(self.get_property(name) for name in names)
+        )
+        result: Dict[str, aew_api.Property] = dict(zip(names, properties))
+        return result
+
+    @interpret_rpc_error({**WRAP_INVALID_ARG, **WRAP_TARGET_NOT_FOUND})
+    async def set_property(self, property_name: str, property_value: atvi.IVariableValue) -> None:
+        """Set a property of the datapin.
+
+        Parameters
+        ----------
+        property_name : str
+            Name of the property.
+        property_value : atvi.IVariableValue
+            New value of the property.
+        """
+        grpc_value = convert_interop_value_to_grpc(
+            property_value, engine_is_local=self._engine.is_local
+        )
+        await self._client.PropertyOwnerSetPropertyValue(
+            MetadataSetValueRequest(
+                id=self._element_id, property_name=property_name, value=grpc_value
+            )
+        )
+
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
+    async def get_dependents(
+        self, only_fetch_direct_dependents: bool, follow_suspended_links: bool
+    ) -> List["AsyncDatapin"]:
+        """Get the datapins that depend on this datapin.
+
+        Parameters
+        ----------
+        only_fetch_direct_dependents : bool
+            Whether to get only the datapins that depend on this datapin
+            directly.
+        follow_suspended_links : bool
+            Whether to follow suspended links.
+
+        Returns
+        -------
+        List[AsyncDatapin]
+            The dependent datapins.
+        """
+        request = var_val_msg.GetVariableDependenciesRequest(
+            id=self._element_id,
+            only_fetch_direct_dependencies=only_fetch_direct_dependents,
+            follow_suspended=follow_suspended_links,
+        )
+        response = await self._client.VariableGetDependents(request)
+        return [
+            AsyncDatapin(var_info.id, var_info.value_type, self._engine)
+            for var_info in response.variables
+        ]
+
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
+    async def get_precedents(
+        self, only_fetch_direct_precedents: bool, follow_suspended_links: bool
+    ) -> List["AsyncDatapin"]:
+        """Get the datapins that this datapin depends on.
+
+        Parameters
+        ----------
+        only_fetch_direct_precedents : bool
+            Whether to get only the datapins that this datapin depends on
+            directly.
+        follow_suspended_links : bool
+            Whether to follow suspended links.
+
+        Returns
+        -------
+        List[AsyncDatapin]
+            The precedent datapins.
+        """
+        request = var_val_msg.GetVariableDependenciesRequest(
+            id=self._element_id,
+            only_fetch_direct_dependencies=only_fetch_direct_precedents,
+            follow_suspended=follow_suspended_links,
+        )
+        response = await self._client.VariableGetPrecedents(request)
+        return [
+            AsyncDatapin(var_info.id, var_info.value_type, self._engine)
+            for var_info in response.variables
+        ]
+
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
+    async def is_input_to_component(self) -> bool:
+        """Get whether the datapin is an input to its component.
+
+        Returns
+        -------
+        bool
+            ``True`` if the datapin is an input to its component.
+        """
+        response = await self._client.VariableGetIsInput(self._element_id)
+        return response.is_input_component
+
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
+    async def is_input_to_workflow(self) -> bool:
+        """Get whether the datapin is an input to the workflow.
+
+        Returns
+        -------
+        bool
+            ``True`` if the datapin is an input to the workflow.
+        """
+        response = await self._client.VariableGetIsInput(self._element_id)
+        return response.is_input_workflow
+
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
+    async def get_state(self) -> atvi.VariableState:
+        """Get the state of the datapin.
+
+        Returns
+        -------
+        atvi.VariableState
+            Current value of the datapin and whether it is valid.
+        """
+        response: var_val_msg.VariableState
+        if self._var_type == var_val_msg.VARIABLE_TYPE_REFERENCE:
+            response = await self._client.ReferenceVariableGetValue(
+                var_val_msg.GetReferenceValueRequest(target=self._element_id)
+            )
+        else:
+            response = await self._client.VariableGetState(
+                ElementIdOrName(target_id=self._element_id)
+            )
+        return convert_grpc_state_to_atvi(response, self._engine.is_local)
+
+    @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND, **WRAP_OUT_OF_BOUNDS})
+    async def set_state(self, state: atvi.VariableState) -> bool:
+        """Set the value of the datapin.
+
+        Parameters
+        ----------
+        state : atvi.VariableState
+            New state. The value is implicitly coerced to the datapin's
+            type.
+
+        Returns
+        -------
+        bool
+            Whether the value was changed.
+        """
+        if self._var_type == var_val_msg.VARIABLE_TYPE_REFERENCE:
+            return await self._set_reference_state(state)
+        if self._var_type == var_val_msg.VARIABLE_TYPE_REFERENCE_ARRAY:
+            return await self._set_reference_array_state(state)
+        value: atvi.IVariableValue = atvi.implicit_coerce_single(
+            state.value, self._get_type_info().value_type
+        )
+        with ExitStack() as local_file_context_stack:
+            grpc_call, request = value.accept(
+                SetValueRequestVisitor(
+                    self._element_id, self._engine.is_local, local_file_context_stack
+                )
+            )
+            response = await getattr(self._client, grpc_call)(request)
+            return response.was_changed
+        # This line should only be reachable if one of the context managers in
+        # local_file_context_stack suppress an exception, which they should not
+        # be doing.
+        raise aew_api.EngineInternalError(
+            "Reached an unexpected state. A local file content context may be suppressing an "
+            "exception. Report this error on the PyModelCenter repository's Issues page."
+        )
+
+    async def _set_reference_state(self, state: atvi.VariableState) -> bool:
+        """Set the value referenced by a scalar reference datapin."""
+        if not isinstance(state.value, SCALAR_REFERENCE_VALUE_TYPES):
+            raise atvi.IncompatibleTypesException(
+                state.value.variable_type, atvi.VariableType.UNKNOWN
+            )
+        request = var_val_msg.SetReferenceValueRequest(
+            target=self._element_id, new_value=convert_interop_value_to_grpc(state.value)
+        )
+        response = await self._client.ReferenceVariableSetValue(request)
+        return response.was_changed
+
+    @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND, **WRAP_OUT_OF_BOUNDS, **WRAP_INVALID_ARG})
+    async def _set_reference_array_state(self, state: atvi.VariableState) -> bool:
+        """Set the values referenced by a reference array datapin."""
+        if not isinstance(state.value, atvi.RealArrayValue):
+            raise atvi.IncompatibleTypesException(
+                state.value.variable_type, atvi.VariableType.REAL_ARRAY
+            )
+        request = var_val_msg.SetDoubleArrayValueRequest(
+            target=self._element_id,
+            new_value=convert_interop_value_to_grpc(state.value).double_array_value,
+        )
+        response = await self._client.ReferenceArraySetReferencedValues(request)
+        return response.was_changed
+
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
+    async def get_metadata(self) -> atvi.CommonVariableMetadata:
+        """Get the metadata of the datapin.
+
+        Returns
+        -------
+        atvi.CommonVariableMetadata
+            Metadata of the type that matches the datapin's type.
+        """
+        type_info: _DatapinTypeInfo = self._get_type_info()
+        response = await getattr(self._client, type_info.get_metadata_call)(self._element_id)
+        return type_info.convert_metadata(response)
+
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    async def set_metadata(self, new_metadata: atvi.CommonVariableMetadata) -> None:
+        """Set the metadata of the datapin.
+
+        Parameters
+        ----------
+        new_metadata : atvi.CommonVariableMetadata
+            New metadata. It must be of the type that matches the datapin's
+            type.
+        """
+        type_info: _DatapinTypeInfo = self._get_type_info()
+        if not isinstance(new_metadata, type_info.metadata_type):
+            raise TypeError(
+                f"The provided metadata object is not the correct type."
+                f"Expected {type_info.metadata_type}, "
+                f"but received {new_metadata.__class__}."
+            )
+        request = type_info.set_metadata_request(target=self._element_id)
+        type_info.fill_metadata(new_metadata, request.new_metadata)
+        await getattr(self._client, type_info.set_metadata_call)(request)
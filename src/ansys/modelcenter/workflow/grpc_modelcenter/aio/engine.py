@@ -0,0 +1,453 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Defines the asyncio engine."""
+
+import asyncio
+from os import PathLike
+from threading import Lock
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+import ansys.api.modelcenter.v0.engine_messages_pb2 as eng_msg
+from ansys.api.modelcenter.v0.grpc_modelcenter_pb2_grpc import GRPCModelCenterServiceStub
+from ansys.engineeringworkflow.api import WorkflowEngineInfo
+import grpc
+import numpy
+
+from ansys.modelcenter.workflow.api import WorkflowType
+
+from .._heartbeat import _HEARTBEAT_MARGIN, HeartbeatStatistics
+from ..call_options import CallOptions, ChannelOptions, apply_call_options
+from ..engine import (
+    StubType,
+    WorkflowAlreadyLoadedError,
+    convert_preference_response,
+    convert_server_info,
+    create_load_workflow_request,
+    create_new_workflow_request,
+    create_set_preference_request,
+)
+from ..grpc_error_interpretation import WRAP_INVALID_ARG, interpret_rpc_error
+from ..mcd_process import MCDProcess
+from ..retry import RetryPolicy
+from .workflow import AsyncWorkflow
+
+
+class AsyncEngine:
+    """Provides an asyncio version of ``Engine``.
+
+    The engine must be started before use, either by awaiting ``start()``
+    or by using it in an ``async with`` statement. ModelCenter is always
+    started on the local machine.
+
+    Only part of ``Engine`` is provided. There are no asyncio versions of
+    ``get_formatter()``, ``attach()``, or the caches. See the package
+    documentation for the supported subset.
+    """
+
+    def __init__(
+        self,
+        is_run_only: bool = False,
+        heartbeat_interval: numpy.uint = 30000,
+        allowed_heartbeat_misses: numpy.uint = 3,
+        on_unresponsive: Optional[Callable[["AsyncEngine"], None]] = None,
+        channel_options: Optional[ChannelOptions] = None,
+        call_options: Optional[CallOptions] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ):
+        """Initialize an instance.
+
+        Parameters
+        ----------
+        is_run_only : bool
+            Whether to start ModelCenter in run-only mode. The default is ``False``.
+        heartbeat_interval : numpy.uint
+            Number of milliseconds within which a heartbeat call must be made before the server
+            considers a heartbeat signal to have been missed.
+        allowed_heartbeat_misses : numpy.uint
+            Number of heartbeat misses allowed before the server terminates.
+        on_unresponsive : Optional[Callable[[AsyncEngine], None]]
+            Function to call with this engine when ``allowed_heartbeat_misses``
+            heartbeats in a row have failed. It is called on the event
+            loop, so it should return quickly.
+        channel_options : Optional[ChannelOptions]
+            Options for the gRPC channel, such as message size limits and
+            keepalive settings. The default is to use the gRPC defaults.
+        call_options : Optional[CallOptions]
+            Options applied to every call made through this engine and its
+            workflows and datapins, such as a default deadline. The default
+            is to leave calls unchanged.
+        retry_policy : Optional[RetryPolicy]
+            Policy for retrying read-only operations that fail with a
+            transient error. The default is not to retry.
+        """
+        self._is_closed = False
+        self._channel_options: Optional[ChannelOptions] = channel_options
+        self._call_options: Optional[CallOptions] = call_options
+        self._retry_policy: Optional[RetryPolicy] = retry_policy
+        self._is_run_only: bool = is_run_only
+        self._heartbeat_interval: numpy.uint = heartbeat_interval
+        self._allowed_heartbeat_misses: numpy.uint = allowed_heartbeat_misses
+        self._on_unresponsive: Optional[Callable[["AsyncEngine"], None]] = on_unresponsive
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._heartbeat_statistics: Optional[HeartbeatStatistics] = None
+        self._process: Optional[MCDProcess] = None
+        self._channel: Optional[grpc.aio.Channel] = None
+        self._shared_stubs: Dict[type, Any] = {}
+        self._shared_stubs_lock = Lock()
+        self._stub = None
+
+    async def __aenter__(self):
+        """Start the engine when used in an 'async with' statement."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Clean up when leaving an 'async with' block."""
+        await self.close()
+
+    async def start(self) -> None:
+        """Launch ModelCenter and connect to it.
+
+        The process is launched on a worker thread so that the event loop
+        is not blocked while waiting for ModelCenter to start.
+        """
+        if self._stub is not None:
+            return
+        self._process = MCDProcess()
+        port: int = await asyncio.get_running_loop().run_in_executor(
+            None,
+            self._process.start,
+            self._is_run_only,
+            self._heartbeat_interval,
+            self._allowed_heartbeat_misses,
+        )
+        grpc_options: List[Tuple[str, Any]] = [("grpc.default_authority", "localhost")]
+        if self._channel_options is not None:
+            grpc_options.extend(self._channel_options.to_grpc_options())
+        self._channel = self._create_channel(port, grpc_options)
+        self._stub = apply_call_options(self._create_client(self._channel), self._call_options)
+        self._heartbeat_statistics = HeartbeatStatistics(0, 0, 0)
+        self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+
+    @staticmethod
+    def _create_channel(port: int, grpc_options: List[Tuple[str, Any]]) -> grpc.aio.Channel:
+        """Create a channel to a ModelCenter process on the local machine.
+
+        ``grpc_options`` should start with the default authority of
+        ``"localhost"``, which mirrors the options that cyberchannel uses
+        for WNUA connections. cyberchannel can only create synchronous
+        channels.
+        """
+        return grpc.aio.insecure_channel(f"localhost:{port}", options=grpc_options)
+
+    @staticmethod
+    def _create_client(grpc_channel) -> GRPCModelCenterServiceStub:
+        """Create a client from a gRPC channel."""
+        return GRPCModelCenterServiceStub(grpc_channel)
+
+    def _get_shared_stub(self, stub_type: Type[StubType]) -> StubType:
+        """Get the stub for a gRPC service on this engine's channel.
+
+        See ``Engine._get_shared_stub()``. The stub is created the first
+        time it is requested and then shared by every workflow and datapin
+        that uses this engine.
+
+        Parameters
+        ----------
+        stub_type : Type[StubType]
+            Generated stub class of the service, for example
+            ``ModelCenterWorkflowServiceStub``.
+
+        Returns
+        -------
+        StubType
+            Shared stub for the service.
+        """
+        stub: Optional[StubType] = self._shared_stubs.get(stub_type)
+        if stub is None:
+            with self._shared_stubs_lock:
+                stub = self._shared_stubs.get(stub_type)
+                if stub is None:
+                    stub = apply_call_options(stub_type(self._channel), self._call_options)
+                    self._shared_stubs[stub_type] = stub
+        return stub
+
+    async def _heartbeat_loop(self) -> None:
+        """Send heartbeat messages to the server at regular intervals.
+
+        Each message times out after one interval. A message that fails
+        is counted as missed rather than stopping the loop, as
+        ``HeartbeatScheduler`` does for ``Engine``.
+        """
+        interval: float = float(self._heartbeat_interval) / 1000
+        while not self._is_closed:
+            succeeded: bool
+            try:
+                await self._stub.Heartbeat(eng_msg.HeartbeatRequest(), timeout=interval)
+            except grpc.RpcError:
+                succeeded = False
+            else:
+                succeeded = True
+            self._record_heartbeat(succeeded)
+            # sleep for a little less than the heartbeat interval
+            await asyncio.sleep(max(0, interval * _HEARTBEAT_MARGIN))
+
+    def _record_heartbeat(self, succeeded: bool) -> None:
+        """Record the outcome of a heartbeat message, and call
+        ``on_unresponsive`` if too many have failed in a row."""
+        sent, missed, consecutive_missed = self._heartbeat_statistics
+        if succeeded:
+            self._heartbeat_statistics = HeartbeatStatistics(sent + 1, missed, 0)
+            return
+        self._heartbeat_statistics = HeartbeatStatistics(
+            sent + 1, missed + 1, consecutive_missed + 1
+        )
+        if (
+            self._on_unresponsive is not None
+            and consecutive_missed + 1 == self._allowed_heartbeat_misses
+        ):
+            try:
+                self._on_unresponsive(self)
+            except Exception:  # nosec B110
+                # A failing callback must not stop the heartbeat messages.
+                pass
+
+    @property
+    def is_closed(self) -> bool:
+        """Flag indicating if this instance has been closed."""
+        return self._is_closed
+
+    @property
+    def is_local(self) -> bool:
+        """Flag indicating if ModelCenter Desktop was started locally.
+
+        Returns
+        -------
+        bool
+            ``True`` once the engine has been started.
+        """
+        return self._process is not None
+
+    @property
+    def heartbeat_statistics(self) -> Optional[HeartbeatStatistics]:
+        """Counts of the heartbeat messages sent to the server.
+
+        Returns
+        -------
+        Optional[HeartbeatStatistics]
+            Number of heartbeats sent, missed, and missed since the last
+            one that succeeded, or ``None`` if the engine has not been
+            started.
+        """
+        return self._heartbeat_statistics
+
+    @property
+    def retry_policy(self) -> Optional[RetryPolicy]:
+        """Policy for retrying read-only operations that fail with a
+        transient error."""
+        return self._retry_policy
+
+    @property
+    def call_options(self) -> Optional[CallOptions]:
+        """Options applied to every call made through this engine."""
+        return self._call_options
+
+    @property
+    def channel(self) -> Optional[grpc.aio.Channel]:
+        """Get the gRPC channel used to communicate with ModelCenter Desktop.
+
+        Returns
+        -------
+        grpc.aio.Channel
+            ``grpc.aio.Channel`` object or ``None`` if it has not been created.
+        """
+        return self._channel
+
+    @interpret_rpc_error()
+    async def close(self) -> None:
+        """Shut down the gRPC server and clear out all objects."""
+        self._is_closed = True
+
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            try:
+                await self._heartbeat_task
+            except (asyncio.CancelledError, grpc.RpcError):
+                pass
+            self._heartbeat_task = None
+
+        if self._stub is not None:
+            await self._stub.Shutdown(eng_msg.ShutdownRequest())
+            self._stub = None
+        with self._shared_stubs_lock:
+            self._shared_stubs.clear()
+
+        if self._channel is not None:
+            await self._channel.close()
+            self._channel = None
+
+        self._process = None
+
+    @interpret_rpc_error(
+        {grpc.StatusCode.RESOURCE_EXHAUSTED: WorkflowAlreadyLoadedError, **WRAP_INVALID_ARG}
+    )
+    async def new_workflow(
+        self, name: str, workflow_type: WorkflowType = WorkflowType.DATA
+    ) -> AsyncWorkflow:
+        """Create a workflow.
+
+        Parameters
+        ----------
+        name : str
+            Path of the new workflow.
+        workflow_type : WorkflowType
+            Type of the new workflow.
+
+        Returns
+        -------
+        AsyncWorkflow
+            The new workflow.
+        """
+        request = create_new_workflow_request(name, workflow_type)
+        response: eng_msg.NewWorkflowResponse = await self._stub.EngineCreateWorkflow(request)
+        return AsyncWorkflow(response.workflow_id, name, self)
+
+    @interpret_rpc_error(
+        {
+            grpc.StatusCode.NOT_FOUND: FileNotFoundError,
+            grpc.StatusCode.RESOURCE_EXHAUSTED: WorkflowAlreadyLoadedError,
+            **WRAP_INVALID_ARG,
+        }
+    )
+    async def load_workflow(
+        self, file_name: Union[PathLike, str], ignore_connection_errors: Optional[bool] = None
+    ) -> AsyncWorkflow:
+        """Load a saved workflow from a file.
+
+        Parameters
+        ----------
+        file_name : Union[PathLike, str]
+            Path of the workflow file to load.
+        ignore_connection_errors : Optional[bool]
+            Whether to ignore errors connecting to analysis components.
+
+        Returns
+        -------
+        AsyncWorkflow
+            The loaded workflow.
+        """
+        request = create_load_workflow_request(file_name, ignore_connection_errors)
+        response: eng_msg.LoadWorkflowResponse = await self._stub.EngineLoadWorkflow(request)
+        return AsyncWorkflow(response.workflow_id, request.path, self)
+
+    @interpret_rpc_error(WRAP_INVALID_ARG, idempotent=True)
+    async def get_preference(self, pref: str) -> Union[bool, int, float, str]:
+        """Get the value of a preference.
+
+        Parameters
+        ----------
+        pref : str
+            Name of the preference.
+
+        Returns
+        -------
+        Union[bool, int, float, str]
+            Value of the preference.
+        """
+        request = eng_msg.GetPreferenceRequest(preference_name=pref)
+        response: eng_msg.GetPreferenceResponse = await self._stub.EngineGetPreference(request)
+        return convert_preference_response(response)
+
+    @interpret_rpc_error(WRAP_INVALID_ARG)
+    async def set_preference(self, pref: str, value: Union[bool, int, float, str]) -> None:
+        """Set the value of a preference.
+
+        Parameters
+        ----------
+        pref : str
+            Name of the preference.
+        value : Union[bool, int, float, str]
+            New value of the preference.
+        """
+        await self._stub.EngineSetPreference(create_set_preference_request(pref, value))
+
+    @interpret_rpc_error(idempotent=True)
+    async def get_units(self) -> Mapping[str, Collection[str]]:
+        """Get the unit categories and the units in each of them.
+
+        The unit names of every category are requested concurrently.
+
+        Returns
+        -------
+        Mapping[str, Collection[str]]
+            Unit names, keyed by category.
+        """
+        category_response: eng_msg.GetUnitCategoriesResponse = (
+            await self._stub.EngineGetUnitCategories(eng_msg.GetUnitCategoriesRequest())
+        )
+        categories: List[str] = list(category_response.names)
+        responses: List[eng_msg.GetUnitNamesResponse] = await asyncio.gather(
+            *(
+                self._stub.EngineGetUnitNames(eng_msg.GetUnitNamesRequest(category=category))
+                for category in categories
+            )
+        )
+        result: Dict[str, List[str]] = {
+            category: list(response.names) for category, response in zip(categories, responses)
+        }
+        return result
+
+    def get_run_only_mode(self) -> bool:
+        """Get whether the engine was started in run-only mode.
+
+        Returns
+        -------
+        bool
+            ``True`` if the engine is in run-only mode.
+        """
+        return self._is_run_only
+
+    @interpret_rpc_error(idempotent=True)
+    async def get_server_info(self) -> WorkflowEngineInfo:
+        """Get information about the engine.
+
+        Returns
+        -------
+        WorkflowEngineInfo
+            Information about the engine.
+        """
+        response: eng_msg.GetServerInfoResponse = await self._stub.GetEngineInfo(
+            eng_msg.GetServerInfoRequest()
+        )
+        return convert_server_info(response)
@@ -0,0 +1,334 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Defines the asyncio workflow."""
+
+from contextlib import ExitStack
+import os
+from typing import TYPE_CHECKING, AbstractSet, Mapping
+
+import ansys.api.modelcenter.v0.element_messages_pb2 as element_msg
+import ansys.api.modelcenter.v0.grpc_modelcenter_workflow_pb2_grpc as grpc_mcd_workflow
+import ansys.api.modelcenter.v0.variable_value_messages_pb2 as var_val_msg
+import ansys.api.modelcenter.v0.workflow_messages_pb2 as workflow_msg
+import ansys.engineeringworkflow.api as engapi
+import ansys.tools.variableinterop as atvi
+import grpc
+
+from .._datapin_states import convert_grpc_state_to_atvi
+from ..grpc_error_interpretation import (
+    WRAP_INVALID_ARG,
+    WRAP_OUT_OF_BOUNDS,
+    WRAP_TARGET_NOT_FOUND,
+    interpret_rpc_error,
+)
+from ..workflow import (
+    WorkflowRunFailedError,
+    convert_grpc_workflow_state,
+    convert_run_response,
+    create_run_request,
+)
+from .datapin import _DATAPIN_TYPE_INFO, AsyncDatapin
+
+if TYPE_CHECKING:
+    from .engine import AsyncEngine
+
+
+class AsyncWorkflow:
+    """Provides an asyncio version of ``Workflow``.
+
+    Only running the workflow, saving it, and access to its datapins are
+    provided. Components, assemblies, and links are not available, so
+    ``get_root()``, ``get_element_by_name()``, ``get_component()``,
+    ``get_assembly()``, ``get_links()``, and the methods that create,
+    move, link, or remove elements have no asyncio versions.
+
+    .. note::
+        This class should not be directly instantiated by clients. Start an ``AsyncEngine``
+        instance and use it to get a valid instance of this object.
+    """
+
+    def __init__(self, workflow_id: str, file_path: str, engine: "AsyncEngine"):
+        """Initialize an instance.
+
+        Parameters
+        ----------
+        workflow_id : str
+            ID of the workflow.
+        file_path : str
+            Path to the workflow file.
+        engine : AsyncEngine
+            Engine that the workflow belongs to.
+        """
+        self._id = workflow_id
+        self._file_name = os.path.basename(file_path)
+        self._engine = engine
+        self._stub = self._create_client(self._engine)
+        self._closed = False
+
+    async def __aenter__(self):
+        """Initialization when used in an 'async with' statement."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Clean up when leaving an 'async with' block."""
+        if not self._closed:
+            await self.close_workflow()
+
+    def _create_client(
+        self, engine: "AsyncEngine"
+    ) -> grpc_mcd_workflow.ModelCenterWorkflowServiceStub:
+        """Get the engine's shared workflow client."""
+        return engine._get_shared_stub(grpc_mcd_workflow.ModelCenterWorkflowServiceStub)
+
+    @property
+    def workflow_file_name(self) -> str:
+        """Get the file name of the workflow."""
+        return self._file_name
+
+    def get_workflow_uuid(self) -> str:
+        """Get the unique ID of the workflow.
+
+        Returns
+        -------
+        str
+            ID of the workflow.
+        """
+        return self._id
+
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
+    async def get_state(self) -> engapi.WorkflowInstanceState:
+        """Get the state of the workflow instance.
+
+        See ``Workflow.get_state()`` for the possible states.
+
+        Returns
+        -------
+        WorkflowInstanceState
+            Current state of the workflow instance.
+        """
+        request = workflow_msg.GetWorkflowStateRequest()
+        response: workflow_msg.GetWorkflowStateResponse = await self._stub.WorkflowGetState(request)
+        return convert_grpc_workflow_state(response.state)
+
+    @interpret_rpc_error(
+        {
+            **WRAP_TARGET_NOT_FOUND,
+            **WRAP_INVALID_ARG,
+            **WRAP_OUT_OF_BOUNDS,
+            grpc.StatusCode.FAILED_PRECONDITION: WorkflowRunFailedError,
+        }
+    )
+    async def run(
+        self,
+        inputs: Mapping[str, atvi.VariableState] = {},
+        reset: bool = False,
+        validation_names: AbstractSet[str] = set(),
+        collect_names: AbstractSet[str] = set(),
+    ) -> Mapping[str, atvi.VariableState]:
+        """Run the workflow and wait for it to finish.
+
+        Parameters
+        ----------
+        inputs : Mapping[str, atvi.VariableState], optional
+            Input states to set before the run, keyed by datapin name.
+        reset : bool, optional
+            Whether to reset the workflow before the run. The default is ``False``.
+        validation_names : AbstractSet[str], optional
+            Names of the datapins to validate.
+        collect_names : AbstractSet[str], optional
+            Names of additional datapins whose values should be collected.
+
+        Returns
+        -------
+        Mapping[str, atvi.VariableState]
+            States of the validated and collected datapins, keyed by name.
+        """
+        with ExitStack() as local_file_content_pins:
+            request: workflow_msg.WorkflowRunRequest = create_run_request(
+                self._id,
+                inputs,
+                reset,
+                validation_names,
+                collect_names,
+                local_file_content_pins,
+                self._engine.is_local,
+            )
+            response = await self._stub.WorkflowRun(request)
+            return convert_run_response(response, self._engine.is_local)
+        # This line should only be reachable if one of the context managers in
+        # local_file_content_pins suppress an exception, which they should not
+        # be doing.
+        raise engapi.EngineInternalError(
+            "Reached an unexpected state. A local file content context may be suppressing an "
+            "exception. Report this error on the PyModelCenter repository's Issues page."
+        )
+
+    @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND, **WRAP_INVALID_ARG, **WRAP_OUT_OF_BOUNDS})
+    async def start_run(
+        self,
+        inputs: Mapping[str, atvi.VariableState],
+        reset: bool,
+        validation_names: AbstractSet[str],
+    ) -> None:
+        """Start a run of the workflow without waiting for it to finish.
+
+        Parameters
+        ----------
+        inputs : Mapping[str, atvi.VariableState]
+            Input states to set before the run, keyed by datapin name.
+        reset : bool
+            Whether to reset the workflow before the run.
+        validation_names : AbstractSet[str]
+            Names of the datapins to validate.
+        """
+        with ExitStack() as local_file_content_pins:
+            request: workflow_msg.WorkflowRunRequest = create_run_request(
+                self._id,
+                inputs,
+                reset,
+                validation_names,
+                set(),
+                local_file_content_pins,
+                self._engine.is_local,
+            )
+            await self._stub.WorkflowStartRun(request)
+            return
+        # This line should only be reachable if one of the context managers in
+        # local_file_content_pins suppress an exception, which they should not
+        # be doing.
+        raise engapi.EngineInternalError(
+            "Reached an unexpected state. A local file content context may be suppressing an "
+            "exception. Report this error on the PyModelCenter repository's Issues page."
+        )
+
+    @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND})
+    async def halt(self) -> None:
+        """Halt the running workflow."""
+        await self._stub.WorkflowHalt(workflow_msg.WorkflowHaltRequest())
+
+    @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND, **WRAP_INVALID_ARG}, idempotent=True)
+    async def get_datapin(self, name: str) -> AsyncDatapin:
+        """Get a datapin by its full name.
+
+        Parameters
+        ----------
+        name : str
+            Full name of the datapin.
+
+        Returns
+        -------
+        AsyncDatapin
+            The datapin.
+        """
+        request = workflow_msg.NamedElementWorkflow(
+            workflow=workflow_msg.WorkflowId(id=self._id),
+            element_full_name=element_msg.ElementName(name=name),
+        )
+        response: workflow_msg.ElementInfo = await self._stub.WorkflowGetElementByName(request)
+        if response.type != element_msg.ELEMENT_TYPE_VARIABLE:
+            raise ValueError("Element is not a datapin.")
+        if response.var_type not in _DATAPIN_TYPE_INFO:
+            raise engapi.EngineInternalError(
+                f"The datapin {name} has a type that the asyncio API does not support."
+            )
+        return AsyncDatapin(response.id, response.var_type, self._engine)
+
+    @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND, **WRAP_INVALID_ARG}, idempotent=True)
+    async def get_datapin_state(self, var_name: str) -> atvi.VariableState:
+        """Get the state of a datapin by its full name.
+
+        This takes a single call to the engine, without looking up the
+        datapin first.
+
+        Parameters
+        ----------
+        var_name : str
+            Full name of the datapin.
+
+        Returns
+        -------
+        atvi.VariableState
+            Current value of the datapin and whether it is valid.
+        """
+        request = workflow_msg.ElementIdOrName(
+            target_name=workflow_msg.NamedElementWorkflow(
+                element_full_name=element_msg.ElementName(name=var_name),
+                workflow=workflow_msg.WorkflowId(id=self._id),
+            )
+        )
+        response: var_val_msg.VariableState = await self._stub.VariableGetState(request)
+        return convert_grpc_state_to_atvi(response, self._engine.is_local)
+
+    async def get_datapin_meta_data(self, name: str) -> atvi.CommonVariableMetadata:
+        """Get the metadata of a datapin by its full name.
+
+        Parameters
+        ----------
+        name : str
+            Full name of the datapin.
+
+        Returns
+        -------
+        atvi.CommonVariableMetadata
+            Metadata of the type that matches the datapin's type.
+        """
+        datapin: AsyncDatapin = await self.get_datapin(name)
+        return await datapin.get_metadata()
+
+    async def set_value(self, var_name: str, value: atvi.IVariableValue) -> None:
+        """Set the value of a datapin by its full name.
+
+        Parameters
+        ----------
+        var_name : str
+            Full name of the datapin.
+        value : atvi.IVariableValue
+            New value. It is implicitly coerced to the datapin's type.
+        """
+        datapin: AsyncDatapin = await self.get_datapin(var_name)
+        await datapin.set_state(atvi.VariableState(value, True))
+
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    async def save_workflow(self) -> None:
+        """Save the workflow."""
+        await self._stub.WorkflowSave(workflow_msg.WorkflowId(id=self._id))
+
+    @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND, **WRAP_INVALID_ARG})
+    async def save_workflow_as(self, file_name: str) -> None:
+        """Save the workflow to a new file.
+
+        Parameters
+        ----------
+        file_name : str
+            Path to save the workflow to.
+        """
+        request = workflow_msg.WorkflowSaveAsRequest()
+        request.target.id = self._id
+        request.new_target_path = file_name
+        await self._stub.WorkflowSaveAs(request)
+
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    async def close_workflow(self) -> None:
+        """Close the workflow."""
+        await self._stub.WorkflowClose(workflow_msg.WorkflowId(id=self._id))
+        self._closed = True
@@ -110,6 +110,7 @@ class Assembly(
                 variable_type=type_in_request,
             )
         )
+        self._engine._notify_structure_changed()
         return create_datapin(interop_type_to_grpc_type_enum(mc_type), result.id, self._engine)
 
     @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
@@ -122,7 +123,9 @@ class Assembly(
                 target_name=NamedElementWorkflow(element_full_name=ElementName(name=var_name))
             )
         )
-        return self._client.AssemblyDeleteVariable(request).existed
+        existed: bool = self._client.AssemblyDeleteVariable(request).existed
+        self._engine._notify_structure_changed()
+        return existed
 
     @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND, **WRAP_NAME_COLLISION, **WRAP_INVALID_ARG})
     @overrides
@@ -146,4 +149,5 @@ class Assembly(
             request.av_pos.x_pos = x_pos
             request.av_pos.y_pos = y_pos
         response = self._client.AssemblyAddAssembly(request)
+        self._engine._notify_structure_changed()
         return Assembly(response.id, self._engine)
@@ -28,7 +28,6 @@ This interaction is handled in an object-oriented way.
 from abc import ABC
 from typing import TYPE_CHECKING, Collection, Optional
 
-import ansys.engineeringworkflow.api as aew_api
 import ansys.tools.variableinterop as atvi
 from overrides import overrides
 
@@ -44,8 +43,9 @@ from ansys.api.modelcenter.v0.element_messages_pb2 import ElementId
 from ansys.api.modelcenter.v0.variable_value_messages_pb2 import GetVariableDependenciesRequest
 from ansys.api.modelcenter.v0.workflow_messages_pb2 import ElementIdOrName
 
+from ._datapin_states import convert_grpc_state_to_atvi
 from .grpc_error_interpretation import WRAP_TARGET_NOT_FOUND, interpret_rpc_error
-from .var_value_convert import convert_grpc_value_to_atvi, grpc_type_enum_to_interop_type
+from .var_value_convert import grpc_type_enum_to_interop_type
 
 
 class BaseDatapin(AbstractWorkflowElement, mc_api.IDatapin, ABC):
@@ -64,42 +64,35 @@ class BaseDatapin(AbstractWorkflowElement, mc_api.IDatapin, ABC):
         super(BaseDatapin, self).__init__(element_id=element_id, engine=engine)
 
     @property
-    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
     @overrides
     def value_type(self) -> atvi.VariableType:
         response = self._client.VariableGetType(self._element_id)
         return grpc_type_enum_to_interop_type(response.var_type)
 
     @property
-    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
     @overrides
     def is_input_to_component(self) -> bool:
         response = self._client.VariableGetIsInput(self._element_id)
         return response.is_input_component
 
     @property
-    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
     @overrides
     def is_input_to_workflow(self) -> bool:
         response = self._client.VariableGetIsInput(self._element_id)
         return response.is_input_workflow
 
-    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
     @overrides
     def get_state(self, hid: Optional[str] = None) -> atvi.VariableState:
         if hid is not None:
             raise ValueError("This engine implementation does not yet support HIDs.")
         response = self._client.VariableGetState(ElementIdOrName(target_id=self._element_id))
-        interop_value: atvi.IVariableValue
-        try:
-            interop_value = convert_grpc_value_to_atvi(response.value, self._engine.is_local)
-        except ValueError as convert_failure:
-            raise aew_api.EngineInternalError(
-                "Unexpected failure occurred converting gRPC value response."
-            ) from convert_failure
-        return atvi.VariableState(value=interop_value, is_valid=response.is_valid)
-
-    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+        return convert_grpc_state_to_atvi(response, self._engine.is_local)
+
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
     @overrides
     def get_dependents(
         self, only_fetch_direct_dependents: bool, follow_suspended_links: bool
@@ -117,7 +110,7 @@ class BaseDatapin(AbstractWorkflowElement, mc_api.IDatapin, ABC):
         ]
         return variables
 
-    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
     @overrides
     def get_precedents(
         self, only_fetch_direct_precedents: bool, follow_suspended_links: bool
@@ -0,0 +1,164 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Provides the base class for the numeric array datapins, which support
+chunked transfers of their values."""
+
+from abc import ABC
+from typing import ClassVar, Iterable, Iterator, Sequence, Type
+
+from ansys.api.modelcenter.v0.variable_value_messages_pb2 import VariableState
+from ansys.api.modelcenter.v0.workflow_messages_pb2 import ElementIdOrName
+import ansys.engineeringworkflow.api as aew_api
+import numpy as np
+from numpy.typing import ArrayLike
+
+from ._array_convert import (
+    DEFAULT_CHUNK_SIZE,
+    ArrayChunk,
+    NumericArrayMessage,
+    convert_grpc_array_to_numpy,
+    convert_numpy_chunks_to_grpc_array,
+    iter_grpc_array_chunks,
+)
+from .base_datapin import BaseDatapin
+from .grpc_error_interpretation import (
+    WRAP_OUT_OF_BOUNDS,
+    WRAP_TARGET_NOT_FOUND,
+    interpret_rpc_error,
+)
+
+
+class BaseNumericArrayDatapin(BaseDatapin, ABC):
+    """Represents a Boolean, integer or real array datapin.
+
+    Besides the usual ``get_state`` and ``set_state``, the values of these
+    datapins can be read and written in chunks of flat (row-major) index
+    ranges. The engine has no calls that transfer part of an array, so
+    the whole value still travels in one message. The chunked methods
+    avoid holding the value as a protobuf field, a list and an ndarray
+    at once, and let callers produce or consume very large values
+    incrementally.
+    """
+
+    _VALUE_FIELD: ClassVar[str]
+    """Name of the ``VariableValue`` field that holds this datapin's value."""
+    _ARRAY_MESSAGE_TYPE: ClassVar[Type]
+    """Type of the array message, for example ``DoubleArrayValue``."""
+    _SET_VALUE_REQUEST_TYPE: ClassVar[Type]
+    """Type of the request that sets the value."""
+    _SET_VALUE_CALL: ClassVar[str]
+    """Name of the stub method that sets the value."""
+    _DTYPE: ClassVar[np.dtype]
+    """NumPy type of the datapin's values."""
+
+    def _get_array_message(self) -> VariableState:
+        """Get the state of the datapin, checking that it holds an array of
+        the expected type."""
+        response: VariableState = self._client.VariableGetState(
+            ElementIdOrName(target_id=self._element_id)
+        )
+        if response.value.WhichOneof("value") != self._VALUE_FIELD:
+            raise aew_api.EngineInternalError(
+                f"Expected the engine to return a {self._VALUE_FIELD}, "
+                f"but it returned {response.value.WhichOneof('value')}."
+            )
+        return response
+
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    def iter_value_chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[ArrayChunk]:
+        """Iterate over the value of the datapin in chunks.
+
+        The value is requested when this method is called. Each chunk is
+        converted to an ndarray only when the iterator reaches it.
+
+        Parameters
+        ----------
+        chunk_size : int, optional
+            Maximum number of elements in each chunk.
+
+        Returns
+        -------
+        Iterator[ArrayChunk]
+            Chunks of the value, in row-major order.
+        """
+        message: NumericArrayMessage = getattr(self._get_array_message().value, self._VALUE_FIELD)
+        return iter_grpc_array_chunks(message, chunk_size)
+
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
+    def get_value_into(self, out: np.ndarray, chunk_size: int = DEFAULT_CHUNK_SIZE) -> bool:
+        """Read the value of the datapin into a preallocated array.
+
+        Parameters
+        ----------
+        out : np.ndarray
+            Writable C-contiguous array with the same dimensions as the
+            value.
+        chunk_size : int, optional
+            Maximum number of elements to convert at a time.
+
+        Returns
+        -------
+        bool
+            Whether the value is valid.
+
+        Raises
+        ------
+        ValueError
+            If ``out`` does not match the dimensions of the value.
+        """
+        response: VariableState = self._get_array_message()
+        convert_grpc_array_to_numpy(getattr(response.value, self._VALUE_FIELD), out, chunk_size)
+        return response.is_valid
+
+    @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND, **WRAP_OUT_OF_BOUNDS})
+    def set_value_from_chunks(self, shape: Sequence[int], chunks: Iterable[ArrayLike]) -> None:
+        """Set the value of the datapin from chunks of a new value.
+
+        Parameters
+        ----------
+        shape : Sequence[int]
+            Dimensions of the whole new value.
+        chunks : Iterable[ArrayLike]
+            Values, in row-major order. The chunks may be of any size,
+            and are consumed one at a time.
+
+        Raises
+        ------
+        TypeError
+            If a chunk cannot be safely cast to the datapin's type.
+        ValueError
+            If the chunks do not hold exactly as many values as ``shape``
+            describes.
+        """
+        message = convert_numpy_chunks_to_grpc_array(
+            self._ARRAY_MESSAGE_TYPE, shape, (self._check_chunk(chunk) for chunk in chunks)
+        )
+        request = self._SET_VALUE_REQUEST_TYPE(target=self._element_id, new_value=message)
+        getattr(self._client, self._SET_VALUE_CALL)(request)
+
+    def _check_chunk(self, chunk: ArrayLike) -> np.ndarray:
+        """Check that a chunk can be safely cast to the datapin's type."""
+        array: np.ndarray = np.asarray(chunk)
+        if not np.can_cast(array.dtype, self._DTYPE, casting="safe"):
+            raise TypeError(f"Cannot safely cast a chunk of {array.dtype} values to {self._DTYPE}.")
+        return array
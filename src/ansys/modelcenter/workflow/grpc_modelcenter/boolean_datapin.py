@@ -28,19 +28,26 @@ These classes include ``BooleanDatapin`` and ``BooleanArrayDatapin``.
 from typing import TYPE_CHECKING
 
 import ansys.tools.variableinterop as atvi
+import numpy as np
 from overrides import overrides
 
 import ansys.modelcenter.workflow.api as mc_api
 
 from ._visitors.variable_value_visitor import VariableValueVisitor
 from .base_datapin import BaseDatapin
+from .base_numeric_array_datapin import BaseNumericArrayDatapin
 
 if TYPE_CHECKING:
     from .engine import Engine
 
 from ansys.api.modelcenter.v0.element_messages_pb2 import ElementId
-from ansys.api.modelcenter.v0.variable_value_messages_pb2 import SetBooleanVariableMetadataRequest
+from ansys.api.modelcenter.v0.variable_value_messages_pb2 import (
+    BooleanArrayValue,
+    SetBooleanArrayValueRequest,
+    SetBooleanVariableMetadataRequest,
+)
 
+from ._metadata_cache import cached_metadata, invalidates_metadata
 from .grpc_error_interpretation import (
     WRAP_OUT_OF_BOUNDS,
     WRAP_TARGET_NOT_FOUND,
@@ -77,13 +84,15 @@ class BooleanDatapin(BaseDatapin, mc_api.IBooleanDatapin):
     def __eq__(self, other):
         return isinstance(other, BooleanDatapin) and self.element_id == other.element_id
 
-    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
+    @cached_metadata
     @overrides
     def get_metadata(self) -> atvi.BooleanMetadata:
         response = self._client.BooleanVariableGetMetadata(self._element_id)
         return convert_grpc_boolean_metadata(response)
 
     @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @invalidates_metadata
     @overrides
     def set_metadata(self, new_metadata: atvi.CommonVariableMetadata) -> None:
         if not isinstance(new_metadata, atvi.BooleanMetadata):
@@ -109,7 +118,7 @@ class BooleanDatapin(BaseDatapin, mc_api.IBooleanDatapin):
         state.value.accept(set_visitor)
 
 
-class BooleanArrayDatapin(BaseDatapin, mc_api.IBooleanArrayDatapin):
+class BooleanArrayDatapin(BaseNumericArrayDatapin, mc_api.IBooleanArrayDatapin):
     """Represents a Boolean array datapin.
 
     .. note::
@@ -117,17 +126,25 @@ class BooleanArrayDatapin(BaseDatapin, mc_api.IBooleanArrayDatapin):
         an instantiated ``Engine`` instance and use it to get a valid instance of this object.
     """
 
+    _VALUE_FIELD = "bool_array_value"
+    _ARRAY_MESSAGE_TYPE = BooleanArrayValue
+    _SET_VALUE_REQUEST_TYPE = SetBooleanArrayValueRequest
+    _SET_VALUE_CALL = "BooleanArraySetValue"
+    _DTYPE = np.dtype(np.bool_)
+
     @overrides
     def __eq__(self, other):
         return isinstance(other, BooleanArrayDatapin) and self.element_id == other.element_id
 
-    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
+    @cached_metadata
     @overrides
     def get_metadata(self) -> atvi.BooleanArrayMetadata:
         response = self._client.BooleanVariableGetMetadata(self._element_id)
         return convert_grpc_boolean_array_metadata(response)
 
     @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @invalidates_metadata
     @overrides
     def set_metadata(self, new_metadata: atvi.CommonVariableMetadata) -> None:
         if not isinstance(new_metadata, atvi.BooleanArrayMetadata):
@@ -0,0 +1,183 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Defines the options for gRPC channels and calls made by an engine."""
+
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Tuple, TypeVar
+
+import grpc
+
+StubType = TypeVar("StubType")
+
+
+class ChannelOptions(NamedTuple):
+    """Options for the gRPC channel that an engine creates.
+
+    Options left as ``None`` keep the gRPC defaults.
+    """
+
+    max_send_message_length: Optional[int] = None
+    """Largest message that may be sent, in bytes. Use ``-1`` for no limit."""
+    max_receive_message_length: Optional[int] = None
+    """Largest message that may be received, in bytes. gRPC defaults to
+    4 MB, which large array datapins can exceed. Use ``-1`` for no limit."""
+    keepalive_time_ms: Optional[int] = None
+    """Milliseconds between keepalive pings on the connection."""
+    keepalive_timeout_ms: Optional[int] = None
+    """Milliseconds to wait for a keepalive ping to be answered before the
+    connection is considered broken."""
+    keepalive_permit_without_calls: Optional[bool] = None
+    """Whether to send keepalive pings while no calls are in progress."""
+
+    def to_grpc_options(self) -> List[Tuple[str, Any]]:
+        """Convert these options to the form that gRPC channels accept.
+
+        Returns
+        -------
+        List[Tuple[str, Any]]
+            gRPC channel arguments for the options that are set.
+        """
+        names = {
+            "max_send_message_length": "grpc.max_send_message_length",
+            "max_receive_message_length": "grpc.max_receive_message_length",
+            "keepalive_time_ms": "grpc.keepalive_time_ms",
+            "keepalive_timeout_ms": "grpc.keepalive_timeout_ms",
+            "keepalive_permit_without_calls": "grpc.keepalive_permit_without_calls",
+        }
+        return [
+            (names[field], int(value))
+            for field, value in self._asdict().items()
+            if value is not None
+        ]
+
+
+class CallOptions(NamedTuple):
+    """Options for each gRPC call that an engine and its elements make.
+
+    A ``timeout`` passed directly to a stub method takes precedence over
+    these options.
+    """
+
+    timeout: Optional[float] = None
+    """Default deadline of each call, in seconds. ``None`` means calls wait
+    indefinitely."""
+    method_timeouts: Optional[Mapping[str, Optional[float]]] = None
+    """Deadlines for particular RPC methods, in seconds, keyed by method name
+    (for example ``"WorkflowRun"``). These override ``timeout``. A value of
+    ``None`` means calls to that method wait indefinitely."""
+    compression_threshold: Optional[int] = None
+    """Size in bytes at or above which requests are compressed with gzip.
+    ``None`` means requests are never compressed."""
+
+    def get_timeout(self, method_name: str) -> Optional[float]:
+        """Get the deadline of calls to an RPC method.
+
+        Parameters
+        ----------
+        method_name : str
+            Name of the method, for example ``"WorkflowRun"``.
+
+        Returns
+        -------
+        Optional[float]
+            Deadline in seconds, or ``None`` for no deadline.
+        """
+        if self.method_timeouts is not None and method_name in self.method_timeouts:
+            return self.method_timeouts[method_name]
+        return self.timeout
+
+    @property
+    def is_default(self) -> bool:
+        """Whether these options leave every call unchanged."""
+        return (
+            self.timeout is None and not self.method_timeouts and self.compression_threshold is None
+        )
+
+
+class _OptionsCall:
+    """Wraps one stub method so that calls to it use a set of
+    ``CallOptions``."""
+
+    def __init__(self, call: Callable, method_name: str, options: CallOptions):
+        self._call: Callable = call
+        self._timeout: Optional[float] = options.get_timeout(method_name)
+        self._compression_threshold: Optional[int] = options.compression_threshold
+        start_call: Optional[Callable] = getattr(call, "future", None)
+        if start_call is not None:
+            self._start_call: Callable = start_call
+            self.future = self._future
+
+    def _get_kwargs(self, request: Any, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        if self._timeout is not None:
+            kwargs.setdefault("timeout", self._timeout)
+        if (
+            self._compression_threshold is not None
+            and "compression" not in kwargs
+            and request.ByteSize() >= self._compression_threshold
+        ):
+            kwargs["compression"] = grpc.Compression.Gzip
+        return kwargs
+
+    def __call__(self, request: Any, **kwargs: Any) -> Any:
+        return self._call(request, **self._get_kwargs(request, kwargs))
+
+    def _future(self, request: Any, **kwargs: Any) -> Any:
+        return self._start_call(request, **self._get_kwargs(request, kwargs))
+
+
+class _OptionsStub:
+    """Wraps a stub so that every call made with it uses a set of
+    ``CallOptions``."""
+
+    def __init__(self, stub: Any, options: CallOptions):
+        self._stub: Any = stub
+        self._options: CallOptions = options
+
+    def __getattr__(self, name: str) -> Any:
+        call = getattr(self._stub, name)
+        if name.startswith("_") or not callable(call):
+            return call
+        wrapped = _OptionsCall(call, name, self._options)
+        # Keep the wrapper so later lookups skip __getattr__.
+        setattr(self, name, wrapped)
+        return wrapped
+
+
+def apply_call_options(stub: StubType, options: Optional[CallOptions]) -> StubType:
+    """Make every call through a stub use a set of call options.
+
+    Parameters
+    ----------
+    stub : StubType
+        Stub to apply the options to.
+    options : Optional[CallOptions]
+        Options to apply. If ``None``, or if the options leave calls
+        unchanged, the stub is returned as is.
+
+    Returns
+    -------
+    StubType
+        Stub whose methods apply the options.
+    """
+    if options is None or options.is_default:
+        return stub
+    return _OptionsStub(stub, options)  # type: ignore[return-value]
@@ -87,7 +87,7 @@ class Component(
     def _create_group(self, element_id: ElementId) -> mc_api.IGroup:
         return group.Group(element_id, self._engine)
 
-    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
     @overrides
     def get_source(self) -> str:
         response = self._client.ComponentGetSource(self._element_id)
@@ -106,7 +106,7 @@ class Component(
         self._client.ComponentInvalidate(self._element_id)
 
     @property
-    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
     @overrides
     def is_connected(self) -> bool:
         response = self._client.ComponentIsConnected(self._element_id)
@@ -118,6 +118,7 @@ class Component(
     @overrides
     def reconnect(self) -> None:
         self._client.ComponentReconnect(self._element_id)
+        self._engine._notify_structure_changed()
 
     @interpret_rpc_error(
         {
@@ -130,7 +131,7 @@ class Component(
         self._client.ComponentDownloadValues(self._element_id)
 
     @property
-    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
     @overrides
     def pacz_url(self) -> Optional[str]:
         response = self._client.ComponentGetPaczUrl(self._element_id)
@@ -0,0 +1,280 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Defines a searchable index of the datapins in a workflow."""
+
+import fnmatch
+import re
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from ansys.api.modelcenter.v0.element_messages_pb2 import ElementId, ElementType
+from ansys.api.modelcenter.v0.grpc_modelcenter_workflow_pb2_grpc import (
+    ModelCenterWorkflowServiceStub,
+)
+from ansys.api.modelcenter.v0.variable_value_messages_pb2 import VariableType
+import ansys.tools.variableinterop as atvi
+import numpy as np
+
+import ansys.modelcenter.workflow.api as mc_api
+
+from ._pipeline import DEFAULT_MAX_IN_FLIGHT, pipeline_calls
+from .create_datapin import create_datapin
+from .var_value_convert import grpc_type_enum_to_interop_type
+from .workflow_snapshot import WorkflowSnapshot
+
+if TYPE_CHECKING:
+    from .engine import Engine
+
+_GLOB_SPECIAL_CHARACTERS = "*?["
+"""Characters that end the literal prefix of a glob pattern."""
+
+_NAME_UPPER_BOUND = "\U0010ffff"
+"""Character that sorts after any character that can appear in a name."""
+
+
+class DatapinIndex:
+    """Index of the datapins in a workflow, sorted by full name.
+
+    The index holds the value type and direction of each datapin, so
+    queries are answered without any calls to the engine. It reflects the
+    workflow at the time it was built.
+
+    .. note::
+        This class should not be directly instantiated by clients. Call
+        ``Workflow.get_datapin_index()`` or ``Workflow.find_datapins()``.
+    """
+
+    def __init__(
+        self,
+        snapshot: WorkflowSnapshot,
+        is_input_to_component: np.ndarray,
+        is_input_to_workflow: np.ndarray,
+        engine: "Engine",
+    ):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        snapshot : WorkflowSnapshot
+            Snapshot of the workflow to index the datapins of.
+        is_input_to_component : np.ndarray
+            Whether each datapin in the snapshot, in snapshot order, is an
+            input to its component.
+        is_input_to_workflow : np.ndarray
+            Whether each datapin in the snapshot, in snapshot order, is an
+            input to the workflow.
+        engine : Engine
+            Engine to create datapin objects with.
+        """
+        self._snapshot = snapshot
+        self._engine = engine
+        rows = np.flatnonzero(snapshot.kinds == ElementType.ELEMENT_TYPE_VARIABLE)
+        names = np.asarray([snapshot.names[row] for row in rows], dtype=str)
+        order = np.argsort(names, kind="stable")
+        self._rows: np.ndarray = rows[order]
+        self._names: np.ndarray = names[order]
+        self._value_types: np.ndarray = snapshot.value_types[self._rows]
+        self._is_input_to_component: np.ndarray = np.asarray(is_input_to_component, dtype=bool)[
+            order
+        ]
+        self._is_input_to_workflow: np.ndarray = np.asarray(is_input_to_workflow, dtype=bool)[order]
+
+    def __len__(self) -> int:
+        """Get the number of datapins in the index."""
+        return len(self._rows)
+
+    @property
+    def snapshot(self) -> WorkflowSnapshot:
+        """Snapshot of the workflow that the index was built from."""
+        return self._snapshot
+
+    def _prefix_range(self, prefix: str) -> slice:
+        start = int(np.searchsorted(self._names, prefix, side="left"))
+        stop = int(np.searchsorted(self._names, prefix + _NAME_UPPER_BOUND, side="left"))
+        return slice(start, stop)
+
+    def _find_positions(
+        self,
+        pattern: str,
+        regex: bool,
+        value_type: Optional[atvi.VariableType],
+        is_input_to_component: Optional[bool],
+        is_input_to_workflow: Optional[bool],
+    ) -> np.ndarray:
+        if regex:
+            candidates = slice(0, len(self._names))
+            matcher = re.compile(pattern)
+        else:
+            literal_end = len(pattern)
+            for special in _GLOB_SPECIAL_CHARACTERS:
+                found = pattern.find(special)
+                if found != -1:
+                    literal_end = min(literal_end, found)
+            candidates = self._prefix_range(pattern[:literal_end])
+            matcher = re.compile(fnmatch.translate(pattern))
+
+        mask = np.ones(candidates.stop - candidates.start, dtype=bool)
+        if value_type is not None:
+            matching_types = [
+                grpc_type
+                for grpc_type in VariableType.values()
+                if grpc_type_enum_to_interop_type(grpc_type) == value_type
+            ]
+            mask &= np.isin(self._value_types[candidates], matching_types)
+        if is_input_to_component is not None:
+            mask &= self._is_input_to_component[candidates] == is_input_to_component
+        if is_input_to_workflow is not None:
+            mask &= self._is_input_to_workflow[candidates] == is_input_to_workflow
+
+        positions = np.flatnonzero(mask) + candidates.start
+        return np.asarray(
+            [position for position in positions if matcher.fullmatch(self._names[position])],
+            dtype=np.intp,
+        )
+
+    def find_names(
+        self,
+        pattern: str = "*",
+        regex: bool = False,
+        value_type: Optional[atvi.VariableType] = None,
+        is_input_to_component: Optional[bool] = None,
+        is_input_to_workflow: Optional[bool] = None,
+    ) -> List[str]:
+        """Get the full names of the datapins that match a query.
+
+        Parameters
+        ----------
+        pattern : str, optional
+            Pattern that the full name must match. This is a glob pattern
+            in which ``*`` also matches dots, so ``"Model.Wing.*"`` matches
+            every datapin under ``Model.Wing``. The default matches every
+            datapin.
+        regex : bool, optional
+            Whether ``pattern`` is a regular expression that must match the
+            whole name instead of a glob pattern. The default is ``False``.
+        value_type : atvi.VariableType, optional
+            Value type the datapins must have. The default is any type.
+        is_input_to_component : bool, optional
+            Whether the datapins must be inputs (``True``) or outputs
+            (``False``) of their component. The default is either.
+        is_input_to_workflow : bool, optional
+            Whether the datapins must be inputs (``True``) or not inputs
+            (``False``) of the workflow. The default is either.
+
+        Returns
+        -------
+        List[str]
+            Full names of the matching datapins, in sorted order.
+        """
+        positions = self._find_positions(
+            pattern, regex, value_type, is_input_to_component, is_input_to_workflow
+        )
+        return self._names[positions].tolist()
+
+    def find(
+        self,
+        pattern: str = "*",
+        regex: bool = False,
+        value_type: Optional[atvi.VariableType] = None,
+        is_input_to_component: Optional[bool] = None,
+        is_input_to_workflow: Optional[bool] = None,
+    ) -> Dict[str, mc_api.IDatapin]:
+        """Get the datapins that match a query.
+
+        The datapin objects are created from the index, so no calls are
+        made to the engine.
+
+        Parameters
+        ----------
+        pattern : str, optional
+            Pattern that the full name must match. This is a glob pattern
+            in which ``*`` also matches dots, so ``"Model.Wing.*"`` matches
+            every datapin under ``Model.Wing``. The default matches every
+            datapin.
+        regex : bool, optional
+            Whether ``pattern`` is a regular expression that must match the
+            whole name instead of a glob pattern. The default is ``False``.
+        value_type : atvi.VariableType, optional
+            Value type the datapins must have. The default is any type.
+        is_input_to_component : bool, optional
+            Whether the datapins must be inputs (``True``) or outputs
+            (``False``) of their component. The default is either.
+        is_input_to_workflow : bool, optional
+            Whether the datapins must be inputs (``True``) or not inputs
+            (``False``) of the workflow. The default is either.
+
+        Returns
+        -------
+        Dict[str, mc_api.IDatapin]
+            Matching datapins keyed by full name, in sorted order.
+        """
+        positions = self._find_positions(
+            pattern, regex, value_type, is_input_to_component, is_input_to_workflow
+        )
+        ids = self._snapshot.ids
+        return {
+            str(self._names[position]): create_datapin(
+                int(self._value_types[position]),
+                ElementId(id_string=ids[self._rows[position]]),
+                self._engine,
+            )
+            for position in positions
+        }
+
+
+def build_datapin_index(
+    client: ModelCenterWorkflowServiceStub,
+    snapshot: WorkflowSnapshot,
+    engine: "Engine",
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+) -> DatapinIndex:
+    """Read the direction of every datapin in a snapshot and index them.
+
+    Parameters
+    ----------
+    client : ModelCenterWorkflowServiceStub
+        Client to make the calls with.
+    snapshot : WorkflowSnapshot
+        Snapshot of the workflow to index.
+    engine : Engine
+        Engine to create datapin objects with.
+    max_in_flight : int
+        Maximum number of calls to have outstanding at once.
+
+    Returns
+    -------
+    DatapinIndex
+        Index of the datapins in the snapshot.
+    """
+    rows = np.flatnonzero(snapshot.kinds == ElementType.ELEMENT_TYPE_VARIABLE)
+    ids = snapshot.ids
+    is_input_to_component = np.zeros(len(rows), dtype=bool)
+    is_input_to_workflow = np.zeros(len(rows), dtype=bool)
+    responses = pipeline_calls(
+        client.VariableGetIsInput,
+        (ElementId(id_string=ids[row]) for row in rows),
+        max_in_flight,
+    )
+    for position, response in enumerate(responses):
+        is_input_to_component[position] = response.is_input_component
+        is_input_to_workflow[position] = response.is_input_workflow
+    return DatapinIndex(snapshot, is_input_to_component, is_input_to_workflow, engine)
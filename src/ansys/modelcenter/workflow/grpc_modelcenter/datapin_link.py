@@ -22,6 +22,8 @@
 
 """Defines the datapin link."""
 
+from typing import TYPE_CHECKING, Optional
+
 import ansys.api.modelcenter.v0.element_messages_pb2 as elem_msg
 import ansys.api.modelcenter.v0.grpc_modelcenter_workflow_pb2_grpc as grpc_mcd_workflow
 import ansys.api.modelcenter.v0.workflow_messages_pb2 as workflow_msg
@@ -31,6 +33,9 @@ import ansys.modelcenter.workflow.api as wfapi
 
 from .grpc_error_interpretation import WRAP_TARGET_NOT_FOUND, interpret_rpc_error
 
+if TYPE_CHECKING:
+    from .engine import Engine
+
 
 class DatapinLink(wfapi.IDatapinLink):
     """Defines a link between the datapins in the workflow.
@@ -41,7 +46,11 @@ class DatapinLink(wfapi.IDatapinLink):
     """
 
     def __init__(
-        self, stub: grpc_mcd_workflow.ModelCenterWorkflowServiceStub, lhs_id: str, rhs: str
+        self,
+        stub: grpc_mcd_workflow.ModelCenterWorkflowServiceStub,
+        lhs_id: str,
+        rhs: str,
+        engine: Optional["Engine"] = None,
     ):
         """Construct an instance.
 
@@ -51,10 +60,18 @@ class DatapinLink(wfapi.IDatapinLink):
             Left-hand side of the link equation.
         rhs: str
             Right-hand side of the link equation.
+        engine : Engine, optional
+            Engine that the workflow is loaded in. If given, it is told
+            when the link is broken, suspended, or resumed.
         """
         self._stub = stub
         self._lhs_id = lhs_id
         self._rhs = rhs
+        self._engine = engine
+
+    def _notify_links_changed(self) -> None:
+        if self._engine is not None:
+            self._engine._notify_links_changed()
 
     @overrides
     def __eq__(self, other):
@@ -70,6 +87,7 @@ class DatapinLink(wfapi.IDatapinLink):
         request = workflow_msg.WorkflowBreakLinkRequest()
         request.target_var.id_string = self._lhs_id
         response: workflow_msg.WorkflowBreakLinkResponse = self._stub.WorkflowBreakLink(request)
+        self._notify_links_changed()
         if not response.existed:
             raise ValueError("Target ID does not exist.")
 
@@ -79,6 +97,7 @@ class DatapinLink(wfapi.IDatapinLink):
             target_link_lhs=elem_msg.ElementId(id_string=self._lhs_id), suspend=suspend
         )
         self._stub.WorkflowSuspendOrResumeLink(request)
+        self._notify_links_changed()
 
     @overrides
     def suspend(self) -> None:
@@ -88,7 +107,7 @@ class DatapinLink(wfapi.IDatapinLink):
     def resume(self) -> None:
         self._do_suspend_or_resume(False)
 
-    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
     @overrides
     def is_suspended(self) -> bool:
         response: workflow_msg.WorkflowLinkSuspension = self._stub.WorkflowGetLinkSuspensionState(
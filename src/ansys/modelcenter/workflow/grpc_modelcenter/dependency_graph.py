@@ -0,0 +1,341 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Defines an in-memory graph of the dependencies between datapins."""
+
+from typing import TYPE_CHECKING, Iterable, List, Tuple, Union
+
+from ansys.api.modelcenter.v0.element_messages_pb2 import ElementId, ElementType
+from ansys.api.modelcenter.v0.grpc_modelcenter_workflow_pb2_grpc import (
+    ModelCenterWorkflowServiceStub,
+)
+from ansys.api.modelcenter.v0.variable_value_messages_pb2 import GetVariableDependenciesRequest
+import numpy as np
+
+import ansys.modelcenter.workflow.api as mc_api
+
+from ._pipeline import DEFAULT_MAX_IN_FLIGHT, pipeline_calls
+from .workflow_snapshot import WorkflowSnapshot
+
+if TYPE_CHECKING:
+    from .datapin_index import DatapinIndex
+
+
+def _expand(indptr: np.ndarray, indices: np.ndarray, nodes: np.ndarray) -> np.ndarray:
+    """Get the neighbors of several nodes of a CSR graph, with repeats."""
+    starts = indptr[nodes]
+    counts = indptr[nodes + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        return np.empty(0, dtype=indices.dtype)
+    offsets = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(total)
+    return indices[offsets]
+
+
+def _reach(indptr: np.ndarray, indices: np.ndarray, sources: np.ndarray) -> np.ndarray:
+    """Get a mask of the nodes reachable from the sources by at least one
+    edge."""
+    reached = np.zeros(len(indptr) - 1, dtype=bool)
+    frontier = np.unique(_expand(indptr, indices, sources))
+    while frontier.size > 0:
+        reached[frontier] = True
+        following = np.unique(_expand(indptr, indices, frontier))
+        frontier = following[~reached[following]]
+    return reached
+
+
+def _transpose(indptr: np.ndarray, indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Reverse the edges of a CSR graph."""
+    count = len(indptr) - 1
+    sources = np.repeat(np.arange(count, dtype=indices.dtype), np.diff(indptr))
+    order = np.argsort(indices, kind="stable")
+    reverse_indptr = np.zeros(count + 1, dtype=indptr.dtype)
+    np.cumsum(np.bincount(indices, minlength=count), out=reverse_indptr[1:])
+    return reverse_indptr, sources[order]
+
+
+class DependencyGraph:
+    """Graph of the direct dependencies between the datapins in a workflow.
+
+    The graph is stored in compressed sparse row (CSR) form over the
+    element indices of a ``WorkflowSnapshot``: the direct dependents of the
+    element at index ``i`` are ``indices[indptr[i]:indptr[i + 1]]``. All
+    queries are answered in memory, without calls to the engine. The
+    graph reflects the workflow at the time it was built.
+
+    .. note::
+        This class should not be directly instantiated by clients. Call
+        ``Workflow.dependency_graph()``.
+    """
+
+    def __init__(
+        self,
+        snapshot: WorkflowSnapshot,
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        is_input_to_component: np.ndarray,
+        follow_suspended_links: bool,
+    ):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        snapshot : WorkflowSnapshot
+            Snapshot that the node indices refer to.
+        indptr : np.ndarray
+            Offset of the first dependent of each element in ``indices``,
+            with one more entry than there are elements.
+        indices : np.ndarray
+            Indices of the direct dependents of each element in turn.
+        is_input_to_component : np.ndarray
+            Whether each element is a datapin that is an input to its
+            component.
+        follow_suspended_links : bool
+            Whether suspended links were followed to build the graph.
+        """
+        self._snapshot = snapshot
+        self._indptr: np.ndarray = np.asarray(indptr, dtype=np.int32)
+        self._indices: np.ndarray = np.asarray(indices, dtype=np.int32)
+        if self._indptr.shape != (len(snapshot) + 1,):
+            raise ValueError("indptr must have one more entry than the snapshot has elements.")
+        self._reverse_indptr, self._reverse_indices = _transpose(self._indptr, self._indices)
+        self._is_datapin: np.ndarray = snapshot.kinds == ElementType.ELEMENT_TYPE_VARIABLE
+        self._is_output: np.ndarray = self._is_datapin & ~np.asarray(
+            is_input_to_component, dtype=bool
+        )
+        self._follow_suspended_links = follow_suspended_links
+        for array in (self._indptr, self._indices, self._reverse_indptr, self._reverse_indices):
+            array.setflags(write=False)
+
+    @property
+    def snapshot(self) -> WorkflowSnapshot:
+        """Snapshot that the node indices refer to."""
+        return self._snapshot
+
+    @property
+    def indptr(self) -> np.ndarray:
+        """Offset of the first direct dependent of each element in
+        ``indices``."""
+        return self._indptr
+
+    @property
+    def indices(self) -> np.ndarray:
+        """Indices of the direct dependents of each element in turn."""
+        return self._indices
+
+    @property
+    def edge_count(self) -> int:
+        """Number of direct dependencies in the graph."""
+        return len(self._indices)
+
+    @property
+    def follow_suspended_links(self) -> bool:
+        """Whether suspended links were followed to build the graph."""
+        return self._follow_suspended_links
+
+    def _to_nodes(self, datapins: Iterable[Union[str, mc_api.IDatapin]]) -> np.ndarray:
+        nodes = [
+            (
+                self._snapshot.index_of(datapin)
+                if isinstance(datapin, str)
+                else self._snapshot.index_of_id(datapin.element_id)
+            )
+            for datapin in datapins
+        ]
+        return np.asarray(nodes, dtype=np.int32)
+
+    def _to_names(self, mask: np.ndarray) -> List[str]:
+        names = self._snapshot.names
+        return [names[node] for node in np.flatnonzero(mask)]
+
+    def get_dependents(
+        self, datapins: Iterable[Union[str, mc_api.IDatapin]], transitive: bool = True
+    ) -> List[str]:
+        """Get the datapins that depend on any of several datapins.
+
+        Parameters
+        ----------
+        datapins : Iterable[Union[str, mc_api.IDatapin]]
+            Datapins to start from, given as full names or datapin objects.
+        transitive : bool, optional
+            Whether to include indirect dependents. The default is ``True``.
+
+        Returns
+        -------
+        List[str]
+            Full names of the dependents, in snapshot order. A starting
+            datapin is only included if it depends on another starting
+            datapin or, transitively, on itself.
+
+        Raises
+        ------
+        KeyError
+            If a datapin is not in the graph.
+        """
+        nodes = self._to_nodes(datapins)
+        if transitive:
+            return self._to_names(_reach(self._indptr, self._indices, nodes))
+        mask = np.zeros(len(self._snapshot), dtype=bool)
+        mask[_expand(self._indptr, self._indices, nodes)] = True
+        return self._to_names(mask)
+
+    def get_precedents(
+        self, datapins: Iterable[Union[str, mc_api.IDatapin]], transitive: bool = True
+    ) -> List[str]:
+        """Get the datapins that any of several datapins depend on.
+
+        Parameters
+        ----------
+        datapins : Iterable[Union[str, mc_api.IDatapin]]
+            Datapins to start from, given as full names or datapin objects.
+        transitive : bool, optional
+            Whether to include indirect precedents. The default is ``True``.
+
+        Returns
+        -------
+        List[str]
+            Full names of the precedents, in snapshot order.
+
+        Raises
+        ------
+        KeyError
+            If a datapin is not in the graph.
+        """
+        nodes = self._to_nodes(datapins)
+        if transitive:
+            return self._to_names(_reach(self._reverse_indptr, self._reverse_indices, nodes))
+        mask = np.zeros(len(self._snapshot), dtype=bool)
+        mask[_expand(self._reverse_indptr, self._reverse_indices, nodes)] = True
+        return self._to_names(mask)
+
+    def get_affected_outputs(self, datapins: Iterable[Union[str, mc_api.IDatapin]]) -> List[str]:
+        """Get the component outputs that change if any of several datapins
+        change.
+
+        Parameters
+        ----------
+        datapins : Iterable[Union[str, mc_api.IDatapin]]
+            Datapins that change, given as full names or datapin objects.
+
+        Returns
+        -------
+        List[str]
+            Full names of the outputs that depend on the datapins, directly
+            or indirectly, in snapshot order.
+
+        Raises
+        ------
+        KeyError
+            If a datapin is not in the graph.
+        """
+        reached = _reach(self._indptr, self._indices, self._to_nodes(datapins))
+        return self._to_names(reached & self._is_output)
+
+    def topological_order(self) -> List[str]:
+        """Get the datapins ordered so that each comes before its dependents.
+
+        Returns
+        -------
+        List[str]
+            Full names of every datapin in the graph.
+
+        Raises
+        ------
+        ValueError
+            If the dependencies form a cycle.
+        """
+        in_degree = np.bincount(self._indices, minlength=len(self._snapshot))
+        frontier = np.flatnonzero(self._is_datapin & (in_degree == 0))
+        order: List[int] = []
+        while frontier.size > 0:
+            order.extend(frontier.tolist())
+            following = _expand(self._indptr, self._indices, frontier)
+            in_degree -= np.bincount(following, minlength=len(in_degree))
+            candidates = np.unique(following)
+            frontier = candidates[in_degree[candidates] == 0]
+        if len(order) < int(np.count_nonzero(self._is_datapin)):
+            raise ValueError("The datapin dependencies form a cycle.")
+        names = self._snapshot.names
+        return [names[node] for node in order]
+
+
+def build_dependency_graph(
+    client: ModelCenterWorkflowServiceStub,
+    index: "DatapinIndex",
+    follow_suspended_links: bool = False,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+) -> DependencyGraph:
+    """Read the direct dependents of every datapin in an index.
+
+    Parameters
+    ----------
+    client : ModelCenterWorkflowServiceStub
+        Client to make the calls with.
+    index : DatapinIndex
+        Index of the datapins to build the graph over.
+    follow_suspended_links : bool, optional
+        Whether to follow suspended links.
+    max_in_flight : int
+        Maximum number of calls to have outstanding at once.
+
+    Returns
+    -------
+    DependencyGraph
+        Graph of the dependencies between the datapins.
+    """
+    snapshot = index.snapshot
+    count = len(snapshot)
+    rows = np.flatnonzero(snapshot.kinds == ElementType.ELEMENT_TYPE_VARIABLE)
+    ids = snapshot.ids
+    requests = (
+        GetVariableDependenciesRequest(
+            id=ElementId(id_string=ids[row]),
+            only_fetch_direct_dependencies=True,
+            follow_suspended=follow_suspended_links,
+        )
+        for row in rows
+    )
+    degrees = np.zeros(count + 1, dtype=np.int32)
+    indices: List[int] = []
+    for row, response in zip(
+        rows, pipeline_calls(client.VariableGetDependents, requests, max_in_flight)
+    ):
+        # Dependents outside of the snapshot, for example in a workflow that
+        # changed after the snapshot was taken, are left out.
+        dependent_count = 0
+        for variable in response.variables:
+            try:
+                indices.append(snapshot.index_of_id(variable.id.id_string))
+            except KeyError:
+                continue
+            dependent_count += 1
+        degrees[row + 1] = dependent_count
+
+    is_input_to_component = np.zeros(count, dtype=bool)
+    is_input_to_component[index._rows] = index._is_input_to_component
+    return DependencyGraph(
+        snapshot,
+        np.cumsum(degrees, dtype=np.int32),
+        np.asarray(indices, dtype=np.int32),
+        is_input_to_component,
+        follow_suspended_links,
+    )
@@ -24,42 +24,45 @@
 
 from os import PathLike
 from string import Template
-from threading import Condition, Thread
-from typing import Collection, Dict, List, Mapping, Optional, Union
+from threading import Lock
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import ansys.api.modelcenter.v0.engine_messages_pb2 as eng_msg
 from ansys.api.modelcenter.v0.grpc_modelcenter_pb2_grpc import GRPCModelCenterServiceStub
 from ansys.engineeringworkflow.api import WorkflowEngineInfo
-import ansys.platform.instancemanagement as pypim
-from ansys.tools.common import cyberchannel
 import grpc
 import numpy
 from overrides import overrides
 
 from ansys.modelcenter.workflow.api import IEngine, WorkflowType
 
+from ._format_cache import FormatCache
+from ._heartbeat import HeartbeatRegistration, HeartbeatStatistics, get_heartbeat_scheduler
+from ._metadata_cache import MetadataCache
+from .call_options import CallOptions, ChannelOptions, apply_call_options
 from .format import Format
 from .grpc_error_interpretation import WRAP_INVALID_ARG, interpret_rpc_error
 from .mcd_process import MCDProcess
+from .retry import RetryPolicy
 from .workflow import Workflow
 
+if TYPE_CHECKING:
+    import ansys.platform.instancemanagement as pypim
 
-def _heartbeat_loop(condition: Condition, address: str, engine, interval: numpy.uint) -> None:
-    """Runs a loop that sends heartbeat messages to the server at regular
-    intervals."""
-    # should use Condition to perform timing AND decide whether or not to bail,
-    # allows immediate leaving while still joining the thread
-    # should keep going if HeartbeatRequest fails for a reason besides UNAVAILABLE
-    channel = grpc.insecure_channel(address)
-    stub = engine._create_client(channel)
-    should_continue_heartbeating: bool = not engine.is_closed
-    while should_continue_heartbeating:
-        request = eng_msg.HeartbeatRequest()
-        stub.Heartbeat(request)
-        # sleep for a little less than the heartbeat interval
-        with condition:
-            condition.wait(max(0, (interval * 0.95) / 1000))
-        should_continue_heartbeating = not engine.is_closed
+StubType = TypeVar("StubType")
 
 
 class WorkflowAlreadyLoadedError(Exception):
@@ -72,6 +75,144 @@ class WorkflowAlreadyLoadedError(Exception):
     ...
 
 
+def create_new_workflow_request(
+    name: str, workflow_type: WorkflowType = WorkflowType.DATA
+) -> eng_msg.NewWorkflowRequest:
+    """Build the request message for creating a workflow.
+
+    Parameters
+    ----------
+    name : str
+        Path of the new workflow.
+    workflow_type : WorkflowType
+        Type of the new workflow.
+
+    Returns
+    -------
+    eng_msg.NewWorkflowRequest
+        Request message to send to ``EngineCreateWorkflow``.
+    """
+    return eng_msg.NewWorkflowRequest(
+        path=name,
+        workflow_type=(
+            eng_msg.WORKFLOW_TYPE_DATA_DEPENDENCY
+            if workflow_type is WorkflowType.DATA
+            else eng_msg.WORKFLOW_TYPE_PROCESS
+        ),
+    )
+
+
+def create_load_workflow_request(
+    file_name: Union[PathLike, str], ignore_connection_errors: Optional[bool] = None
+) -> eng_msg.LoadWorkflowRequest:
+    """Build the request message for loading a workflow.
+
+    Parameters
+    ----------
+    file_name : Union[PathLike, str]
+        Path of the workflow file to load.
+    ignore_connection_errors : Optional[bool]
+        Whether to ignore errors connecting to analysis components.
+
+    Returns
+    -------
+    eng_msg.LoadWorkflowRequest
+        Request message to send to ``EngineLoadWorkflow``.
+    """
+    return eng_msg.LoadWorkflowRequest(
+        path=str(file_name),
+        connect_err_mode=(
+            eng_msg.OnConnectionErrorMode.ON_CONNECTION_ERROR_MODE_IGNORE
+            if ignore_connection_errors
+            else eng_msg.ON_CONNECTION_ERROR_MODE_RAISE_ERROR
+        ),
+    )
+
+
+def convert_preference_response(
+    response: eng_msg.GetPreferenceResponse,
+) -> Union[bool, int, float, str]:
+    """Extract the value of a preference from the server's response.
+
+    Parameters
+    ----------
+    response : eng_msg.GetPreferenceResponse
+        Response from ``EngineGetPreference``.
+
+    Returns
+    -------
+    Union[bool, int, float, str]
+        Value of the preference.
+    """
+    attr: Optional[str] = response.WhichOneof("value")
+    if attr is not None:
+        return getattr(response, attr)
+    else:
+        raise Exception("Server did not return a value.")
+
+
+def create_set_preference_request(
+    pref: str, value: Union[bool, int, float, str]
+) -> eng_msg.SetPreferenceRequest:
+    """Build the request message for setting a preference.
+
+    Parameters
+    ----------
+    pref : str
+        Name of the preference.
+    value : Union[bool, int, float, str]
+        New value of the preference.
+
+    Returns
+    -------
+    eng_msg.SetPreferenceRequest
+        Request message to send to ``EngineSetPreference``.
+    """
+    request = eng_msg.SetPreferenceRequest(preference_name=pref)
+    if isinstance(value, bool):
+        request.bool_value = value
+    elif isinstance(value, int):
+        request.int_value = value
+    elif isinstance(value, float):
+        request.double_value = value
+    else:
+        request.str_value = value
+    return request
+
+
+def convert_server_info(response: eng_msg.GetServerInfoResponse) -> WorkflowEngineInfo:
+    """Convert the server's description of itself to a ``WorkflowEngineInfo``.
+
+    Parameters
+    ----------
+    response : eng_msg.GetServerInfoResponse
+        Response from ``GetEngineInfo``.
+
+    Returns
+    -------
+    WorkflowEngineInfo
+        Information about the engine.
+    """
+    version = {
+        "major": response.version.major,
+        "minor": response.version.minor,
+        "patch": response.version.patch,
+    }
+    version_str: str = Template("${major}.${minor}.${patch}").safe_substitute(version)
+
+    return WorkflowEngineInfo(
+        release_year=version["major"],
+        release_id=version["minor"],
+        build=version["patch"],
+        is_release_build=response.is_release,
+        build_type=response.build_type,
+        version_as_string=version_str,
+        server_type=response.server_type,
+        install_location=response.directory_path,
+        base_url=None,
+    )
+
+
 class Engine(IEngine):
     """Provides the gRPC implementation of IEngine."""
 
@@ -81,6 +222,11 @@ class Engine(IEngine):
         force_local: bool = False,
         heartbeat_interval: numpy.uint = 30000,
         allowed_heartbeat_misses: numpy.uint = 3,
+        wait_for_channel_ready: bool = False,
+        on_unresponsive: Optional[Callable[["Engine"], None]] = None,
+        channel_options: Optional[ChannelOptions] = None,
+        call_options: Optional[CallOptions] = None,
+        retry_policy: Optional[RetryPolicy] = None,
     ):
         """Initialize an instance.
 
@@ -97,18 +243,138 @@ class Engine(IEngine):
             considers a heartbeat signal to have been missed.
         allowed_heartbeat_misses : numpy.uint
             Number of heartbeat misses allowed before the server terminates.
+        wait_for_channel_ready : bool
+            Whether to wait, when ModelCenter is started locally, until the
+            gRPC channel to it is connected rather than only until it
+            reports its port. The default is ``False``.
+        on_unresponsive : Optional[Callable[[Engine], None]]
+            Function to call with this engine when ``allowed_heartbeat_misses``
+            heartbeats in a row have failed. It is called on the thread
+            that sends heartbeats for every engine, so it should return
+            quickly.
+        channel_options : Optional[ChannelOptions]
+            Options for the gRPC channel, such as message size limits and
+            keepalive settings. The default is to use the gRPC defaults.
+        call_options : Optional[CallOptions]
+            Options applied to every call made through this engine and its
+            elements, such as a default deadline. The default is to leave
+            calls unchanged.
+        retry_policy : Optional[RetryPolicy]
+            Policy for retrying read-only operations that fail with a
+            transient error. The default is not to retry.
         """
+        self._initialize_state(
+            is_run_only, heartbeat_interval, allowed_heartbeat_misses, on_unresponsive
+        )
+        self._wait_for_channel_ready = wait_for_channel_ready
+        self._channel_options = channel_options
+        self._call_options = call_options
+        self._retry_policy = retry_policy
+        self._launch_modelcenter(force_local)
+        self._stub = apply_call_options(self._create_client(self._channel), call_options)
+        self._start_heartbeat()
+
+    @classmethod
+    def attach(
+        cls,
+        address: str,
+        is_run_only: bool = False,
+        send_heartbeats: bool = True,
+        heartbeat_interval: numpy.uint = 30000,
+        allowed_heartbeat_misses: numpy.uint = 3,
+        owns_server: bool = False,
+        on_unresponsive: Optional[Callable[["Engine"], None]] = None,
+        channel_options: Optional[ChannelOptions] = None,
+        call_options: Optional[CallOptions] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> "Engine":
+        """Connect to a ModelCenter gRPC server that is already running.
+
+        No process is launched, so this costs only the creation of a
+        channel. Unless ``owns_server`` is ``True``, closing the engine
+        closes the connection but leaves the server running.
+
+        Parameters
+        ----------
+        address : str
+            Address of the server, for example ``"localhost:50051"``.
+        is_run_only : bool, optional
+            Whether the server was started in run-only mode. The default is
+            ``False``.
+        send_heartbeats : bool, optional
+            Whether to send heartbeat messages to the server while the
+            engine is open. Servers started with a heartbeat shut
+            themselves down if no client sends them. The default is
+            ``True``.
+        heartbeat_interval : numpy.uint, optional
+            Number of milliseconds within which a heartbeat call must be
+            made. This should match the interval that the server was
+            started with. The default is ``30000``.
+        allowed_heartbeat_misses : numpy.uint, optional
+            Number of heartbeats in a row that may fail before
+            ``on_unresponsive`` is called. The default is ``3``.
+        owns_server : bool, optional
+            Whether closing the engine should also shut down the server.
+            The default is ``False``.
+        on_unresponsive : Optional[Callable[[Engine], None]], optional
+            Function to call with the engine when ``allowed_heartbeat_misses``
+            heartbeats in a row have failed. See ``Engine()``.
+        channel_options : Optional[ChannelOptions], optional
+            Options for the gRPC channel. See ``Engine()``.
+        call_options : Optional[CallOptions], optional
+            Options applied to every call. See ``Engine()``.
+        retry_policy : Optional[RetryPolicy], optional
+            Policy for retrying read-only operations. See ``Engine()``.
+
+        Returns
+        -------
+        Engine
+            Engine connected to the server.
+        """
+        engine = cls.__new__(cls)
+        engine._initialize_state(
+            is_run_only, heartbeat_interval, allowed_heartbeat_misses, on_unresponsive
+        )
+        engine._owns_server = owns_server
+        engine._channel_options = channel_options
+        engine._call_options = call_options
+        engine._retry_policy = retry_policy
+        engine._channel = grpc.insecure_channel(address, options=engine._get_grpc_options())
+        engine._stub = apply_call_options(engine._create_client(engine._channel), call_options)
+        if send_heartbeats:
+            engine._start_heartbeat()
+        return engine
+
+    def _initialize_state(
+        self,
+        is_run_only: bool,
+        heartbeat_interval: numpy.uint,
+        allowed_heartbeat_misses: numpy.uint,
+        on_unresponsive: Optional[Callable[["Engine"], None]],
+    ) -> None:
+        """Set up the attributes of an engine that is not yet connected."""
         self._is_closed = False
+        self._owns_server: bool = True
+        self._wait_for_channel_ready: bool = False
+        self._channel_options: Optional[ChannelOptions] = None
+        self._call_options: Optional[CallOptions] = None
+        self._retry_policy: Optional[RetryPolicy] = None
         self._is_run_only: bool = is_run_only
         self._heartbeat_interval: numpy.uint = heartbeat_interval
         self._allowed_heartbeat_misses: numpy.uint = allowed_heartbeat_misses
-        self._heartbeat_thread: Optional[Thread] = None
-        self._heartbeat_condition: Optional[Condition] = None
-        self._instance: Optional[pypim.Instance] = None
+        self._on_unresponsive: Optional[Callable[["Engine"], None]] = on_unresponsive
+        self._heartbeat: Optional[HeartbeatRegistration] = None
+        self._instance: Optional["pypim.Instance"] = None
         self._process: Optional[MCDProcess] = None
         self._channel: Optional[grpc.Channel] = None
-        self._launch_modelcenter(force_local)
-        self._stub = self._create_client(self._channel)
+        self._shared_stubs: Dict[type, Any] = {}
+        self._shared_stubs_lock = Lock()
+        self._structure_generation: int = 0
+        self._link_generation: int = 0
+        self._metadata_cache = MetadataCache()
+        self._format_cache = FormatCache()
+        self._loaded_workflows: List[Workflow] = []
+        self._stub: Optional[GRPCModelCenterServiceStub] = None
         self._workflow_id: Optional[str] = None
 
     def __enter__(self):
@@ -129,6 +395,11 @@ class Engine(IEngine):
             `PyPIM <https://github.com/ansys/pypim>`_ is configured. The default
             is ``False``.
         """
+        # PyPIM and cyberchannel are only needed here, so they are imported
+        # here to keep importing this module cheap.
+        import ansys.platform.instancemanagement as pypim
+        from ansys.tools.common import cyberchannel
+
         if pypim.is_configured() and not force_local:
             if self._is_run_only:
                 raise Exception("PyPim does not support running ModelCenter in run-only mode.")
@@ -138,53 +409,130 @@ class Engine(IEngine):
                 self._instance.wait_for_ready()
                 # LTTODO: Pypi support not required for this release;
                 # this has not been verified to work
-                self._channel = self._instance.build_grpc_channel()
+                self._channel = self._instance.build_grpc_channel(options=self._get_grpc_options())
         else:
             self._process = MCDProcess()
             port: int = self._process.start(
                 self._is_run_only, self._heartbeat_interval, self._allowed_heartbeat_misses
             )
-            self._channel = cyberchannel.create_channel("wnua", "localhost", str(port))
-
-        # run a background task to send heartbeat messages to the server
-        self._heartbeat_condition = Condition()
-        self._heartbeat_thread = Thread(
-            target=_heartbeat_loop,
-            args=(
-                self._heartbeat_condition,
-                self._channel._channel.target(),
-                self,
-                self._heartbeat_interval,
-            ),
-            daemon=True,
+            self._channel = cyberchannel.create_channel(
+                "wnua", "localhost", str(port), grpc_options=self._get_grpc_options() or None
+            )
+            if self._wait_for_channel_ready:
+                self._process.wait_for_channel(self._channel)
+
+    def _get_grpc_options(self) -> List[Tuple[str, Any]]:
+        """Get the gRPC channel arguments for this engine's channel
+        options."""
+        if self._channel_options is None:
+            return []
+        return self._channel_options.to_grpc_options()
+
+    def _start_heartbeat(self) -> None:
+        """Start sending heartbeat messages to the server on this engine's
+        channel, through the scheduler shared by every engine."""
+        on_unresponsive: Optional[Callable[[], None]] = None
+        if self._on_unresponsive is not None:
+            callback = self._on_unresponsive
+
+            def on_unresponsive() -> None:
+                callback(self)
+
+        self._heartbeat = get_heartbeat_scheduler().register(
+            self._stub,
+            self._heartbeat_interval,
+            int(self._allowed_heartbeat_misses),
+            on_unresponsive,
         )
-        self._heartbeat_thread.start()
 
     @property
     def is_closed(self) -> bool:
         """Flag indicating if this instance has been closed."""
         return self._is_closed
 
+    @property
+    def heartbeat_statistics(self) -> Optional[HeartbeatStatistics]:
+        """Counts of the heartbeat messages sent to the server.
+
+        Returns
+        -------
+        Optional[HeartbeatStatistics]
+            Number of heartbeats sent, missed, and missed since the last
+            one that succeeded, or ``None`` if this engine does not send
+            heartbeats.
+        """
+        if self._heartbeat is None:
+            return None
+        return self._heartbeat.statistics
+
+    @property
+    def retry_policy(self) -> Optional[RetryPolicy]:
+        """Policy for retrying read-only operations that fail with a
+        transient error.
+
+        Returns
+        -------
+        Optional[RetryPolicy]
+            Retry policy, or ``None`` if operations are not retried.
+        """
+        return self._retry_policy
+
+    @property
+    def metadata_cache(self) -> MetadataCache:
+        """Cache of the metadata of the datapins on this engine.
+
+        The cache is disabled by default. Set ``metadata_cache.enabled`` to
+        ``True`` to stop repeated ``get_metadata`` calls on the same datapin
+        from calling the engine each time, and ``metadata_cache.max_size``
+        to bound the number of datapins it holds.
+
+        Returns
+        -------
+        MetadataCache
+            Metadata cache for this engine.
+        """
+        return self._metadata_cache
+
+    @property
+    def format_cache(self) -> FormatCache:
+        """Cache of the values converted by the format service of this
+        engine.
+
+        The cache is disabled by default. Set ``format_cache.enabled`` to
+        ``True`` to stop the array conversion methods of ``Format`` from
+        calling the engine again for values they have converted before,
+        and ``format_cache.max_size`` to bound the number of values it
+        holds.
+
+        Returns
+        -------
+        FormatCache
+            Format cache for this engine.
+        """
+        return self._format_cache
+
     @interpret_rpc_error()
     def close(self):
-        """Shut down the gRPC server and clear out all objects."""
-        self._is_closed = True
+        """Shut down the gRPC server and clear out all objects.
 
-        if self._heartbeat_condition is not None:
-            with self._heartbeat_condition:
-                self._heartbeat_condition.notify_all()
-            self._heartbeat_condition = None
+        An engine made with ``attach()`` only shuts down the server if it
+        was attached with ``owns_server=True``.
+        """
+        self._is_closed = True
 
-        if self._heartbeat_thread is not None and self._heartbeat_thread.is_alive():
-            self._heartbeat_thread.join(self._heartbeat_interval * 1.1)
-            self._heartbeat_thread = None
+        if self._heartbeat is not None:
+            get_heartbeat_scheduler().unregister(self._heartbeat)
 
         if self._instance is not None:
             self._instance.delete()
-        else:
+        elif self._owns_server:
             request = eng_msg.ShutdownRequest()
             self._stub.Shutdown(request)
         self._stub = None
+        with self._shared_stubs_lock:
+            self._shared_stubs.clear()
+        self._metadata_cache.invalidate()
+        self._format_cache.invalidate()
 
         self._channel.close()
         self._channel = None
@@ -196,6 +544,73 @@ class Engine(IEngine):
         """Create a client from a gRPC channel."""
         return GRPCModelCenterServiceStub(grpc_channel)
 
+    def _get_shared_stub(self, stub_type: Type[StubType]) -> StubType:
+        """Get the stub for a gRPC service on this engine's channel.
+
+        The stub is created the first time it is requested and then shared
+        by every object that uses this engine, so that elements do not each
+        build their own stub. Calls made through it use the engine's call
+        options. This method is thread-safe.
+
+        Parameters
+        ----------
+        stub_type : Type[StubType]
+            Generated stub class of the service, for example
+            ``ModelCenterWorkflowServiceStub``.
+
+        Returns
+        -------
+        StubType
+            Shared stub for the service.
+        """
+        stub: Optional[StubType] = self._shared_stubs.get(stub_type)
+        if stub is None:
+            with self._shared_stubs_lock:
+                stub = self._shared_stubs.get(stub_type)
+                if stub is None:
+                    stub = apply_call_options(stub_type(self._channel), self._call_options)
+                    self._shared_stubs[stub_type] = stub
+        return stub
+
+    @interpret_rpc_error()
+    def _send_heartbeat(self) -> None:
+        """Send a single heartbeat message to the server.
+
+        This is a cheap way to check that the server is still responding.
+        """
+        self._stub.Heartbeat(eng_msg.HeartbeatRequest())
+
+    def _close_loaded_workflows(self) -> None:
+        """Close every workflow opened through this engine that is still
+        open."""
+        while len(self._loaded_workflows) > 0:
+            workflow = self._loaded_workflows.pop()
+            if not workflow._closed:
+                workflow.close_workflow()
+
+    def _forget_workflow(self, workflow: Workflow) -> None:
+        """Stop tracking a workflow that has been closed."""
+        self._loaded_workflows = [
+            loaded for loaded in self._loaded_workflows if loaded is not workflow
+        ]
+
+    def _notify_structure_changed(self) -> None:
+        """Record that this client changed the structure of a workflow.
+
+        Call this after adding, renaming, moving, or removing elements so
+        that cached name lookups are discarded.
+        """
+        self._structure_generation += 1
+
+    def _notify_links_changed(self) -> None:
+        """Record that this client changed the links of a workflow.
+
+        Call this after creating, breaking, suspending, or resuming links,
+        or setting reference equations, so that cached dependency graphs are
+        discarded.
+        """
+        self._link_generation += 1
+
     @property
     def is_local(self) -> bool:
         """Flag indicating if ModelCenter Desktop was started locally or
@@ -208,6 +623,22 @@ class Engine(IEngine):
         """
         return self._process is not None
 
+    @property
+    def startup_timings(self) -> Mapping[str, float]:
+        """Number of seconds that each phase of starting ModelCenter took.
+
+        See ``MCDProcess.startup_timings`` for the phases.
+
+        Returns
+        -------
+        Mapping[str, float]
+            Phase names and their durations in seconds, or an empty mapping
+            if ModelCenter was not started locally.
+        """
+        if self._process is None:
+            return {}
+        return self._process.startup_timings
+
     @property
     def channel(self) -> Optional[grpc.Channel]:
         """Get the gRPC channel used to communicate with ModelCenter Desktop.
@@ -239,16 +670,11 @@ class Engine(IEngine):
     )
     @overrides
     def new_workflow(self, name: str, workflow_type: WorkflowType = WorkflowType.DATA) -> Workflow:
-        request = eng_msg.NewWorkflowRequest(
-            path=name,
-            workflow_type=(
-                eng_msg.WORKFLOW_TYPE_DATA_DEPENDENCY
-                if workflow_type is WorkflowType.DATA
-                else eng_msg.WORKFLOW_TYPE_PROCESS
-            ),
-        )
+        request = create_new_workflow_request(name, workflow_type)
         response: eng_msg.NewWorkflowResponse = self._stub.EngineCreateWorkflow(request)
-        return Workflow(response.workflow_id, name, self)
+        workflow = Workflow(response.workflow_id, name, self)
+        self._loaded_workflows.append(workflow)
+        return workflow
 
     @interpret_rpc_error(
         {
@@ -261,48 +687,34 @@ class Engine(IEngine):
     def load_workflow(
         self, file_name: Union[PathLike, str], ignore_connection_errors: Optional[bool] = None
     ) -> Workflow:
-        request = eng_msg.LoadWorkflowRequest(
-            path=str(file_name),
-            connect_err_mode=(
-                eng_msg.OnConnectionErrorMode.ON_CONNECTION_ERROR_MODE_IGNORE
-                if ignore_connection_errors
-                else eng_msg.ON_CONNECTION_ERROR_MODE_RAISE_ERROR
-            ),
-        )
+        request = create_load_workflow_request(file_name, ignore_connection_errors)
         response: eng_msg.LoadWorkflowResponse = self._stub.EngineLoadWorkflow(request)
-        return Workflow(response.workflow_id, request.path, self)
+        workflow = Workflow(response.workflow_id, request.path, self)
+        self._loaded_workflows.append(workflow)
+        return workflow
 
     @overrides
     def get_formatter(self, fmt: str) -> Format:
         formatter: Format = Format(fmt, self)
         return formatter
 
-    @interpret_rpc_error(WRAP_INVALID_ARG)
+    @interpret_rpc_error(WRAP_INVALID_ARG, idempotent=True)
     @overrides
     def get_preference(self, pref: str) -> Union[bool, int, float, str]:
         request = eng_msg.GetPreferenceRequest(preference_name=pref)
         response: eng_msg.GetPreferenceResponse = self._stub.EngineGetPreference(request)
-        attr: Optional[str] = response.WhichOneof("value")
-        if attr is not None:
-            return getattr(response, attr)
-        else:
-            raise Exception("Server did not return a value.")
+        return convert_preference_response(response)
 
     @interpret_rpc_error(WRAP_INVALID_ARG)
     @overrides
     def set_preference(self, pref: str, value: Union[bool, int, float, str]) -> None:
-        request = eng_msg.SetPreferenceRequest(preference_name=pref)
-        if isinstance(value, bool):
-            request.bool_value = value
-        elif isinstance(value, int):
-            request.int_value = value
-        elif isinstance(value, float):
-            request.double_value = value
-        else:
-            request.str_value = value
-        self._stub.EngineSetPreference(request)
+        request = create_set_preference_request(pref, value)
+        try:
+            self._stub.EngineSetPreference(request)
+        finally:
+            self._format_cache.invalidate()
 
-    @interpret_rpc_error()
+    @interpret_rpc_error(idempotent=True)
     @overrides
     def get_units(self) -> Mapping[str, Collection[str]]:
         result: Dict[str, List[str]] = {}
@@ -323,28 +735,10 @@ class Engine(IEngine):
     def get_run_only_mode(self) -> bool:
         return self._is_run_only
 
-    @interpret_rpc_error()
+    @interpret_rpc_error(idempotent=True)
     @overrides
     def get_server_info(self) -> WorkflowEngineInfo:
         request = eng_msg.GetServerInfoRequest()
         response: eng_msg.GetServerInfoResponse = self._stub.GetEngineInfo(request)
 
-        version = {
-            "major": response.version.major,
-            "minor": response.version.minor,
-            "patch": response.version.patch,
-        }
-        version_str: str = Template("${major}.${minor}.${patch}").safe_substitute(version)
-
-        info = WorkflowEngineInfo(
-            release_year=version["major"],
-            release_id=version["minor"],
-            build=version["patch"],
-            is_release_build=response.is_release,
-            build_type=response.build_type,
-            version_as_string=version_str,
-            server_type=response.server_type,
-            install_location=response.directory_path,
-            base_url=None,
-        )
-        return info
+        return convert_server_info(response)
@@ -0,0 +1,342 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Defines a pool of engines that are started ahead of time."""
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from threading import Condition, Thread
+import time
+from typing import Callable, Deque, Iterator, List, Optional, Set
+
+from .engine import Engine
+
+DEFAULT_HEALTH_CHECK_INTERVAL: float = 30.0
+"""Default number of seconds between checks that idle engines still respond."""
+
+
+class EnginePool:
+    """Keeps a number of engines started and hands them out on request.
+
+    Starting ModelCenter can take tens of seconds, so the pool starts its
+    engines in the background ahead of time. ``lease()`` hands out an
+    idle engine for the duration of a ``with`` block:
+
+    .. code-block:: python
+
+        with EnginePool(size=4) as pool:
+            with pool.lease() as engine:
+                workflow = engine.load_workflow("model.pxcz")
+                ...
+
+    When an engine is returned, any workflows opened through it are closed
+    so the next user gets an engine with nothing loaded. Idle engines are
+    checked with a heartbeat call at regular intervals. Engines that fail
+    the check, or that cannot be reset, are closed and replaced in the
+    background.
+
+    This class is thread-safe.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        engine_factory: Callable[[], Engine] = Engine,
+        health_check_interval: float = DEFAULT_HEALTH_CHECK_INTERVAL,
+    ):
+        """Initialize an instance.
+
+        The engines are started in the background, so this returns before
+        they are ready.
+
+        Parameters
+        ----------
+        size : int
+            Number of engines to keep, whether idle or leased.
+        engine_factory : Callable[[], Engine], optional
+            Function that starts a new engine. Pass a ``functools.partial``
+            of ``Engine`` to start engines with non-default arguments.
+        health_check_interval : float, optional
+            Number of seconds between checks of the idle engines.
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1.")
+        self._size: int = size
+        self._engine_factory: Callable[[], Engine] = engine_factory
+        self._health_check_interval: float = health_check_interval
+        self._condition = Condition()
+        self._idle: Deque[Engine] = deque()
+        self._leased: Set[Engine] = set()
+        self._checking: Set[Engine] = set()
+        self._starting: int = 0
+        self._start_error: Optional[BaseException] = None
+        self._is_closed: bool = False
+        self._executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix="EnginePool")
+        with self._condition:
+            self._replenish()
+        self._health_thread = Thread(target=self._health_check_loop, daemon=True)
+        self._health_thread.start()
+
+    def __enter__(self):
+        """Initialization when created in a 'with' statement."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Clean up when leaving a 'with' block."""
+        self.close()
+
+    @property
+    def size(self) -> int:
+        """Number of engines the pool keeps."""
+        return self._size
+
+    @property
+    def idle_count(self) -> int:
+        """Number of engines that are started and ready to be leased."""
+        with self._condition:
+            return len(self._idle)
+
+    @property
+    def is_closed(self) -> bool:
+        """Flag indicating if this pool has been closed."""
+        return self._is_closed
+
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every engine in the pool has finished starting.
+
+        Parameters
+        ----------
+        timeout : Optional[float], optional
+            Maximum number of seconds to wait. The default is to wait
+            indefinitely.
+
+        Returns
+        -------
+        bool
+            ``True`` if no engines are still starting, ``False`` if the
+            timeout expired first.
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self._starting == 0, timeout)
+
+    def acquire(self, timeout: Optional[float] = None) -> Engine:
+        """Take an idle engine out of the pool.
+
+        Prefer ``lease()``, which returns the engine automatically. An
+        engine taken with this method must be given back with
+        ``release()``.
+
+        Parameters
+        ----------
+        timeout : Optional[float], optional
+            Maximum number of seconds to wait for an engine. The default is
+            to wait indefinitely.
+
+        Returns
+        -------
+        Engine
+            Engine that is not in use by anyone else.
+
+        Raises
+        ------
+        TimeoutError
+            If no engine became available within the timeout.
+        RuntimeError
+            If the pool is closed.
+        Exception
+            If no engine is available and the last attempt to start one
+            failed, the error it failed with.
+        """
+        deadline: Optional[float] = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            self._replenish()
+            while True:
+                if self._is_closed:
+                    raise RuntimeError("The engine pool is closed.")
+                if len(self._idle) > 0:
+                    engine = self._idle.popleft()
+                    self._leased.add(engine)
+                    return engine
+                if self._starting == 0 and self._start_error is not None:
+                    error, self._start_error = self._start_error, None
+                    raise error
+                remaining: Optional[float] = None
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError("No engine became available in the pool in time.")
+                self._condition.wait(remaining)
+
+    def release(self, engine: Engine) -> None:
+        """Give an engine taken with ``acquire()`` back to the pool.
+
+        Any workflows still open on the engine are closed. If that fails,
+        the engine is closed and a new one is started in its place.
+
+        Parameters
+        ----------
+        engine : Engine
+            Engine to give back.
+        """
+        with self._condition:
+            if engine not in self._leased:
+                raise ValueError("The engine was not leased from this pool.")
+        is_reusable: bool = not self._is_closed and not engine.is_closed
+        if is_reusable:
+            try:
+                engine._close_loaded_workflows()
+            except Exception:
+                is_reusable = False
+        with self._condition:
+            self._leased.discard(engine)
+            if is_reusable and not self._is_closed:
+                self._idle.append(engine)
+                self._condition.notify_all()
+                return
+            self._replenish()
+        _close_quietly(engine)
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None) -> Iterator[Engine]:
+        """Lease an engine for the duration of a ``with`` block.
+
+        Parameters
+        ----------
+        timeout : Optional[float], optional
+            Maximum number of seconds to wait for an engine. The default is
+            to wait indefinitely.
+
+        Returns
+        -------
+        Iterator[Engine]
+            Context manager that gives an engine and returns it to the pool
+            on exit.
+        """
+        engine = self.acquire(timeout)
+        try:
+            yield engine
+        finally:
+            self.release(engine)
+
+    def close(self) -> None:
+        """Close the idle engines and stop starting new ones.
+
+        Engines that are leased are closed when they are released.
+        """
+        with self._condition:
+            if self._is_closed:
+                return
+            self._is_closed = True
+            self._condition.notify_all()
+        self._health_thread.join()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        with self._condition:
+            # Starts that were cancelled before they ran never report back.
+            self._starting = 0
+            self._condition.notify_all()
+            idle: List[Engine] = list(self._idle)
+            self._idle.clear()
+        for engine in idle:
+            _close_quietly(engine)
+
+    def _replenish(self) -> None:
+        """Start enough engines to bring the pool back up to its size.
+
+        The caller must hold ``self._condition``.
+        """
+        if self._is_closed:
+            return
+        missing: int = (
+            self._size - len(self._idle) - len(self._leased) - len(self._checking) - self._starting
+        )
+        for _ in range(missing):
+            self._starting += 1
+            self._executor.submit(self._start_engine)
+
+    def _start_engine(self) -> None:
+        """Start one engine and add it to the idle engines."""
+        engine: Optional[Engine] = None
+        error: Optional[BaseException] = None
+        try:
+            engine = self._engine_factory()
+        except Exception as e:
+            error = e
+        with self._condition:
+            self._starting -= 1
+            if engine is not None and not self._is_closed:
+                self._idle.append(engine)
+                self._start_error = None
+                engine = None
+            elif error is not None:
+                self._start_error = error
+            self._condition.notify_all()
+        if engine is not None:
+            _close_quietly(engine)
+
+    def _health_check_loop(self) -> None:
+        """Check the idle engines at regular intervals until the pool is
+        closed."""
+        with self._condition:
+            while not self._condition.wait_for(
+                lambda: self._is_closed, self._health_check_interval
+            ):
+                candidates: List[Engine] = list(self._idle)
+                self._condition.release()
+                try:
+                    for engine in candidates:
+                        self._check_engine(engine)
+                finally:
+                    self._condition.acquire()
+                self._replenish()
+
+    def _check_engine(self, engine: Engine) -> None:
+        """Check that an idle engine responds, replacing it if it does not."""
+        with self._condition:
+            if engine not in self._idle:
+                # Leased since the check started.
+                return
+            self._idle.remove(engine)
+            self._checking.add(engine)
+        is_healthy: bool = not engine.is_closed
+        if is_healthy:
+            try:
+                engine._send_heartbeat()
+            except Exception:
+                is_healthy = False
+        with self._condition:
+            self._checking.discard(engine)
+            if is_healthy and not self._is_closed:
+                self._idle.append(engine)
+                self._condition.notify_all()
+                return
+        _close_quietly(engine)
+
+
+def _close_quietly(engine: Engine) -> None:
+    """Close an engine, ignoring errors from one that has already died."""
+    if engine.is_closed:
+        return
+    try:
+        engine.close()
+    except Exception:
+        pass
@@ -22,9 +22,11 @@
 
 """Defines the formats."""
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable, List, Optional
 
+import numpy as np
 from numpy import float64, int64
+from numpy.typing import ArrayLike, DTypeLike
 from overrides import overrides
 
 from ansys.modelcenter.workflow.api import IFormat
@@ -42,12 +44,21 @@ from ansys.api.modelcenter.v0.format_messages_pb2 import (
 )
 from ansys.api.modelcenter.v0.grpc_modelcenter_format_pb2_grpc import ModelCenterFormatServiceStub
 
+from ._local_format import NumberFormat, parse_integer, parse_number_format, parse_real
+from ._pipeline import DEFAULT_MAX_IN_FLIGHT, pipeline_calls
 from .grpc_error_interpretation import WRAP_INVALID_ARG, interpret_rpc_error
 
 
 class Format(IFormat):
     """Provides the formatter for converting between strings and values.
 
+    By default, every conversion is made by the server. Set
+    ``use_local_formats`` to ``True`` to convert values locally for the
+    **Number**, **Currency**, **Percentage**, and **Scientific** formats.
+
+    Each conversion method also has an array variant, such as
+    ``reals_to_strings()``, that converts a whole NumPy array at once.
+
     .. note::
         This class should not be directly instantiated by clients. Create
         an ``Engine`` instance and use it to get a valid instance of this object.
@@ -66,12 +77,14 @@ class Format(IFormat):
         self._format: str = fmt
         if self._format == "":
             self._format = "General"
-        self._stub = self._create_client(engine.channel)
+        self._number_format: Optional[NumberFormat] = parse_number_format(self._format)
+        self._use_local_formats: bool = False
+        self._engine = engine
+        self._stub = self._create_client(engine)
 
-    @staticmethod
-    def _create_client(grpc_channel) -> ModelCenterFormatServiceStub:
-        """Create a client from a gRPC channel."""
-        return ModelCenterFormatServiceStub(grpc_channel)
+    def _create_client(self, engine: "Engine") -> ModelCenterFormatServiceStub:
+        """Get the engine's shared format client."""
+        return engine._get_shared_stub(ModelCenterFormatServiceStub)
 
     @property  # type: ignore
     @overrides
@@ -82,42 +95,105 @@ class Format(IFormat):
     @overrides
     def format(self, fmt: str) -> None:
         self._format = fmt
+        self._number_format = parse_number_format(fmt)
+
+    @property
+    def use_local_formats(self) -> bool:
+        """Whether to convert values locally where the format allows it.
+
+        This is ``False`` by default. When it is ``True``, the **Number**,
+        **Currency**, **Percentage**, and **Scientific** formats are
+        converted without calling the server. Values are rounded to 15
+        significant digits and then to the decimal places shown, with
+        ties rounded away from zero. The local conversions have not yet
+        been verified against the server for every format, so results
+        may differ from the server's in some cases.
+
+        Returns
+        -------
+        bool
+            ``True`` if values are converted locally where possible,
+            otherwise ``False``.
+        """
+        return self._use_local_formats
+
+    @use_local_formats.setter
+    def use_local_formats(self, value: bool) -> None:
+        self._use_local_formats = value
+
+    @property
+    def is_local(self) -> bool:
+        """Whether values in the current format are converted without
+        calling the server.
+
+        Even when this is ``True``, strings that cannot be parsed locally
+        and values that cannot be shown exactly are still passed to the
+        server.
 
-    @interpret_rpc_error(WRAP_INVALID_ARG)
+        Returns
+        -------
+        bool
+            ``True`` if ``use_local_formats`` is set and the current
+            format is converted locally, otherwise ``False``.
+        """
+        return self._local_format is not None
+
+    @property
+    def _local_format(self) -> Optional[NumberFormat]:
+        """Parsed form of the current format, if it is converted locally."""
+        return self._number_format if self._use_local_formats else None
+
+    @interpret_rpc_error(WRAP_INVALID_ARG, idempotent=True)
     @overrides
     def string_to_integer(self, string: str) -> int64:
+        if self._local_format is not None:
+            integer = parse_integer(self._local_format, string)
+            if integer is not None:
+                return integer
         request = FormatStringRequest(format=self._format, original=string)
         response: FormatIntegerResponse = self._stub.FormatStringToInteger(request)
         return response.result
 
-    @interpret_rpc_error(WRAP_INVALID_ARG)
+    @interpret_rpc_error(WRAP_INVALID_ARG, idempotent=True)
     @overrides
     def string_to_real(self, string: str) -> float64:
+        if self._local_format is not None:
+            real = parse_real(self._local_format, string)
+            if real is not None:
+                return real
         request = FormatStringRequest()
         request.format = self._format
         request.original = string
         response: FormatDoubleResponse = self._stub.FormatStringToDouble(request)
         return float64(response.result)
 
-    @interpret_rpc_error(WRAP_INVALID_ARG)
+    @interpret_rpc_error(WRAP_INVALID_ARG, idempotent=True)
     @overrides
     def integer_to_string(self, integer: int64) -> str:
+        if self._local_format is not None:
+            result = self._local_format.format_value(int(integer))
+            if result is not None:
+                return result
         request = FormatIntegerRequest()
         request.format = self._format
         request.original = integer
         response: FormatStringResponse = self._stub.FormatIntegerToString(request)
         return response.result
 
-    @interpret_rpc_error(WRAP_INVALID_ARG)
+    @interpret_rpc_error(WRAP_INVALID_ARG, idempotent=True)
     @overrides
     def real_to_string(self, real: float64) -> str:
+        if self._local_format is not None:
+            result = self._local_format.format_value(float(real))
+            if result is not None:
+                return result
         request = FormatDoubleRequest()
         request.format = self._format
         request.original = real
         response: FormatStringResponse = self._stub.FormatDoubleToString(request)
         return response.result
 
-    @interpret_rpc_error(WRAP_INVALID_ARG)
+    @interpret_rpc_error(WRAP_INVALID_ARG, idempotent=True)
     @overrides
     def string_to_string(self, string: str) -> str:
         request = FormatStringRequest()
@@ -126,7 +202,7 @@ class Format(IFormat):
         response: FormatStringResponse = self._stub.FormatStringToString(request)
         return response.result
 
-    @interpret_rpc_error(WRAP_INVALID_ARG)
+    @interpret_rpc_error(WRAP_INVALID_ARG, idempotent=True)
     @overrides
     def integer_to_editable_string(self, integer: int64) -> str:
         request = FormatIntegerRequest()
@@ -135,7 +211,7 @@ class Format(IFormat):
         response: FormatStringResponse = self._stub.FormatIntegerToEditString(request)
         return response.result
 
-    @interpret_rpc_error(WRAP_INVALID_ARG)
+    @interpret_rpc_error(WRAP_INVALID_ARG, idempotent=True)
     @overrides
     def real_to_editable_string(self, real: float64) -> str:
         request = FormatDoubleRequest()
@@ -143,3 +219,280 @@ class Format(IFormat):
         request.original = real
         response: FormatStringResponse = self._stub.FormatDoubleToEditString(request)
         return response.result
+
+    @interpret_rpc_error(WRAP_INVALID_ARG, idempotent=True)
+    def strings_to_integers(
+        self, strings: ArrayLike, max_in_flight: int = DEFAULT_MAX_IN_FLIGHT
+    ) -> np.ndarray:
+        """Convert an array of formatted strings to integers.
+
+        This is the array variant of ``string_to_integer()``.
+
+        Parameters
+        ----------
+        strings : ArrayLike
+            Formatted strings.
+        max_in_flight : int, optional
+            Maximum number of requests to have outstanding at once.
+
+        Returns
+        -------
+        np.ndarray
+            Array of ``int64`` values, with the same shape as ``strings``.
+        """
+        return self._convert_array(
+            strings,
+            str,
+            int64,
+            "FormatStringToInteger",
+            lambda original: FormatStringRequest(format=self._format, original=original),
+            parse_integer,
+            max_in_flight,
+        )
+
+    @interpret_rpc_error(WRAP_INVALID_ARG, idempotent=True)
+    def strings_to_reals(
+        self, strings: ArrayLike, max_in_flight: int = DEFAULT_MAX_IN_FLIGHT
+    ) -> np.ndarray:
+        """Convert an array of formatted strings to real values.
+
+        This is the array variant of ``string_to_real()``.
+
+        Parameters
+        ----------
+        strings : ArrayLike
+            Formatted strings.
+        max_in_flight : int, optional
+            Maximum number of requests to have outstanding at once.
+
+        Returns
+        -------
+        np.ndarray
+            Array of ``float64`` values, with the same shape as ``strings``.
+        """
+        return self._convert_array(
+            strings,
+            str,
+            float64,
+            "FormatStringToDouble",
+            lambda original: FormatStringRequest(format=self._format, original=original),
+            parse_real,
+            max_in_flight,
+        )
+
+    @interpret_rpc_error(WRAP_INVALID_ARG, idempotent=True)
+    def integers_to_strings(
+        self, integers: ArrayLike, max_in_flight: int = DEFAULT_MAX_IN_FLIGHT
+    ) -> np.ndarray:
+        """Convert an array of integers to formatted strings.
+
+        This is the array variant of ``integer_to_string()``.
+
+        Parameters
+        ----------
+        integers : ArrayLike
+            Values.
+        max_in_flight : int, optional
+            Maximum number of requests to have outstanding at once.
+
+        Returns
+        -------
+        np.ndarray
+            Array of strings, with the same shape as ``integers``.
+        """
+        return self._convert_array(
+            integers,
+            int64,
+            str,
+            "FormatIntegerToString",
+            lambda original: FormatIntegerRequest(format=self._format, original=original),
+            NumberFormat.format_value,
+            max_in_flight,
+        )
+
+    @interpret_rpc_error(WRAP_INVALID_ARG, idempotent=True)
+    def reals_to_strings(
+        self, reals: ArrayLike, max_in_flight: int = DEFAULT_MAX_IN_FLIGHT
+    ) -> np.ndarray:
+        """Convert an array of real values to formatted strings.
+
+        This is the array variant of ``real_to_string()``.
+
+        Parameters
+        ----------
+        reals : ArrayLike
+            Values.
+        max_in_flight : int, optional
+            Maximum number of requests to have outstanding at once.
+
+        Returns
+        -------
+        np.ndarray
+            Array of strings, with the same shape as ``reals``.
+        """
+        return self._convert_array(
+            reals,
+            float64,
+            str,
+            "FormatDoubleToString",
+            lambda original: FormatDoubleRequest(format=self._format, original=original),
+            NumberFormat.format_value,
+            max_in_flight,
+        )
+
+    @interpret_rpc_error(WRAP_INVALID_ARG, idempotent=True)
+    def strings_to_strings(
+        self, strings: ArrayLike, max_in_flight: int = DEFAULT_MAX_IN_FLIGHT
+    ) -> np.ndarray:
+        """Convert an array of unformatted strings to formatted strings.
+
+        This is the array variant of ``string_to_string()``.
+
+        Parameters
+        ----------
+        strings : ArrayLike
+            Unformatted strings.
+        max_in_flight : int, optional
+            Maximum number of requests to have outstanding at once.
+
+        Returns
+        -------
+        np.ndarray
+            Array of strings, with the same shape as ``strings``.
+        """
+        return self._convert_array(
+            strings,
+            str,
+            str,
+            "FormatStringToString",
+            lambda original: FormatStringRequest(format=self._format, original=original),
+            None,
+            max_in_flight,
+        )
+
+    @interpret_rpc_error(WRAP_INVALID_ARG, idempotent=True)
+    def integers_to_editable_strings(
+        self, integers: ArrayLike, max_in_flight: int = DEFAULT_MAX_IN_FLIGHT
+    ) -> np.ndarray:
+        """Convert an array of integers to editable formatted strings.
+
+        This is the array variant of ``integer_to_editable_string()``.
+
+        Parameters
+        ----------
+        integers : ArrayLike
+            Values.
+        max_in_flight : int, optional
+            Maximum number of requests to have outstanding at once.
+
+        Returns
+        -------
+        np.ndarray
+            Array of strings, with the same shape as ``integers``.
+        """
+        return self._convert_array(
+            integers,
+            int64,
+            str,
+            "FormatIntegerToEditString",
+            lambda original: FormatIntegerRequest(format=self._format, original=original),
+            None,
+            max_in_flight,
+        )
+
+    @interpret_rpc_error(WRAP_INVALID_ARG, idempotent=True)
+    def reals_to_editable_strings(
+        self, reals: ArrayLike, max_in_flight: int = DEFAULT_MAX_IN_FLIGHT
+    ) -> np.ndarray:
+        """Convert an array of real values to editable formatted strings.
+
+        This is the array variant of ``real_to_editable_string()``.
+
+        Parameters
+        ----------
+        reals : ArrayLike
+            Values.
+        max_in_flight : int, optional
+            Maximum number of requests to have outstanding at once.
+
+        Returns
+        -------
+        np.ndarray
+            Array of strings, with the same shape as ``reals``.
+        """
+        return self._convert_array(
+            reals,
+            float64,
+            str,
+            "FormatDoubleToEditString",
+            lambda original: FormatDoubleRequest(format=self._format, original=original),
+            None,
+            max_in_flight,
+        )
+
+    def _convert_array(
+        self,
+        values: ArrayLike,
+        dtype: DTypeLike,
+        result_dtype: DTypeLike,
+        conversion: str,
+        create_request: Callable[[Any], Any],
+        convert_locally: Optional[Callable[[NumberFormat, Any], Optional[Any]]],
+        max_in_flight: int,
+    ) -> np.ndarray:
+        """Convert each value of an array.
+
+        Each distinct value is converted once. Values are converted locally
+        where possible, then taken from the engine's format cache, and the
+        rest are requested from the server with at most ``max_in_flight``
+        requests outstanding.
+
+        Parameters
+        ----------
+        values : ArrayLike
+            Values to convert.
+        dtype : DTypeLike
+            Type to convert the values to before converting them.
+        result_dtype : DTypeLike
+            Type of the returned array.
+        conversion : str
+            Name of the format service method that converts one value.
+        create_request : Callable[[Any], Any]
+            Function that creates the request to convert one value.
+        convert_locally : Optional[Callable[[NumberFormat, Any], Optional[Any]]]
+            Function that converts one value locally, returning ``None`` if
+            it cannot. If ``None``, all values are converted by the server.
+        max_in_flight : int
+            Maximum number of requests to have outstanding at once.
+
+        Returns
+        -------
+        np.ndarray
+            Converted values, with the same shape as ``values``.
+        """
+        array = np.asarray(values, dtype=dtype)
+        unique, inverse = np.unique(array.ravel(), return_inverse=True)
+        originals: List[Any] = unique.tolist()
+        results: List[Any] = [None] * len(originals)
+        cache = self._engine.format_cache
+        pending: List[int] = []
+        for position, original in enumerate(originals):
+            result = None
+            if convert_locally is not None and self._local_format is not None:
+                result = convert_locally(self._local_format, original)
+            if result is None:
+                result = cache.get((conversion, self._format, original))
+            if result is None:
+                pending.append(position)
+            else:
+                results[position] = result
+
+        responses = pipeline_calls(
+            getattr(self._stub, conversion),
+            (create_request(originals[position]) for position in pending),
+            max_in_flight,
+        )
+        for position, response in zip(pending, responses):
+            results[position] = response.result
+            cache.put((conversion, self._format, originals[position]), response.result)
+        return np.array(results, dtype=result_dtype)[inverse].reshape(array.shape)
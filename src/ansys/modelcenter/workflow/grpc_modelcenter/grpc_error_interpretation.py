@@ -25,12 +25,17 @@
 The decorator and exceptons types interpret errors from the gRPC client.
 """
 
+import asyncio
 import functools
-from typing import Any, Mapping, Type
+import inspect
+import time
+from typing import Any, Callable, Dict, Iterator, Mapping, NoReturn, Sequence, Type
 
 import ansys.engineeringworkflow.api as aew_api
 import grpc
 
+from .retry import RetryPolicy, find_retry_policy
+
 
 class UnexpectedEngineError(Exception):
     """Raised if an error that is unexpected for the call is made.
@@ -113,7 +118,146 @@ Do not attempt to modify this map at runtime.
 """
 
 
-def interpret_rpc_error(additional_codes: Mapping[grpc.StatusCode, Type[Exception]] = {}):
+def wrap_rpc_error(
+    rpc_error: grpc.RpcError,
+    additional_codes: Mapping[grpc.StatusCode, Type[Exception]] = {},
+) -> Exception:
+    """Create the exception that a ``grpc.RpcError`` should be wrapped as.
+
+    This applies the same mapping as ``interpret_rpc_error``, for errors
+    that are collected rather than raised, such as the per-call failures
+    of a batch of calls.
+
+    Parameters
+    ----------
+    rpc_error : grpc.RpcError
+        Error raised by the gRPC client.
+    additional_codes : Mapping[grpc.StatusCode, Type[Exception]]
+        Map of additional codes to wrap.
+
+    Returns
+    -------
+    Exception
+        Wrapped exception, with ``rpc_error`` as its cause.
+    """
+    return _wrap_rpc_error(rpc_error, _merge_status_codes(additional_codes))
+
+
+def _merge_status_codes(
+    additional_codes: Mapping[grpc.StatusCode, Type[Exception]],
+) -> Mapping[grpc.StatusCode, Type[Exception]]:
+    """Merge additional status codes into the default map."""
+    return {**__DEFAULT_STATUS_EXCEPTION_TYPE_MAP, **additional_codes}
+
+
+def _wrap_rpc_error(
+    rpc_error: grpc.RpcError,
+    code_to_exception_type: Mapping[grpc.StatusCode, Type[Exception]],
+) -> Exception:
+    """Create the exception that a ``grpc.RpcError`` should be wrapped as,
+    given the full map of status codes to exception types."""
+    status: grpc.StatusCode = rpc_error.code()
+    wrapped: Exception
+    if status in code_to_exception_type:
+        # If we know how to wrap it, do so:
+        wrapped = code_to_exception_type[status](rpc_error.details())
+    else:
+        wrapped = UnexpectedEngineError(rpc_error.details(), status)
+    wrapped.__cause__ = rpc_error
+    return wrapped
+
+
+def _raise_wrapped_rpc_error(
+    thrown_rpc_error: grpc.RpcError,
+    code_to_exception_type: Mapping[grpc.StatusCode, Type[Exception]],
+) -> NoReturn:
+    """Raise the exception that a ``grpc.RpcError`` should be wrapped as.
+
+    Parameters
+    ----------
+    thrown_rpc_error : grpc.RpcError
+        Error raised by the gRPC client.
+    code_to_exception_type : Mapping[grpc.StatusCode, Type[Exception]]
+        Full map of status codes to the exception types they should raise,
+        including the defaults.
+    """
+    raise _wrap_rpc_error(thrown_rpc_error, code_to_exception_type) from thrown_rpc_error
+
+
+def _iter_retry_backoffs(policy: RetryPolicy, started: float) -> Iterator[float]:
+    """Get the wait before each retry that a policy allows, in seconds.
+
+    ``started`` is the ``time.monotonic()`` time of the first attempt.
+    """
+    deadline: float = started + policy.total_timeout
+    for retry_number in range(policy.max_attempts - 1):
+        backoff: float = policy.get_backoff(retry_number)
+        if time.monotonic() + backoff > deadline:
+            return
+        yield backoff
+
+
+def _retry(
+    orig_func: Callable,
+    args: Sequence[Any],
+    kwargs: Dict[str, Any],
+    rpc_error: grpc.RpcError,
+    code_to_exception_type: Mapping[grpc.StatusCode, Type[Exception]],
+    started: float,
+) -> Any:
+    """Retry an idempotent function that raised a ``grpc.RpcError``, under
+    the retry policy of its engine."""
+    policy = find_retry_policy(args)
+    if policy is None or not policy.is_retryable(rpc_error):
+        _raise_wrapped_rpc_error(rpc_error, code_to_exception_type)
+    for backoff in _iter_retry_backoffs(policy, started):
+        time.sleep(backoff)
+        policy._record_retry()
+        try:
+            result = orig_func(*args, **kwargs)
+        except grpc.RpcError as retry_error:
+            rpc_error = retry_error
+            if not policy.is_retryable(retry_error):
+                break
+        else:
+            policy._record_outcome(True)
+            return result
+    policy._record_outcome(False)
+    _raise_wrapped_rpc_error(rpc_error, code_to_exception_type)
+
+
+async def _retry_async(
+    orig_func: Callable,
+    args: Sequence[Any],
+    kwargs: Dict[str, Any],
+    rpc_error: grpc.RpcError,
+    code_to_exception_type: Mapping[grpc.StatusCode, Type[Exception]],
+    started: float,
+) -> Any:
+    """Retry an idempotent coroutine function that raised a
+    ``grpc.RpcError``, under the retry policy of its engine."""
+    policy = find_retry_policy(args)
+    if policy is None or not policy.is_retryable(rpc_error):
+        _raise_wrapped_rpc_error(rpc_error, code_to_exception_type)
+    for backoff in _iter_retry_backoffs(policy, started):
+        await asyncio.sleep(backoff)
+        policy._record_retry()
+        try:
+            result = await orig_func(*args, **kwargs)
+        except grpc.RpcError as retry_error:
+            rpc_error = retry_error
+            if not policy.is_retryable(retry_error):
+                break
+        else:
+            policy._record_outcome(True)
+            return result
+    policy._record_outcome(False)
+    _raise_wrapped_rpc_error(rpc_error, code_to_exception_type)
+
+
+def interpret_rpc_error(
+    additional_codes: Mapping[grpc.StatusCode, Type[Exception]] = {}, idempotent: bool = False
+):
     r"""Decorate a function so that the ``grpc.RpcErrors`` that it raises are
     wrapped in a more meaningful way.
 
@@ -135,29 +279,64 @@ def interpret_rpc_error(additional_codes: Mapping[grpc.StatusCode, Type[Exceptio
     If a code is not specified (or is one of the default codes), it is wrapped as
     an ``UnexpectedEngineError``.
 
+    Coroutine functions can be decorated too. Errors raised by ``grpc.aio``
+    calls awaited inside them are wrapped in the same way.
+
+    The merged map of status codes is built once, when the function is
+    decorated, so a call that does not raise costs only the extra frame of
+    the wrapper, and for idempotent functions, reading the clock.
+
+    Functions marked as idempotent are retried when they fail with a
+    transient status code, if the engine they are called through has a
+    ``RetryPolicy``. The engine is found from the first argument, which
+    should be the engine itself or an object with an ``_engine``
+    attribute. Only mark functions that make read-only calls, because the
+    whole function is run again. The policy's ``total_timeout`` counts from
+    the start of the first attempt.
+
     Parameters
     ----------
     additional_codes : Mapping[grpc.StatusCode, Type[Exception]]
         Map of additional codes to wrap.
+    idempotent : bool
+        Whether the function can safely be run again after it fails.
     """
 
+    code_to_exception_type = _merge_status_codes(additional_codes)
+
     def interpret_rpc_error_parameterized(orig_func) -> Any:
+        if inspect.iscoroutinefunction(orig_func):
+
+            @functools.wraps(orig_func)
+            async def wrapped_async_rpc_use_method(*args, **kwargs) -> Any:
+                started: float = time.monotonic() if idempotent else 0.0
+                try:
+                    return await orig_func(*args, **kwargs)
+                except grpc.RpcError as thrown_rpc_error:
+                    if idempotent:
+                        return await _retry_async(
+                            orig_func,
+                            args,
+                            kwargs,
+                            thrown_rpc_error,
+                            code_to_exception_type,
+                            started,
+                        )
+                    _raise_wrapped_rpc_error(thrown_rpc_error, code_to_exception_type)
+
+            return wrapped_async_rpc_use_method
+
         @functools.wraps(orig_func)
         def wrapped_rpc_use_method(*args, **kwargs) -> Any:
-            code_to_exception_type = {**__DEFAULT_STATUS_EXCEPTION_TYPE_MAP, **additional_codes}
+            started: float = time.monotonic() if idempotent else 0.0
             try:
                 return orig_func(*args, **kwargs)
             except grpc.RpcError as thrown_rpc_error:
-                thrown_status: grpc.StatusCode = thrown_rpc_error.code()
-                if thrown_status in code_to_exception_type:
-                    # If we know how to wrap it, do so:
-                    raise code_to_exception_type[thrown_status](
-                        thrown_rpc_error.details()
-                    ) from thrown_rpc_error
-                else:
-                    raise UnexpectedEngineError(
-                        thrown_rpc_error.details(), thrown_status
-                    ) from thrown_rpc_error
+                if idempotent:
+                    return _retry(
+                        orig_func, args, kwargs, thrown_rpc_error, code_to_exception_type, started
+                    )
+                _raise_wrapped_rpc_error(thrown_rpc_error, code_to_exception_type)
 
         return wrapped_rpc_use_method
 
@@ -28,19 +28,26 @@ These classes include ``IntegerDatapin`` and ``IntegerArray``.
 from typing import TYPE_CHECKING
 
 import ansys.tools.variableinterop as atvi
+import numpy as np
 from overrides import overrides
 
 import ansys.modelcenter.workflow.api as mc_api
 
 from ._visitors.variable_value_visitor import VariableValueVisitor
 from .base_datapin import BaseDatapin
+from .base_numeric_array_datapin import BaseNumericArrayDatapin
 
 if TYPE_CHECKING:
     from .engine import Engine
 
 from ansys.api.modelcenter.v0.element_messages_pb2 import ElementId
-from ansys.api.modelcenter.v0.variable_value_messages_pb2 import SetIntegerVariableMetadataRequest
+from ansys.api.modelcenter.v0.variable_value_messages_pb2 import (
+    IntegerArrayValue,
+    SetIntegerArrayValueRequest,
+    SetIntegerVariableMetadataRequest,
+)
 
+from ._metadata_cache import cached_metadata, invalidates_metadata
 from .grpc_error_interpretation import (
     WRAP_OUT_OF_BOUNDS,
     WRAP_TARGET_NOT_FOUND,
@@ -77,13 +84,15 @@ class IntegerDatapin(BaseDatapin, mc_api.IIntegerDatapin):
     def __eq__(self, other):
         return isinstance(other, IntegerDatapin) and self.element_id == other.element_id
 
-    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
+    @cached_metadata
     @overrides
     def get_metadata(self) -> atvi.IntegerMetadata:
         response = self._client.IntegerVariableGetMetadata(self._element_id)
         return convert_grpc_integer_metadata(response)
 
     @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @invalidates_metadata
     @overrides
     def set_metadata(self, new_metadata: atvi.CommonVariableMetadata) -> None:
         if not isinstance(new_metadata, atvi.IntegerMetadata):
@@ -106,7 +115,7 @@ class IntegerDatapin(BaseDatapin, mc_api.IIntegerDatapin):
         value.accept(VariableValueVisitor(self._element_id, self._client, self._engine.is_local))
 
 
-class IntegerArrayDatapin(BaseDatapin, mc_api.IIntegerArrayDatapin):
+class IntegerArrayDatapin(BaseNumericArrayDatapin, mc_api.IIntegerArrayDatapin):
     """Represents an integer array datapin.
 
     .. note::
@@ -114,6 +123,12 @@ class IntegerArrayDatapin(BaseDatapin, mc_api.IIntegerArrayDatapin):
         an instantiated ``Engine`` instance and use it to get a valid instance of this object.
     """
 
+    _VALUE_FIELD = "int_array_value"
+    _ARRAY_MESSAGE_TYPE = IntegerArrayValue
+    _SET_VALUE_REQUEST_TYPE = SetIntegerArrayValueRequest
+    _SET_VALUE_CALL = "IntegerArraySetValue"
+    _DTYPE = np.dtype(np.int64)
+
     def __init__(self, element_id: ElementId, engine: "Engine"):
         """Initialize an instance.
 
@@ -130,11 +145,13 @@ class IntegerArrayDatapin(BaseDatapin, mc_api.IIntegerArrayDatapin):
     def __eq__(self, other):
         return isinstance(other, IntegerArrayDatapin) and self.element_id == other.element_id
 
+    @cached_metadata
     @overrides
     def get_metadata(self) -> atvi.IntegerArrayMetadata:
         response = self._client.IntegerVariableGetMetadata(self._element_id)
         return convert_grpc_integer_array_metadata(response)
 
+    @invalidates_metadata
     @overrides
     def set_metadata(self, new_metadata: atvi.CommonVariableMetadata) -> None:
         if not isinstance(new_metadata, atvi.IntegerArrayMetadata):
@@ -28,18 +28,28 @@ Desktop process.
 
 from io import TextIOWrapper
 from pathlib import Path
+from queue import Empty, Queue
 
 # Subprocess is used safely to start a local exe without user input.
 import subprocess  # nosec B404
+from threading import Event, Thread
 import time
-from typing import Optional
-import winreg
+from typing import IO, Dict, Mapping, Optional
 
+import grpc
 import numpy
 
+_EXIT_POLL_INTERVAL: float = 0.25
+"""Longest time to wait for startup progress before checking whether the
+process has exited."""
+
 
 def _find_exe_location() -> str:  # pragma: no cover
     """Attempts to find the ModelCenter EXE file."""
+    # winreg only exists on Windows, so it is imported here rather than at
+    # module level to let this module be imported on other platforms.
+    import winreg
+
     key: winreg.HKEYType = winreg.OpenKey(
         winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Phoenix Integration\ModelCenter"
     )
@@ -52,6 +62,21 @@ def _find_exe_location() -> str:  # pragma: no cover
         return f"{install_dir}\\ModelCenter.exe"
 
 
+def _read_lines(stream: IO[bytes], lines: "Queue[Optional[str]]", discard: Event) -> None:
+    """Put each line of a process's output into a queue, then ``None`` once
+    the output ends.
+
+    Once ``discard`` is set, the rest of the output is read and dropped.
+    """
+    try:
+        for line in TextIOWrapper(stream, encoding="utf-8", errors="replace"):
+            if not discard.is_set():
+                lines.put(line)
+    finally:
+        if not discard.is_set():
+            lines.put(None)
+
+
 class EngineLicensingFailedException(Exception):
     """Raised if engine licensing has failed."""
 
@@ -67,6 +92,25 @@ class MCDProcess:
         self._process: Optional[subprocess.Popen] = None
         self._debug: bool = True if self._exe_path.endswith("ModelCenterD.exe") else False
         self._timeout: float = 60 if self._debug else 30
+        self._deadline: float = 0.0
+        self._startup_timings: Dict[str, float] = {}
+
+    @property
+    def startup_timings(self) -> Mapping[str, float]:
+        """Number of seconds that each phase of starting took.
+
+        The phases are ``"launch"``, creating the process; ``"listening"``,
+        from then until the process reported the port it listens on; and,
+        if ``wait_for_channel()`` was called, ``"channel_ready"``, from then
+        until a gRPC channel to the process was connected.
+
+        Returns
+        -------
+        Mapping[str, float]
+            Phase names and their durations in seconds, in the order they
+            happened.
+        """
+        return dict(self._startup_timings)
 
     def start(
         self,
@@ -91,6 +135,14 @@ class MCDProcess:
         -------
         int
             Port number that the gRPC server was started on.
+
+        Raises
+        ------
+        EngineLicensingFailedException
+            If the process reports that licensing failed.
+        Exception
+            If the process exits, or does not report its port before the
+            timeout.
         """
         args = [
             self._exe_path,
@@ -100,29 +152,106 @@ class MCDProcess:
         ]
         if run_only:
             args.append("/runonly")
+        self._startup_timings = {}
+        start: float = time.monotonic()
+        self._deadline = start + self._timeout
         # Subproccess call is safe here; exe and arguments are completely controlled by us.
         self._process = subprocess.Popen(args, stdout=subprocess.PIPE)  # nosec B603
+        launched: float = time.monotonic()
+        self._startup_timings["launch"] = launched - start
 
-        # Wait until we read the grpc server start message from stdout.
-        start: float = time.time()
         if self._process.stdout is None:
             raise Exception("Failed to connect to ModelCenter stdout.")
-        for line in TextIOWrapper(self._process.stdout, encoding="utf-8"):
-            # if self._debug:
-            #     print(line)
-            # But bail if too much time passes before that happens.
-            if time.time() - start > self._timeout:
-                break
-            elif line.startswith("grpc server listening on "):
-                colon_index = line.find(":") + 1  # MCD returns string like: 0.0.0.0:50051
-                return int(line[colon_index:].strip())
-            elif line.startswith("grpcmc: licensing failed"):
-                raise EngineLicensingFailedException(
-                    "The engine reported that licensing has failed."
-                )
-            else:
-                time.sleep(0.1)
-        raise Exception("Timed out waiting for ModelCenter to start.")
+        # Read stdout on another thread so that a process that stops writing
+        # cannot block us past the timeout. The thread keeps draining the
+        # output after startup so that the process never blocks on a full pipe,
+        # but discards it so that the queue does not grow for the process's life.
+        lines: "Queue[Optional[str]]" = Queue()
+        startup_done = Event()
+        Thread(
+            target=_read_lines, args=(self._process.stdout, lines, startup_done), daemon=True
+        ).start()
+
+        # Wait until we read the grpc server start message from stdout.
+        try:
+            while True:
+                line: Optional[str] = self._get_startup_line(lines)
+                if line is None:
+                    self._raise_exited()
+                elif line.startswith("grpc server listening on "):
+                    colon_index = line.find(":") + 1  # MCD returns string like: 0.0.0.0:50051
+                    port = int(line[colon_index:].strip())
+                    self._startup_timings["listening"] = time.monotonic() - launched
+                    return port
+                elif line.startswith("grpcmc: licensing failed"):
+                    raise EngineLicensingFailedException(
+                        "The engine reported that licensing has failed."
+                    )
+        finally:
+            startup_done.set()
+
+    def wait_for_channel(self, channel: grpc.Channel) -> None:
+        """Wait until a gRPC channel to the started process is connected.
+
+        This confirms that the server is accepting calls, not only that it
+        reported its port. The wait shares its timeout with ``start()``.
+
+        Parameters
+        ----------
+        channel : grpc.Channel
+            Channel to the port returned by ``start()``.
+
+        Raises
+        ------
+        Exception
+            If the process exits, or the channel does not connect before the
+            timeout.
+        """
+        start: float = time.monotonic()
+        ready_future = grpc.channel_ready_future(channel)
+        try:
+            while True:
+                try:
+                    ready_future.result(timeout=self._get_poll_timeout())
+                    break
+                except grpc.FutureTimeoutError:
+                    self._check_running()
+        finally:
+            ready_future.cancel()
+        self._startup_timings["channel_ready"] = time.monotonic() - start
+
+    def _get_poll_timeout(self) -> float:
+        """Get how long to wait for the next sign of startup progress.
+
+        Raises if the startup timeout has expired.
+        """
+        remaining: float = self._deadline - time.monotonic()
+        if remaining <= 0:
+            raise Exception("Timed out waiting for ModelCenter to start.")
+        return min(remaining, _EXIT_POLL_INTERVAL)
+
+    def _get_startup_line(self, lines: "Queue[Optional[str]]") -> Optional[str]:
+        """Get the next line of output, or ``None`` at the end of the output.
+
+        Raises if the startup timeout expires or the process exits first.
+        """
+        while True:
+            try:
+                return lines.get(timeout=self._get_poll_timeout())
+            except Empty:
+                self._check_running()
+
+    def _check_running(self) -> None:
+        """Raise if the process has exited."""
+        if self._process is not None and self._process.poll() is not None:
+            self._raise_exited()
+
+    def _raise_exited(self) -> None:
+        """Raise an error for a process that stopped before it was ready."""
+        exit_code: Optional[int] = None if self._process is None else self._process.poll()
+        if exit_code is None:
+            raise Exception("ModelCenter closed its output before it started.")
+        raise Exception(f"ModelCenter exited with code {exit_code} before it started.")
 
     def get_process_id(self) -> int:
         """Get the process ID of the ModelCenter Desktop process."""
@@ -28,19 +28,26 @@ These classes include ``RealDatapin`` and ``RealArrayDatapin``.
 from typing import TYPE_CHECKING
 
 import ansys.tools.variableinterop as atvi
+import numpy as np
 from overrides import overrides
 
 import ansys.modelcenter.workflow.api as mc_api
 
 from ._visitors.variable_value_visitor import VariableValueVisitor
 from .base_datapin import BaseDatapin
+from .base_numeric_array_datapin import BaseNumericArrayDatapin
 
 if TYPE_CHECKING:
     from .engine import Engine
 
 from ansys.api.modelcenter.v0.element_messages_pb2 import ElementId
-from ansys.api.modelcenter.v0.variable_value_messages_pb2 import SetDoubleVariableMetadataRequest
+from ansys.api.modelcenter.v0.variable_value_messages_pb2 import (
+    DoubleArrayValue,
+    SetDoubleArrayValueRequest,
+    SetDoubleVariableMetadataRequest,
+)
 
+from ._metadata_cache import cached_metadata, invalidates_metadata
 from .grpc_error_interpretation import (
     WRAP_OUT_OF_BOUNDS,
     WRAP_TARGET_NOT_FOUND,
@@ -77,13 +84,15 @@ class RealDatapin(BaseDatapin, mc_api.IRealDatapin):
     def __eq__(self, other):
         return isinstance(other, RealDatapin) and self.element_id == other.element_id
 
-    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
+    @cached_metadata
     @overrides
     def get_metadata(self) -> atvi.RealMetadata:
         response = self._client.DoubleVariableGetMetadata(self._element_id)
         return convert_grpc_real_metadata(response)
 
     @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @invalidates_metadata
     @overrides
     def set_metadata(self, new_metadata: atvi.CommonVariableMetadata) -> None:
         if not isinstance(new_metadata, atvi.RealMetadata):
@@ -106,7 +115,7 @@ class RealDatapin(BaseDatapin, mc_api.IRealDatapin):
         value.accept(VariableValueVisitor(self._element_id, self._client, self._engine.is_local))
 
 
-class RealArrayDatapin(BaseDatapin, mc_api.IRealArrayDatapin):
+class RealArrayDatapin(BaseNumericArrayDatapin, mc_api.IRealArrayDatapin):
     """Represents a real (double-precision floating point) array datapin.
 
     .. note::
@@ -114,6 +123,12 @@ class RealArrayDatapin(BaseDatapin, mc_api.IRealArrayDatapin):
         an instantiated ``Engine`` instance and use it to get a valid instance of this object.
     """
 
+    _VALUE_FIELD = "double_array_value"
+    _ARRAY_MESSAGE_TYPE = DoubleArrayValue
+    _SET_VALUE_REQUEST_TYPE = SetDoubleArrayValueRequest
+    _SET_VALUE_CALL = "DoubleArraySetValue"
+    _DTYPE = np.dtype(np.float64)
+
     def __init__(self, element_id: ElementId, engine: "Engine"):
         """Initialize an instance.
 
@@ -130,13 +145,15 @@ class RealArrayDatapin(BaseDatapin, mc_api.IRealArrayDatapin):
     def __eq__(self, other):
         return isinstance(other, RealArrayDatapin) and self.element_id == other.element_id
 
-    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
+    @cached_metadata
     @overrides
     def get_metadata(self) -> atvi.RealArrayMetadata:
         response = self._client.DoubleVariableGetMetadata(self._element_id)
         return convert_grpc_real_array_metadata(response)
 
     @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @invalidates_metadata
     @overrides
     def set_metadata(self, new_metadata: atvi.CommonVariableMetadata) -> None:
         if not isinstance(new_metadata, atvi.RealArrayMetadata):
@@ -35,6 +35,8 @@ import ansys.api.modelcenter.v0.variable_value_messages_pb2 as var_msgs
 import ansys.api.modelcenter.v0.workflow_messages_pb2 as wkfl_msgs
 import ansys.engineeringworkflow.api as aew_api
 import ansys.tools.variableinterop as atvi
+import numpy as np
+from numpy.typing import ArrayLike
 from overrides import overrides
 
 import ansys.modelcenter.workflow.api as mc_api
@@ -44,13 +46,21 @@ from ..api import IDatapinReferenceBase, IReferenceArrayProperty, IReferenceProp
 from .base_datapin import BaseDatapin
 from .reference_datapin_metadata import ReferenceDatapinMetadata
 from .var_metadata_convert import convert_grpc_reference_metadata, fill_reference_metadata_message
-from .var_value_convert import convert_grpc_value_to_atvi
+from .var_value_convert import convert_grpc_value_to_atvi, convert_interop_states_to_masked_column
 
 if TYPE_CHECKING:
     from .engine import Engine
 
 from ansys.api.modelcenter.v0.element_messages_pb2 import ElementId
 
+from ._bulk_access import (
+    IndexSelection,
+    collect_scalar_values,
+    convert_grpc_states,
+    resolve_indices,
+)
+from ._metadata_cache import cached_metadata, invalidates_metadata
+from ._pipeline import DEFAULT_MAX_IN_FLIGHT, pipeline_calls
 from .grpc_error_interpretation import (
     WRAP_INVALID_ARG,
     WRAP_OUT_OF_BOUNDS,
@@ -94,7 +104,7 @@ class ReferenceArrayDatapinElement(mc_api.IDatapinReferenceBase):
         self._engine = parent_engine
 
     @property
-    @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND, **WRAP_OUT_OF_BOUNDS})
+    @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND, **WRAP_OUT_OF_BOUNDS}, idempotent=True)
     @overrides
     def equation(self) -> str:
         request = var_msgs.GetReferenceEquationRequest(
@@ -113,9 +123,10 @@ class ReferenceArrayDatapinElement(mc_api.IDatapinReferenceBase):
             target=self._parent_element_id, index=self._index, equation=equation
         )
         self._client.ReferenceVariableSetReferenceEquation(request)
+        self._engine._notify_links_changed()
 
     @property
-    @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND, **WRAP_OUT_OF_BOUNDS})
+    @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND, **WRAP_OUT_OF_BOUNDS}, idempotent=True)
     @overrides
     def is_direct(self) -> bool:
         request = var_msgs.GetReferenceIsDirectRequest(
@@ -126,7 +137,7 @@ class ReferenceArrayDatapinElement(mc_api.IDatapinReferenceBase):
         )
         return response.is_direct
 
-    @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND, **WRAP_OUT_OF_BOUNDS})
+    @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND, **WRAP_OUT_OF_BOUNDS}, idempotent=True)
     @overrides
     def get_state(self, hid: Optional[str] = None) -> atvi.VariableState:
         if hid is not None:
@@ -172,13 +183,15 @@ class ReferenceDatapinBase(BaseDatapin, ABC):
     array reference datapins.
     """
 
-    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
+    @cached_metadata
     @overrides
     def get_metadata(self) -> ReferenceDatapinMetadata:
         response = self._client.ReferenceVariableGetMetadata(self._element_id)
         return convert_grpc_reference_metadata(response)
 
     @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @invalidates_metadata
     @overrides
     def set_metadata(self, new_metadata: atvi.CommonVariableMetadata) -> None:
         if not isinstance(new_metadata, ReferenceDatapinMetadata):
@@ -235,7 +248,7 @@ class ReferenceDatapin(ReferenceDatapinBase, mc_api.IReferenceDatapin):
         return response.was_changed
 
     @property
-    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
     @overrides
     def equation(self) -> str:
         request = var_msgs.GetReferenceEquationRequest(target=self._element_id)
@@ -250,9 +263,10 @@ class ReferenceDatapin(ReferenceDatapinBase, mc_api.IReferenceDatapin):
     def equation(self, equation: str) -> None:
         request = var_msgs.SetReferenceEquationRequest(target=self._element_id, equation=equation)
         self._client.ReferenceVariableSetReferenceEquation(request)
+        self._engine._notify_links_changed()
 
     @property
-    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
     @overrides
     def is_direct(self) -> bool:
         request = var_msgs.GetReferenceIsDirectRequest(target=self._element_id)
@@ -261,7 +275,7 @@ class ReferenceDatapin(ReferenceDatapinBase, mc_api.IReferenceDatapin):
         )
         return response.is_direct
 
-    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
     @overrides
     def get_state(self, hid: Optional[str] = None) -> atvi.VariableState:
         if hid is not None:
@@ -277,7 +291,7 @@ class ReferenceDatapin(ReferenceDatapinBase, mc_api.IReferenceDatapin):
             ) from convert_failure
         return atvi.VariableState(value=interop_value, is_valid=response.is_valid)
 
-    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
     @overrides
     def get_reference_properties(self) -> Mapping[str, IReferenceProperty]:
         response: var_msgs.ReferencePropertyNames = (
@@ -366,7 +380,15 @@ class ReferenceArrayDatapin(ReferenceDatapinBase, mc_api.IReferenceArrayDatapin)
         of the reference array datapin.
         """
         if isinstance(index, slice):
-            raise NotImplementedError()
+            return [
+                ReferenceArrayDatapinElement(
+                    parent_client=self._client,
+                    parent_element_id=self._element_id,
+                    index=one_index,
+                    parent_engine=self._engine,
+                )
+                for one_index in range(*index.indices(len(self)))
+            ]
         elif isinstance(index, int):
             return ReferenceArrayDatapinElement(
                 parent_client=self._client,
@@ -381,7 +403,7 @@ class ReferenceArrayDatapin(ReferenceDatapinBase, mc_api.IReferenceArrayDatapin)
                 + " is not supported."
             )
 
-    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
     def __len__(self) -> int:
         """Get the length of the reference array.
 
@@ -394,6 +416,93 @@ class ReferenceArrayDatapin(ReferenceDatapinBase, mc_api.IReferenceArrayDatapin)
         assert response.value >= 0  # nosec B101
         return response.value
 
+    @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND, **WRAP_OUT_OF_BOUNDS}, idempotent=True)
+    def get_states(
+        self,
+        indices: IndexSelection = None,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ) -> np.ma.MaskedArray:
+        """Get the states of the values referenced by several elements of the
+        array at once.
+
+        The values are requested without waiting for each earlier request
+        to return, with at most ``max_in_flight`` requests outstanding.
+
+        Parameters
+        ----------
+        indices : IndexSelection, optional
+            Indices of the elements to read, given as a sequence of indices,
+            a slice, or a boolean mask. The default is every element.
+        max_in_flight : int, optional
+            Maximum number of requests to have outstanding at once.
+
+        Returns
+        -------
+        np.ma.MaskedArray
+            Column of values, masked where the value is invalid. If every
+            value is a scalar of the same type, the column has the matching
+            NumPy dtype; otherwise, it holds the ``atvi.IVariableValue``
+            objects.
+        """
+        resolved = resolve_indices(indices, self.__len__)
+        responses = pipeline_calls(
+            self._client.ReferenceVariableGetValue,
+            (
+                var_msgs.GetReferenceValueRequest(target=self._element_id, index=one_index)
+                for one_index in resolved
+            ),
+            max_in_flight,
+        )
+        states = convert_grpc_states(responses, self._engine.is_local)
+        return convert_interop_states_to_masked_column(states)
+
+    @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND, **WRAP_OUT_OF_BOUNDS})
+    def set_states(
+        self,
+        values: Union[ArrayLike, Sequence[Union[atvi.IVariableValue, atvi.VariableState]]],
+        indices: IndexSelection = None,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ) -> None:
+        """Set the values referenced by several elements of the array at once.
+
+        The values are sent without waiting for each earlier request to
+        return, with at most ``max_in_flight`` requests outstanding.
+
+        Parameters
+        ----------
+        values : Union[ArrayLike, Sequence[Union[atvi.IVariableValue, atvi.VariableState]]]
+            Values to set, as a one-dimensional NumPy column or a sequence
+            of values or states. Each must be a scalar boolean, integer,
+            real, string, or file value.
+        indices : IndexSelection, optional
+            Indices of the elements to set, one per value, given as a
+            sequence of indices, a slice, or a boolean mask. The default is
+            the first ``len(values)`` elements.
+        max_in_flight : int, optional
+            Maximum number of requests to have outstanding at once.
+        """
+        interop_values = collect_scalar_values(values)
+        resolved = (
+            list(range(len(interop_values)))
+            if indices is None
+            else resolve_indices(indices, self.__len__)
+        )
+        if len(resolved) != len(interop_values):
+            raise ValueError("The number of indices must match the number of values.")
+        for _ in pipeline_calls(
+            self._client.ReferenceVariableSetValue,
+            (
+                var_msgs.SetReferenceValueRequest(
+                    target=self._element_id,
+                    index=one_index,
+                    new_value=var_value_convert.convert_interop_value_to_grpc(interop_value),
+                )
+                for one_index, interop_value in zip(resolved, interop_values)
+            ),
+            max_in_flight,
+        ):
+            pass
+
     @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND, **WRAP_OUT_OF_BOUNDS})
     @overrides
     def set_length(self, new_size: int) -> None:
@@ -414,7 +523,7 @@ class ReferenceArrayDatapin(ReferenceDatapinBase, mc_api.IReferenceArrayDatapin)
         response = self._client.ReferenceArraySetReferencedValues(request)
         return response.was_changed
 
-    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
     @overrides
     def get_reference_properties(self) -> Mapping[str, IReferenceArrayProperty]:
         response: var_msgs.ReferencePropertyNames = (
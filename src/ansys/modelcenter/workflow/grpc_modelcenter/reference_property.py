@@ -23,23 +23,35 @@
 """Contains implementations of reference property-related classes."""
 
 from abc import abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List, Sequence, Union
 
 from ansys.api.modelcenter.v0.grpc_modelcenter_workflow_pb2_grpc import (
     ModelCenterWorkflowServiceStub,
 )
-import grpc
+import numpy as np
+from numpy.typing import ArrayLike
 from overrides import overrides
 
 from . import var_value_convert
 from ..api.ireferenceproperty import IReferencePropertyBase
+from ._bulk_access import (
+    IndexSelection,
+    collect_values,
+    convert_grpc_states,
+    resolve_indices,
+)
+from ._pipeline import DEFAULT_MAX_IN_FLIGHT, pipeline_calls
 from .grpc_error_interpretation import (
     WRAP_OUT_OF_BOUNDS,
     WRAP_TARGET_NOT_FOUND,
     interpret_rpc_error,
 )
 from .var_metadata_convert import convert_grpc_metadata
-from .var_value_convert import convert_grpc_value_to_atvi, grpc_type_enum_to_interop_type
+from .var_value_convert import (
+    convert_grpc_value_to_atvi,
+    convert_interop_states_to_masked_column,
+    grpc_type_enum_to_interop_type,
+)
 
 if TYPE_CHECKING:
     from .engine import Engine
@@ -81,11 +93,11 @@ class ReferencePropertyBase(IReferencePropertyBase):
         self._element_id: ElementId = element_id
         self._name = name
         self._engine = engine
-        self._client: ModelCenterWorkflowServiceStub = self._create_client(engine.channel)
+        self._client: ModelCenterWorkflowServiceStub = self._create_client(engine)
 
-    @staticmethod
-    def _create_client(channel: grpc.Channel) -> ModelCenterWorkflowServiceStub:
-        return ModelCenterWorkflowServiceStub(channel)  # pragma: no cover
+    def _create_client(self, engine: "Engine") -> ModelCenterWorkflowServiceStub:
+        """Get the engine's shared workflow client."""
+        return engine._get_shared_stub(ModelCenterWorkflowServiceStub)
 
     @overrides
     def get_value_type(self) -> atvi.VariableType:
@@ -97,7 +109,7 @@ class ReferencePropertyBase(IReferencePropertyBase):
         )
         return grpc_type_enum_to_interop_type(response.type)
 
-    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
     @overrides
     def get_metadata(self) -> atvi.CommonVariableMetadata:
         request = var_msgs.ReferencePropertyIdentifier(
@@ -112,7 +124,7 @@ class ReferencePropertyBase(IReferencePropertyBase):
         pass
 
     @property
-    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
     @overrides
     def is_input(self) -> bool:
         request = ReferencePropertyIdentifier(reference_var=self._element_id, prop_name=self._name)
@@ -134,7 +146,7 @@ class ReferenceProperty(ReferencePropertyBase, IReferenceProperty):
     def __init__(self, element_id: ElementId, name: str, engine: "Engine") -> None:
         super().__init__(element_id=element_id, name=name, engine=engine)
 
-    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
     @overrides
     def get_state(self) -> atvi.VariableState:
         target_prop = var_msgs.ReferencePropertyIdentifier(
@@ -188,7 +200,7 @@ class ReferenceArrayProperty(ReferencePropertyBase, IReferenceArrayProperty):
         )
         self._client.ReferencePropertySetValue(request)
 
-    @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND, **WRAP_OUT_OF_BOUNDS})
+    @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND, **WRAP_OUT_OF_BOUNDS}, idempotent=True)
     @overrides
     def get_state_at(self, index: int) -> atvi.VariableState:
         target_prop = var_msgs.ReferencePropertyIdentifier(
@@ -204,3 +216,100 @@ class ReferenceArrayProperty(ReferencePropertyBase, IReferenceArrayProperty):
                 "Unexpected failure occurred converting gRPC value response."
             ) from convert_failure
         return atvi.VariableState(value=interop_value, is_valid=response.is_valid)
+
+    def _get_array_length(self) -> int:
+        """Get the length of the reference array that owns this property."""
+        response: var_msgs.IntegerValue = self._client.ReferenceArrayGetLength(self._element_id)
+        return response.value
+
+    def _indexed_identifier(self, index: int) -> var_msgs.IndexedReferencePropertyIdentifier:
+        return var_msgs.IndexedReferencePropertyIdentifier(
+            target_prop=var_msgs.ReferencePropertyIdentifier(
+                reference_var=self._element_id, prop_name=self._name
+            ),
+            index=index,
+        )
+
+    @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND, **WRAP_OUT_OF_BOUNDS}, idempotent=True)
+    def get_states_at(
+        self, indices: IndexSelection = None, max_in_flight: int = DEFAULT_MAX_IN_FLIGHT
+    ) -> np.ma.MaskedArray:
+        """Get the state of the property at several indices at once.
+
+        The values are requested without waiting for each earlier request
+        to return, with at most ``max_in_flight`` requests outstanding.
+
+        Parameters
+        ----------
+        indices : IndexSelection, optional
+            Indices to read, given as a sequence of indices, a slice, or a
+            boolean mask. The default is every index of the reference array.
+        max_in_flight : int, optional
+            Maximum number of requests to have outstanding at once.
+
+        Returns
+        -------
+        np.ma.MaskedArray
+            Column of values, masked where the value is invalid. If every
+            value is a scalar of the same type, the column has the matching
+            NumPy dtype; otherwise, it holds the ``atvi.IVariableValue``
+            objects.
+        """
+        resolved = resolve_indices(indices, self._get_array_length)
+        responses = pipeline_calls(
+            self._client.ReferencePropertyGetValue,
+            (self._indexed_identifier(one_index) for one_index in resolved),
+            max_in_flight,
+        )
+        return convert_interop_states_to_masked_column(
+            convert_grpc_states(responses, self._engine.is_local)
+        )
+
+    @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND, **WRAP_OUT_OF_BOUNDS})
+    def set_values_at(
+        self,
+        indices: IndexSelection,
+        values: Union[
+            ArrayLike,
+            atvi.IVariableValue,
+            Sequence[Union[atvi.IVariableValue, atvi.VariableState]],
+        ],
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ) -> None:
+        """Set the value of the property at several indices at once.
+
+        The values are sent without waiting for each earlier request to
+        return, with at most ``max_in_flight`` requests outstanding.
+
+        Parameters
+        ----------
+        indices : IndexSelection
+            Indices to set, given as a sequence of indices, a slice, or a
+            boolean mask. ``None`` selects every index of the reference
+            array.
+        values : Union[ArrayLike, atvi.IVariableValue, Sequence[...]]
+            Values to set, one per index, as a NumPy column or a sequence of
+            values or states. A single value is set at every index.
+        max_in_flight : int, optional
+            Maximum number of requests to have outstanding at once.
+        """
+        resolved = resolve_indices(indices, self._get_array_length)
+        interop_values: List[atvi.IVariableValue]
+        if isinstance(values, (atvi.IVariableValue, atvi.VariableState)) or np.ndim(values) == 0:
+            interop_values = collect_values([values]) * len(resolved)
+        else:
+            interop_values = collect_values(values)
+        if len(resolved) != len(interop_values):
+            raise ValueError("The number of indices must match the number of values.")
+        for _ in pipeline_calls(
+            self._client.ReferencePropertySetValue,
+            (
+                var_msgs.ReferencePropertySetValueRequest(
+                    target_prop=self._indexed_identifier(one_index),
+                    new_value=var_value_convert.convert_interop_value_to_grpc(interop_value),
+                )
+                for one_index, interop_value in zip(resolved, interop_values)
+            ),
+            max_in_flight,
+        ):
+            pass
@@ -0,0 +1,194 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Defines the policy for retrying read-only calls that fail transiently."""
+
+import random
+from threading import Lock
+from typing import AbstractSet, Any, NamedTuple, Optional, Sequence
+
+import grpc
+
+DEFAULT_RETRYABLE_CODES: AbstractSet[grpc.StatusCode] = frozenset(
+    {grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.DEADLINE_EXCEEDED}
+)
+"""Status codes that are retried by default."""
+
+
+class RetryStatistics(NamedTuple):
+    """Counts of the retries made under a retry policy."""
+
+    retries: int
+    """Number of times a call was retried."""
+    recovered: int
+    """Number of operations that succeeded after at least one retry."""
+    exhausted: int
+    """Number of operations that still failed when the policy gave up."""
+
+
+class RetryPolicy:
+    """Decides whether and when to retry an operation that failed.
+
+    Only operations that are marked as idempotent, such as getting the name
+    or value of an element, are retried. Operations that change the
+    workflow, such as running it or setting a value, are never retried.
+    The wait before each retry is chosen at random between zero and an
+    exponentially growing limit, so that many clients do not retry in
+    step.
+
+    A policy can be shared by several engines. Its statistics cover every
+    engine that uses it. This class is thread-safe.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        initial_backoff: float = 0.1,
+        max_backoff: float = 5.0,
+        backoff_multiplier: float = 2.0,
+        total_timeout: float = 60.0,
+        retryable_codes: AbstractSet[grpc.StatusCode] = DEFAULT_RETRYABLE_CODES,
+    ):
+        """Initialize an instance.
+
+        Parameters
+        ----------
+        max_attempts : int, optional
+            Most times to attempt an operation, including the first.
+        initial_backoff : float, optional
+            Limit of the wait before the first retry, in seconds.
+        max_backoff : float, optional
+            Largest limit of the wait before any retry, in seconds.
+        backoff_multiplier : float, optional
+            Factor by which the limit of the wait grows after each retry.
+        total_timeout : float, optional
+            Number of seconds, counted from the start of the first attempt,
+            after which no more retries are started.
+        retryable_codes : AbstractSet[grpc.StatusCode], optional
+            Status codes that are retried. Errors with other codes are
+            raised straight away.
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+        self._max_attempts: int = max_attempts
+        self._initial_backoff: float = initial_backoff
+        self._max_backoff: float = max_backoff
+        self._backoff_multiplier: float = backoff_multiplier
+        self._total_timeout: float = total_timeout
+        self._retryable_codes: AbstractSet[grpc.StatusCode] = frozenset(retryable_codes)
+        self._lock = Lock()
+        self._retries: int = 0
+        self._recovered: int = 0
+        self._exhausted: int = 0
+
+    @property
+    def max_attempts(self) -> int:
+        """Most times to attempt an operation, including the first."""
+        return self._max_attempts
+
+    @property
+    def total_timeout(self) -> float:
+        """Number of seconds, counted from the start of the first attempt,
+        after which no more retries are started."""
+        return self._total_timeout
+
+    @property
+    def statistics(self) -> RetryStatistics:
+        """Counts of the retries made so far."""
+        with self._lock:
+            return RetryStatistics(self._retries, self._recovered, self._exhausted)
+
+    def reset_statistics(self) -> None:
+        """Set the counts of retries back to zero."""
+        with self._lock:
+            self._retries = 0
+            self._recovered = 0
+            self._exhausted = 0
+
+    def is_retryable(self, rpc_error: grpc.RpcError) -> bool:
+        """Get whether a failed call may be retried.
+
+        Parameters
+        ----------
+        rpc_error : grpc.RpcError
+            Error raised by the call.
+
+        Returns
+        -------
+        bool
+            ``True`` if the error's status code is one that is retried.
+        """
+        return rpc_error.code() in self._retryable_codes
+
+    def get_backoff(self, retry_number: int) -> float:
+        """Get how long to wait before a retry.
+
+        Parameters
+        ----------
+        retry_number : int
+            Number of the retry, starting from zero for the first.
+
+        Returns
+        -------
+        float
+            Number of seconds to wait.
+        """
+        limit = min(
+            self._max_backoff, self._initial_backoff * self._backoff_multiplier**retry_number
+        )
+        return random.uniform(0, limit)  # nosec B311
+
+    def _record_retry(self) -> None:
+        with self._lock:
+            self._retries += 1
+
+    def _record_outcome(self, succeeded: bool) -> None:
+        with self._lock:
+            if succeeded:
+                self._recovered += 1
+            else:
+                self._exhausted += 1
+
+
+def find_retry_policy(args: Sequence[Any]) -> Optional[RetryPolicy]:
+    """Find the retry policy that applies to a call of a decorated method.
+
+    The policy is taken from the object the method is called on, if it is
+    an engine, or from that object's engine.
+
+    Parameters
+    ----------
+    args : Sequence[Any]
+        Positional arguments of the call, starting with ``self``.
+
+    Returns
+    -------
+    Optional[RetryPolicy]
+        Retry policy, or ``None`` if the call should not be retried.
+    """
+    if len(args) == 0:
+        return None
+    owner = args[0]
+    policy = getattr(owner, "_retry_policy", None)
+    if policy is None:
+        policy = getattr(getattr(owner, "_engine", None), "_retry_policy", None)
+    return policy if isinstance(policy, RetryPolicy) else None
@@ -41,6 +41,7 @@ if TYPE_CHECKING:
 from ansys.api.modelcenter.v0.element_messages_pb2 import ElementId
 from ansys.api.modelcenter.v0.variable_value_messages_pb2 import SetStringVariableMetadataRequest
 
+from ._metadata_cache import cached_metadata, invalidates_metadata
 from .grpc_error_interpretation import (
     WRAP_OUT_OF_BOUNDS,
     WRAP_TARGET_NOT_FOUND,
@@ -77,13 +78,15 @@ class StringDatapin(BaseDatapin, mc_api.IStringDatapin):
     def __eq__(self, other):
         return isinstance(other, StringDatapin) and self.element_id == other.element_id
 
-    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
+    @cached_metadata
     @overrides
     def get_metadata(self) -> atvi.StringMetadata:
         response = self._client.StringVariableGetMetadata(self._element_id)
         return convert_grpc_string_metadata(response)
 
     @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @invalidates_metadata
     @overrides
     def set_metadata(self, new_metadata: atvi.CommonVariableMetadata) -> None:
         if not isinstance(new_metadata, atvi.StringMetadata):
@@ -130,13 +133,15 @@ class StringArrayDatapin(BaseDatapin, mc_api.IStringArrayDatapin):
     def __eq__(self, other):
         return isinstance(other, StringArrayDatapin) and self.element_id == other.element_id
 
-    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
+    @cached_metadata
     @overrides
     def get_metadata(self) -> atvi.StringArrayMetadata:
         response = self._client.StringVariableGetMetadata(self._element_id)
         return convert_grpc_string_array_metadata(response)
 
     @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @invalidates_metadata
     @overrides
     def set_metadata(self, new_metadata: atvi.CommonVariableMetadata) -> None:
         if not isinstance(new_metadata, atvi.StringArrayMetadata):
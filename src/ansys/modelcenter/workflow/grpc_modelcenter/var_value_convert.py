@@ -27,7 +27,7 @@ For more information, see `IVariableValue`_ in the
 """
 
 from contextlib import ExitStack
-from typing import Optional
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Type
 
 from ansys.api.modelcenter.v0.variable_value_messages_pb2 import (
     ArrayDimensions,
@@ -42,8 +42,11 @@ from ansys.api.modelcenter.v0.variable_value_messages_pb2 import (
 )
 import ansys.tools.variableinterop as atvi
 import numpy as np
+from numpy.typing import ArrayLike
 from overrides import overrides
 
+from ._array_convert import convert_grpc_array_to_numpy, convert_numpy_to_grpc_array
+
 
 class ValueTypeNotSupportedError(ValueError):
     """Raised if an attempt is made to convert a value with a known but
@@ -182,17 +185,17 @@ def convert_grpc_value_to_atvi(
     elif original.HasField("int_array_value"):
         return atvi.IntegerArrayValue(
             original.int_array_value.dims.dims,
-            np.reshape(original.int_array_value.values, original.int_array_value.dims.dims),
+            convert_grpc_array_to_numpy(original.int_array_value),
         )
     elif original.HasField("double_array_value"):
         return atvi.RealArrayValue(
             original.double_array_value.dims.dims,
-            np.reshape(original.double_array_value.values, original.double_array_value.dims.dims),
+            convert_grpc_array_to_numpy(original.double_array_value),
         )
     elif original.HasField("bool_array_value"):
         return atvi.BooleanArrayValue(
             original.bool_array_value.dims.dims,
-            np.reshape(original.bool_array_value.values, original.bool_array_value.dims.dims),
+            convert_grpc_array_to_numpy(original.bool_array_value),
         )
     elif original.HasField("string_array_value"):
         return atvi.StringArrayValue(
@@ -271,11 +274,7 @@ class ToGRPCVisitor(atvi.IVariableValueVisitor[VariableValue]):
 
     @overrides
     def visit_integer_array(self, value: atvi.IntegerArrayValue) -> VariableValue:
-        return VariableValue(
-            int_array_value=IntegerArrayValue(
-                values=value.flatten(), dims=ArrayDimensions(dims=value.shape)
-            )
-        )
+        return VariableValue(int_array_value=convert_numpy_to_grpc_array(IntegerArrayValue, value))
 
     @overrides
     def visit_file(self, value: atvi.FileValue) -> VariableValue:
@@ -297,18 +296,12 @@ class ToGRPCVisitor(atvi.IVariableValueVisitor[VariableValue]):
     @overrides
     def visit_real_array(self, value: atvi.RealArrayValue) -> VariableValue:
         return VariableValue(
-            double_array_value=DoubleArrayValue(
-                values=value.flatten(), dims=ArrayDimensions(dims=value.shape)
-            )
+            double_array_value=convert_numpy_to_grpc_array(DoubleArrayValue, value)
         )
 
     @overrides
     def visit_boolean_array(self, value: atvi.BooleanArrayValue) -> VariableValue:
-        return VariableValue(
-            bool_array_value=BooleanArrayValue(
-                values=value.flatten(), dims=ArrayDimensions(dims=value.shape)
-            )
-        )
+        return VariableValue(bool_array_value=convert_numpy_to_grpc_array(BooleanArrayValue, value))
 
     @overrides
     def visit_string_array(self, value: atvi.StringArrayValue) -> VariableValue:
@@ -348,3 +341,164 @@ def convert_interop_value_to_grpc(
     """Create an equivalent ``VariableValue`` message from a
     ``atvi.IVariableValue`` object."""
     return original.accept(ToGRPCVisitor(local_file_context_stack, engine_is_local))
+
+
+__NUMPY_KIND_TO_INTEROP_SCALAR_TYPE: Dict[str, Type[atvi.IVariableValue]] = {
+    "b": atvi.BooleanValue,
+    "i": atvi.IntegerValue,
+    "u": atvi.IntegerValue,
+    "f": atvi.RealValue,
+    "U": atvi.StringValue,
+}
+
+__NUMPY_KIND_TO_INTEROP_ARRAY_TYPE: Dict[str, Type[atvi.CommonArrayValue]] = {
+    "b": atvi.BooleanArrayValue,
+    "i": atvi.IntegerArrayValue,
+    "u": atvi.IntegerArrayValue,
+    "f": atvi.RealArrayValue,
+    "U": atvi.StringArrayValue,
+}
+
+
+def _convert_numpy_item_to_interop(item: Any) -> atvi.IVariableValue:
+    """Convert one entry of an object-typed NumPy column to an
+    ``atvi.IVariableValue`` object."""
+    if isinstance(item, atvi.IVariableValue):
+        return item
+    return convert_numpy_column_to_interop(np.asarray([item]))[0]
+
+
+def convert_numpy_column_to_interop(column: ArrayLike) -> List[atvi.IVariableValue]:
+    """Convert each row of a column-oriented NumPy array to an
+    ``atvi.IVariableValue`` object.
+
+    A one-dimensional column produces scalar values. A column with more
+    dimensions produces one array value per row, each with the shape of
+    the remaining dimensions. The value type is chosen from the dtype of
+    the column. Object columns are converted entry by entry, and entries
+    that are already ``atvi.IVariableValue`` objects are passed through.
+
+    Parameters
+    ----------
+    column : ArrayLike
+        Column to convert. The first dimension indexes the rows.
+
+    Returns
+    -------
+    List[atvi.IVariableValue]
+        One converted value per row.
+    """
+    array = np.asarray(column)
+    if array.ndim == 0:
+        raise ValueError("A column must have at least one dimension.")
+    kind: str = array.dtype.kind
+    if kind == "O":
+        if array.ndim != 1:
+            raise ValueError("Object columns must be one-dimensional.")
+        return [_convert_numpy_item_to_interop(item) for item in array]
+    elif array.ndim == 1:
+        if kind not in __NUMPY_KIND_TO_INTEROP_SCALAR_TYPE:
+            raise ValueTypeNotSupportedError(
+                f"Columns with dtype {array.dtype} cannot be converted to datapin values."
+            )
+        scalar_type = __NUMPY_KIND_TO_INTEROP_SCALAR_TYPE[kind]
+        return [scalar_type(item) for item in array.tolist()]
+    else:
+        if kind not in __NUMPY_KIND_TO_INTEROP_ARRAY_TYPE:
+            raise ValueTypeNotSupportedError(
+                f"Columns with dtype {array.dtype} cannot be converted to datapin values."
+            )
+        array_type = __NUMPY_KIND_TO_INTEROP_ARRAY_TYPE[kind]
+        return [array_type(values=row) for row in array]
+
+
+__INTEROP_SCALAR_TYPE_TO_NUMPY: Dict[type, Tuple[type, type]] = {
+    atvi.BooleanValue: (np.bool_, bool),
+    atvi.IntegerValue: (np.int64, int),
+    atvi.RealValue: (np.float64, float),
+    atvi.StringValue: (np.str_, str),
+}
+
+
+def convert_interop_states_to_masked_column(
+    states: Sequence[Optional[atvi.VariableState]],
+) -> np.ma.MaskedArray:
+    """Collect a sequence of variable states into a masked NumPy column.
+
+    Invalid states and missing (``None``) entries are masked. If every
+    present value is a scalar of the same type, the column has the
+    matching NumPy dtype. Otherwise, it is an object array holding the
+    ``atvi.IVariableValue`` objects themselves.
+
+    Parameters
+    ----------
+    states : Sequence[Optional[atvi.VariableState]]
+        States to collect, one per row.
+
+    Returns
+    -------
+    np.ma.MaskedArray
+        Column of values, masked where the state is invalid or missing.
+    """
+    mask = np.array([state is None or not state.is_valid for state in states], dtype=np.bool_)
+    value_types = {type(state.value) for state in states if state is not None}
+    data: np.ndarray
+    if len(value_types) == 1 and next(iter(value_types)) in __INTEROP_SCALAR_TYPE_TO_NUMPY:
+        dtype, python_type = __INTEROP_SCALAR_TYPE_TO_NUMPY[next(iter(value_types))]
+        data = np.array(
+            [python_type(state.value) if state is not None else python_type() for state in states],
+            dtype=dtype,
+        )
+    else:
+        data = np.empty(len(states), dtype=object)
+        for index, state in enumerate(states):
+            data[index] = state.value if state is not None else None
+    return np.ma.MaskedArray(data, mask=mask)
+
+
+__INTEROP_SCALAR_TYPE_TO_STRUCTURED_FIELD: Dict[type, type] = {
+    atvi.IntegerValue: np.int64,
+    atvi.RealValue: np.float64,
+}
+
+
+def convert_interop_states_to_structured(
+    states: Mapping[str, atvi.VariableState],
+) -> np.ma.MaskedArray:
+    """Collect the states of scalar real and integer datapins into a single
+    NumPy structured record.
+
+    Each datapin becomes a field of the record, named after its key in
+    ``states``. Fields of invalid states are masked.
+
+    Parameters
+    ----------
+    states : Mapping[str, atvi.VariableState]
+        States to collect, keyed by datapin name.
+
+    Returns
+    -------
+    np.ma.MaskedArray
+        Zero-dimensional masked array with one field per datapin.
+    """
+    fields: List[Tuple[str, type]] = []
+    for name, state in states.items():
+        field_type: Optional[type] = __INTEROP_SCALAR_TYPE_TO_STRUCTURED_FIELD.get(
+            type(state.value)
+        )
+        if field_type is None:
+            raise ValueTypeNotSupportedError(
+                f"Datapin {name} has a value of type {type(state.value).__name__}. Only real and "
+                "integer values can be collected into a structured array."
+            )
+        fields.append((name, field_type))
+    dtype = np.dtype(fields)
+    data = np.array(
+        tuple(state.value for state in states.values()),
+        dtype=dtype,
+    )
+    mask = np.array(
+        tuple(not state.is_valid for state in states.values()),
+        dtype=np.ma.make_mask_descr(dtype),
+    )
+    return np.ma.MaskedArray(data, mask=mask)
@@ -24,7 +24,21 @@
 
 from contextlib import ExitStack
 import os
-from typing import TYPE_CHECKING, AbstractSet, Collection, List, Mapping, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Any,
+    Collection,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 import ansys.api.modelcenter.v0.element_messages_pb2 as element_msg
 import ansys.api.modelcenter.v0.grpc_modelcenter_workflow_pb2_grpc as grpc_mcd_workflow
@@ -34,18 +48,26 @@ from ansys.api.modelcenter.v0.workflow_messages_pb2 import WorkflowInstanceState
 import ansys.engineeringworkflow.api as engapi
 import ansys.tools.variableinterop as atvi
 import grpc
+import numpy as np
 from overrides import overrides
 
 import ansys.modelcenter.workflow.api as wfapi
 
+from ._datapin_states import get_datapin_states
+from ._pipeline import DEFAULT_MAX_IN_FLIGHT, pipeline_calls
+from ._properties import get_element_properties
+from ._visitors import SetValueRequestVisitor
 from .assembly import Assembly
 from .component import Component
 from .create_datapin import create_datapin
+from .datapin_index import DatapinIndex, build_datapin_index
 from .datapin_link import DatapinLink
+from .dependency_graph import DependencyGraph, build_dependency_graph
 
 if TYPE_CHECKING:
     from .engine import Engine
 
+from ._element_name_cache import ElementNameCache
 from .element_wrapper import create_element
 from .grpc_error_interpretation import (
     WRAP_INVALID_ARG,
@@ -53,14 +75,185 @@ from .grpc_error_interpretation import (
     WRAP_OUT_OF_BOUNDS,
     WRAP_TARGET_NOT_FOUND,
     interpret_rpc_error,
+    wrap_rpc_error,
+)
+from .var_value_convert import (
+    convert_grpc_value_to_atvi,
+    convert_interop_states_to_masked_column,
+    convert_interop_states_to_structured,
+    convert_interop_value_to_grpc,
+    convert_numpy_column_to_interop,
+    grpc_type_enum_to_interop_type,
 )
-from .var_value_convert import convert_grpc_value_to_atvi, convert_interop_value_to_grpc
+from .workflow_snapshot import WorkflowSnapshot, take_workflow_snapshot
 
 
 class WorkflowRunFailedError(Exception):
     """Raised to indicate that a workflow run failed."""
 
 
+class SetValuesError(Exception):
+    """Raised to indicate that some of the values in a bulk set could not be
+    set.
+
+    The values of the other datapins were still set.
+    """
+
+    def __init__(self, errors: Mapping[str, Exception]):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        errors : Mapping[str, Exception]
+            Error for each datapin that could not be set, keyed by the
+            datapin name it was given as.
+        """
+        self.errors: Dict[str, Exception] = dict(errors)
+        """Error for each datapin that could not be set, keyed by datapin
+        name."""
+        super().__init__(
+            f"Failed to set {len(self.errors)} datapin value(s): {', '.join(self.errors)}"
+        )
+
+
+_VALUE_TYPES: Mapping[atvi.VariableType, Type[atvi.IVariableValue]] = {
+    atvi.VariableType.BOOLEAN: atvi.BooleanValue,
+    atvi.VariableType.INTEGER: atvi.IntegerValue,
+    atvi.VariableType.REAL: atvi.RealValue,
+    atvi.VariableType.STRING: atvi.StringValue,
+    atvi.VariableType.FILE: atvi.FileValue,
+    atvi.VariableType.BOOLEAN_ARRAY: atvi.BooleanArrayValue,
+    atvi.VariableType.INTEGER_ARRAY: atvi.IntegerArrayValue,
+    atvi.VariableType.REAL_ARRAY: atvi.RealArrayValue,
+    atvi.VariableType.STRING_ARRAY: atvi.StringArrayValue,
+    atvi.VariableType.FILE_ARRAY: atvi.FileArrayValue,
+}
+"""Interop value type that values are coerced to, for each datapin type."""
+
+
+_METADATA_DATAPIN_TYPES: AbstractSet[int] = frozenset(
+    {
+        var_val_msg.VARIABLE_TYPE_BOOLEAN,
+        var_val_msg.VARIABLE_TYPE_INTEGER,
+        var_val_msg.VARIABLE_TYPE_REAL,
+        var_val_msg.VARIABLE_TYPE_STRING,
+        var_val_msg.VARIABLE_TYPE_FILE,
+        var_val_msg.VARIABLE_TYPE_BOOLEAN_ARRAY,
+        var_val_msg.VARIABLE_TYPE_INTEGER_ARRAY,
+        var_val_msg.VARIABLE_TYPE_REAL_ARRAY,
+        var_val_msg.VARIABLE_TYPE_STRING_ARRAY,
+        var_val_msg.VARIABLE_TYPE_FILE_ARRAY,
+    }
+)
+"""Datapin types that ``Workflow.get_datapin_meta_data`` supports."""
+
+
+_WORKFLOW_INSTANCE_STATE_MAP: Mapping[int, engapi.WorkflowInstanceState] = {
+    WkflInstState.WORKFLOW_INSTANCE_STATE_UNSPECIFIED: engapi.WorkflowInstanceState.UNKNOWN,
+    WkflInstState.WORKFLOW_INSTANCE_STATE_INVALID: engapi.WorkflowInstanceState.INVALID,
+    WkflInstState.WORKFLOW_INSTANCE_STATE_RUNNING: engapi.WorkflowInstanceState.RUNNING,
+    WkflInstState.WORKFLOW_INSTANCE_STATE_PAUSED: engapi.WorkflowInstanceState.PAUSED,
+    WkflInstState.WORKFLOW_INSTANCE_STATE_FAILED: engapi.WorkflowInstanceState.FAILED,
+    WkflInstState.WORKFLOW_INSTANCE_STATE_SUCCESS: engapi.WorkflowInstanceState.SUCCESS,
+}
+
+
+def convert_grpc_workflow_state(state: int) -> engapi.WorkflowInstanceState:
+    """Convert a gRPC workflow instance state to the API equivalent.
+
+    Parameters
+    ----------
+    state : int
+        ``WorkflowInstanceState`` value from a ``GetWorkflowStateResponse``.
+
+    Returns
+    -------
+    engapi.WorkflowInstanceState
+        Equivalent state, or ``UNKNOWN`` if the state is not recognized.
+    """
+    return _WORKFLOW_INSTANCE_STATE_MAP.get(state, engapi.WorkflowInstanceState.UNKNOWN)
+
+
+def create_run_request(
+    workflow_id: str,
+    inputs: Mapping[str, atvi.VariableState],
+    reset: bool,
+    validation_names: AbstractSet[str],
+    collection_names: AbstractSet[str],
+    local_file_content_pins: ExitStack,
+    engine_is_local: bool,
+) -> workflow_msg.WorkflowRunRequest:
+    """Build the request message for running a workflow.
+
+    Parameters
+    ----------
+    workflow_id : str
+        ID of the workflow to run.
+    inputs : Mapping[str, atvi.VariableState]
+        Input states to set before the run, keyed by datapin name.
+    reset : bool
+        Whether to reset the workflow before the run.
+    validation_names : AbstractSet[str]
+        Names of the datapins to validate.
+    collection_names : AbstractSet[str]
+        Names of additional datapins whose values should be collected.
+    local_file_content_pins : ExitStack
+        Exit stack to open local file content contexts in. These must stay
+        open until the request has been sent.
+    engine_is_local : bool
+        Whether the engine is running on the local machine.
+
+    Returns
+    -------
+    workflow_msg.WorkflowRunRequest
+        Request message to send to ``WorkflowRun`` or ``WorkflowStartRun``.
+    """
+    request = workflow_msg.WorkflowRunRequest(
+        target=workflow_msg.WorkflowId(id=workflow_id),
+        reset=reset,
+        validation_names=[name for name in validation_names],
+        collection_names=[name for name in collection_names],
+    )
+
+    var_id: str
+    var_state: atvi.VariableState
+    for var_id, var_state in inputs.items():
+        request.inputs[var_id].is_valid = var_state.is_valid
+        request.inputs[var_id].value.MergeFrom(
+            convert_interop_value_to_grpc(var_state.value, local_file_content_pins, engine_is_local)
+        )
+
+    return request
+
+
+def convert_run_response(
+    response: workflow_msg.WorkflowRunResponse, engine_is_local: bool
+) -> Dict[str, atvi.VariableState]:
+    """Convert the results of a workflow run to interop states.
+
+    Parameters
+    ----------
+    response : workflow_msg.WorkflowRunResponse
+        Response from ``WorkflowRun``.
+    engine_is_local : bool
+        Whether the engine is running on the local machine.
+
+    Returns
+    -------
+    Dict[str, atvi.VariableState]
+        Result states, keyed by datapin name.
+    """
+    elem_id: str
+    response_var_state: var_val_msg.VariableState
+    return {
+        elem_id: atvi.VariableState(
+            is_valid=response_var_state.is_valid,
+            value=convert_grpc_value_to_atvi(response_var_state.value, engine_is_local),
+        )
+        for elem_id, response_var_state in response.results.items()
+    }
+
+
 class Workflow(wfapi.IWorkflow):
     """Represents a workflow or model in ModelCenter.
 
@@ -84,8 +277,12 @@ class Workflow(wfapi.IWorkflow):
         self._id = workflow_id
         self._file_name = os.path.basename(file_path)
         self._engine = engine
-        self._stub = self._create_client(self._engine.channel)
+        self._stub = self._create_client(self._engine)
         self._closed = False
+        self._name_cache = ElementNameCache(engine)
+        self._datapin_index: Optional[DatapinIndex] = None
+        self._datapin_index_generation: int = engine._structure_generation
+        self._dependency_graphs: Dict[bool, Tuple[DependencyGraph, int, int]] = {}
 
     def __enter__(self):
         """Initialization when created in a 'with' statement."""
@@ -96,21 +293,52 @@ class Workflow(wfapi.IWorkflow):
         if not self._closed:
             self.close_workflow()
 
-    @staticmethod
-    def _create_client(grpc_channel) -> grpc_mcd_workflow.ModelCenterWorkflowServiceStub:
-        """Create a client from a gRPC channel."""
-        return grpc_mcd_workflow.ModelCenterWorkflowServiceStub(grpc_channel)
-
-    __WORKFLOW_INSTANCE_STATE_MAP = {
-        WkflInstState.WORKFLOW_INSTANCE_STATE_UNSPECIFIED: engapi.WorkflowInstanceState.UNKNOWN,
-        WkflInstState.WORKFLOW_INSTANCE_STATE_INVALID: engapi.WorkflowInstanceState.INVALID,
-        WkflInstState.WORKFLOW_INSTANCE_STATE_RUNNING: engapi.WorkflowInstanceState.RUNNING,
-        WkflInstState.WORKFLOW_INSTANCE_STATE_PAUSED: engapi.WorkflowInstanceState.PAUSED,
-        WkflInstState.WORKFLOW_INSTANCE_STATE_FAILED: engapi.WorkflowInstanceState.FAILED,
-        WkflInstState.WORKFLOW_INSTANCE_STATE_SUCCESS: engapi.WorkflowInstanceState.SUCCESS,
-    }
+    def _create_client(self, engine: "Engine") -> grpc_mcd_workflow.ModelCenterWorkflowServiceStub:
+        """Get the engine's shared workflow client."""
+        return engine._get_shared_stub(grpc_mcd_workflow.ModelCenterWorkflowServiceStub)
 
-    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @property
+    def name_cache(self) -> ElementNameCache:
+        """Get the cache of element name lookups for this workflow.
+
+        The cache is disabled by default. Set ``name_cache.enabled`` to
+        ``True`` to stop methods that take an element name, such as
+        ``get_datapin()`` and ``set_value()``, from looking the name up
+        with the engine every time they are called.
+
+        Returns
+        -------
+        ElementNameCache
+            Cache of element name lookups.
+        """
+        return self._name_cache
+
+    def _get_element_info(self, name: str) -> workflow_msg.ElementInfo:
+        """Look up an element by its full name, using the name cache if it is
+        enabled.
+
+        Parameters
+        ----------
+        name : str
+            Full name of the element.
+
+        Returns
+        -------
+        workflow_msg.ElementInfo
+            ID and type of the element.
+        """
+        cached: Optional[workflow_msg.ElementInfo] = self._name_cache.get(name)
+        if cached is not None:
+            return cached
+        request = workflow_msg.NamedElementWorkflow(
+            workflow=workflow_msg.WorkflowId(id=self._id),
+            element_full_name=element_msg.ElementName(name=name),
+        )
+        response: workflow_msg.ElementInfo = self._stub.WorkflowGetElementByName(request)
+        self._name_cache.put(name, response)
+        return response
+
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
     def get_state(self) -> engapi.WorkflowInstanceState:
         """Get the state of the workflow instance.
 
@@ -142,38 +370,7 @@ class Workflow(wfapi.IWorkflow):
         """
         request = workflow_msg.GetWorkflowStateRequest()
         response: workflow_msg.GetWorkflowStateResponse = self._stub.WorkflowGetState(request)
-        return (
-            Workflow.__WORKFLOW_INSTANCE_STATE_MAP[response.state]
-            if response.state in Workflow.__WORKFLOW_INSTANCE_STATE_MAP
-            else engapi.WorkflowInstanceState.UNKNOWN
-        )
-
-    def _create_run_request(
-        self,
-        inputs: Mapping[str, atvi.VariableState],
-        reset: bool,
-        validation_names: AbstractSet[str],
-        collection_names: AbstractSet[str],
-        local_file_content_pins: ExitStack,
-    ) -> workflow_msg.WorkflowRunRequest:
-        request = workflow_msg.WorkflowRunRequest(
-            target=workflow_msg.WorkflowId(id=self._id),
-            reset=reset,
-            validation_names=[name for name in validation_names],
-            collection_names=[name for name in collection_names],
-        )
-
-        var_id: str
-        var_state: atvi.VariableState
-        for var_id, var_state in inputs.items():
-            request.inputs[var_id].is_valid = var_state.is_valid
-            request.inputs[var_id].value.MergeFrom(
-                convert_interop_value_to_grpc(
-                    var_state.value, local_file_content_pins, self._engine.is_local
-                )
-            )
-
-        return request
+        return convert_grpc_workflow_state(response.state)
 
     @interpret_rpc_error(
         {
@@ -192,20 +389,117 @@ class Workflow(wfapi.IWorkflow):
         collect_names: AbstractSet[str] = set(),
     ) -> Mapping[str, atvi.VariableState]:
         with ExitStack() as local_file_content_pins:
-            request: workflow_msg.WorkflowRunRequest = self._create_run_request(
-                inputs, reset, validation_names, collect_names, local_file_content_pins
+            request: workflow_msg.WorkflowRunRequest = create_run_request(
+                self._id,
+                inputs,
+                reset,
+                validation_names,
+                collect_names,
+                local_file_content_pins,
+                self._engine.is_local,
             )
             response = self._stub.WorkflowRun(request)
-            elem_id: str
-            response_var_state: var_val_msg.VariableState
+            return convert_run_response(response, self._engine.is_local)
+        # This line should only be reachable if one of the context managers in
+        # local_file_content_pins suppress an exception, which they should not
+        # be doing.
+        raise engapi.EngineInternalError(
+            "Reached an unexpected state. A local file content context may be suppressing an "
+            "exception. Report this error on the PyModelCenter repository's Issues page."
+        )
+
+    @staticmethod
+    def _input_rows_from_columns(
+        columns: Mapping[str, np.ndarray],
+    ) -> Iterator[Mapping[str, atvi.VariableState]]:
+        """Convert column-oriented inputs into one mapping of input states per
+        run."""
+        converted: Dict[str, List[atvi.IVariableValue]] = {
+            name: convert_numpy_column_to_interop(column) for name, column in columns.items()
+        }
+        row_counts = {len(values) for values in converted.values()}
+        if len(row_counts) > 1:
+            raise ValueError("All input columns must have the same number of rows.")
+        row_count: int = row_counts.pop() if len(row_counts) == 1 else 0
+        for row in range(row_count):
+            yield {
+                name: atvi.VariableState(value=values[row], is_valid=True)
+                for name, values in converted.items()
+            }
+
+    @interpret_rpc_error(
+        {
+            **WRAP_TARGET_NOT_FOUND,
+            **WRAP_INVALID_ARG,
+            **WRAP_OUT_OF_BOUNDS,
+            grpc.StatusCode.FAILED_PRECONDITION: WorkflowRunFailedError,
+        }
+    )
+    def run_many(
+        self,
+        inputs: Union[Mapping[str, np.ndarray], Iterable[Mapping[str, atvi.VariableState]]],
+        reset: bool = False,
+        validation_names: AbstractSet[str] = set(),
+        collect_names: AbstractSet[str] = set(),
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ) -> Mapping[str, np.ma.MaskedArray]:
+        """Run the workflow once for each of several sets of inputs.
+
+        Requests are sent without waiting for earlier runs to return, with
+        at most ``max_in_flight`` runs outstanding at once. Each run is
+        otherwise equivalent to a call to ``run()`` with the same arguments.
+
+        Parameters
+        ----------
+        inputs : Union[Mapping[str, np.ndarray], Iterable[Mapping[str, atvi.VariableState]]]
+            Inputs for each run. Pass a mapping of datapin names to NumPy
+            columns, where row ``i`` of every column is the input for run
+            ``i``, or pass an iterable with one mapping of input states per
+            run.
+        reset : bool, optional
+            Whether to reset the workflow before each run. The default is ``False``.
+        validation_names : AbstractSet[str], optional
+            Names of the datapins to validate in each run.
+        collect_names : AbstractSet[str], optional
+            Names of additional datapins whose values should be collected.
+        max_in_flight : int, optional
+            Maximum number of runs to have outstanding at once.
+
+        Returns
+        -------
+        Mapping[str, np.ma.MaskedArray]
+            One column of results per datapin, with one row per run. Rows
+            are masked where the result was invalid or not returned by that
+            run.
+        """
+        input_rows: Iterable[Mapping[str, atvi.VariableState]] = (
+            Workflow._input_rows_from_columns(inputs) if isinstance(inputs, Mapping) else inputs
+        )
+        with ExitStack() as local_file_content_pins:
+            requests: Iterator[workflow_msg.WorkflowRunRequest] = (
+                create_run_request(
+                    self._id,
+                    one_row,
+                    reset,
+                    validation_names,
+                    collect_names,
+                    local_file_content_pins,
+                    self._engine.is_local,
+                )
+                for one_row in input_rows
+            )
+            results: List[Dict[str, atvi.VariableState]] = []
+            response: workflow_msg.WorkflowRunResponse
+            for response in pipeline_calls(self._stub.WorkflowRun, requests, max_in_flight):
+                results.append(convert_run_response(response, self._engine.is_local))
+            result_names: Dict[str, None] = {
+                name: None for one_result in results for name in one_result
+            }
             return {
-                elem_id: atvi.VariableState(
-                    is_valid=response_var_state.is_valid,
-                    value=convert_grpc_value_to_atvi(
-                        response_var_state.value, self._engine.is_local
-                    ),
+                name: convert_interop_states_to_masked_column(
+                    [one_result.get(name) for one_result in results]
                 )
-                for elem_id, response_var_state in response.results.items()
+                for name in result_names
             }
         # This line should only be reachable if one of the context managers in
         # local_file_content_pins suppress an exception, which they should not
@@ -224,8 +518,14 @@ class Workflow(wfapi.IWorkflow):
         validation_names: AbstractSet[str],
     ) -> None:
         with ExitStack() as local_file_content_pins:
-            request: workflow_msg.WorkflowRunRequest = self._create_run_request(
-                inputs, reset, validation_names, set(), local_file_content_pins
+            request: workflow_msg.WorkflowRunRequest = create_run_request(
+                self._id,
+                inputs,
+                reset,
+                validation_names,
+                set(),
+                local_file_content_pins,
+                self._engine.is_local,
             )
             self._stub.WorkflowStartRun(request)
             return
@@ -237,7 +537,7 @@ class Workflow(wfapi.IWorkflow):
             "exception. Report this error on the PyModelCenter repository's Issues page."
         )
 
-    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
     @overrides
     def get_root(self) -> Assembly:
         request = workflow_msg.WorkflowId(id=self._id)
@@ -245,14 +545,155 @@ class Workflow(wfapi.IWorkflow):
         root: element_msg.ElementId = response.id
         return Assembly(root, self._engine)
 
-    @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND, **WRAP_INVALID_ARG})
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
+    def snapshot(self, max_in_flight: int = DEFAULT_MAX_IN_FLIGHT) -> WorkflowSnapshot:
+        """Read the structure of the whole workflow into a snapshot.
+
+        The element tree is crawled one level at a time, with the requests
+        for each level sent without waiting for each earlier request to
+        return. This is much faster than walking the tree with
+        ``get_elements()``, ``get_groups()``, and ``get_datapins()`` for
+        large workflows.
+
+        Parameters
+        ----------
+        max_in_flight : int, optional
+            Maximum number of requests to have outstanding at once.
+
+        Returns
+        -------
+        WorkflowSnapshot
+            Names, IDs, kinds, and value types of every element in the
+            workflow as of the call.
+        """
+        request = workflow_msg.WorkflowId(id=self._id)
+        response: workflow_msg.WorkflowGetRootResponse = self._stub.WorkflowGetRoot(request)
+        return take_workflow_snapshot(self._stub, response.id, max_in_flight)
+
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
+    def get_datapin_index(
+        self, refresh: bool = False, max_in_flight: int = DEFAULT_MAX_IN_FLIGHT
+    ) -> DatapinIndex:
+        """Get an index of the datapins in the workflow.
+
+        The index is built the first time it is needed and kept until this
+        client changes the structure of a workflow on the same engine.
+        Changes made in other ways, such as by another client or by the
+        ModelCenter user interface, are not detected; pass ``refresh=True``
+        after them.
+
+        Parameters
+        ----------
+        refresh : bool, optional
+            Whether to rebuild the index even if it is up to date.
+        max_in_flight : int, optional
+            Maximum number of requests to have outstanding at once while
+            building the index.
+
+        Returns
+        -------
+        DatapinIndex
+            Index of the datapins in the workflow.
+        """
+        generation = self._engine._structure_generation
+        if refresh or self._datapin_index is None or self._datapin_index_generation != generation:
+            self._datapin_index = build_datapin_index(
+                self._stub, self.snapshot(max_in_flight), self._engine, max_in_flight
+            )
+            self._datapin_index_generation = generation
+        return self._datapin_index
+
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
+    def dependency_graph(
+        self,
+        follow_suspended_links: bool = False,
+        refresh: bool = False,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ) -> DependencyGraph:
+        """Get a graph of the dependencies between the datapins in the
+        workflow.
+
+        The graph is built with one request per datapin the first time it
+        is needed, and kept until this client changes the structure or the
+        links of a workflow on the same engine, for example with
+        ``create_link()`` or ``DatapinLink.break_link()``. Changes made in
+        other ways, such as by another client or by the ModelCenter user
+        interface, are not detected; pass ``refresh=True`` after them.
+
+        Parameters
+        ----------
+        follow_suspended_links : bool, optional
+            Whether to follow suspended links. Graphs that do and do not
+            follow them are kept separately.
+        refresh : bool, optional
+            Whether to rebuild the graph even if it is up to date.
+        max_in_flight : int, optional
+            Maximum number of requests to have outstanding at once while
+            building the graph.
+
+        Returns
+        -------
+        DependencyGraph
+            Graph of the dependencies between the datapins.
+        """
+        generations = (self._engine._structure_generation, self._engine._link_generation)
+        cached = self._dependency_graphs.get(follow_suspended_links)
+        if refresh or cached is None or cached[1:] != generations:
+            index = self.get_datapin_index(refresh, max_in_flight)
+            graph = build_dependency_graph(self._stub, index, follow_suspended_links, max_in_flight)
+            cached = (graph, *generations)
+            self._dependency_graphs[follow_suspended_links] = cached
+        return cached[0]
+
+    def find_datapins(
+        self,
+        pattern: str = "*",
+        regex: bool = False,
+        value_type: Optional[atvi.VariableType] = None,
+        is_input_to_component: Optional[bool] = None,
+        is_input_to_workflow: Optional[bool] = None,
+        refresh: bool = False,
+    ) -> Dict[str, wfapi.IDatapin]:
+        """Get the datapins whose full names and properties match a query.
+
+        The query is answered from the index returned by
+        ``get_datapin_index()``, so once the index is built, no calls are
+        made to the engine.
+
+        Parameters
+        ----------
+        pattern : str, optional
+            Pattern that the full name must match. This is a glob pattern
+            in which ``*`` also matches dots, so ``"Model.Wing.*"`` matches
+            every datapin under ``Model.Wing``. The default matches every
+            datapin.
+        regex : bool, optional
+            Whether ``pattern`` is a regular expression that must match the
+            whole name instead of a glob pattern. The default is ``False``.
+        value_type : atvi.VariableType, optional
+            Value type the datapins must have. The default is any type.
+        is_input_to_component : bool, optional
+            Whether the datapins must be inputs (``True``) or outputs
+            (``False``) of their component. The default is either.
+        is_input_to_workflow : bool, optional
+            Whether the datapins must be inputs (``True``) or not inputs
+            (``False``) of the workflow. The default is either.
+        refresh : bool, optional
+            Whether to rebuild the index before the query.
+
+        Returns
+        -------
+        Dict[str, wfapi.IDatapin]
+            Matching datapins keyed by full name, in sorted order.
+        """
+        return self.get_datapin_index(refresh).find(
+            pattern, regex, value_type, is_input_to_component, is_input_to_workflow
+        )
+
+    @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND, **WRAP_INVALID_ARG}, idempotent=True)
     @overrides
     def get_element_by_name(self, element_name: str) -> engapi.IElement:
-        request = workflow_msg.NamedElementWorkflow(
-            workflow=workflow_msg.WorkflowId(id=self._id),
-            element_full_name=element_msg.ElementName(name=element_name),
-        )
-        response = self._stub.WorkflowGetElementByName(request)
+        response: workflow_msg.ElementInfo = self._get_element_info(element_name)
         return create_element(response, self._engine)
 
     @property
@@ -275,7 +716,7 @@ class Workflow(wfapi.IWorkflow):
     def workflow_file_name(self) -> str:
         return self._file_name
 
-    @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND, **WRAP_INVALID_ARG})
+    @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND, **WRAP_INVALID_ARG}, idempotent=True)
     @overrides
     def get_datapin_state(self, var_name: str) -> atvi.VariableState:
         request = workflow_msg.ElementIdOrName(
@@ -289,6 +730,121 @@ class Workflow(wfapi.IWorkflow):
             convert_grpc_value_to_atvi(response.value, self._engine.is_local), response.is_valid
         )
 
+    @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND, **WRAP_INVALID_ARG}, idempotent=True)
+    def get_datapin_states(
+        self,
+        datapins: Iterable[Union[str, wfapi.IDatapin]],
+        as_structured: bool = False,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ) -> Union[Dict[str, atvi.VariableState], np.ma.MaskedArray]:
+        """Get the states of several datapins at once.
+
+        The states are requested without waiting for each earlier request
+        to return, with at most ``max_in_flight`` requests outstanding.
+
+        Parameters
+        ----------
+        datapins : Iterable[Union[str, wfapi.IDatapin]]
+            Datapins to read, given as full names or as datapin objects.
+        as_structured : bool, optional
+            Whether to return a NumPy structured record instead of a
+            dictionary. This is only possible if every datapin is a scalar
+            real or integer. The default is ``False``.
+        max_in_flight : int, optional
+            Maximum number of requests to have outstanding at once.
+
+        Returns
+        -------
+        Union[Dict[str, atvi.VariableState], np.ma.MaskedArray]
+            States of the datapins, keyed by full name. If ``as_structured``
+            is ``True``, a zero-dimensional masked array with one field per
+            datapin, with invalid values masked.
+        """
+        pins: List[Union[str, wfapi.IDatapin]] = list(datapins)
+        pin_objects: List[wfapi.IDatapin] = [pin for pin in pins if not isinstance(pin, str)]
+        full_names: Iterator[element_msg.ElementName] = pipeline_calls(
+            self._stub.ElementGetFullName,
+            (element_msg.ElementId(id_string=pin.element_id) for pin in pin_objects),
+            max_in_flight,
+        )
+        pin_object_names: Dict[str, str] = {
+            pin.element_id: full_name.name for pin, full_name in zip(pin_objects, full_names)
+        }
+        targets: Dict[str, workflow_msg.ElementIdOrName] = {}
+        for pin in pins:
+            if isinstance(pin, str):
+                targets[pin] = workflow_msg.ElementIdOrName(
+                    target_name=workflow_msg.NamedElementWorkflow(
+                        element_full_name=element_msg.ElementName(name=pin),
+                        workflow=workflow_msg.WorkflowId(id=self._id),
+                    )
+                )
+            else:
+                targets[pin_object_names[pin.element_id]] = workflow_msg.ElementIdOrName(
+                    target_id=element_msg.ElementId(id_string=pin.element_id)
+                )
+        states = get_datapin_states(self._stub, targets, self._engine.is_local, max_in_flight)
+        return convert_interop_states_to_structured(states) if as_structured else states
+
+    @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND, **WRAP_INVALID_ARG}, idempotent=True)
+    def get_all_properties(
+        self,
+        elements: Iterable[Union[str, engapi.IElement]],
+        property_names: Optional[Iterable[str]] = None,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ) -> Dict[str, Dict[str, engapi.Property]]:
+        """Get the properties of several elements at once.
+
+        The property names and values of all the elements are requested
+        without waiting for each earlier request to return, with at most
+        ``max_in_flight`` requests outstanding.
+
+        Parameters
+        ----------
+        elements : Iterable[Union[str, engapi.IElement]]
+            Elements to read, given as full names or as element objects.
+        property_names : Optional[Iterable[str]], optional
+            Names of the properties to get from every element. The default
+            is every property of each element.
+        max_in_flight : int, optional
+            Maximum number of requests to have outstanding at once.
+
+        Returns
+        -------
+        Dict[str, Dict[str, engapi.Property]]
+            Properties of each element keyed by property name, keyed by the
+            full name of the element.
+        """
+        items: List[Union[str, engapi.IElement]] = list(elements)
+        element_objects: List[engapi.IElement] = [
+            item for item in items if not isinstance(item, str)
+        ]
+        full_names: Iterator[element_msg.ElementName] = pipeline_calls(
+            self._stub.ElementGetFullName,
+            (element_msg.ElementId(id_string=item.element_id) for item in element_objects),
+            max_in_flight,
+        )
+        object_names: Dict[str, str] = {
+            item.element_id: full_name.name for item, full_name in zip(element_objects, full_names)
+        }
+        errors: Dict[str, Exception] = {}
+        element_infos = self._get_element_infos(
+            (item for item in items if isinstance(item, str)), errors, max_in_flight
+        )
+        if len(errors) > 0:
+            raise next(iter(errors.values()))
+        targets: Dict[str, element_msg.ElementId] = {}
+        for item in items:
+            if isinstance(item, str):
+                targets[item] = element_infos[item].id
+            else:
+                targets[object_names[item.element_id]] = element_msg.ElementId(
+                    id_string=item.element_id
+                )
+        return get_element_properties(
+            self._stub, targets, self._engine.is_local, property_names, max_in_flight
+        )
+
     @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND, **WRAP_INVALID_ARG})
     @overrides
     def create_link(
@@ -305,6 +861,7 @@ class Workflow(wfapi.IWorkflow):
         else:
             request.target.id_string = datapin.element_id
         response: workflow_msg.WorkflowCreateLinkResponse = self._stub.WorkflowCreateLink(request)
+        self._engine._notify_links_changed()
 
     @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
     @overrides
@@ -328,15 +885,14 @@ class Workflow(wfapi.IWorkflow):
         request.id = self._id
         response: workflow_msg.WorkflowCloseResponse = self._stub.WorkflowClose(request)
         self._closed = True
+        self._name_cache.invalidate()
+        self._engine.metadata_cache.invalidate()
+        self._engine._forget_workflow(self)
 
-    @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND, **WRAP_INVALID_ARG})
+    @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND, **WRAP_INVALID_ARG}, idempotent=True)
     @overrides
     def get_datapin(self, name: str) -> wfapi.IDatapin:
-        request = workflow_msg.NamedElementWorkflow(
-            workflow=workflow_msg.WorkflowId(id=self._id),
-            element_full_name=element_msg.ElementName(name=name),
-        )
-        response: workflow_msg.ElementInfo = self._stub.WorkflowGetElementByName(request)
+        response: workflow_msg.ElementInfo = self._get_element_info(name)
 
         if response.type != element_msg.ELEMENT_TYPE_VARIABLE:
             raise ValueError("Element is not a datapin.")
@@ -349,14 +905,10 @@ class Workflow(wfapi.IWorkflow):
             engine=self._engine,
         )
 
-    @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND, **WRAP_INVALID_ARG})
+    @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND, **WRAP_INVALID_ARG}, idempotent=True)
     @overrides
     def get_component(self, name: str) -> Component:
-        request = workflow_msg.NamedElementWorkflow(
-            workflow=workflow_msg.WorkflowId(id=self._id),
-            element_full_name=element_msg.ElementName(name=name),
-        )
-        response: workflow_msg.ElementInfo = self._stub.WorkflowGetElementByName(request)
+        response: workflow_msg.ElementInfo = self._get_element_info(name)
         if response.type == element_msg.ELEMENT_TYPE_COMPONENT:
             return Component(response.id, self._engine)
         elif response.type == element_msg.ELEMENT_TYPE_DRIVERCOMPONENT:
@@ -372,6 +924,7 @@ class Workflow(wfapi.IWorkflow):
         request = workflow_msg.WorkflowRemoveComponentRequest()
         request.target.id_string = comp.element_id
         self._stub.WorkflowRemoveComponent(request)
+        self._engine._notify_structure_changed()
 
     @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND, **WRAP_INVALID_ARG, **WRAP_NAME_COLLISION})
     @overrides
@@ -396,6 +949,7 @@ class Workflow(wfapi.IWorkflow):
             else:
                 request.parent.id_string = parent.element_id
         response: element_msg.AddAssemblyResponse = self._stub.AssemblyAddAssembly(request)
+        self._engine._notify_structure_changed()
         return Assembly(response.id, self._engine)
 
     @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND, **WRAP_INVALID_ARG})
@@ -413,13 +967,14 @@ class Workflow(wfapi.IWorkflow):
         request.source_comp.id_string = src_comp_used.element_id
         request.target_comp.id_string = dest_comp_used.element_id
         response: workflow_msg.WorkflowAutoLinkResponse = self._stub.WorkflowAutoLink(request)
+        self._engine._notify_links_changed()
         links: List[wfapi.IDatapinLink] = [
-            DatapinLink(self._stub, lhs_id=entry.lhs.id_string, rhs=entry.rhs)
+            DatapinLink(self._stub, lhs_id=entry.lhs.id_string, rhs=entry.rhs, engine=self._engine)
             for entry in response.created_links
         ]
         return links
 
-    @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND})
+    @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND}, idempotent=True)
     @overrides
     def get_links(self) -> Collection[wfapi.IDatapinLink]:
         request = workflow_msg.WorkflowId(id=self._id)
@@ -427,7 +982,7 @@ class Workflow(wfapi.IWorkflow):
             request
         )
         links: List[wfapi.IDatapinLink] = [
-            DatapinLink(self._stub, lhs_id=entry.lhs.id_string, rhs=entry.rhs)
+            DatapinLink(self._stub, lhs_id=entry.lhs.id_string, rhs=entry.rhs, engine=self._engine)
             for entry in response.links
         ]
         return links
@@ -462,18 +1017,15 @@ class Workflow(wfapi.IWorkflow):
             index_parent=index,
         )
         self._stub.WorkflowMoveComponent(request)
+        self._engine._notify_structure_changed()
 
-    @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND, **WRAP_INVALID_ARG})
+    @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND, **WRAP_INVALID_ARG}, idempotent=True)
     @overrides
     def get_assembly(self, name: Optional[str] = None) -> wfapi.IAssembly:
         if name is None:
             return self.get_root()
         else:
-            request = workflow_msg.NamedElementWorkflow(
-                workflow=workflow_msg.WorkflowId(id=self._id),
-                element_full_name=element_msg.ElementName(name=name),
-            )
-            response: workflow_msg.ElementInfo = self._stub.WorkflowGetElementByName(request)
+            response: workflow_msg.ElementInfo = self._get_element_info(name)
             if response.type == element_msg.ELEMENT_TYPE_ASSEMBLY:
                 return Assembly(
                     element_msg.ElementId(id_string=response.id.id_string), self._engine
@@ -511,6 +1063,7 @@ class Workflow(wfapi.IWorkflow):
         response: workflow_msg.WorkflowCreateComponentResponse = self._stub.WorkflowCreateComponent(
             request
         )
+        self._engine._notify_structure_changed()
         parent_elements: workflow_msg.ElementInfoCollection = (
             self._stub.AssemblyGetAssembliesAndComponents(
                 element_msg.ElementId(id_string=used_parent.element_id)
@@ -530,165 +1083,151 @@ class Workflow(wfapi.IWorkflow):
                 "A request to create a component created something that was not a component."
             )
 
-    @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND, **WRAP_INVALID_ARG})
+    @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND, **WRAP_INVALID_ARG}, idempotent=True)
     @overrides
     def get_datapin_meta_data(self, name: str) -> atvi.CommonVariableMetadata:
-        metadata: atvi.CommonVariableMetadata
-        request = workflow_msg.NamedElementWorkflow(
-            workflow=workflow_msg.WorkflowId(id=self._id),
-            element_full_name=element_msg.ElementName(name=name),
-        )
-        response: workflow_msg.ElementInfo = self._stub.WorkflowGetElementByName(request)
+        response: workflow_msg.ElementInfo = self._get_element_info(name)
 
         if response.type != element_msg.ELEMENT_TYPE_VARIABLE:
             raise ValueError("Element is not a datapin.")
-        elem_id: element_msg.ElementId = response.id
-        var_type: var_val_msg.VariableType = response.var_type
-
-        if var_type == var_val_msg.VARIABLE_TYPE_BOOLEAN:
-            metadata = atvi.BooleanMetadata()
-            self._set_bool_metadata(elem_id, metadata)
-        elif var_type == var_val_msg.VARIABLE_TYPE_INTEGER:
-            metadata = atvi.IntegerMetadata()
-            self._set_int_metadata(elem_id, metadata)
-        elif var_type == var_val_msg.VARIABLE_TYPE_REAL:
-            metadata = atvi.RealMetadata()
-            self._set_real_metadata(elem_id, metadata)
-        elif var_type == var_val_msg.VARIABLE_TYPE_STRING:
-            metadata = atvi.StringMetadata()
-            self._set_string_metadata(elem_id, metadata)
-        elif var_type == var_val_msg.VARIABLE_TYPE_FILE:
-            metadata = atvi.FileMetadata()
-            self._set_file_metadata(elem_id, metadata)
-        elif var_type == var_val_msg.VARIABLE_TYPE_BOOLEAN_ARRAY:
-            metadata = atvi.BooleanArrayMetadata()
-            self._set_bool_metadata(elem_id, metadata)
-        elif var_type == var_val_msg.VARIABLE_TYPE_INTEGER_ARRAY:
-            metadata = atvi.IntegerArrayMetadata()
-            self._set_int_metadata(elem_id, metadata)
-        elif var_type == var_val_msg.VARIABLE_TYPE_REAL_ARRAY:
-            metadata = atvi.RealArrayMetadata()
-            self._set_real_metadata(elem_id, metadata)
-        elif var_type == var_val_msg.VARIABLE_TYPE_STRING_ARRAY:
-            metadata = atvi.StringArrayMetadata()
-            self._set_string_metadata(elem_id, metadata)
-        elif var_type == var_val_msg.VARIABLE_TYPE_FILE_ARRAY:
-            metadata = atvi.FileArrayMetadata()
-            self._set_file_metadata(elem_id, metadata)
-        else:
+        if response.var_type not in _METADATA_DATAPIN_TYPES:
             raise ValueError("Datapin type is unknown.")
-        return metadata
 
-    def _set_bool_metadata(
-        self,
-        var_id: element_msg.ElementId,
-        metadata: Union[atvi.BooleanMetadata, atvi.BooleanArrayMetadata],
-    ) -> None:
-        """Query gRPC for metadata for a Boolean datapin and populate the given
-        metadata object.
+        # Go through the datapin so that the engine's metadata cache is used.
+        return create_datapin(response.var_type, response.id, self._engine).get_metadata()
 
-        Parameters
-        ----------
-        var_id : ElementId
-            ID of the datapin.
-        metadata : Union[atvi.BooleanMetadata, atvi.BooleanArrayMetadata]
-            Metadata object to populate.
-        """
-        response: var_val_msg.BooleanVariableMetadata = self._stub.BooleanVariableGetMetadata(
-            var_id
-        )
-        metadata.description = response.base_metadata.description
+    @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND, **WRAP_INVALID_ARG, **WRAP_OUT_OF_BOUNDS})
+    @overrides
+    def set_value(self, var_name: str, value: atvi.IVariableValue) -> None:
+        var = self.get_datapin(var_name)
+        var.set_state(atvi.VariableState(value, True))
 
-    def _set_real_metadata(
+    def set_values(
         self,
-        var_id: element_msg.ElementId,
-        metadata: Union[atvi.RealMetadata, atvi.RealArrayMetadata],
+        values: Mapping[str, atvi.IVariableValue],
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
     ) -> None:
-        """Query gRPC for metadata for a real datapin and populate the given
-        metadata object.
+        """Set the values of several datapins at once.
 
-        Parameters
-        ----------
-        var_id : ElementId
-            ID of the datapin.
-        metadata : Union[atvi.RealMetadata, atvi.RealArrayMetadata]
-            Metadata object to populate.
-        """
-        response: var_val_msg.DoubleVariableMetadata = self._stub.DoubleVariableGetMetadata(var_id)
-        metadata.description = response.base_metadata.description
-        metadata.units = response.numeric_metadata.units
-        metadata.display_format = response.numeric_metadata.display_format
-        metadata.lower_bound = response.lower_bound
-        metadata.upper_bound = response.upper_bound
-        metadata.enumerated_values.extend(response.enum_values)
-        metadata.enumerated_aliases.extend(response.enum_aliases)
-
-    def _set_int_metadata(
-        self,
-        var_id: element_msg.ElementId,
-        metadata: Union[atvi.IntegerMetadata, atvi.IntegerArrayMetadata],
-    ) -> None:
-        """Query gRPC for metadata for an integer datapin and populate the
-        given metadata object.
+        All the names are looked up before any value is set. The values are
+        then grouped by the kind of request that sets them, and each group
+        is sent without waiting for each earlier request to return, with
+        at most ``max_in_flight`` requests outstanding. Each value is
+        implicitly coerced to its datapin's type, as with ``set_value``.
+
+        A failure to set one datapin does not stop the others from being
+        set. Any failures are reported together once every request has
+        returned.
 
         Parameters
         ----------
-        var_id : ElementId
-            ID of the datapin.
-        metadata : Union[atvi.IntegerMetadata, atvi.IntegerArrayMetadata]
-            Metadata object to populate.
+        values : Mapping[str, atvi.IVariableValue]
+            New values, keyed by datapin full name.
+        max_in_flight : int, optional
+            Maximum number of requests to have outstanding at once.
+
+        Raises
+        ------
+        SetValuesError
+            If any of the values could not be set. Its ``errors`` attribute
+            holds the error for each of these datapins.
         """
-        response: var_val_msg.IntegerVariableMetadata = self._stub.IntegerVariableGetMetadata(
-            var_id
+        errors: Dict[str, Exception] = {}
+        element_infos: Dict[str, workflow_msg.ElementInfo] = self._get_element_infos(
+            values.keys(), errors, max_in_flight
         )
-        metadata.description = response.base_metadata.description
-        metadata.units = response.numeric_metadata.units
-        metadata.display_format = response.numeric_metadata.display_format
-        metadata.lower_bound = response.lower_bound
-        metadata.upper_bound = response.upper_bound
-        metadata.enumerated_values.extend(response.enum_values)
-        metadata.enumerated_aliases.extend(response.enum_aliases)
-
-    def _set_string_metadata(
-        self,
-        var_id: element_msg.ElementId,
-        metadata: Union[atvi.StringMetadata, atvi.StringArrayMetadata],
-    ) -> None:
-        """Query gRPC for metadata for a string datapin and populate the given
-        metadata object.
+        requests_by_call: Dict[str, List[Tuple[str, Any]]] = {}
+        with ExitStack() as local_file_context_stack:
+            for name, info in element_infos.items():
+                if info.type != element_msg.ELEMENT_TYPE_VARIABLE:
+                    errors[name] = ValueError("Element is not a datapin.")
+                    continue
+                try:
+                    var_type: atvi.VariableType = grpc_type_enum_to_interop_type(info.var_type)
+                    if var_type not in _VALUE_TYPES:
+                        # Reference datapins are not set with a value request,
+                        # so let the datapin set itself.
+                        create_datapin(info.var_type, info.id, self._engine).set_state(
+                            atvi.VariableState(values[name], True)
+                        )
+                        continue
+                    value: atvi.IVariableValue = atvi.implicit_coerce_single(
+                        values[name], _VALUE_TYPES[var_type]
+                    )
+                    grpc_call, request = value.accept(
+                        SetValueRequestVisitor(
+                            info.id, self._engine.is_local, local_file_context_stack
+                        )
+                    )
+                except Exception as error:
+                    errors[name] = error
+                    continue
+                requests_by_call.setdefault(grpc_call, []).append((name, request))
+
+            for grpc_call, named_requests in requests_by_call.items():
+                responses: Iterator[Any] = pipeline_calls(
+                    getattr(self._stub, grpc_call),
+                    (request for _, request in named_requests),
+                    max_in_flight,
+                    return_exceptions=True,
+                )
+                for (name, _), response in zip(named_requests, responses):
+                    if isinstance(response, grpc.RpcError):
+                        errors[name] = wrap_rpc_error(
+                            response,
+                            {**WRAP_TARGET_NOT_FOUND, **WRAP_INVALID_ARG, **WRAP_OUT_OF_BOUNDS},
+                        )
+
+        if len(errors) > 0:
+            raise SetValuesError(errors)
+
+    def _get_element_infos(
+        self, names: Iterable[str], errors: Dict[str, Exception], max_in_flight: int
+    ) -> Dict[str, workflow_msg.ElementInfo]:
+        """Look up several elements by their full names, using the name cache
+        if it is enabled.
 
         Parameters
         ----------
-        var_id : ElementId
-            ID of the datapin.
-        metadata : Union[atvi.StringMetadata, atvi.StringArrayMetadata]
-            Metadata object to populate.
-        """
-        response: var_val_msg.StringVariableMetadata = self._stub.StringVariableGetMetadata(var_id)
-        metadata.description = response.base_metadata.description
-        metadata.enumerated_values.extend(response.enum_values)
-        metadata.enumerated_aliases.extend(response.enum_aliases)
+        names : Iterable[str]
+            Full names of the elements.
+        errors : Dict[str, Exception]
+            Dictionary to add the error for each failed lookup to.
+        max_in_flight : int
+            Maximum number of lookups to have outstanding at once.
 
-    def _set_file_metadata(
-        self,
-        var_id: element_msg.ElementId,
-        metadata: Union[atvi.FileMetadata, atvi.FileArrayMetadata],
-    ) -> None:
-        """Query gRPC for metadata for a file datapin and populate the given
-        metadata object.
-
-        Parameters
-        ----------
-        var_id : ElementId
-            ID of the datapin.
-        metadata : Union[atvi.FileMetadata, atvi.FileArrayMetadata]
-            Metadata object to populate.
+        Returns
+        -------
+        Dict[str, workflow_msg.ElementInfo]
+            ID and type of each element that was found, keyed by name.
         """
-        response: var_val_msg.FileVariableMetadata = self._stub.FileVariableGetMetadata(var_id)
-        metadata.description = response.base_metadata.description
-
-    @interpret_rpc_error({**WRAP_TARGET_NOT_FOUND, **WRAP_INVALID_ARG, **WRAP_OUT_OF_BOUNDS})
-    @overrides
-    def set_value(self, var_name: str, value: atvi.IVariableValue) -> None:
-        var = self.get_datapin(var_name)
-        var.set_state(atvi.VariableState(value, True))
+        element_infos: Dict[str, workflow_msg.ElementInfo] = {}
+        uncached: List[str] = []
+        for name in names:
+            cached: Optional[workflow_msg.ElementInfo] = self._name_cache.get(name)
+            if cached is not None:
+                element_infos[name] = cached
+            else:
+                uncached.append(name)
+
+        responses: Iterator[Any] = pipeline_calls(
+            self._stub.WorkflowGetElementByName,
+            (
+                workflow_msg.NamedElementWorkflow(
+                    workflow=workflow_msg.WorkflowId(id=self._id),
+                    element_full_name=element_msg.ElementName(name=name),
+                )
+                for name in uncached
+            ),
+            max_in_flight,
+            return_exceptions=True,
+        )
+        for name, response in zip(uncached, responses):
+            if isinstance(response, grpc.RpcError):
+                errors[name] = wrap_rpc_error(
+                    response, {**WRAP_TARGET_NOT_FOUND, **WRAP_INVALID_ARG}
+                )
+            else:
+                self._name_cache.put(name, response)
+                element_infos[name] = response
+        return element_infos
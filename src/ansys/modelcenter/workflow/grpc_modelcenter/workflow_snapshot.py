@@ -0,0 +1,515 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Defines a snapshot of the structure of a workflow."""
+
+import os
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Sequence, Tuple, Union
+
+from ansys.api.modelcenter.v0.element_messages_pb2 import ElementId, ElementType
+from ansys.api.modelcenter.v0.grpc_modelcenter_workflow_pb2_grpc import (
+    ModelCenterWorkflowServiceStub,
+)
+from ansys.api.modelcenter.v0.variable_value_messages_pb2 import VariableType
+from ansys.api.modelcenter.v0.workflow_messages_pb2 import ElementInfo
+import ansys.engineeringworkflow.api as aew_api
+import ansys.tools.variableinterop as atvi
+import numpy as np
+
+from ._pipeline import DEFAULT_MAX_IN_FLIGHT, pipeline_calls
+from .element_wrapper import create_element
+from .var_value_convert import grpc_type_enum_to_interop_type
+
+if TYPE_CHECKING:
+    from .engine import Engine
+
+_CONTROL_STATEMENT_KINDS: Tuple[int, ...] = (
+    ElementType.ELEMENT_TYPE_ASSEMBLY,
+    ElementType.ELEMENT_TYPE_DRIVERCOMPONENT,
+)
+"""Kinds of element that can contain assemblies and components."""
+
+_DATAPIN_CONTAINER_KINDS: Tuple[int, ...] = (
+    ElementType.ELEMENT_TYPE_ASSEMBLY,
+    ElementType.ELEMENT_TYPE_COMPONENT,
+    ElementType.ELEMENT_TYPE_DRIVERCOMPONENT,
+    ElementType.ELEMENT_TYPE_GROUP,
+)
+"""Kinds of element that can contain groups and datapins."""
+
+_FORMAT_VERSION: int = 1
+"""Version of the layout written by ``WorkflowSnapshot.save``."""
+
+SnapshotKey = Union[int, str]
+"""Index of an element in a snapshot, or its full name."""
+
+
+class WorkflowSnapshot:
+    """Read-only index of the elements of a workflow at one point in time.
+
+    Elements are stored in breadth-first order, so the root is at index
+    ``0`` and the children of each element are stored next to each other.
+    The per-element data is kept in flat arrays, which can be used
+    directly for vectorized queries, for example
+    ``np.flatnonzero(snapshot.kinds == ElementType.ELEMENT_TYPE_VARIABLE)``.
+
+    The snapshot does not change when the workflow changes. Take a new
+    snapshot after editing the workflow.
+
+    .. note::
+        This class should not be directly instantiated by clients. Call
+        ``Workflow.snapshot()`` to take a snapshot or
+        ``WorkflowSnapshot.load()`` to read one from a file.
+    """
+
+    def __init__(
+        self,
+        ids: Sequence[str],
+        names: Sequence[str],
+        parents: Iterable[int],
+        kinds: Iterable[int],
+        value_types: Iterable[int],
+    ):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        ids : Sequence[str]
+            ID of each element, in breadth-first order.
+        names : Sequence[str]
+            Full name of each element.
+        parents : Iterable[int]
+            Index of the parent of each element, or ``-1`` for the root.
+        kinds : Iterable[int]
+            ``ElementType`` of each element.
+        value_types : Iterable[int]
+            ``VariableType`` of each element. This is
+            ``VARIABLE_TYPE_UNSPECIFIED`` for elements that are not datapins.
+        """
+        self._ids: Tuple[str, ...] = tuple(ids)
+        self._names: Tuple[str, ...] = tuple(names)
+        self._parents: np.ndarray = self._freeze(np.asarray(parents, dtype=np.int32))
+        self._kinds: np.ndarray = self._freeze(np.asarray(kinds, dtype=np.int8))
+        self._value_types: np.ndarray = self._freeze(np.asarray(value_types, dtype=np.int8))
+        count = len(self._ids)
+        if not (
+            len(self._names) == count
+            and self._parents.shape == (count,)
+            and self._kinds.shape == (count,)
+            and self._value_types.shape == (count,)
+        ):
+            raise ValueError("Every column of a snapshot must have one entry per element.")
+
+        # Breadth-first order keeps each element's children together, so
+        # they can be found from the first child and the number of children.
+        child_counts = np.bincount(self._parents[1:], minlength=count).astype(np.int32)
+        child_starts = np.empty(count, dtype=np.int32)
+        if count > 0:
+            child_starts[0] = 1
+            np.cumsum(child_counts[:-1], out=child_starts[1:])
+            child_starts[1:] += 1
+        self._child_starts: np.ndarray = self._freeze(child_starts)
+        self._child_counts: np.ndarray = self._freeze(child_counts)
+
+        self._index_by_name: Dict[str, int] = {
+            name: index for index, name in enumerate(self._names)
+        }
+        self._index_by_id: Dict[str, int] = {
+            element_id: index for index, element_id in enumerate(self._ids)
+        }
+
+    @staticmethod
+    def _freeze(array: np.ndarray) -> np.ndarray:
+        array.setflags(write=False)
+        return array
+
+    def __len__(self) -> int:
+        """Get the number of elements in the snapshot."""
+        return len(self._ids)
+
+    def __contains__(self, name: object) -> bool:
+        """Check whether the snapshot has an element with a full name."""
+        return name in self._index_by_name
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the full names of the elements in breadth-first
+        order."""
+        return iter(self._names)
+
+    @property
+    def ids(self) -> Sequence[str]:
+        """ID of each element, in breadth-first order."""
+        return self._ids
+
+    @property
+    def names(self) -> Sequence[str]:
+        """Full name of each element, in breadth-first order."""
+        return self._names
+
+    @property
+    def parents(self) -> np.ndarray:
+        """Index of the parent of each element, or ``-1`` for the root."""
+        return self._parents
+
+    @property
+    def kinds(self) -> np.ndarray:
+        """``ElementType`` of each element."""
+        return self._kinds
+
+    @property
+    def value_types(self) -> np.ndarray:
+        """``VariableType`` of each element.
+
+        This is ``VARIABLE_TYPE_UNSPECIFIED`` for elements that are not
+        datapins.
+        """
+        return self._value_types
+
+    def index_of(self, name: str) -> int:
+        """Get the index of the element with a full name.
+
+        Parameters
+        ----------
+        name : str
+            Full name of the element.
+
+        Returns
+        -------
+        int
+            Index of the element.
+
+        Raises
+        ------
+        KeyError
+            If the snapshot has no element with the name.
+        """
+        return self._index_by_name[name]
+
+    def index_of_id(self, element_id: str) -> int:
+        """Get the index of the element with an ID.
+
+        Parameters
+        ----------
+        element_id : str
+            ID of the element.
+
+        Returns
+        -------
+        int
+            Index of the element.
+
+        Raises
+        ------
+        KeyError
+            If the snapshot has no element with the ID.
+        """
+        return self._index_by_id[element_id]
+
+    def _resolve(self, key: SnapshotKey) -> int:
+        if isinstance(key, str):
+            return self._index_by_name[key]
+        if not 0 <= key < len(self._ids):
+            raise IndexError(f"Element index {key} is out of range.")
+        return int(key)
+
+    def get_id(self, key: SnapshotKey) -> str:
+        """Get the ID of an element.
+
+        Parameters
+        ----------
+        key : SnapshotKey
+            Index or full name of the element.
+
+        Returns
+        -------
+        str
+            ID of the element.
+        """
+        return self._ids[self._resolve(key)]
+
+    def get_name(self, key: SnapshotKey) -> str:
+        """Get the full name of an element.
+
+        Parameters
+        ----------
+        key : SnapshotKey
+            Index or full name of the element.
+
+        Returns
+        -------
+        str
+            Full name of the element.
+        """
+        return self._names[self._resolve(key)]
+
+    def get_kind(self, key: SnapshotKey) -> int:
+        """Get the ``ElementType`` of an element.
+
+        Parameters
+        ----------
+        key : SnapshotKey
+            Index or full name of the element.
+
+        Returns
+        -------
+        int
+            ``ElementType`` of the element.
+        """
+        return int(self._kinds[self._resolve(key)])
+
+    def get_value_type(self, key: SnapshotKey) -> atvi.VariableType:
+        """Get the value type of a datapin.
+
+        Parameters
+        ----------
+        key : SnapshotKey
+            Index or full name of the datapin.
+
+        Returns
+        -------
+        atvi.VariableType
+            Value type of the datapin, or ``atvi.VariableType.UNKNOWN`` if
+            the element is not a datapin.
+        """
+        return grpc_type_enum_to_interop_type(int(self._value_types[self._resolve(key)]))
+
+    def get_parent(self, key: SnapshotKey) -> int:
+        """Get the index of the parent of an element.
+
+        Parameters
+        ----------
+        key : SnapshotKey
+            Index or full name of the element.
+
+        Returns
+        -------
+        int
+            Index of the parent, or ``-1`` for the root.
+        """
+        return int(self._parents[self._resolve(key)])
+
+    def get_children(self, key: SnapshotKey) -> range:
+        """Get the indices of the children of an element.
+
+        Parameters
+        ----------
+        key : SnapshotKey
+            Index or full name of the element.
+
+        Returns
+        -------
+        range
+            Indices of the child assemblies, components, groups, and
+            datapins of the element.
+        """
+        index = self._resolve(key)
+        start = int(self._child_starts[index])
+        return range(start, start + int(self._child_counts[index]))
+
+    def iter_children(self, key: SnapshotKey) -> Iterator[str]:
+        """Iterate over the full names of the children of an element.
+
+        Parameters
+        ----------
+        key : SnapshotKey
+            Index or full name of the element.
+
+        Returns
+        -------
+        Iterator[str]
+            Full names of the children of the element.
+        """
+        return (self._names[child] for child in self.get_children(key))
+
+    def create_element(self, key: SnapshotKey, engine: "Engine") -> aew_api.IElement:
+        """Create a wrapper for an element in the snapshot.
+
+        No calls are made to the engine, so the element is not checked to
+        still exist.
+
+        Parameters
+        ----------
+        key : SnapshotKey
+            Index or full name of the element.
+        engine : Engine
+            Engine that the workflow is loaded in.
+
+        Returns
+        -------
+        aew_api.IElement
+            Wrapper of the appropriate type for the element.
+        """
+        index = self._resolve(key)
+        info = ElementInfo(
+            id=ElementId(id_string=self._ids[index]),
+            type=int(self._kinds[index]),
+            var_type=int(self._value_types[index]),
+        )
+        return create_element(info, engine)
+
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        """Write the snapshot to a file.
+
+        The file is a NumPy ``.npz`` archive that can be read back with
+        ``WorkflowSnapshot.load()`` without an engine.
+
+        Parameters
+        ----------
+        path : Union[str, os.PathLike]
+            Path of the file to write.
+        """
+        with open(path, "wb") as file:
+            np.savez_compressed(
+                file,
+                version=np.asarray(_FORMAT_VERSION),
+                ids=np.asarray(self._ids, dtype=str),
+                names=np.asarray(self._names, dtype=str),
+                parents=self._parents,
+                kinds=self._kinds,
+                value_types=self._value_types,
+            )
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike]) -> "WorkflowSnapshot":
+        """Read a snapshot written by ``WorkflowSnapshot.save()``.
+
+        Parameters
+        ----------
+        path : Union[str, os.PathLike]
+            Path of the file to read.
+
+        Returns
+        -------
+        WorkflowSnapshot
+            Snapshot read from the file.
+
+        Raises
+        ------
+        ValueError
+            If the file was written in a layout this version cannot read.
+        """
+        with np.load(path, allow_pickle=False) as archive:
+            version = int(archive["version"])
+            if version != _FORMAT_VERSION:
+                raise ValueError(f"Unsupported workflow snapshot version {version}.")
+            return cls(
+                ids=archive["ids"].tolist(),
+                names=archive["names"].tolist(),
+                parents=archive["parents"],
+                kinds=archive["kinds"],
+                value_types=archive["value_types"],
+            )
+
+
+def take_workflow_snapshot(
+    client: ModelCenterWorkflowServiceStub,
+    root_id: ElementId,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+) -> WorkflowSnapshot:
+    """Crawl the elements of a workflow one level at a time.
+
+    Each level is read with concurrent calls, so the number of round trips
+    grows with the depth of the workflow rather than its size.
+
+    Parameters
+    ----------
+    client : ModelCenterWorkflowServiceStub
+        Client to make the calls with.
+    root_id : ElementId
+        ID of the root assembly of the workflow.
+    max_in_flight : int
+        Maximum number of calls to have outstanding at once.
+
+    Returns
+    -------
+    WorkflowSnapshot
+        Snapshot of the workflow.
+    """
+    ids: List[str] = [root_id.id_string]
+    parents: List[int] = [-1]
+    kinds: List[int] = [ElementType.ELEMENT_TYPE_ASSEMBLY]
+    value_types: List[int] = [VariableType.VARIABLE_TYPE_UNSPECIFIED]
+
+    level_start = 0
+    while level_start < len(ids):
+        level_end = len(ids)
+        level = range(level_start, level_end)
+        statements = [index for index in level if kinds[index] in _CONTROL_STATEMENT_KINDS]
+        containers = [index for index in level if kinds[index] in _DATAPIN_CONTAINER_KINDS]
+
+        def element_ids(indices: List[int]) -> Iterator[ElementId]:
+            return (ElementId(id_string=ids[index]) for index in indices)
+
+        elements = dict(
+            zip(
+                statements,
+                pipeline_calls(
+                    client.AssemblyGetAssembliesAndComponents,
+                    element_ids(statements),
+                    max_in_flight,
+                ),
+            )
+        )
+        groups = dict(
+            zip(
+                containers,
+                pipeline_calls(client.RegistryGetGroups, element_ids(containers), max_in_flight),
+            )
+        )
+        variables = dict(
+            zip(
+                containers,
+                pipeline_calls(client.RegistryGetVariables, element_ids(containers), max_in_flight),
+            )
+        )
+
+        # Append the children parent by parent to keep siblings together.
+        for parent in level:
+            if parent in elements:
+                for element in elements[parent].elements:
+                    ids.append(element.id.id_string)
+                    parents.append(parent)
+                    kinds.append(element.type)
+                    value_types.append(element.var_type)
+            if parent in groups:
+                for group_id in groups[parent].ids:
+                    ids.append(group_id.id_string)
+                    parents.append(parent)
+                    kinds.append(ElementType.ELEMENT_TYPE_GROUP)
+                    value_types.append(VariableType.VARIABLE_TYPE_UNSPECIFIED)
+            if parent in variables:
+                for variable in variables[parent].variables:
+                    ids.append(variable.id.id_string)
+                    parents.append(parent)
+                    kinds.append(ElementType.ELEMENT_TYPE_VARIABLE)
+                    value_types.append(variable.value_type)
+        level_start = level_end
+
+    names = [
+        response.name
+        for response in pipeline_calls(
+            client.ElementGetFullName,
+            (ElementId(id_string=element_id) for element_id in ids),
+            max_in_flight,
+        )
+    ]
+    return WorkflowSnapshot(ids, names, parents, kinds, value_types)
@@ -29,6 +29,18 @@ from .test_server import TestGRPCServer
 class MockEngineServicer(engine_grpc.GRPCModelCenterServiceServicer):
     """A mock servicer for the MCD engine service."""
 
+    def __init__(self):
+        self.heartbeats: int = 0
+        self.shutdowns: int = 0
+
+    def Heartbeat(self, request, context):
+        self.heartbeats += 1
+        return engine_messages.HeartbeatResponse()
+
+    def Shutdown(self, request, context):
+        self.shutdowns += 1
+        return engine_messages.ShutdownResponse()
+
     def GetEngineInfo(self, request, context):
         response = engine_messages.GetServerInfoResponse(
             is_release=False,
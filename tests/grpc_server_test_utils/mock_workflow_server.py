@@ -0,0 +1,77 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from typing import Dict
+
+import ansys.api.modelcenter.v0.grpc_modelcenter_workflow_pb2_grpc as workflow_grpc
+import ansys.api.modelcenter.v0.variable_value_messages_pb2 as var_msgs
+import ansys.api.modelcenter.v0.workflow_messages_pb2 as wkf_msgs
+import grpc
+
+from .test_server import TestGRPCServer
+
+
+class MockWorkflowServicer(workflow_grpc.ModelCenterWorkflowServiceServicer):
+    """A mock servicer for the workflow service that stores datapin states by
+    element ID."""
+
+    def __init__(self):
+        self.states: Dict[str, var_msgs.VariableState] = {}
+
+    def VariableGetState(self, request: wkf_msgs.ElementIdOrName, context):
+        if request.target_id.id_string not in self.states:
+            context.abort(grpc.StatusCode.NOT_FOUND, "No such datapin.")
+        return self.states[request.target_id.id_string]
+
+    def _set_array_value(self, request, field: str) -> var_msgs.SetVariableValueResponse:
+        state = var_msgs.VariableState(is_valid=True)
+        getattr(state.value, field).CopyFrom(request.new_value)
+        self.states[request.target.id_string] = state
+        return var_msgs.SetVariableValueResponse(was_changed=True)
+
+    def DoubleArraySetValue(self, request, context):
+        return self._set_array_value(request, "double_array_value")
+
+    def IntegerArraySetValue(self, request, context):
+        return self._set_array_value(request, "int_array_value")
+
+    def BooleanArraySetValue(self, request, context):
+        return self._set_array_value(request, "bool_array_value")
+
+
+class MockWorkflowServer(TestGRPCServer):
+    """A mock server for servicing workflow requests."""
+
+    def __init__(self, max_workers: int = 1):
+        super(MockWorkflowServer, self).__init__(max_workers=max_workers)
+        self._workflow_servicer = MockWorkflowServicer()
+
+    def get_workflow_servicer(self) -> MockWorkflowServicer:
+        """Access the mock servicer handling workflow requests."""
+        return self._workflow_servicer
+
+    def _add_servicers(self):
+        """Add the workflow servicer."""
+        workflow_grpc.add_ModelCenterWorkflowServiceServicer_to_server(
+            servicer=self._workflow_servicer, server=self._server
+        )
+        super(MockWorkflowServer, self)._add_servicers()
@@ -66,6 +66,12 @@ class TestGRPCServer:
             self._server.wait_for_termination()
             self._server = None
 
+    def get_address(self) -> str:
+        """Get the address that the server is listening on."""
+        if self._port == 0:
+            raise ValueError("You must enter a with block using this object to get its address.")
+        return f"localhost:{self._port}"
+
     def get_channel(self) -> grpc.Channel:
         """Get a channel that can be used to communicate with the server.
 
@@ -20,6 +20,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from typing import List
 import unittest
 
 from ansys.api.modelcenter.v0.custom_metadata_messages_pb2 import (
@@ -169,27 +170,58 @@ def do_test_get_properties(monkeypatch, engine, sut_type) -> None:
     mock_client = MockWorkflowClientForAbstractWorkflowElementTest()
     mock_response = MetadataPropertyNamesResponse(names=names_in_response)
     sut_get_prop_names = ElementId(id_string="SUT_ELEMENT_ID")
+    names_requests: List[ElementId] = []
+    value_requests: List[MetadataGetValueRequest] = []
+
+    # Plain functions rather than mocks, which would appear to support future().
+    def get_properties(request: ElementId) -> MetadataPropertyNamesResponse:
+        names_requests.append(request)
+        return mock_response
+
+    def get_property_value(request: MetadataGetValueRequest) -> VariableValue:
+        value_requests.append(request)
+        return value_response
+
+    monkeypatch.setattr(mock_client, "PropertyOwnerGetProperties", get_properties)
+    monkeypatch.setattr(mock_client, "PropertyOwnerGetPropertyValue", get_property_value)
+    monkeypatch_client_creation(monkeypatch, AbstractWorkflowElement, mock_client)
+    sut = sut_type(sut_get_prop_names, engine=engine)
+
+    result = sut.get_properties()
+
+    assert result == {
+        name: aew_api.Property(
+            parent_element_id=sut_get_prop_names.id_string,
+            property_name=name,
+            property_value=atvi.IntegerValue(value_response.int_value),
+        )
+        for name in names_in_response
+    }
+    assert names_requests == [sut_get_prop_names]
+    assert {request.property_name for request in value_requests} == names_in_response
 
-    with unittest.mock.patch.object(
-        mock_client, "PropertyOwnerGetProperties", return_value=mock_response
-    ) as mock_grpc_method:
-        with unittest.mock.patch.object(
-            mock_client, "PropertyOwnerGetPropertyValue", return_value=value_response
-        ):
-            monkeypatch_client_creation(monkeypatch, AbstractWorkflowElement, mock_client)
-            sut = sut_type(sut_get_prop_names, engine=engine)
-
-            result = sut.get_properties()
-
-            assert result == {
-                name: aew_api.Property(
-                    parent_element_id=sut_get_prop_names.id_string,
-                    property_name=name,
-                    property_value=atvi.IntegerValue(value_response.int_value),
-                )
-                for name in names_in_response
-            }
-            mock_grpc_method.assert_called_once_with(sut_get_prop_names)
+
+def do_test_get_properties_subset(monkeypatch, engine, sut_type) -> None:
+    mock_client = MockWorkflowClientForAbstractWorkflowElementTest()
+    value_requests: List[MetadataGetValueRequest] = []
+
+    def get_properties(request: ElementId) -> MetadataPropertyNamesResponse:
+        raise AssertionError("Property names should not be requested.")
+
+    def get_property_value(request: MetadataGetValueRequest) -> VariableValue:
+        value_requests.append(request)
+        return VariableValue(double_value=1.5)
+
+    monkeypatch.setattr(mock_client, "PropertyOwnerGetProperties", get_properties)
+    monkeypatch.setattr(mock_client, "PropertyOwnerGetPropertyValue", get_property_value)
+    monkeypatch_client_creation(monkeypatch, AbstractWorkflowElement, mock_client)
+    sut = sut_type(ElementId(id_string="SUT_ELEMENT_ID"), engine=engine)
+
+    result = sut.get_properties(["upperBound"])
+
+    assert list(result) == ["upperBound"]
+    assert result["upperBound"].property_value == atvi.RealValue(1.5)
+    assert [request.property_name for request in value_requests] == ["upperBound"]
 
 
 def test_parent_element(monkeypatch, engine) -> None:
@@ -0,0 +1,286 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import asyncio
+from typing import List, Optional
+
+import ansys.api.modelcenter.v0.element_messages_pb2 as elem_msgs
+import ansys.api.modelcenter.v0.engine_messages_pb2 as eng_msgs
+from ansys.api.modelcenter.v0.grpc_modelcenter_workflow_pb2_grpc import (
+    ModelCenterWorkflowServiceStub,
+)
+import ansys.api.modelcenter.v0.variable_value_messages_pb2 as var_msgs
+import grpc
+import pytest
+
+import ansys.modelcenter.workflow.grpc_modelcenter as grpcmc
+import ansys.modelcenter.workflow.grpc_modelcenter.aio as grpcmc_aio
+from ansys.modelcenter.workflow.grpc_modelcenter.grpc_error_interpretation import (
+    EngineDisconnectedError,
+)
+from tests.grpc_server_test_utils.mock_grpc_exception import MockGrpcError
+
+from .grpc_server_test_utils.client_creation_monkeypatch import monkeypatch_client_creation
+
+
+class MockAsyncChannel:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def unary_unary(self, method: str, **kwargs) -> str:
+        return method
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class MockAsyncEngineClient:
+    def __init__(self) -> None:
+        self.heartbeats = 0
+        self.raise_error_on_heartbeat: Optional[grpc.StatusCode] = None
+        self.was_shut_down = False
+        self.pref_value: Optional[object] = None
+        self.raise_error_on_info: Optional[grpc.StatusCode] = None
+        self.unit_name_requests: List[str] = []
+
+    async def Heartbeat(
+        self, request: eng_msgs.HeartbeatRequest, timeout: Optional[float] = None
+    ) -> eng_msgs.HeartbeatResponse:
+        self.heartbeats += 1
+        if self.raise_error_on_heartbeat is not None:
+            raise MockGrpcError(self.raise_error_on_heartbeat, "Simulated failure to communicate.")
+        return eng_msgs.HeartbeatResponse()
+
+    async def Shutdown(self, request: eng_msgs.ShutdownRequest) -> eng_msgs.ShutdownResponse:
+        self.was_shut_down = True
+        return eng_msgs.ShutdownResponse()
+
+    async def GetEngineInfo(
+        self, request: eng_msgs.GetServerInfoRequest
+    ) -> eng_msgs.GetServerInfoResponse:
+        if self.raise_error_on_info is not None:
+            raise MockGrpcError(self.raise_error_on_info, "Simulated failure to communicate.")
+        response = eng_msgs.GetServerInfoResponse(
+            is_release=True, build_type="Mock", server_type="WorkflowCenter"
+        )
+        response.version.major = 1
+        response.version.minor = 2
+        response.version.patch = 3
+        return response
+
+    async def EngineGetPreference(
+        self, request: eng_msgs.GetPreferenceRequest
+    ) -> eng_msgs.GetPreferenceResponse:
+        return eng_msgs.GetPreferenceResponse(int_value=7)
+
+    async def EngineSetPreference(
+        self, request: eng_msgs.SetPreferenceRequest
+    ) -> eng_msgs.SetPreferenceResponse:
+        self.pref_value = getattr(request, request.WhichOneof("value"))
+        return eng_msgs.SetPreferenceResponse()
+
+    async def EngineGetUnitCategories(
+        self, request: eng_msgs.GetUnitCategoriesRequest
+    ) -> eng_msgs.GetUnitCategoriesResponse:
+        return eng_msgs.GetUnitCategoriesResponse(names=["length", "time"])
+
+    async def EngineGetUnitNames(
+        self, request: eng_msgs.GetUnitNamesRequest
+    ) -> eng_msgs.GetUnitNamesResponse:
+        self.unit_name_requests.append(request.category)
+        if request.category == "length":
+            return eng_msgs.GetUnitNamesResponse(names=["inches", "feet"])
+        return eng_msgs.GetUnitNamesResponse(names=["seconds"])
+
+    async def EngineCreateWorkflow(
+        self, request: eng_msgs.NewWorkflowRequest
+    ) -> eng_msgs.NewWorkflowResponse:
+        return eng_msgs.NewWorkflowResponse(workflow_id="8675309")
+
+    async def EngineLoadWorkflow(
+        self, request: eng_msgs.LoadWorkflowRequest
+    ) -> eng_msgs.LoadWorkflowResponse:
+        if request.path == "missing.pxcz":
+            raise MockGrpcError(grpc.StatusCode.NOT_FOUND, "No such file.")
+        return eng_msgs.LoadWorkflowResponse(workflow_id="1")
+
+
+@pytest.fixture
+def mock_client(monkeypatch) -> MockAsyncEngineClient:
+    def mock_start(
+        self, run_only=False, heartbeat_interval=30000, allowed_heartbeat_misses=3
+    ) -> int:
+        return 12345
+
+    def mock_init(self):
+        pass
+
+    client = MockAsyncEngineClient()
+    monkeypatch.setattr(grpcmc.MCDProcess, "start", mock_start)
+    monkeypatch.setattr(grpcmc.MCDProcess, "__init__", mock_init)
+    monkeypatch.setattr(
+        grpcmc_aio.AsyncEngine,
+        "_create_channel",
+        staticmethod(lambda port, grpc_options: MockAsyncChannel()),
+    )
+    monkeypatch_client_creation(monkeypatch, grpcmc_aio.AsyncEngine, client)
+    return client
+
+
+def test_start_and_close(mock_client: MockAsyncEngineClient) -> None:
+    async def scenario() -> None:
+        engine = grpcmc_aio.AsyncEngine(heartbeat_interval=10)
+        assert engine.channel is None
+        async with engine:
+            assert engine.is_local
+            assert isinstance(engine.channel, MockAsyncChannel)
+            await asyncio.sleep(0.05)
+        assert engine.is_closed
+        assert engine.channel is None
+
+    asyncio.run(scenario())
+
+    assert mock_client.was_shut_down
+    assert mock_client.heartbeats > 0
+
+
+def test_heartbeat_failures_are_reported(mock_client: MockAsyncEngineClient) -> None:
+    # Arrange
+    mock_client.raise_error_on_heartbeat = grpc.StatusCode.UNAVAILABLE
+    unresponsive: List[grpcmc_aio.AsyncEngine] = []
+
+    def on_unresponsive(engine: grpcmc_aio.AsyncEngine) -> None:
+        unresponsive.append(engine)
+        raise RuntimeError("A failing callback must not stop the heartbeats.")
+
+    # Act
+    async def scenario():
+        engine = grpcmc_aio.AsyncEngine(
+            heartbeat_interval=10, allowed_heartbeat_misses=2, on_unresponsive=on_unresponsive
+        )
+        async with engine:
+            while engine.heartbeat_statistics.missed < 4:
+                await asyncio.sleep(0.01)
+            mock_client.raise_error_on_heartbeat = None
+            while engine.heartbeat_statistics.consecutive_missed > 0:
+                await asyncio.sleep(0.01)
+            return engine, engine.heartbeat_statistics
+
+    engine, statistics = asyncio.run(asyncio.wait_for(scenario(), 5))
+
+    # Assert
+    assert unresponsive == [engine]
+    assert statistics.missed >= 4
+    assert statistics.sent > statistics.missed
+
+
+def test_get_server_info(mock_client: MockAsyncEngineClient) -> None:
+    async def scenario():
+        async with grpcmc_aio.AsyncEngine() as engine:
+            return await engine.get_server_info()
+
+    result = asyncio.run(scenario())
+
+    assert result.version_as_string == "1.2.3"
+    assert result.is_release_build
+    assert result.server_type == "WorkflowCenter"
+
+
+def test_get_server_info_disconnected(mock_client: MockAsyncEngineClient) -> None:
+    mock_client.raise_error_on_info = grpc.StatusCode.UNAVAILABLE
+
+    async def scenario():
+        async with grpcmc_aio.AsyncEngine() as engine:
+            await engine.get_server_info()
+
+    with pytest.raises(EngineDisconnectedError):
+        asyncio.run(scenario())
+
+
+def test_preferences(mock_client: MockAsyncEngineClient) -> None:
+    async def scenario():
+        async with grpcmc_aio.AsyncEngine() as engine:
+            await engine.set_preference("pref", 2.5)
+            return await engine.get_preference("pref")
+
+    result = asyncio.run(scenario())
+
+    assert result == 7
+    assert mock_client.pref_value == 2.5
+
+
+def test_get_units(mock_client: MockAsyncEngineClient) -> None:
+    async def scenario():
+        async with grpcmc_aio.AsyncEngine() as engine:
+            return await engine.get_units()
+
+    result = asyncio.run(scenario())
+
+    assert result == {"length": ["inches", "feet"], "time": ["seconds"]}
+    assert sorted(mock_client.unit_name_requests) == ["length", "time"]
+
+
+def test_new_and_load_workflow(mock_client: MockAsyncEngineClient, monkeypatch) -> None:
+    monkeypatch_client_creation(monkeypatch, grpcmc_aio.AsyncWorkflow, object())
+
+    async def scenario():
+        async with grpcmc_aio.AsyncEngine() as engine:
+            created = await engine.new_workflow("C:\\dir\\new.pxcz")
+            loaded = await engine.load_workflow("loaded.pxcz")
+            return created, loaded
+
+    created, loaded = asyncio.run(scenario())
+
+    assert created.get_workflow_uuid() == "8675309"
+    assert loaded.get_workflow_uuid() == "1"
+    assert loaded.workflow_file_name == "loaded.pxcz"
+
+
+def test_load_workflow_not_found(mock_client: MockAsyncEngineClient) -> None:
+    async def scenario():
+        async with grpcmc_aio.AsyncEngine() as engine:
+            await engine.load_workflow("missing.pxcz")
+
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(scenario())
+
+
+def test_workflows_and_datapins_share_stub(mock_client: MockAsyncEngineClient) -> None:
+    async def scenario():
+        async with grpcmc_aio.AsyncEngine() as engine:
+            first = engine._get_shared_stub(ModelCenterWorkflowServiceStub)
+            second = engine._get_shared_stub(ModelCenterWorkflowServiceStub)
+            workflows = [
+                grpcmc_aio.AsyncWorkflow("1", "first.pxcz", engine),
+                grpcmc_aio.AsyncWorkflow("2", "second.pxcz", engine),
+            ]
+            datapin = grpcmc_aio.AsyncDatapin(
+                elem_msgs.ElementId(id_string="VAR_1"), var_msgs.VARIABLE_TYPE_REAL, engine
+            )
+            return engine, first, second, workflows, datapin
+
+    engine, first, second, workflows, datapin = asyncio.run(scenario())
+
+    assert first is second
+    assert isinstance(first, ModelCenterWorkflowServiceStub)
+    assert all(workflow._stub is first for workflow in workflows)
+    assert datapin._client is first
+    assert engine._shared_stubs == {}
@@ -0,0 +1,436 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import asyncio
+from typing import Dict, List
+
+import ansys.api.modelcenter.v0.custom_metadata_messages_pb2 as custom_msgs
+import ansys.api.modelcenter.v0.element_messages_pb2 as elem_msgs
+import ansys.api.modelcenter.v0.variable_value_messages_pb2 as var_msgs
+import ansys.api.modelcenter.v0.workflow_messages_pb2 as wkl_msgs
+import ansys.engineeringworkflow.api as engapi
+import ansys.tools.variableinterop as atvi
+import grpc
+import pytest
+
+import ansys.modelcenter.workflow.grpc_modelcenter as grpcmc
+import ansys.modelcenter.workflow.grpc_modelcenter.aio as grpcmc_aio
+from ansys.modelcenter.workflow.grpc_modelcenter.grpc_error_interpretation import (
+    InvalidInstanceError,
+)
+from tests.grpc_server_test_utils.mock_grpc_exception import MockGrpcError
+
+from .grpc_server_test_utils.client_creation_monkeypatch import monkeypatch_client_creation
+
+
+class MockAsyncEngine:
+    channel = None
+    call_options = None
+    is_local = True
+
+
+class MockAsyncWorkflowClient:
+    def __init__(self) -> None:
+        self.values: Dict[str, float] = {"root.a": 1.0, "root.b": 2.0}
+        self.description = "original"
+        self.var_types: Dict[str, int] = {
+            "root.ref": var_msgs.VARIABLE_TYPE_REFERENCE,
+            "root.refs": var_msgs.VARIABLE_TYPE_REFERENCE_ARRAY,
+            "root.unknown": var_msgs.VARIABLE_TYPE_UNSPECIFIED,
+        }
+        self.referenced_value = var_msgs.VariableValue(double_value=5.0)
+        self.referenced_array_value: List[float] = []
+        self.properties: Dict[str, var_msgs.VariableValue] = {
+            "lower": var_msgs.VariableValue(double_value=0.0),
+            "upper": var_msgs.VariableValue(double_value=10.0),
+        }
+        self.dependency_requests: List[var_msgs.GetVariableDependenciesRequest] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.run_requests: List[wkl_msgs.WorkflowRunRequest] = []
+        self.closed = False
+
+    async def WorkflowGetState(
+        self, request: wkl_msgs.GetWorkflowStateRequest
+    ) -> wkl_msgs.GetWorkflowStateResponse:
+        return wkl_msgs.GetWorkflowStateResponse(
+            state=wkl_msgs.WorkflowInstanceState.WORKFLOW_INSTANCE_STATE_SUCCESS
+        )
+
+    async def WorkflowRun(
+        self, request: wkl_msgs.WorkflowRunRequest
+    ) -> wkl_msgs.WorkflowRunResponse:
+        self.run_requests.append(request)
+        response = wkl_msgs.WorkflowRunResponse()
+        response.results["root.b"].is_valid = True
+        response.results["root.b"].value.double_value = (
+            2 * request.inputs["root.a"].value.double_value
+        )
+        return response
+
+    async def WorkflowGetElementByName(
+        self, request: wkl_msgs.NamedElementWorkflow
+    ) -> wkl_msgs.ElementInfo:
+        name = request.element_full_name.name
+        if name not in self.values and name not in self.var_types:
+            raise MockGrpcError(grpc.StatusCode.NOT_FOUND, "No such element.")
+        return wkl_msgs.ElementInfo(
+            id=elem_msgs.ElementId(id_string=name),
+            type=elem_msgs.ELEMENT_TYPE_VARIABLE,
+            var_type=self.var_types.get(name, var_msgs.VARIABLE_TYPE_REAL),
+        )
+
+    async def ReferenceVariableGetValue(
+        self, request: var_msgs.GetReferenceValueRequest
+    ) -> var_msgs.VariableState:
+        return var_msgs.VariableState(is_valid=True, value=self.referenced_value)
+
+    async def ReferenceVariableSetValue(
+        self, request: var_msgs.SetReferenceValueRequest
+    ) -> var_msgs.SetVariableValueResponse:
+        self.referenced_value = request.new_value
+        return var_msgs.SetVariableValueResponse(was_changed=True)
+
+    async def ReferenceArraySetReferencedValues(
+        self, request: var_msgs.SetDoubleArrayValueRequest
+    ) -> var_msgs.SetVariableValueResponse:
+        self.referenced_array_value = list(request.new_value.values)
+        return var_msgs.SetVariableValueResponse(was_changed=True)
+
+    async def ReferenceVariableGetMetadata(
+        self, request: elem_msgs.ElementId
+    ) -> var_msgs.ReferenceVariableMetadata:
+        response = var_msgs.ReferenceVariableMetadata()
+        response.base_metadata.description = self.description
+        return response
+
+    async def ReferenceVariableSetMetadata(
+        self, request: var_msgs.SetReferenceVariableMetadataRequest
+    ) -> var_msgs.SetMetadataResponse:
+        self.description = request.new_metadata.base_metadata.description
+        return var_msgs.SetMetadataResponse()
+
+    async def VariableGetState(self, request: wkl_msgs.ElementIdOrName) -> var_msgs.VariableState:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        if request.HasField("target_id"):
+            name = request.target_id.id_string
+        else:
+            name = request.target_name.element_full_name.name
+        if name not in self.values:
+            # A state without a value cannot be converted.
+            return var_msgs.VariableState(is_valid=False)
+        return var_msgs.VariableState(
+            is_valid=True, value=var_msgs.VariableValue(double_value=self.values[name])
+        )
+
+    async def DoubleVariableSetValue(
+        self, request: var_msgs.SetDoubleValueRequest
+    ) -> var_msgs.SetVariableValueResponse:
+        self.values[request.target.id_string] = request.new_value
+        return var_msgs.SetVariableValueResponse(was_changed=True)
+
+    async def DoubleVariableGetMetadata(
+        self, request: elem_msgs.ElementId
+    ) -> var_msgs.DoubleVariableMetadata:
+        response = var_msgs.DoubleVariableMetadata()
+        response.base_metadata.description = self.description
+        return response
+
+    async def DoubleVariableSetMetadata(
+        self, request: var_msgs.SetDoubleVariableMetadataRequest
+    ) -> var_msgs.SetMetadataResponse:
+        self.description = request.new_metadata.base_metadata.description
+        return var_msgs.SetMetadataResponse()
+
+    async def ElementGetParentElement(self, request: elem_msgs.ElementId) -> wkl_msgs.ElementInfo:
+        return wkl_msgs.ElementInfo(
+            id=elem_msgs.ElementId(id_string="root"), type=elem_msgs.ELEMENT_TYPE_ASSEMBLY
+        )
+
+    async def PropertyOwnerGetProperties(
+        self, request: elem_msgs.ElementId
+    ) -> custom_msgs.MetadataPropertyNamesResponse:
+        return custom_msgs.MetadataPropertyNamesResponse(names=list(self.properties.keys()))
+
+    async def PropertyOwnerGetPropertyValue(
+        self, request: custom_msgs.MetadataGetValueRequest
+    ) -> var_msgs.VariableValue:
+        if request.property_name not in self.properties:
+            raise MockGrpcError(grpc.StatusCode.INVALID_ARGUMENT, "No such property.")
+        return self.properties[request.property_name]
+
+    async def PropertyOwnerSetPropertyValue(
+        self, request: custom_msgs.MetadataSetValueRequest
+    ) -> custom_msgs.MetadataSetValueResponse:
+        self.properties[request.property_name] = request.value
+        return custom_msgs.MetadataSetValueResponse()
+
+    async def VariableGetDependents(
+        self, request: var_msgs.GetVariableDependenciesRequest
+    ) -> var_msgs.VariableInfoCollection:
+        self.dependency_requests.append(request)
+        return var_msgs.VariableInfoCollection(
+            variables=[
+                var_msgs.VariableInfo(
+                    id=elem_msgs.ElementId(id_string="root.b"),
+                    value_type=var_msgs.VARIABLE_TYPE_REAL,
+                )
+            ]
+        )
+
+    async def VariableGetPrecedents(
+        self, request: var_msgs.GetVariableDependenciesRequest
+    ) -> var_msgs.VariableInfoCollection:
+        self.dependency_requests.append(request)
+        return var_msgs.VariableInfoCollection(
+            variables=[
+                var_msgs.VariableInfo(
+                    id=elem_msgs.ElementId(id_string="root.ref"),
+                    value_type=var_msgs.VARIABLE_TYPE_REFERENCE,
+                )
+            ]
+        )
+
+    async def WorkflowClose(self, request: wkl_msgs.WorkflowId) -> wkl_msgs.WorkflowCloseResponse:
+        self.closed = True
+        return wkl_msgs.WorkflowCloseResponse()
+
+
+@pytest.fixture
+def mock_client(monkeypatch) -> MockAsyncWorkflowClient:
+    client = MockAsyncWorkflowClient()
+    monkeypatch_client_creation(monkeypatch, grpcmc_aio.AsyncWorkflow, client)
+    monkeypatch_client_creation(monkeypatch, grpcmc_aio.AsyncDatapin, client)
+    return client
+
+
+def test_get_state(mock_client: MockAsyncWorkflowClient) -> None:
+    workflow = grpcmc_aio.AsyncWorkflow("wf", "model.pxcz", MockAsyncEngine())
+
+    result = asyncio.run(workflow.get_state())
+
+    assert result == engapi.WorkflowInstanceState.SUCCESS
+
+
+def test_run(mock_client: MockAsyncWorkflowClient) -> None:
+    workflow = grpcmc_aio.AsyncWorkflow("wf", "model.pxcz", MockAsyncEngine())
+
+    result = asyncio.run(
+        workflow.run(
+            {"root.a": atvi.VariableState(atvi.RealValue(4.0), True)},
+            validation_names={"root.b"},
+        )
+    )
+
+    assert result == {"root.b": atvi.VariableState(atvi.RealValue(8.0), True)}
+    assert mock_client.run_requests[0].target.id == "wf"
+    assert list(mock_client.run_requests[0].validation_names) == ["root.b"]
+
+
+def test_concurrent_datapin_reads(mock_client: MockAsyncWorkflowClient) -> None:
+    workflow = grpcmc_aio.AsyncWorkflow("wf", "model.pxcz", MockAsyncEngine())
+
+    async def scenario():
+        return await asyncio.gather(
+            *(workflow.get_datapin_state(name) for name in ["root.a", "root.b"] * 10)
+        )
+
+    results = asyncio.run(scenario())
+
+    assert [result.value for result in results[:2]] == [atvi.RealValue(1.0), atvi.RealValue(2.0)]
+    assert mock_client.max_in_flight == 20
+
+
+def test_datapin_state_conversion_failure(mock_client: MockAsyncWorkflowClient) -> None:
+    workflow = grpcmc_aio.AsyncWorkflow("wf", "model.pxcz", MockAsyncEngine())
+
+    with pytest.raises(engapi.EngineInternalError):
+        asyncio.run(workflow.get_datapin_state("root.unset"))
+
+
+def test_set_value_coerces(mock_client: MockAsyncWorkflowClient) -> None:
+    workflow = grpcmc_aio.AsyncWorkflow("wf", "model.pxcz", MockAsyncEngine())
+
+    asyncio.run(workflow.set_value("root.a", 3.5))
+
+    assert mock_client.values["root.a"] == 3.5
+
+
+def test_get_datapin_missing(mock_client: MockAsyncWorkflowClient) -> None:
+    workflow = grpcmc_aio.AsyncWorkflow("wf", "model.pxcz", MockAsyncEngine())
+
+    with pytest.raises(InvalidInstanceError):
+        asyncio.run(workflow.get_datapin("root.missing"))
+
+
+def test_datapin_state_and_metadata(mock_client: MockAsyncWorkflowClient) -> None:
+    workflow = grpcmc_aio.AsyncWorkflow("wf", "model.pxcz", MockAsyncEngine())
+
+    async def scenario():
+        datapin = await workflow.get_datapin("root.b")
+        state = await datapin.get_state()
+        metadata = await datapin.get_metadata()
+        metadata.description = "changed"
+        await datapin.set_metadata(metadata)
+        return datapin, state, await workflow.get_datapin_meta_data("root.b")
+
+    datapin, state, metadata = asyncio.run(scenario())
+
+    assert datapin.value_type == atvi.VariableType.REAL
+    assert state == atvi.VariableState(atvi.RealValue(2.0), True)
+    assert isinstance(metadata, atvi.RealMetadata)
+    assert metadata.description == "changed"
+
+
+def test_datapin_set_metadata_wrong_type(mock_client: MockAsyncWorkflowClient) -> None:
+    workflow = grpcmc_aio.AsyncWorkflow("wf", "model.pxcz", MockAsyncEngine())
+
+    async def scenario():
+        datapin = await workflow.get_datapin("root.a")
+        await datapin.set_metadata(atvi.StringMetadata())
+
+    with pytest.raises(TypeError):
+        asyncio.run(scenario())
+
+
+def test_reference_datapin(mock_client: MockAsyncWorkflowClient) -> None:
+    workflow = grpcmc_aio.AsyncWorkflow("wf", "model.pxcz", MockAsyncEngine())
+
+    async def scenario():
+        datapin = await workflow.get_datapin("root.ref")
+        before = await datapin.get_state()
+        was_changed = await datapin.set_state(atvi.VariableState(atvi.IntegerValue(3), True))
+        metadata = await datapin.get_metadata()
+        metadata.description = "changed"
+        await datapin.set_metadata(metadata)
+        return before, was_changed, await datapin.get_state(), await datapin.get_metadata()
+
+    before, was_changed, after, metadata = asyncio.run(scenario())
+
+    assert before == atvi.VariableState(atvi.RealValue(5.0), True)
+    assert was_changed
+    assert after == atvi.VariableState(atvi.IntegerValue(3), True)
+    assert isinstance(metadata, grpcmc.ReferenceDatapinMetadata)
+    assert metadata.description == "changed"
+
+
+def test_reference_array_datapin(mock_client: MockAsyncWorkflowClient) -> None:
+    workflow = grpcmc_aio.AsyncWorkflow("wf", "model.pxcz", MockAsyncEngine())
+
+    async def scenario():
+        datapin = await workflow.get_datapin("root.refs")
+        return await datapin.set_state(
+            atvi.VariableState(atvi.RealArrayValue(values=[1.5, 2.5]), True)
+        )
+
+    was_changed = asyncio.run(scenario())
+
+    assert was_changed
+    assert mock_client.referenced_array_value == [1.5, 2.5]
+
+
+def test_reference_array_datapin_wrong_type(mock_client: MockAsyncWorkflowClient) -> None:
+    workflow = grpcmc_aio.AsyncWorkflow("wf", "model.pxcz", MockAsyncEngine())
+
+    async def scenario():
+        datapin = await workflow.get_datapin("root.refs")
+        await datapin.set_state(atvi.VariableState(atvi.RealValue(1.5), True))
+
+    with pytest.raises(atvi.IncompatibleTypesException):
+        asyncio.run(scenario())
+    assert mock_client.referenced_array_value == []
+
+
+def test_get_datapin_unsupported_type(mock_client: MockAsyncWorkflowClient) -> None:
+    workflow = grpcmc_aio.AsyncWorkflow("wf", "model.pxcz", MockAsyncEngine())
+
+    with pytest.raises(engapi.EngineInternalError):
+        asyncio.run(workflow.get_datapin("root.unknown"))
+
+
+def test_datapin_properties(mock_client: MockAsyncWorkflowClient) -> None:
+    workflow = grpcmc_aio.AsyncWorkflow("wf", "model.pxcz", MockAsyncEngine())
+
+    async def scenario():
+        datapin = await workflow.get_datapin("root.a")
+        await datapin.set_property("upper", atvi.RealValue(20.0))
+        return (
+            await datapin.get_parent_element_id(),
+            await datapin.get_property_names(),
+            await datapin.get_property("upper"),
+            await datapin.get_properties(),
+        )
+
+    parent_id, names, upper, properties = asyncio.run(scenario())
+
+    assert parent_id == "root"
+    assert names == {"lower", "upper"}
+    assert upper == engapi.Property("root.a", "upper", atvi.RealValue(20.0))
+    assert properties == {
+        "lower": engapi.Property("root.a", "lower", atvi.RealValue(0.0)),
+        "upper": engapi.Property("root.a", "upper", atvi.RealValue(20.0)),
+    }
+
+
+def test_datapin_missing_property(mock_client: MockAsyncWorkflowClient) -> None:
+    workflow = grpcmc_aio.AsyncWorkflow("wf", "model.pxcz", MockAsyncEngine())
+
+    async def scenario():
+        datapin = await workflow.get_datapin("root.a")
+        await datapin.get_property("missing")
+
+    with pytest.raises(ValueError):
+        asyncio.run(scenario())
+
+
+def test_datapin_dependencies(mock_client: MockAsyncWorkflowClient) -> None:
+    workflow = grpcmc_aio.AsyncWorkflow("wf", "model.pxcz", MockAsyncEngine())
+
+    async def scenario():
+        datapin = await workflow.get_datapin("root.a")
+        return (
+            await datapin.get_dependents(True, False),
+            await datapin.get_precedents(False, True),
+        )
+
+    dependents, precedents = asyncio.run(scenario())
+
+    assert [(pin.element_id, pin.value_type) for pin in dependents] == [
+        ("root.b", atvi.VariableType.REAL)
+    ]
+    assert [pin.element_id for pin in precedents] == ["root.ref"]
+    assert [
+        (request.id.id_string, request.only_fetch_direct_dependencies, request.follow_suspended)
+        for request in mock_client.dependency_requests
+    ] == [("root.a", True, False), ("root.a", False, True)]
+
+
+def test_close_on_exit(mock_client: MockAsyncWorkflowClient) -> None:
+    async def scenario():
+        async with grpcmc_aio.AsyncWorkflow("wf", "model.pxcz", MockAsyncEngine()):
+            pass
+
+    asyncio.run(scenario())
+
+    assert mock_client.closed
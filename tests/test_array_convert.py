@@ -0,0 +1,149 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the NumPy array conversion helpers."""
+
+import struct
+import tracemalloc
+
+import ansys.api.modelcenter.v0.variable_value_messages_pb2 as grpc_msg
+import numpy as np
+import pytest
+
+import ansys.modelcenter.workflow.grpc_modelcenter._array_convert as test_module
+
+round_trip_tests = [
+    pytest.param(grpc_msg.DoubleArrayValue, np.array([[1.5, -2.25], [np.inf, 1e-300]]), id="real"),
+    pytest.param(
+        grpc_msg.IntegerArrayValue,
+        np.array([0, -1, 2147483647, -2147483648, 300], dtype=np.int64),
+        id="int",
+    ),
+    pytest.param(grpc_msg.BooleanArrayValue, np.array([[[True], [False], [True]]]), id="bool"),
+    pytest.param(grpc_msg.DoubleArrayValue, np.zeros((2, 0)), id="empty"),
+]
+
+
+@pytest.mark.parametrize("message_type,original", round_trip_tests)
+def test_round_trip(message_type, original: np.ndarray) -> None:
+    # Execute
+    message = test_module.convert_numpy_to_grpc_array(message_type, original)
+    converted = test_module.convert_grpc_array_to_numpy(message)
+
+    # Verify
+    assert list(message.values) == original.flatten().tolist()
+    assert list(message.dims.dims) == list(original.shape)
+    assert converted.dtype == original.dtype
+    assert converted.shape == original.shape
+    assert np.array_equal(converted, original)
+
+
+def test_numpy_to_grpc_matches_field_assignment() -> None:
+    # Setup
+    original = np.arange(12, dtype=np.float64).reshape((3, 4)) / 7
+
+    # Execute
+    message = test_module.convert_numpy_to_grpc_array(grpc_msg.DoubleArrayValue, original)
+
+    # Verify
+    expected = grpc_msg.DoubleArrayValue(
+        values=original.flatten().tolist(), dims=grpc_msg.ArrayDimensions(dims=[3, 4])
+    )
+    assert message == expected
+
+
+def test_grpc_to_numpy_is_writable() -> None:
+    # Setup
+    message = grpc_msg.DoubleArrayValue(values=[1.0, 2.0], dims=grpc_msg.ArrayDimensions(dims=[2]))
+
+    # Execute
+    converted = test_module.convert_grpc_array_to_numpy(message)
+    converted[0] = 5.0
+
+    # Verify
+    assert list(message.values) == [1.0, 2.0]
+
+
+def test_grpc_to_numpy_unpacked_values() -> None:
+    # Setup: the values are sent one element per field rather than packed.
+    serialized = b"".join(b"\x09" + struct.pack("<d", value) for value in [0.5, 1.5, 2.5])
+    serialized += grpc_msg.DoubleArrayValue(
+        dims=grpc_msg.ArrayDimensions(dims=[3])
+    ).SerializeToString()
+    message = grpc_msg.DoubleArrayValue.FromString(serialized)
+
+    # Execute
+    converted = test_module.convert_grpc_array_to_numpy(message)
+
+    # Verify
+    assert converted.tolist() == [0.5, 1.5, 2.5]
+
+
+def test_grpc_to_numpy_non_canonical_booleans() -> None:
+    # Setup: true is encoded as a two-byte varint.
+    message = grpc_msg.BooleanArrayValue.FromString(b"\x0a\x03\x81\x00\x00\x12\x03\x0a\x01\x02")
+
+    # Execute
+    converted = test_module.convert_grpc_array_to_numpy(message)
+
+    # Verify
+    assert converted.tolist() == [True, False]
+
+
+def test_grpc_to_numpy_split_packed_values() -> None:
+    # Setup: the packed values are sent in two runs.
+    first = struct.pack("<2d", 1.5, 2.5)
+    second = struct.pack("<d", 3.5)
+    serialized = b"\x0a\x10" + first + b"\x0a\x08" + second + b"\x12\x03\x0a\x01\x03"
+    message = grpc_msg.DoubleArrayValue.FromString(serialized)
+
+    # Execute
+    converted = test_module.convert_grpc_array_to_numpy(message)
+
+    # Verify
+    assert converted.tolist() == [1.5, 2.5, 3.5]
+
+
+@pytest.mark.parametrize("use_out", [False, True], ids=["chunks", "out"])
+def test_grpc_to_numpy_holds_one_serialized_copy(use_out: bool) -> None:
+    # Setup
+    count = 1 << 17
+    message = test_module.convert_numpy_chunks_to_grpc_array(
+        grpc_msg.DoubleArrayValue, (count,), [np.arange(count, dtype=np.float64)]
+    )
+    out = np.empty(count)
+    payload_size = count * 8
+
+    # Execute
+    tracemalloc.start()
+    try:
+        if use_out:
+            test_module.convert_grpc_array_to_numpy(message, out)
+        else:
+            for chunk in test_module.iter_grpc_array_chunks(message, chunk_size=1024):
+                pass
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # Verify: only the serialized message is held, not another copy of it.
+    assert peak < payload_size * 1.5
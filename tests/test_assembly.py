@@ -213,6 +213,10 @@ def test_get_properties(monkeypatch, engine) -> None:
     awe_tests.do_test_get_properties(monkeypatch, engine, Assembly)
 
 
+def test_get_properties_subset(monkeypatch, engine) -> None:
+    awe_tests.do_test_get_properties_subset(monkeypatch, engine, Assembly)
+
+
 def test_can_get_control_type(monkeypatch, engine) -> None:
     mock_client = MockWorkflowClientForAssemblyTest()
     mock_client.control_type_responses["TEST_ID_SHOULD_MATCH"] = "Sequence"
@@ -398,6 +402,18 @@ def test_get_variables_multiple_variables(monkeypatch, engine) -> None:
     base_tests.do_test_get_datapins_multiple_variables(monkeypatch, engine, Assembly)
 
 
+def test_get_datapin_states_all(monkeypatch, engine):
+    base_tests.do_test_get_datapin_states_all(monkeypatch, engine, Assembly)
+
+
+def test_get_datapin_states_by_name(monkeypatch, engine):
+    base_tests.do_test_get_datapin_states_by_name(monkeypatch, engine, Assembly)
+
+
+def test_get_datapin_states_structured(monkeypatch, engine):
+    base_tests.do_test_get_datapin_states_structured(monkeypatch, engine, Assembly)
+
+
 def test_get_groups_empty(monkeypatch, engine) -> None:
     base_tests.do_test_get_groups_empty(monkeypatch, engine, Assembly)
 
@@ -0,0 +1,187 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from typing import Any, Dict, List, Tuple
+
+from ansys.api.modelcenter.v0.engine_messages_pb2 import GetServerInfoRequest
+from ansys.api.modelcenter.v0.grpc_modelcenter_workflow_pb2_grpc import (
+    ModelCenterWorkflowServiceStub,
+)
+from ansys.api.modelcenter.v0.variable_value_messages_pb2 import DoubleArrayValue
+import grpc
+import pytest
+
+import ansys.modelcenter.workflow.grpc_modelcenter as grpcmc
+from ansys.modelcenter.workflow.grpc_modelcenter.call_options import apply_call_options
+from tests.grpc_server_test_utils.mock_engine_server import MockEngineServer
+
+
+class RecordingCall:
+    def __init__(self) -> None:
+        self.calls: List[Tuple[Any, Dict[str, Any]]] = []
+
+    def __call__(self, request: Any, **kwargs: Any) -> str:
+        self.calls.append((request, kwargs))
+        return "response"
+
+
+class RecordingFutureCall(RecordingCall):
+    def future(self, request: Any, **kwargs: Any) -> str:
+        self.calls.append((request, kwargs))
+        return "future"
+
+
+class RecordingStub:
+    def __init__(self) -> None:
+        self.WorkflowRun = RecordingCall()
+        self.VariableGetState = RecordingFutureCall()
+
+
+def test_channel_options_to_grpc_options() -> None:
+    # Setup
+    sut = grpcmc.ChannelOptions(
+        max_receive_message_length=-1, keepalive_time_ms=1000, keepalive_permit_without_calls=True
+    )
+
+    # SUT
+    result = sut.to_grpc_options()
+
+    # Verification
+    assert result == [
+        ("grpc.max_receive_message_length", -1),
+        ("grpc.keepalive_time_ms", 1000),
+        ("grpc.keepalive_permit_without_calls", 1),
+    ]
+
+
+def test_default_channel_options_are_empty() -> None:
+    assert grpcmc.ChannelOptions().to_grpc_options() == []
+
+
+@pytest.mark.parametrize(
+    "method_name,expected", [("WorkflowRun", None), ("VariableGetState", 5.0), ("Other", 5.0)]
+)
+def test_call_options_get_timeout(method_name: str, expected: float) -> None:
+    # Setup
+    sut = grpcmc.CallOptions(
+        timeout=5.0, method_timeouts={"WorkflowRun": None, "VariableGetState": 5.0}
+    )
+
+    # SUT
+    result = sut.get_timeout(method_name)
+
+    # Verification
+    assert result == expected
+
+
+@pytest.mark.parametrize("options", [None, grpcmc.CallOptions()])
+def test_default_options_leave_stub_unchanged(options) -> None:
+    # Setup
+    stub = RecordingStub()
+
+    # SUT
+    result = apply_call_options(stub, options)
+
+    # Verification
+    assert result is stub
+
+
+def test_timeouts_are_applied() -> None:
+    # Setup
+    stub = RecordingStub()
+    sut = apply_call_options(
+        stub, grpcmc.CallOptions(timeout=5.0, method_timeouts={"WorkflowRun": 60.0})
+    )
+    request = GetServerInfoRequest()
+
+    # SUT
+    sut.WorkflowRun(request)
+    sut.VariableGetState(request)
+    sut.VariableGetState(request, timeout=1.0)
+    sut.VariableGetState.future(request)
+
+    # Verification
+    assert stub.WorkflowRun.calls == [(request, {"timeout": 60.0})]
+    assert stub.VariableGetState.calls == [
+        (request, {"timeout": 5.0}),
+        (request, {"timeout": 1.0}),
+        (request, {"timeout": 5.0}),
+    ]
+
+
+def test_future_is_only_offered_when_supported() -> None:
+    # Setup
+    sut = apply_call_options(RecordingStub(), grpcmc.CallOptions(timeout=5.0))
+
+    # Verification
+    assert not hasattr(sut.WorkflowRun, "future")
+    assert sut.VariableGetState.future(GetServerInfoRequest()) == "future"
+
+
+def test_large_requests_are_compressed() -> None:
+    # Setup
+    stub = RecordingStub()
+    sut = apply_call_options(stub, grpcmc.CallOptions(compression_threshold=1024))
+    small = DoubleArrayValue(values=[1.0])
+    large = DoubleArrayValue(values=[1.0] * 1000)
+
+    # SUT
+    sut.WorkflowRun(small)
+    sut.WorkflowRun(large)
+    sut.WorkflowRun(large, compression=grpc.Compression.NoCompression)
+
+    # Verification
+    assert stub.WorkflowRun.calls == [
+        (small, {}),
+        (large, {"compression": grpc.Compression.Gzip}),
+        (large, {"compression": grpc.Compression.NoCompression}),
+    ]
+
+
+def test_engine_applies_channel_options() -> None:
+    with MockEngineServer() as server:
+        with grpcmc.Engine.attach(
+            server.get_address(),
+            send_heartbeats=False,
+            channel_options=grpcmc.ChannelOptions(max_receive_message_length=16),
+        ) as sut:
+            # SUT
+            with pytest.raises(grpcmc.UnexpectedEngineError) as err:
+                sut.get_server_info()
+
+            # Verification
+            assert "RESOURCE_EXHAUSTED" in str(err.value)
+
+
+def test_engine_applies_call_options_to_shared_stubs() -> None:
+    with MockEngineServer() as server:
+        with grpcmc.Engine.attach(
+            server.get_address(),
+            send_heartbeats=False,
+            call_options=grpcmc.CallOptions(timeout=10.0),
+        ) as sut:
+            # SUT
+            stub = sut._get_shared_stub(ModelCenterWorkflowServiceStub)
+
+            # Verification
+            assert stub.WorkflowRun._timeout == 10.0
+            assert sut.get_server_info().server_type == "mock"
@@ -112,6 +112,10 @@ def test_get_properties(monkeypatch, engine) -> None:
     awe_tests.do_test_get_properties(monkeypatch, engine, Component)
 
 
+def test_get_properties_subset(monkeypatch, engine) -> None:
+    awe_tests.do_test_get_properties_subset(monkeypatch, engine, Component)
+
+
 def test_get_variables_empty(monkeypatch, engine):
     varcontainer_tests.do_test_get_datapins_empty(monkeypatch, engine, Component)
 
@@ -142,6 +146,18 @@ def test_get_variables_multiple_variables(monkeypatch, engine):
     varcontainer_tests.do_test_get_datapins_multiple_variables(monkeypatch, engine, Component)
 
 
+def test_get_datapin_states_all(monkeypatch, engine):
+    varcontainer_tests.do_test_get_datapin_states_all(monkeypatch, engine, Component)
+
+
+def test_get_datapin_states_by_name(monkeypatch, engine):
+    varcontainer_tests.do_test_get_datapin_states_by_name(monkeypatch, engine, Component)
+
+
+def test_get_datapin_states_structured(monkeypatch, engine):
+    varcontainer_tests.do_test_get_datapin_states_structured(monkeypatch, engine, Component)
+
+
 def test_get_groups_empty(monkeypatch, engine):
     varcontainer_tests.do_test_get_groups_empty(monkeypatch, engine, Component)
 
@@ -31,14 +31,20 @@ from ansys.api.modelcenter.v0.element_messages_pb2 import (
 from ansys.api.modelcenter.v0.variable_value_messages_pb2 import (
     VariableInfo,
     VariableInfoCollection,
+    VariableState,
     VariableType,
+    VariableValue,
 )
+from ansys.api.modelcenter.v0.workflow_messages_pb2 import ElementIdOrName
+import ansys.tools.variableinterop as atvi
+import numpy as np
 
 import ansys.modelcenter.workflow.api as mc_api
 from ansys.modelcenter.workflow.grpc_modelcenter.abstract_workflow_element import (
     AbstractWorkflowElement,
 )
 from ansys.modelcenter.workflow.grpc_modelcenter.group import Group
+from ansys.modelcenter.workflow.grpc_modelcenter.integer_datapin import IntegerDatapin
 
 from .grpc_server_test_utils.client_creation_monkeypatch import monkeypatch_client_creation
 
@@ -47,6 +53,7 @@ class MockWorkflowClientForAbstractDatapinContainerTest:
     def __init__(self) -> None:
         self._name_responses: Dict[str, str] = {}
         self._full_name_responses: Dict[str, str] = {}
+        self.states: Dict[str, VariableState] = {}
 
     @property
     def name_responses(self) -> Dict[str, str]:
@@ -65,6 +72,11 @@ class MockWorkflowClientForAbstractDatapinContainerTest:
     def RegistryGetVariables(self, request: ElementId) -> ElementIdCollection:
         return ElementIdCollection()
 
+    def VariableGetState(self, request: ElementIdOrName) -> VariableState:
+        if request.HasField("target_id"):
+            return self.states[request.target_id.id_string]
+        return self.states[request.target_name.element_full_name.name]
+
     def RegistryGetGroups(self, request: ElementId) -> ElementIdCollection:
         return ElementIdCollection()
 
@@ -199,3 +211,72 @@ def do_test_get_groups_multiple_groups(monkeypatch, engine, sut_type) -> None:
         assert result["moe"].element_id == "IDGROUP_MOE"
         assert isinstance(result["curly"], Group)
         assert result["curly"].element_id == "IDGROUP_CURLY"
+
+
+def _stooges_client() -> MockWorkflowClientForAbstractDatapinContainerTest:
+    mock_client = MockWorkflowClientForAbstractDatapinContainerTest()
+    mock_client.name_responses["IDVAR_LARRY"] = "larry"
+    mock_client.full_name_responses["STOOGES"] = "Model.stooges"
+    mock_client.states["IDVAR_LARRY"] = VariableState(
+        is_valid=True, value=VariableValue(int_value=1)
+    )
+    mock_client.states["IDVAR_MOE"] = VariableState(
+        is_valid=False, value=VariableValue(double_value=2.5)
+    )
+    mock_client.states["Model.stooges.curly"] = VariableState(
+        is_valid=True, value=VariableValue(double_value=3.5)
+    )
+    return mock_client
+
+
+def do_test_get_datapin_states_all(monkeypatch, engine, sut_type) -> None:
+    mock_client = _stooges_client()
+    variables = VariableInfoCollection(
+        variables=[
+            VariableInfo(
+                id=ElementId(id_string="IDVAR_LARRY"),
+                value_type=VariableType.VARIABLE_TYPE_INTEGER,
+            ),
+            VariableInfo(
+                id=ElementId(id_string="IDVAR_MOE"),
+                value_type=VariableType.VARIABLE_TYPE_REAL,
+                short_name="moe",
+            ),
+        ]
+    )
+    with (
+        unittest.mock.patch.object(mock_client, "RegistryGetVariables", return_value=variables),
+        unittest.mock.patch.object(
+            mock_client, "ElementGetName", wraps=mock_client.ElementGetName
+        ) as mock_get_name,
+    ):
+        monkeypatch_client_creation(monkeypatch, AbstractWorkflowElement, mock_client)
+        sut = sut_type(ElementId(id_string="STOOGES"), engine=engine)
+        result = sut.get_datapin_states()
+        assert result == {
+            "moe": atvi.VariableState(atvi.RealValue(2.5), False),
+            "larry": atvi.VariableState(atvi.IntegerValue(1), True),
+        }
+        # Only the datapin without a short name in the registry is looked up.
+        mock_get_name.assert_called_once_with(ElementId(id_string="IDVAR_LARRY"))
+
+
+def do_test_get_datapin_states_by_name(monkeypatch, engine, sut_type) -> None:
+    mock_client = _stooges_client()
+    monkeypatch_client_creation(monkeypatch, AbstractWorkflowElement, mock_client)
+    sut = sut_type(ElementId(id_string="STOOGES"), engine=engine)
+    larry = IntegerDatapin(ElementId(id_string="IDVAR_LARRY"), engine=engine)
+    result = sut.get_datapin_states(["curly", larry])
+    assert result == {
+        "curly": atvi.VariableState(atvi.RealValue(3.5), True),
+        "larry": atvi.VariableState(atvi.IntegerValue(1), True),
+    }
+
+
+def do_test_get_datapin_states_structured(monkeypatch, engine, sut_type) -> None:
+    mock_client = _stooges_client()
+    monkeypatch_client_creation(monkeypatch, AbstractWorkflowElement, mock_client)
+    sut = sut_type(ElementId(id_string="STOOGES"), engine=engine)
+    result = sut.get_datapin_states(["curly"], as_structured=True)
+    assert result.dtype == np.dtype([("curly", np.float64)])
+    assert result["curly"] == 3.5
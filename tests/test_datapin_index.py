@@ -0,0 +1,131 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for DatapinIndex and Workflow.find_datapins."""
+
+import ansys.tools.variableinterop as atvi
+import pytest
+
+import ansys.modelcenter.workflow.grpc_modelcenter as grpcmc
+
+from .grpc_server_test_utils.client_creation_monkeypatch import monkeypatch_client_creation
+from .test_workflow_snapshot import VARIABLE, MockWorkflowClientForSnapshotTest
+
+mock_client: MockWorkflowClientForSnapshotTest
+
+
+@pytest.fixture
+def workflow(monkeypatch, engine) -> grpcmc.Workflow:
+    global mock_client
+    mock_client = MockWorkflowClientForSnapshotTest()
+    monkeypatch_client_creation(monkeypatch, grpcmc.Workflow, mock_client)
+    return grpcmc.Workflow(workflow_id="123", file_path="C:\\asdf\\qwerty.pxcz", engine=engine)
+
+
+def test_find_all_datapins(workflow) -> None:
+    # SUT
+    result = workflow.find_datapins()
+
+    # Verification
+    assert list(result) == ["Model.sub.comp.grp.z", "Model.sub.comp.y", "Model.x"]
+    assert isinstance(result["Model.x"], grpcmc.RealDatapin)
+    assert result["Model.x"].element_id == "x"
+    assert isinstance(result["Model.sub.comp.y"], grpcmc.IntegerArrayDatapin)
+    assert isinstance(result["Model.sub.comp.grp.z"], grpcmc.StringDatapin)
+
+
+@pytest.mark.parametrize(
+    "pattern,regex,expected",
+    [
+        pytest.param("Model.sub.*", False, ["Model.sub.comp.grp.z", "Model.sub.comp.y"]),
+        pytest.param("Model.sub.comp.?", False, ["Model.sub.comp.y"]),
+        pytest.param("*.[xy]", False, ["Model.sub.comp.y", "Model.x"]),
+        pytest.param("Model.x", False, ["Model.x"]),
+        pytest.param("Model.nope.*", False, []),
+        pytest.param(r"Model\.sub\..*\.[yz]", True, ["Model.sub.comp.grp.z", "Model.sub.comp.y"]),
+        pytest.param(r"sub", True, []),
+    ],
+)
+def test_find_datapins_by_name(workflow, pattern, regex, expected) -> None:
+    # SUT
+    result = workflow.find_datapins(pattern, regex=regex)
+
+    # Verification
+    assert list(result) == expected
+
+
+def test_find_datapins_by_type_and_direction(workflow) -> None:
+    # SUT / Verification
+    assert list(workflow.find_datapins(value_type=atvi.VariableType.REAL)) == ["Model.x"]
+    assert list(workflow.find_datapins(is_input_to_component=False)) == ["Model.sub.comp.y"]
+    assert list(workflow.find_datapins(is_input_to_workflow=True)) == ["Model.x"]
+    assert list(workflow.find_datapins("Model.sub.*", is_input_to_component=True)) == [
+        "Model.sub.comp.grp.z"
+    ]
+
+
+def test_find_datapins_reuses_index(workflow) -> None:
+    workflow.find_datapins()
+    calls = dict(mock_client.calls)
+
+    # SUT
+    workflow.find_datapins("Model.sub.*")
+    workflow.find_datapins(value_type=atvi.VariableType.STRING)
+
+    # Verification
+    assert mock_client.calls == calls
+    assert calls["VariableGetIsInput"] == 3
+
+
+def test_find_datapins_rebuilds_index_after_structure_change(workflow, engine) -> None:
+    workflow.find_datapins()
+    mock_client.elements["w"] = ("Model.w", VARIABLE, 2)
+    mock_client.children["root"].append("w")
+    mock_client.inputs["w"] = (False, False)
+
+    # SUT
+    before = list(workflow.find_datapins())
+    engine._notify_structure_changed()
+    after = list(workflow.find_datapins())
+
+    # Verification
+    assert "Model.w" not in before
+    assert "Model.w" in after
+
+
+def test_find_datapins_refresh(workflow) -> None:
+    workflow.find_datapins()
+
+    # SUT
+    workflow.find_datapins(refresh=True)
+
+    # Verification
+    assert mock_client.calls["VariableGetIsInput"] == 6
+
+
+def test_datapin_index_find_names(workflow) -> None:
+    index = workflow.get_datapin_index()
+
+    # SUT / Verification
+    assert len(index) == 3
+    assert index.find_names("Model.sub.*") == ["Model.sub.comp.grp.z", "Model.sub.comp.y"]
+    assert index.snapshot.index_of("Model.x") == 2
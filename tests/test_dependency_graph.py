@@ -0,0 +1,186 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for DependencyGraph and Workflow.dependency_graph."""
+
+import ansys.api.modelcenter.v0.element_messages_pb2 as elem_msgs
+import pytest
+
+import ansys.modelcenter.workflow.grpc_modelcenter as grpcmc
+from ansys.modelcenter.workflow.grpc_modelcenter.abstract_workflow_element import (
+    AbstractWorkflowElement,
+)
+
+from .grpc_server_test_utils.client_creation_monkeypatch import monkeypatch_client_creation
+from .test_workflow_snapshot import MockWorkflowClientForSnapshotTest
+
+mock_client: MockWorkflowClientForSnapshotTest
+
+
+@pytest.fixture
+def workflow(monkeypatch, engine) -> grpcmc.Workflow:
+    global mock_client
+    mock_client = MockWorkflowClientForSnapshotTest()
+    monkeypatch_client_creation(monkeypatch, grpcmc.Workflow, mock_client)
+    return grpcmc.Workflow(workflow_id="123", file_path="C:\\asdf\\qwerty.pxcz", engine=engine)
+
+
+def test_dependency_graph_structure(workflow) -> None:
+    # SUT
+    graph = workflow.dependency_graph()
+
+    # Verification
+    snapshot = graph.snapshot
+    assert graph.edge_count == 2
+    assert len(graph.indptr) == len(snapshot) + 1
+    x = snapshot.index_of("Model.x")
+    assert list(graph.indices[graph.indptr[x] : graph.indptr[x + 1]]) == [
+        snapshot.index_of("Model.sub.comp.y")
+    ]
+    assert mock_client.calls["VariableGetDependents"] == 3
+    assert all(
+        request.only_fetch_direct_dependencies for request in mock_client.dependency_requests
+    )
+
+
+@pytest.mark.parametrize("follow_suspended_links", [True, False])
+def test_dependency_graph_follow_suspended(workflow, follow_suspended_links) -> None:
+    # SUT
+    graph = workflow.dependency_graph(follow_suspended_links)
+
+    # Verification
+    assert graph.follow_suspended_links == follow_suspended_links
+    assert all(
+        request.follow_suspended == follow_suspended_links
+        for request in mock_client.dependency_requests
+    )
+
+
+def test_dependents_and_precedents(workflow) -> None:
+    graph = workflow.dependency_graph()
+
+    # SUT / Verification
+    assert graph.get_dependents(["Model.x"]) == ["Model.sub.comp.y", "Model.sub.comp.grp.z"]
+    assert graph.get_dependents(["Model.x"], transitive=False) == ["Model.sub.comp.y"]
+    assert graph.get_dependents(["Model.sub.comp.grp.z"]) == []
+    assert graph.get_precedents(["Model.sub.comp.grp.z"]) == ["Model.x", "Model.sub.comp.y"]
+    assert graph.get_precedents(["Model.sub.comp.grp.z"], transitive=False) == ["Model.sub.comp.y"]
+    with pytest.raises(KeyError):
+        graph.get_dependents(["Model.nope"])
+
+
+def test_dependents_of_datapin_objects(workflow) -> None:
+    graph = workflow.dependency_graph()
+    datapin = workflow.find_datapins("Model.x")["Model.x"]
+
+    # SUT / Verification
+    assert graph.get_dependents([datapin], transitive=False) == ["Model.sub.comp.y"]
+
+
+def test_affected_outputs(workflow) -> None:
+    graph = workflow.dependency_graph()
+
+    # SUT / Verification
+    assert graph.get_affected_outputs(["Model.x"]) == ["Model.sub.comp.y"]
+    assert graph.get_affected_outputs(["Model.sub.comp.grp.z"]) == []
+
+
+def test_topological_order(workflow) -> None:
+    mock_client.dependents = {"x": [], "y": ["x"], "z": ["y", "x"]}
+    graph = workflow.dependency_graph()
+
+    # SUT / Verification
+    assert graph.topological_order() == ["Model.sub.comp.grp.z", "Model.sub.comp.y", "Model.x"]
+
+
+def test_topological_order_with_cycle(workflow) -> None:
+    mock_client.dependents = {"x": ["y"], "y": ["x"], "z": []}
+    graph = workflow.dependency_graph()
+
+    # SUT / Verification
+    assert graph.get_dependents(["Model.x"]) == ["Model.x", "Model.sub.comp.y"]
+    with pytest.raises(ValueError, match="cycle"):
+        graph.topological_order()
+
+
+def test_dependency_graph_is_cached(workflow) -> None:
+    graph = workflow.dependency_graph()
+
+    # SUT / Verification
+    assert workflow.dependency_graph() is graph
+    assert workflow.dependency_graph(follow_suspended_links=True) is not graph
+    assert workflow.dependency_graph(refresh=True) is not graph
+
+
+@pytest.mark.parametrize(
+    "change_links",
+    [
+        pytest.param(
+            lambda workflow, link: workflow.create_link(
+                workflow.find_datapins("Model.x")["Model.x"], "Model.sub.comp.y"
+            ),
+            id="create",
+        ),
+        pytest.param(lambda workflow, link: link.break_link(), id="break"),
+        pytest.param(lambda workflow, link: link.suspend(), id="suspend"),
+        pytest.param(lambda workflow, link: link.resume(), id="resume"),
+    ],
+)
+def test_dependency_graph_invalidated_by_link_changes(workflow, engine, change_links) -> None:
+    link = grpcmc.DatapinLink(mock_client, "y", "Model.x", engine=engine)
+    graph = workflow.dependency_graph()
+
+    # SUT
+    change_links(workflow, link)
+
+    # Verification
+    assert workflow.dependency_graph() is not graph
+
+
+@pytest.mark.parametrize("is_array_element", [False, True])
+def test_dependency_graph_invalidated_by_reference_equation(
+    monkeypatch, workflow, engine, is_array_element
+) -> None:
+    monkeypatch_client_creation(monkeypatch, AbstractWorkflowElement, mock_client)
+    element_id = elem_msgs.ElementId(id_string="ref")
+    if is_array_element:
+        reference = grpcmc.ReferenceArrayDatapin(element_id, engine)[0]
+    else:
+        reference = grpcmc.ReferenceDatapin(element_id, engine)
+    graph = workflow.dependency_graph()
+
+    # SUT
+    reference.equation = "Model.x"
+
+    # Verification
+    assert workflow.dependency_graph() is not graph
+
+
+def test_link_without_engine_does_not_invalidate(workflow) -> None:
+    link = grpcmc.DatapinLink(mock_client, "y", "Model.x")
+    graph = workflow.dependency_graph()
+
+    # SUT
+    link.suspend()
+
+    # Verification
+    assert workflow.dependency_graph() is graph
@@ -21,13 +21,19 @@
 # SOFTWARE.
 
 import time
-from typing import Any, Collection, Mapping, Optional, Union, cast
+from typing import Any, Collection, List, Mapping, Optional, Union, cast
 import unittest
 from unittest.mock import create_autospec
 
+from ansys.api.modelcenter.v0.element_messages_pb2 import ElementId
 import ansys.api.modelcenter.v0.engine_messages_pb2 as eng_msgs
+from ansys.api.modelcenter.v0.grpc_modelcenter_format_pb2_grpc import ModelCenterFormatServiceStub
+from ansys.api.modelcenter.v0.grpc_modelcenter_workflow_pb2_grpc import (
+    ModelCenterWorkflowServiceStub,
+)
 from ansys.engineeringworkflow.api import WorkflowEngineInfo
 import ansys.platform.instancemanagement as pypim
+import ansys.tools.variableinterop as atvi
 import grpc
 import numpy
 import pytest
@@ -38,6 +44,7 @@ import ansys.modelcenter.workflow.grpc_modelcenter as grpcmc
 from ansys.modelcenter.workflow.grpc_modelcenter.grpc_error_interpretation import (
     EngineDisconnectedError,
 )
+from tests.grpc_server_test_utils.mock_engine_server import MockEngineServer
 from tests.grpc_server_test_utils.mock_grpc_exception import MockGrpcError
 
 from .grpc_server_test_utils.client_creation_monkeypatch import monkeypatch_client_creation
@@ -437,6 +444,68 @@ def test_get_channel(setup_function) -> None:
     assert cast(Any, channel)._channel.target() == b"dns:///localhost:12345"
 
 
+def test_shared_stub_is_created_once(setup_function) -> None:
+    # Setup
+    engine = grpcapi.Engine()
+
+    # SUT
+    first = engine._get_shared_stub(ModelCenterWorkflowServiceStub)
+    second = engine._get_shared_stub(ModelCenterWorkflowServiceStub)
+    formatter = engine._get_shared_stub(ModelCenterFormatServiceStub)
+
+    # Verification
+    assert first is second
+    assert isinstance(first, ModelCenterWorkflowServiceStub)
+    assert isinstance(formatter, ModelCenterFormatServiceStub)
+
+
+def test_elements_share_stub(setup_function) -> None:
+    # Setup
+    engine = grpcapi.Engine()
+
+    # SUT
+    elements = [
+        grpcapi.Component(ElementId(id_string="COMP_1"), engine),
+        grpcapi.RealDatapin(ElementId(id_string="VAR_1"), engine),
+        grpcapi.ReferenceProperty(ElementId(id_string="REF_1"), "prop", engine),
+    ]
+    workflow = grpcapi.Workflow("WORKFLOW_ID", "workflow.pxcz", engine)
+
+    # Verification
+    shared = engine._get_shared_stub(ModelCenterWorkflowServiceStub)
+    assert all(element._client is shared for element in elements)
+    assert workflow._stub is shared
+    assert engine.get_formatter("General")._stub is engine.get_formatter("0.0")._stub
+
+
+def test_close_releases_shared_stubs(setup_function) -> None:
+    # Setup
+    engine = grpcapi.Engine()
+    engine._get_shared_stub(ModelCenterWorkflowServiceStub)
+
+    # SUT
+    engine.close()
+
+    # Verification
+    assert engine._shared_stubs == {}
+
+
+def test_close_empties_caches(setup_function) -> None:
+    # Setup
+    engine = grpcapi.Engine()
+    engine.metadata_cache.enabled = True
+    engine.format_cache.enabled = True
+    engine.metadata_cache.put(("ID", grpcapi.RealDatapin), atvi.RealMetadata())
+    engine.format_cache.put(("FormatDoubleToString", "General", 5.5), "5.5")
+
+    # SUT
+    engine.close()
+
+    # Verification
+    assert len(engine.metadata_cache) == 0
+    assert len(engine.format_cache) == 0
+
+
 def test_heartbeat_method_sends_grpc_calls_until_released(monkeypatch, setup_function) -> None:
     # Arrange
     assert mock_client.heartbeats == 0
@@ -449,3 +518,104 @@ def test_heartbeat_method_sends_grpc_calls_until_released(monkeypatch, setup_fun
     heartbeat_snapshot = mock_client.heartbeats
     time.sleep(0.5)
     assert mock_client.heartbeats == heartbeat_snapshot
+
+
+@pytest.mark.parametrize("wait_for_channel_ready", [True, False])
+def test_wait_for_channel_ready(monkeypatch, setup_function, wait_for_channel_ready: bool) -> None:
+    # Setup
+    mock_wait = unittest.mock.Mock()
+    monkeypatch.setattr(grpcapi.MCDProcess, "wait_for_channel", mock_wait)
+
+    # SUT
+    with grpcapi.Engine(wait_for_channel_ready=wait_for_channel_ready) as sut:
+        # Verification
+        assert mock_wait.call_count == (1 if wait_for_channel_ready else 0)
+        if wait_for_channel_ready:
+            mock_wait.assert_called_once_with(sut.channel)
+
+
+def test_attach() -> None:
+    with MockEngineServer() as server:
+        # SUT
+        with grpcmc.Engine.attach(server.get_address(), heartbeat_interval=100) as sut:
+            info = sut.get_server_info()
+            time.sleep(0.5)
+
+            # Verification
+            assert info.server_type == "mock"
+            assert not sut.is_local
+            assert not sut.get_run_only_mode()
+        assert sut.is_closed
+        assert server.get_engine_servicer().heartbeats >= 1
+        assert server.get_engine_servicer().shutdowns == 0
+
+
+def test_attach_without_heartbeats() -> None:
+    with MockEngineServer() as server:
+        # SUT
+        with grpcmc.Engine.attach(server.get_address(), send_heartbeats=False) as sut:
+            sut.get_server_info()
+
+        # Verification
+        assert server.get_engine_servicer().heartbeats == 0
+
+
+def test_attach_owning_server_shuts_it_down() -> None:
+    with MockEngineServer() as server:
+        # SUT
+        with grpcmc.Engine.attach(server.get_address(), owns_server=True):
+            pass
+
+        # Verification
+        assert server.get_engine_servicer().shutdowns == 1
+
+
+def test_heartbeat_failures_are_reported(monkeypatch, setup_function) -> None:
+    # Arrange
+    mock_client.raise_error_on_heartbeat = grpc.StatusCode.UNAVAILABLE
+    unresponsive: List[grpcmc.Engine] = []
+
+    # Act
+    with grpcmc.Engine(
+        heartbeat_interval=20, allowed_heartbeat_misses=2, on_unresponsive=unresponsive.append
+    ) as sut:
+        deadline = time.monotonic() + 5
+        while len(unresponsive) == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        statistics = sut.heartbeat_statistics
+
+    # Assert
+    assert unresponsive == [sut]
+    assert statistics is not None
+    assert statistics.missed >= 2
+    assert statistics.sent >= statistics.missed
+
+
+def test_attach_heartbeat_failures_are_reported(monkeypatch, setup_function) -> None:
+    # Arrange
+    mock_client.raise_error_on_heartbeat = grpc.StatusCode.UNAVAILABLE
+    misses_when_reported: List[int] = []
+
+    def on_unresponsive(engine: grpcmc.Engine) -> None:
+        misses_when_reported.append(engine.heartbeat_statistics.consecutive_missed)
+
+    # Act
+    with grpcmc.Engine.attach(
+        "localhost:12345",
+        heartbeat_interval=20,
+        allowed_heartbeat_misses=1,
+        on_unresponsive=on_unresponsive,
+    ):
+        deadline = time.monotonic() + 5
+        while len(misses_when_reported) == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    # Assert
+    assert misses_when_reported == [1]
+
+
+def test_attach_without_heartbeats_has_no_statistics() -> None:
+    with MockEngineServer() as server:
+        with grpcmc.Engine.attach(server.get_address(), send_heartbeats=False) as sut:
+            # SUT
+            assert sut.heartbeat_statistics is None
@@ -0,0 +1,243 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import threading
+from typing import List
+import unittest.mock
+
+from ansys.api.modelcenter.v0.engine_messages_pb2 import (
+    HeartbeatRequest,
+    HeartbeatResponse,
+    ShutdownRequest,
+    ShutdownResponse,
+)
+import grpc
+import numpy
+import pytest
+
+import ansys.modelcenter.workflow.grpc_modelcenter as grpcmc
+from ansys.modelcenter.workflow.grpc_modelcenter.grpc_error_interpretation import (
+    EngineDisconnectedError,
+)
+from tests.grpc_server_test_utils.mock_grpc_exception import MockGrpcError
+
+from .grpc_server_test_utils.client_creation_monkeypatch import monkeypatch_client_creation
+
+
+class MockEngineClientForPoolTest:
+    def __init__(self) -> None:
+        self.shutdowns = 0
+
+    def Shutdown(self, request: ShutdownRequest) -> ShutdownResponse:
+        self.shutdowns += 1
+        return ShutdownResponse()
+
+    def Heartbeat(self, request: HeartbeatRequest) -> HeartbeatResponse:
+        return HeartbeatResponse()
+
+
+mock_client: MockEngineClientForPoolTest
+
+
+@pytest.fixture
+def setup_function(monkeypatch):
+    """Setup called before each test function in this module."""
+
+    def mock_start(
+        self,
+        run_only: bool = False,
+        force_local: bool = False,
+        heartbeat_interval: numpy.uint = 30000,
+        allowed_heartbeat_misses: numpy.uint = 3,
+    ):
+        return 12345
+
+    def mock_init(self):
+        pass
+
+    monkeypatch.setattr(grpcmc.MCDProcess, "start", mock_start)
+    monkeypatch.setattr(grpcmc.MCDProcess, "__init__", mock_init)
+    global mock_client
+    mock_client = MockEngineClientForPoolTest()
+    monkeypatch_client_creation(monkeypatch, grpcmc.Engine, mock_client)
+
+
+class EngineRecorder:
+    """Engine factory that remembers every engine it started."""
+
+    def __init__(self) -> None:
+        self.engines: List[grpcmc.Engine] = []
+        self._lock = threading.Lock()
+
+    def __call__(self) -> grpcmc.Engine:
+        engine = grpcmc.Engine()
+        with self._lock:
+            self.engines.append(engine)
+        return engine
+
+
+def mock_workflow(engine: grpcmc.Engine) -> unittest.mock.Mock:
+    workflow = unittest.mock.Mock(spec=grpcmc.Workflow)
+    workflow._closed = False
+    engine._loaded_workflows.append(workflow)
+    return workflow
+
+
+def test_engines_are_started_ahead_of_time(setup_function) -> None:
+    # Setup
+    recorder = EngineRecorder()
+
+    # SUT
+    with grpcmc.EnginePool(3, engine_factory=recorder) as sut:
+        assert sut.wait_until_ready(5)
+
+        # Verification
+        assert sut.size == 3
+        assert sut.idle_count == 3
+        assert len(recorder.engines) == 3
+
+
+def test_lease_hands_out_idle_engine_and_takes_it_back(setup_function) -> None:
+    # Setup
+    recorder = EngineRecorder()
+    with grpcmc.EnginePool(1, engine_factory=recorder) as sut:
+        # SUT
+        with sut.lease(timeout=5) as first:
+            assert sut.idle_count == 0
+        with sut.lease(timeout=5) as second:
+            pass
+
+        # Verification
+        assert first is second
+        assert not first.is_closed
+        assert len(recorder.engines) == 1
+        assert sut.idle_count == 1
+
+
+def test_release_closes_loaded_workflows(setup_function) -> None:
+    # Setup
+    with grpcmc.EnginePool(1) as sut:
+        with sut.lease(timeout=5) as engine:
+            workflow = mock_workflow(engine)
+
+        # Verification
+        workflow.close_workflow.assert_called_once_with()
+        assert engine._loaded_workflows == []
+        assert not engine.is_closed
+
+
+def test_release_replaces_engine_that_cannot_be_reset(setup_function) -> None:
+    # Setup
+    recorder = EngineRecorder()
+    with grpcmc.EnginePool(1, engine_factory=recorder) as sut:
+        with sut.lease(timeout=5) as engine:
+            workflow = mock_workflow(engine)
+            workflow.close_workflow.side_effect = EngineDisconnectedError("Simulated failure.")
+
+        # SUT
+        with sut.lease(timeout=5) as replacement:
+            pass
+
+        # Verification
+        assert engine.is_closed
+        assert replacement is not engine
+        assert len(recorder.engines) == 2
+
+
+def test_health_check_replaces_dead_idle_engine(setup_function) -> None:
+    # Setup
+    recorder = EngineRecorder()
+    with grpcmc.EnginePool(1, engine_factory=recorder, health_check_interval=0.01) as sut:
+        with sut.lease(timeout=5) as engine:
+            engine._stub = unittest.mock.Mock()
+            engine._stub.Heartbeat.side_effect = MockGrpcError(
+                grpc.StatusCode.UNAVAILABLE, "Simulated failure."
+            )
+
+        # SUT
+        with sut._condition:
+            replaced = sut._condition.wait_for(
+                lambda: len(recorder.engines) == 2 and len(sut._idle) == 1, 5
+            )
+
+        # Verification
+        assert replaced
+        assert engine.is_closed
+        with sut.lease(timeout=5) as replacement:
+            assert replacement is recorder.engines[1]
+
+
+def test_acquire_times_out_when_all_engines_are_leased(setup_function) -> None:
+    with grpcmc.EnginePool(1) as sut:
+        with sut.lease(timeout=5):
+            # SUT
+            with pytest.raises(TimeoutError):
+                sut.acquire(timeout=0.01)
+
+
+def test_acquire_raises_start_failure(setup_function) -> None:
+    # Setup
+    def failing_factory() -> grpcmc.Engine:
+        raise grpcmc.EngineLicensingFailedException("Simulated failure.")
+
+    with grpcmc.EnginePool(1, engine_factory=failing_factory) as sut:
+        # SUT
+        with pytest.raises(grpcmc.EngineLicensingFailedException):
+            sut.acquire(timeout=5)
+
+
+def test_release_rejects_foreign_engine(setup_function) -> None:
+    with grpcmc.EnginePool(1) as sut:
+        with grpcmc.Engine() as engine:
+            # SUT
+            with pytest.raises(ValueError):
+                sut.release(engine)
+
+
+def test_close_closes_idle_engines(setup_function) -> None:
+    # Setup
+    recorder = EngineRecorder()
+    sut = grpcmc.EnginePool(2, engine_factory=recorder)
+    assert sut.wait_until_ready(5)
+
+    # SUT
+    sut.close()
+
+    # Verification
+    assert sut.is_closed
+    assert all(engine.is_closed for engine in recorder.engines)
+    assert mock_client.shutdowns == 2
+    with pytest.raises(RuntimeError):
+        sut.acquire(timeout=5)
+
+
+def test_engine_leased_during_close_is_closed_on_release(setup_function) -> None:
+    # Setup
+    sut = grpcmc.EnginePool(1)
+    engine = sut.acquire(timeout=5)
+
+    # SUT
+    sut.close()
+    sut.release(engine)
+
+    # Verification
+    assert engine.is_closed
@@ -41,6 +41,7 @@ class MockEngineClientForFormatTest:
         self._str_to_real_responses: Dict[str, float64] = {}
         self._int_to_str_responses: Dict[int64, str] = {}
         self._real_to_str_responses: Dict[float64, str] = {}
+        self.calls: int = 0
 
     @property
     def str_to_int_responses(self) -> Dict[str, int64]:
@@ -61,6 +62,7 @@ class MockEngineClientForFormatTest:
     def FormatStringToInteger(
         self, request: format_messages.FormatStringRequest
     ) -> format_messages.FormatIntegerResponse:
+        self.calls += 1
         key: str = request.original
         if request.format == "mockFormat":
             key = key.lstrip("ඞ")
@@ -69,6 +71,7 @@ class MockEngineClientForFormatTest:
     def FormatStringToDouble(
         self, request: format_messages.FormatStringRequest
     ) -> format_messages.FormatDoubleResponse:
+        self.calls += 1
         key: str = request.original
         if request.format == "mockFormat":
             key = key.lstrip("ඞ")
@@ -77,6 +80,7 @@ class MockEngineClientForFormatTest:
     def FormatIntegerToString(
         self, request: format_messages.FormatIntegerRequest
     ) -> format_messages.FormatStringResponse:
+        self.calls += 1
         result: str = self._int_to_str_responses[request.original]
         if request.format == "mockFormat":
             result = "ඞ" + result
@@ -85,6 +89,7 @@ class MockEngineClientForFormatTest:
     def FormatDoubleToString(
         self, request: format_messages.FormatDoubleRequest
     ) -> format_messages.FormatStringResponse:
+        self.calls += 1
         result: str = self._real_to_str_responses[float64(request.original)]
         if request.format == "mockFormat":
             result = "ඞ" + result
@@ -93,6 +98,7 @@ class MockEngineClientForFormatTest:
     def FormatStringToString(
         self, request: format_messages.FormatStringRequest
     ) -> format_messages.FormatStringResponse:
+        self.calls += 1
         result: str = request.original
         if request.format == "mockFormat":
             result = "ඞ" + result
@@ -101,6 +107,7 @@ class MockEngineClientForFormatTest:
     def FormatIntegerToEditString(
         self, request: format_messages.FormatIntegerRequest
     ) -> format_messages.FormatStringResponse:
+        self.calls += 1
         result: str = self._int_to_str_responses[request.original]
         if request.format == "mockFormat":
             result = "ඞ" + result
@@ -109,6 +116,7 @@ class MockEngineClientForFormatTest:
     def FormatDoubleToEditString(
         self, request: format_messages.FormatDoubleRequest
     ) -> format_messages.FormatStringResponse:
+        self.calls += 1
         result: str = self._real_to_str_responses[float64(request.original)]
         if request.format == "mockFormat":
             result = "ඞ" + result
@@ -119,6 +127,11 @@ class MockEngineClientForFormatTest:
     ) -> engine_messages.HeartbeatResponse:
         return engine_messages.HeartbeatResponse
 
+    def EngineSetPreference(
+        self, request: engine_messages.SetPreferenceRequest
+    ) -> engine_messages.SetPreferenceResponse:
+        return engine_messages.SetPreferenceResponse()
+
 
 engine: mcapi.Engine
 mock_client: MockEngineClientForFormatTest
@@ -320,3 +333,459 @@ def test_real_to_editable_string(setup_function, format_: str, expected: str) ->
     # Verification
     assert isinstance(result, str)
     assert result == expected
+
+
+# Expected conversions for the formats that can be converted without
+# calling the server, as (format, value, formatted string). These follow the
+# format specification on IFormat.format; add cases recorded from a live
+# server here before enabling local conversion by default.
+LOCAL_REAL_CASES = [
+    pytest.param("0", 1234.5, "1235"),
+    pytest.param("0", -0.4, "0"),
+    pytest.param("0.00", 1234.565, "1234.57"),
+    pytest.param("0.00", -2.5, "-2.50"),
+    pytest.param("0", 2.5, "3"),
+    pytest.param("0", -2.5, "-3"),
+    pytest.param("0.00", 2.675, "2.68"),
+    pytest.param("0.00", 1.005, "1.01"),
+    pytest.param("0.00", 0.125, "0.13"),
+    pytest.param("0.00", -1.115, "-1.12"),
+    pytest.param("0.00%", 0.00125, "0.13%"),
+    pytest.param("0.00E+00", 1.125, "1.13E+00"),
+    pytest.param("0.00000", 1.0 / 3.0, "0.33333"),
+    pytest.param("#,##0.00", 1234567.891, "1,234,567.89"),
+    pytest.param("(#,##0.00000)", -1234.5, "(1,234.50000)"),
+    pytest.param("(#,##0.00000)", 1234.5, "1,234.50000"),
+    pytest.param("$#,##0.00", 1234.5, "$1,234.50"),
+    pytest.param("$#,##0.00", -1234.5, "-$1,234.50"),
+    pytest.param("($#,##0.00000)", -0.5, "($0.50000)"),
+    pytest.param("$0.00", 1234.5, "$1,234.50"),
+    pytest.param("0.00%", 0.12345, "12.35%"),
+    pytest.param("0.00000%", -0.5, "-50.00000%"),
+    pytest.param("0.00E+00", 12345.0, "1.23E+04"),
+    pytest.param("0.00E+00", -0.000999999, "-1.00E-03"),
+    pytest.param("0.00000E+00", 0.0, "0.00000E+00"),
+    pytest.param("0.00E+00", 1.0e300, "1.00E+300"),
+]
+
+
+@pytest.mark.parametrize("format_, value, expected", LOCAL_REAL_CASES)
+def test_real_to_string_local(setup_function, format_: str, value: float, expected: str) -> None:
+    """Verifies that real_to_string converts the common formats locally."""
+    # Setup
+    sut: mcapi.Format = engine.get_formatter(format_)
+    sut.use_local_formats = True
+
+    # SUT
+    result: str = sut.real_to_string(float64(value))
+
+    # Verification
+    assert sut.is_local
+    assert result == expected
+    assert mock_client.calls == 0
+
+
+@pytest.mark.parametrize(
+    "format_, value, expected",
+    [
+        pytest.param("0", 5, "5"),
+        pytest.param("0.00", -5, "-5.00"),
+        pytest.param("(#,##0)", -1234567, "(1,234,567)"),
+        pytest.param("$#,##0", 1000, "$1,000"),
+        pytest.param("0%", 3, "300%"),
+        pytest.param("0.0E+00", 9_223_372_036_854_775_807, "9.2E+18"),
+    ],
+)
+def test_integer_to_string_local(setup_function, format_: str, value: int, expected: str) -> None:
+    """Verifies that integer_to_string converts the common formats locally."""
+    # Setup
+    sut: mcapi.Format = engine.get_formatter(format_)
+    sut.use_local_formats = True
+
+    # SUT
+    result: str = sut.integer_to_string(int64(value))
+
+    # Verification
+    assert result == expected
+    assert mock_client.calls == 0
+
+
+@pytest.mark.parametrize(
+    "format_, string, expected",
+    [
+        pytest.param("0.00", " 5.25 ", 5.25),
+        pytest.param("0.00", "-1e3", -1000.0),
+        pytest.param("(#,##0.00)", "(1,234.50)", -1234.5),
+        pytest.param("#,##0.00", "1234.5", 1234.5),
+        pytest.param("$#,##0.00", "-$1,000.25", -1000.25),
+        pytest.param("0.00%", "12.5%", 0.125),
+        pytest.param("0.00E+00", "1.23E+04", 12300.0),
+    ],
+)
+def test_string_to_real_local(setup_function, format_: str, string: str, expected: float) -> None:
+    """Verifies that string_to_real parses the common formats locally."""
+    # Setup
+    sut: mcapi.Format = engine.get_formatter(format_)
+    sut.use_local_formats = True
+
+    # SUT
+    result: float = sut.string_to_real(string)
+
+    # Verification
+    assert isinstance(result, float)
+    assert result == expected
+    assert mock_client.calls == 0
+
+
+@pytest.mark.parametrize(
+    "format_, string, expected",
+    [
+        pytest.param("0", "42", 42),
+        pytest.param("(#,##0)", "(1,234)", -1234),
+        pytest.param("$#,##0.00", "$1,000.00", 1000),
+    ],
+)
+def test_string_to_integer_local(setup_function, format_: str, string: str, expected: int) -> None:
+    """Verifies that string_to_integer parses the common formats locally."""
+    # Setup
+    sut: mcapi.Format = engine.get_formatter(format_)
+    sut.use_local_formats = True
+
+    # SUT
+    result: int = sut.string_to_integer(string)
+
+    # Verification
+    assert isinstance(result, int)
+    assert result == expected
+    assert mock_client.calls == 0
+
+
+def test_local_formats_disabled_by_default(setup_function) -> None:
+    """Verifies that formats that could be converted locally are sent to
+    the server unless local conversion is enabled."""
+    # Setup
+    sut: mcapi.Format = engine.get_formatter("0.00")
+    mock_client.real_to_str_responses[float64(5.5)] = "server"
+
+    # SUT
+    result: str = sut.real_to_string(float64(5.5))
+
+    # Verification
+    assert not sut.use_local_formats
+    assert not sut.is_local
+    assert result == "server"
+    assert mock_client.calls == 1
+
+
+@pytest.mark.parametrize(
+    "format_",
+    [
+        pytest.param("General"),
+        pytest.param("# ??/??"),
+        pytest.param("UTCG"),
+        pytest.param("(0.00%)"),
+        pytest.param("0.00 m"),
+    ],
+)
+def test_unknown_format_uses_server(setup_function, format_: str) -> None:
+    """Verifies that formats that are not understood locally are sent to
+    the server."""
+    # Setup
+    sut: mcapi.Format = engine.get_formatter(format_)
+    sut.use_local_formats = True
+    mock_client.real_to_str_responses[float64(5.5)] = "5.5"
+
+    # SUT
+    result: str = sut.real_to_string(float64(5.5))
+
+    # Verification
+    assert not sut.is_local
+    assert result == "5.5"
+    assert mock_client.calls == 1
+
+
+@pytest.mark.parametrize(
+    "format_, string",
+    [
+        pytest.param("0.00", "1,234.5"),
+        pytest.param("0.00%", "12.5"),
+        pytest.param("0.00", "$5.5"),
+        pytest.param("0.00", "five point five"),
+    ],
+)
+def test_unparsed_string_uses_server(setup_function, format_: str, string: str) -> None:
+    """Verifies that strings that cannot be parsed locally are sent to the
+    server."""
+    # Setup
+    sut: mcapi.Format = engine.get_formatter(format_)
+    sut.use_local_formats = True
+    mock_client.str_to_real_responses[string] = float64(5.5)
+
+    # SUT
+    result: float = sut.string_to_real(string)
+
+    # Verification
+    assert result == 5.5
+    assert mock_client.calls == 1
+
+
+@pytest.mark.parametrize(
+    "value",
+    [pytest.param(float("inf")), pytest.param(float("-inf")), pytest.param(1.0e20)],
+)
+def test_unrepresentable_real_uses_server(setup_function, value: float) -> None:
+    """Verifies that values that cannot be shown locally are sent to the
+    server."""
+    # Setup
+    sut: mcapi.Format = engine.get_formatter("0.00")
+    sut.use_local_formats = True
+    mock_client.real_to_str_responses[float64(value)] = "server"
+
+    # SUT
+    result: str = sut.real_to_string(float64(value))
+
+    # Verification
+    assert result == "server"
+    assert mock_client.calls == 1
+
+
+def test_set_format_switches_to_server(setup_function) -> None:
+    """Verifies that changing the format changes whether it is converted
+    locally."""
+    # Setup
+    sut: mcapi.Format = engine.get_formatter("0.00")
+    sut.use_local_formats = True
+    mock_client.real_to_str_responses[float64(5.5)] = "5.5"
+
+    # SUT
+    sut.format = "General"
+    result: str = sut.real_to_string(float64(5.5))
+
+    # Verification
+    assert not sut.is_local
+    assert result == "5.5"
+    assert mock_client.calls == 1
+
+
+def test_reals_to_strings(setup_function) -> None:
+    """Verifies that reals_to_strings preserves the shape and converts
+    each distinct value once."""
+    # Setup
+    sut: mcapi.Format = engine.get_formatter("mockFormat")
+    mock_client.real_to_str_responses[float64(1.5)] = "1.5"
+    mock_client.real_to_str_responses[float64(2.5)] = "2.5"
+    reals = numpy.array([[1.5, 2.5, 1.5], [2.5, 2.5, 1.5]])
+
+    # SUT
+    result: numpy.ndarray = sut.reals_to_strings(reals)
+
+    # Verification
+    assert result.shape == (2, 3)
+    assert result.tolist() == [["ඞ1.5", "ඞ2.5", "ඞ1.5"], ["ඞ2.5", "ඞ2.5", "ඞ1.5"]]
+    assert mock_client.calls == 2
+
+
+def test_reals_to_strings_local(setup_function) -> None:
+    """Verifies that reals_to_strings converts the common formats
+    locally."""
+    # Setup
+    sut: mcapi.Format = engine.get_formatter("(#,##0.00)")
+    sut.use_local_formats = True
+
+    # SUT
+    result: numpy.ndarray = sut.reals_to_strings([-1234.5, 0.125, 7.0])
+
+    # Verification
+    assert result.tolist() == ["(1,234.50)", "0.13", "7.00"]
+    assert mock_client.calls == 0
+
+
+def test_reals_to_strings_local_with_fallback(setup_function) -> None:
+    """Verifies that reals_to_strings sends the values that cannot be
+    shown locally to the server."""
+    # Setup
+    sut: mcapi.Format = engine.get_formatter("0.0")
+    sut.use_local_formats = True
+    mock_client.real_to_str_responses[float64("inf")] = "server"
+
+    # SUT
+    result: numpy.ndarray = sut.reals_to_strings(numpy.array([1.25, numpy.inf, 1.25]))
+
+    # Verification
+    assert result.tolist() == ["1.3", "server", "1.3"]
+    assert mock_client.calls == 1
+
+
+def test_reals_to_strings_empty(setup_function) -> None:
+    """Verifies that reals_to_strings accepts an empty array."""
+    # Setup
+    sut: mcapi.Format = engine.get_formatter("General")
+
+    # SUT
+    result: numpy.ndarray = sut.reals_to_strings(numpy.zeros((0, 3)))
+
+    # Verification
+    assert result.shape == (0, 3)
+    assert mock_client.calls == 0
+
+
+def test_integers_to_strings(setup_function) -> None:
+    """Verifies the integers_to_strings method."""
+    # Setup
+    sut: mcapi.Format = engine.get_formatter("General")
+    mock_client.int_to_str_responses[5] = "5"
+    mock_client.int_to_str_responses[6] = "6"
+
+    # SUT
+    result: numpy.ndarray = sut.integers_to_strings(numpy.array([6, 5, 6]))
+
+    # Verification
+    assert result.tolist() == ["6", "5", "6"]
+    assert mock_client.calls == 2
+
+
+def test_strings_to_reals(setup_function) -> None:
+    """Verifies the strings_to_reals method."""
+    # Setup
+    sut: mcapi.Format = engine.get_formatter("0.00%")
+    sut.use_local_formats = True
+    mock_client.str_to_real_responses["12.5"] = float64(0.125)
+
+    # SUT
+    result: numpy.ndarray = sut.strings_to_reals([["50%", "12.5"], ["12.5", "1%"]])
+
+    # Verification
+    assert result.dtype == numpy.float64
+    assert result.tolist() == [[0.5, 0.125], [0.125, 0.01]]
+    assert mock_client.calls == 1
+
+
+def test_strings_to_integers(setup_function) -> None:
+    """Verifies the strings_to_integers method."""
+    # Setup
+    sut: mcapi.Format = engine.get_formatter("mockFormat")
+    mock_client.str_to_int_responses["5"] = 5
+
+    # SUT
+    result: numpy.ndarray = sut.strings_to_integers(numpy.array(["ඞ5", "ඞ5"]))
+
+    # Verification
+    assert result.dtype == numpy.int64
+    assert result.tolist() == [5, 5]
+    assert mock_client.calls == 1
+
+
+def test_strings_to_strings(setup_function) -> None:
+    """Verifies the strings_to_strings method."""
+    # Setup
+    sut: mcapi.Format = engine.get_formatter("mockFormat")
+
+    # SUT
+    result: numpy.ndarray = sut.strings_to_strings(["a", "b"])
+
+    # Verification
+    assert result.tolist() == ["ඞa", "ඞb"]
+
+
+def test_editable_strings(setup_function) -> None:
+    """Verifies the integers_to_editable_strings and
+    reals_to_editable_strings methods."""
+    # Setup
+    sut: mcapi.Format = engine.get_formatter("0.00")
+    mock_client.int_to_str_responses[5] = "5"
+    mock_client.real_to_str_responses[float64(5.5)] = "5.5"
+
+    # SUT
+    integers: numpy.ndarray = sut.integers_to_editable_strings([5])
+    reals: numpy.ndarray = sut.reals_to_editable_strings([5.5])
+
+    # Verification
+    assert integers.tolist() == ["5"]
+    assert reals.tolist() == ["5.5"]
+    assert mock_client.calls == 2
+
+
+def test_format_cache_disabled_by_default(setup_function) -> None:
+    """Verifies that conversions are not cached unless enabled."""
+    # Setup
+    sut: mcapi.Format = engine.get_formatter("General")
+    mock_client.real_to_str_responses[float64(5.5)] = "5.5"
+
+    # SUT
+    sut.reals_to_strings([5.5])
+    sut.reals_to_strings([5.5])
+
+    # Verification
+    assert mock_client.calls == 2
+    assert len(engine.format_cache) == 0
+
+
+def test_format_cache_hits(setup_function) -> None:
+    """Verifies that cached conversions do not call the server."""
+    # Setup
+    engine.format_cache.enabled = True
+    sut: mcapi.Format = engine.get_formatter("General")
+    mock_client.real_to_str_responses[float64(5.5)] = "5.5"
+    mock_client.real_to_str_responses[float64(6.5)] = "6.5"
+
+    # SUT
+    sut.reals_to_strings([5.5])
+    result: numpy.ndarray = sut.reals_to_strings([6.5, 5.5])
+
+    # Verification
+    assert result.tolist() == ["6.5", "5.5"]
+    assert mock_client.calls == 2
+    assert engine.format_cache.hits == 1
+
+
+def test_format_cache_keyed_by_format(setup_function) -> None:
+    """Verifies that a conversion cached for one format is not used for
+    another."""
+    # Setup
+    engine.format_cache.enabled = True
+    sut: mcapi.Format = engine.get_formatter("General")
+    mock_client.real_to_str_responses[float64(5.5)] = "5.5"
+    sut.reals_to_strings([5.5])
+
+    # SUT
+    sut.format = "mockFormat"
+    result: numpy.ndarray = sut.reals_to_strings([5.5])
+
+    # Verification
+    assert result.tolist() == ["ඞ5.5"]
+    assert mock_client.calls == 2
+
+
+def test_format_cache_evicts_least_recently_used(setup_function) -> None:
+    """Verifies that the cache holds at most max_size conversions."""
+    # Setup
+    engine.format_cache.enabled = True
+    engine.format_cache.max_size = 2
+    sut: mcapi.Format = engine.get_formatter("General")
+    for value in (1.0, 2.0, 3.0):
+        mock_client.real_to_str_responses[float64(value)] = str(value)
+
+    # SUT
+    sut.reals_to_strings([1.0, 2.0])
+    sut.reals_to_strings([1.0])
+    sut.reals_to_strings([3.0])
+    sut.reals_to_strings([1.0, 2.0])
+
+    # Verification
+    assert len(engine.format_cache) == 2
+    assert mock_client.calls == 4
+
+
+def test_set_preference_invalidates_format_cache(setup_function) -> None:
+    """Verifies that setting a preference empties the format cache."""
+    # Setup
+    engine.format_cache.enabled = True
+    sut: mcapi.Format = engine.get_formatter("General")
+    mock_client.real_to_str_responses[float64(5.5)] = "5.5"
+    sut.reals_to_strings([5.5])
+
+    # SUT
+    engine.set_preference("SomePreference", 3)
+
+    # Verification
+    assert len(engine.format_cache) == 0
@@ -95,6 +95,18 @@ def test_get_variables_multiple_variables(monkeypatch, engine):
     base_tests.do_test_get_datapins_multiple_variables(monkeypatch, engine, Group)
 
 
+def test_get_datapin_states_all(monkeypatch, engine):
+    base_tests.do_test_get_datapin_states_all(monkeypatch, engine, Group)
+
+
+def test_get_datapin_states_by_name(monkeypatch, engine):
+    base_tests.do_test_get_datapin_states_by_name(monkeypatch, engine, Group)
+
+
+def test_get_datapin_states_structured(monkeypatch, engine):
+    base_tests.do_test_get_datapin_states_structured(monkeypatch, engine, Group)
+
+
 def test_get_groups_empty(monkeypatch, engine):
     base_tests.do_test_get_groups_empty(monkeypatch, engine, Group)
 
@@ -137,6 +149,10 @@ def test_get_properties(monkeypatch, engine) -> None:
     awe_tests.do_test_get_properties(monkeypatch, engine, Group)
 
 
+def test_get_properties_subset(monkeypatch, engine) -> None:
+    awe_tests.do_test_get_properties_subset(monkeypatch, engine, Group)
+
+
 def test_can_get_name(monkeypatch, engine):
     mock_client = MockWorkflowClientForAssemblyTest()
     mock_client.name_responses["TEST_ID_SHOULD_MATCH"] = "expected_name"
@@ -0,0 +1,233 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import concurrent.futures
+import threading
+import time
+from typing import Callable, List, Optional
+
+from ansys.api.modelcenter.v0.engine_messages_pb2 import HeartbeatRequest, HeartbeatResponse
+import grpc
+
+from ansys.modelcenter.workflow.grpc_modelcenter._heartbeat import (
+    HeartbeatScheduler,
+    HeartbeatStatistics,
+)
+from tests.grpc_server_test_utils.mock_grpc_exception import MockGrpcError
+
+
+class MockHeartbeatClient:
+    def __init__(self) -> None:
+        self.heartbeats = 0
+        self.threads: List[threading.Thread] = []
+        self.fail = False
+
+    def Heartbeat(self, request: HeartbeatRequest) -> HeartbeatResponse:
+        self.heartbeats += 1
+        self.threads.append(threading.current_thread())
+        if self.fail:
+            raise MockGrpcError(grpc.StatusCode.UNAVAILABLE, "Simulated failure.")
+        return HeartbeatResponse()
+
+
+class MockFutureHeartbeatCall:
+    """Heartbeat call that supports ``future()``, like a real stub's."""
+
+    def __init__(self, error: Optional[Exception]) -> None:
+        self.error = error
+        self.timeouts: List[float] = []
+
+    def __call__(self, request: HeartbeatRequest) -> HeartbeatResponse:
+        raise AssertionError("The call should be started with future().")
+
+    def future(self, request: HeartbeatRequest, timeout: float) -> concurrent.futures.Future:
+        self.timeouts.append(timeout)
+        result: concurrent.futures.Future = concurrent.futures.Future()
+        if self.error is None:
+            result.set_result(HeartbeatResponse())
+        else:
+            result.set_exception(self.error)
+        return result
+
+
+class MockFutureHeartbeatClient:
+    def __init__(self, error: Optional[Exception] = None) -> None:
+        self.Heartbeat = MockFutureHeartbeatCall(error)
+
+
+class MockLateFutureHeartbeatCall(MockFutureHeartbeatCall):
+    """Heartbeat call whose result arrives on another thread, as gRPC's
+    does."""
+
+    def future(self, request: HeartbeatRequest, timeout: float) -> concurrent.futures.Future:
+        self.timeouts.append(timeout)
+        result: concurrent.futures.Future = concurrent.futures.Future()
+        threading.Timer(0.005, result.set_exception, args=(self.error,)).start()
+        return result
+
+
+def wait_until(condition: Callable[[], bool], timeout: float = 5) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def test_engines_share_one_thread() -> None:
+    # Setup
+    sut = HeartbeatScheduler()
+    clients = [MockHeartbeatClient() for _ in range(8)]
+
+    # SUT
+    registrations = [sut.register(client, 50) for client in clients]
+    try:
+        assert wait_until(lambda: all(client.heartbeats >= 3 for client in clients))
+    finally:
+        for registration in registrations:
+            sut.unregister(registration)
+
+    # Verification
+    threads = {thread for client in clients for thread in client.threads}
+    assert len(threads) == 1
+    assert registrations[0].statistics.missed == 0
+
+
+def test_heartbeats_are_spaced_by_interval() -> None:
+    # Setup
+    sut = HeartbeatScheduler()
+    client = MockHeartbeatClient()
+
+    # SUT
+    registration = sut.register(client, 100)
+    time.sleep(1)
+    sut.unregister(registration)
+
+    # Verification
+    assert 9 <= client.heartbeats <= 12
+    assert registration.statistics.sent == client.heartbeats
+
+
+def test_unregister_stops_heartbeats_and_thread() -> None:
+    # Setup
+    sut = HeartbeatScheduler()
+    client = MockHeartbeatClient()
+    registration = sut.register(client, 20)
+    assert wait_until(lambda: client.heartbeats >= 2)
+
+    # SUT
+    sut.unregister(registration)
+    snapshot = client.heartbeats
+    time.sleep(0.1)
+
+    # Verification
+    assert client.heartbeats == snapshot
+    assert wait_until(lambda: sut._thread is None)
+
+
+def test_unresponsive_callback_after_allowed_misses() -> None:
+    # Setup
+    sut = HeartbeatScheduler()
+    client = MockHeartbeatClient()
+    client.fail = True
+    calls: List[HeartbeatStatistics] = []
+    registration = sut.register(
+        client, 20, allowed_misses=3, on_unresponsive=lambda: calls.append(registration.statistics)
+    )
+
+    # SUT
+    try:
+        assert wait_until(lambda: registration.statistics.missed >= 5)
+        client.fail = False
+        assert wait_until(lambda: registration.statistics.consecutive_missed == 0)
+    finally:
+        sut.unregister(registration)
+
+    # Verification
+    assert len(calls) == 1
+    assert calls[0].consecutive_missed == 3
+    assert registration.statistics.missed >= 5
+
+
+def test_calls_are_not_waited_on_when_stub_supports_futures() -> None:
+    # Setup
+    sut = HeartbeatScheduler()
+    client = MockFutureHeartbeatClient(MockGrpcError(grpc.StatusCode.DEADLINE_EXCEEDED, "Late."))
+    unresponsive = threading.Event()
+
+    # SUT
+    registration = sut.register(client, 20, allowed_misses=2, on_unresponsive=unresponsive.set)
+    try:
+        assert unresponsive.wait(5)
+    finally:
+        sut.unregister(registration)
+
+    # Verification
+    assert client.Heartbeat.timeouts[0] == 0.02
+    assert registration.statistics.consecutive_missed >= 2
+
+
+def test_unresponsive_callback_runs_on_scheduler_thread() -> None:
+    # Setup
+    sut = HeartbeatScheduler()
+    client = MockFutureHeartbeatClient()
+    client.Heartbeat = MockLateFutureHeartbeatCall(
+        MockGrpcError(grpc.StatusCode.DEADLINE_EXCEEDED, "Late.")
+    )
+    callback_threads: List[threading.Thread] = []
+    unresponsive = threading.Event()
+
+    def on_unresponsive() -> None:
+        callback_threads.append(threading.current_thread())
+        unresponsive.set()
+
+    # SUT
+    registration = sut.register(client, 20, allowed_misses=2, on_unresponsive=on_unresponsive)
+    scheduler_thread = sut._thread
+    try:
+        assert unresponsive.wait(5)
+    finally:
+        sut.unregister(registration)
+
+    # Verification
+    assert callback_threads == [scheduler_thread]
+
+
+def test_unresponsive_callback_may_unregister() -> None:
+    # Setup
+    sut = HeartbeatScheduler()
+    client = MockHeartbeatClient()
+    client.fail = True
+    unregistered = threading.Event()
+
+    def on_unresponsive() -> None:
+        sut.unregister(registration)
+        unregistered.set()
+
+    # SUT
+    registration = sut.register(client, 20, allowed_misses=2, on_unresponsive=on_unresponsive)
+
+    # Verification
+    assert unregistered.wait(5)
+    assert wait_until(lambda: sut._thread is None)
+    assert registration.statistics.missed == 2
@@ -0,0 +1,107 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import json
+import subprocess
+import sys
+from typing import Dict, Set
+
+import pytest
+
+IMPORT_TIME_BUDGET_US: int = 200_000
+"""Most time that importing the package may take, in microseconds.
+
+Importing every implementation module eagerly took about 600 ms.
+"""
+
+HEAVY_MODULES: Set[str] = {
+    "grpc",
+    "numpy",
+    "ansys.tools.variableinterop",
+    "ansys.platform.instancemanagement",
+    "ansys.tools.common.cyberchannel",
+}
+
+
+def get_loaded_modules(statement: str) -> Set[str]:
+    """Run a statement in a fresh interpreter and get the modules it loaded,
+    leaving out those loaded at startup."""
+    code = (
+        "import json, sys; before = set(sys.modules); {}; "
+        "print(json.dumps(sorted(set(sys.modules) - before)))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code.format(statement)], capture_output=True, text=True, check=True
+    )
+    return set(json.loads(result.stdout))
+
+
+def get_cumulative_import_times(statement: str) -> Dict[str, int]:
+    """Run a statement in a fresh interpreter with ``-X importtime`` and get
+    the cumulative time of each module it loaded, in microseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        fields = line[len("import time:") :].split("|")
+        if len(fields) == 3 and fields[1].strip().isdigit():
+            times[fields[2].strip()] = int(fields[1])
+    return times
+
+
+def test_package_import_loads_no_implementation() -> None:
+    # SUT
+    loaded = get_loaded_modules("import ansys.modelcenter.workflow.grpc_modelcenter")
+
+    # Verification
+    assert loaded.isdisjoint(HEAVY_MODULES)
+    assert "ansys.modelcenter.workflow.grpc_modelcenter.engine" not in loaded
+
+
+def test_engine_import_defers_platform_modules() -> None:
+    # SUT
+    loaded = get_loaded_modules("from ansys.modelcenter.workflow.grpc_modelcenter import Engine")
+
+    # Verification
+    assert "ansys.modelcenter.workflow.grpc_modelcenter.engine" in loaded
+    assert "winreg" not in loaded
+    assert "ansys.platform.instancemanagement" not in loaded
+    assert "ansys.tools.common.cyberchannel" not in loaded
+
+
+def test_package_import_time_within_budget() -> None:
+    # SUT
+    times = get_cumulative_import_times("import ansys.modelcenter.workflow.grpc_modelcenter")
+
+    # Verification
+    assert times["ansys.modelcenter.workflow.grpc_modelcenter"] < IMPORT_TIME_BUDGET_US
+
+
+def test_unknown_attribute() -> None:
+    import ansys.modelcenter.workflow.grpc_modelcenter as grpcmc
+
+    with pytest.raises(AttributeError):
+        grpcmc.NoSuchName
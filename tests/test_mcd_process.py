@@ -21,19 +21,33 @@
 # SOFTWARE.
 
 import io
+import os
+from queue import Queue
 import subprocess
+from threading import Thread
+import time
+from typing import List, Optional
 import unittest
 from unittest.mock import patch
 
+import grpc
 import pytest
 
-from ansys.modelcenter.workflow.grpc_modelcenter import EngineLicensingFailedException, MCDProcess
+from ansys.modelcenter.workflow.grpc_modelcenter import (
+    EngineLicensingFailedException,
+    MCDProcess,
+    mcd_process,
+)
 
 
 class MockProcess:
     def __init__(self) -> None:
         self.stdout = io.BytesIO(b"garbage\r\n\r\ngrpc server listening on 0.0.0.0:50051\n")
         self.pid = 902
+        self.returncode: Optional[int] = None
+
+    def poll(self) -> Optional[int]:
+        return self.returncode
 
 
 def mock_find_exe_location() -> str:
@@ -162,3 +176,158 @@ def test_get_process_id_before_start(monkeypatch) -> None:
 
     # Verification
     assert result == -1
+
+
+@patch(
+    "ansys.modelcenter.workflow.grpc_modelcenter.mcd_process._find_exe_location",
+    mock_find_exe_location,
+)
+def test_start_does_not_wait_between_lines(monkeypatch) -> None:
+    # Setup
+    sut = MCDProcess()
+    mock_process = MockProcess()
+    mock_process.stdout = io.BytesIO(
+        b"log line\n" * 1000 + b"grpc server listening on 0.0.0.0:50051\n"
+    )
+    with unittest.mock.patch.object(subprocess, "Popen", return_value=mock_process):
+        # SUT
+        result: int = sut.start()
+
+    # Verification
+    assert result == 50051
+    assert list(sut.startup_timings.keys()) == ["launch", "listening"]
+    assert sut.startup_timings["listening"] < 5
+
+
+@patch(
+    "ansys.modelcenter.workflow.grpc_modelcenter.mcd_process._find_exe_location",
+    mock_find_exe_location,
+)
+def test_start_discards_later_output(monkeypatch) -> None:
+    # Setup
+    queues: List[Queue] = []
+    threads: List[Thread] = []
+
+    class RecordingQueue(Queue):
+        def __init__(self) -> None:
+            super().__init__()
+            queues.append(self)
+
+    class RecordingThread(Thread):
+        def __init__(self, *args, **kwargs) -> None:
+            super().__init__(*args, **kwargs)
+            threads.append(self)
+
+    monkeypatch.setattr(mcd_process, "Queue", RecordingQueue)
+    monkeypatch.setattr(mcd_process, "Thread", RecordingThread)
+    sut = MCDProcess()
+    mock_process = MockProcess()
+    read_fd, write_fd = os.pipe()
+    mock_process.stdout = os.fdopen(read_fd, "rb")
+    with os.fdopen(write_fd, "wb") as writer:
+        writer.write(b"grpc server listening on 0.0.0.0:50051\n")
+        writer.flush()
+        with unittest.mock.patch.object(subprocess, "Popen", return_value=mock_process):
+            sut.start()
+
+        # SUT
+        writer.write(b"log line\n" * 1000)
+
+    # Verification
+    threads[0].join(timeout=5)
+    assert not threads[0].is_alive()
+    assert queues[0].empty()
+
+
+@patch(
+    "ansys.modelcenter.workflow.grpc_modelcenter.mcd_process._find_exe_location",
+    mock_find_exe_location,
+)
+def test_start_times_out_on_silent_process(monkeypatch) -> None:
+    # Setup
+    sut = MCDProcess()
+    sut._timeout = 0.2
+    mock_process = MockProcess()
+    read_fd, write_fd = os.pipe()
+    mock_process.stdout = os.fdopen(read_fd, "rb")
+    try:
+        with unittest.mock.patch.object(subprocess, "Popen", return_value=mock_process):
+            start = time.monotonic()
+
+            # SUT
+            with pytest.raises(Exception) as err:
+                sut.start()
+
+        # Verification
+        assert err.value.args[0] == "Timed out waiting for ModelCenter to start."
+        assert time.monotonic() - start < 5
+    finally:
+        os.close(write_fd)
+
+
+@patch(
+    "ansys.modelcenter.workflow.grpc_modelcenter.mcd_process._find_exe_location",
+    mock_find_exe_location,
+)
+def test_start_fails_fast_on_exit(monkeypatch) -> None:
+    # Setup
+    sut = MCDProcess()
+    mock_process = MockProcess()
+    mock_process.stdout = io.BytesIO(b"garbage\n")
+    mock_process.returncode = 3
+    with unittest.mock.patch.object(subprocess, "Popen", return_value=mock_process):
+        # SUT
+        with pytest.raises(Exception) as err:
+            sut.start()
+
+    # Verification
+    assert err.value.args[0] == "ModelCenter exited with code 3 before it started."
+
+
+@patch(
+    "ansys.modelcenter.workflow.grpc_modelcenter.mcd_process._find_exe_location",
+    mock_find_exe_location,
+)
+def test_wait_for_channel(monkeypatch) -> None:
+    # Setup
+    sut = MCDProcess()
+    mock_process = MockProcess()
+    ready_future = unittest.mock.Mock()
+    ready_future.result.side_effect = [grpc.FutureTimeoutError(), None]
+    with unittest.mock.patch.object(subprocess, "Popen", return_value=mock_process):
+        sut.start()
+    channel = unittest.mock.Mock()
+    with unittest.mock.patch.object(
+        grpc, "channel_ready_future", return_value=ready_future
+    ) as mock_ready:
+        # SUT
+        sut.wait_for_channel(channel)
+
+    # Verification
+    mock_ready.assert_called_once_with(channel)
+    assert ready_future.result.call_count == 2
+    ready_future.cancel.assert_called_once_with()
+    assert list(sut.startup_timings.keys()) == ["launch", "listening", "channel_ready"]
+
+
+@patch(
+    "ansys.modelcenter.workflow.grpc_modelcenter.mcd_process._find_exe_location",
+    mock_find_exe_location,
+)
+def test_wait_for_channel_fails_fast_on_exit(monkeypatch) -> None:
+    # Setup
+    sut = MCDProcess()
+    mock_process = MockProcess()
+    ready_future = unittest.mock.Mock()
+    ready_future.result.side_effect = grpc.FutureTimeoutError()
+    with unittest.mock.patch.object(subprocess, "Popen", return_value=mock_process):
+        sut.start()
+    mock_process.returncode = 1
+    with unittest.mock.patch.object(grpc, "channel_ready_future", return_value=ready_future):
+        # SUT
+        with pytest.raises(Exception) as err:
+            sut.wait_for_channel(unittest.mock.Mock())
+
+    # Verification
+    assert err.value.args[0] == "ModelCenter exited with code 1 before it started."
+    ready_future.cancel.assert_called_once_with()
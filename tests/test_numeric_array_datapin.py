@@ -0,0 +1,129 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the chunked transfers of numeric array datapins."""
+
+from typing import Generator, Type
+
+from ansys.api.modelcenter.v0.element_messages_pb2 import ElementId
+import ansys.api.modelcenter.v0.grpc_modelcenter_workflow_pb2_grpc as workflow_grpc
+import numpy as np
+import pytest
+
+import ansys.modelcenter.workflow.grpc_modelcenter as grpcmc
+from ansys.modelcenter.workflow.grpc_modelcenter.base_numeric_array_datapin import (
+    BaseNumericArrayDatapin,
+)
+
+from .grpc_server_test_utils.client_creation_monkeypatch import monkeypatch_client_creation
+from .grpc_server_test_utils.mock_workflow_server import MockWorkflowServer
+
+
+@pytest.fixture(scope="module")
+def server() -> Generator[MockWorkflowServer, None, None]:
+    with MockWorkflowServer() as server:
+        yield server
+
+
+@pytest.fixture
+def stub(
+    server: MockWorkflowServer,
+) -> Generator[workflow_grpc.ModelCenterWorkflowServiceStub, None, None]:
+    server.get_workflow_servicer().states.clear()
+    with server.get_channel() as channel:
+        yield workflow_grpc.ModelCenterWorkflowServiceStub(channel)
+
+
+datapin_tests = [
+    pytest.param(
+        grpcmc.RealArrayDatapin, np.linspace(0.0, 1.0, 1000).reshape((10, 100)), id="real"
+    ),
+    pytest.param(grpcmc.IntegerArrayDatapin, np.arange(-500, 500).reshape((10, 10, 10)), id="int"),
+    pytest.param(grpcmc.BooleanArrayDatapin, np.arange(999) % 3 == 0, id="bool"),
+]
+
+
+@pytest.mark.parametrize("sut_type,value", datapin_tests)
+def test_chunked_round_trip(
+    monkeypatch, engine, stub, sut_type: Type[BaseNumericArrayDatapin], value: np.ndarray
+) -> None:
+    # Setup
+    monkeypatch_client_creation(monkeypatch, sut_type, stub)
+    sut = sut_type(ElementId(id_string="VAR"), engine)
+    flat = value.reshape(-1)
+
+    # SUT
+    sut.set_value_from_chunks(value.shape, (flat[i : i + 64] for i in range(0, flat.size, 64)))
+    chunks = list(sut.iter_value_chunks(chunk_size=100))
+    out = np.empty(value.shape, dtype=value.dtype)
+    is_valid = sut.get_value_into(out, chunk_size=7)
+
+    # Verify
+    assert [chunk.start for chunk in chunks] == list(range(0, flat.size, 100))
+    assert all(chunk.shape == value.shape for chunk in chunks)
+    assert np.array_equal(np.concatenate([chunk.values for chunk in chunks]), flat)
+    assert is_valid
+    assert np.array_equal(out, value)
+    assert np.array_equal(sut.get_state().value, value)
+
+
+def test_set_value_from_chunks_wrong_count(monkeypatch, engine, stub) -> None:
+    # Setup
+    monkeypatch_client_creation(monkeypatch, grpcmc.RealArrayDatapin, stub)
+    sut = grpcmc.RealArrayDatapin(ElementId(id_string="VAR"), engine)
+
+    # SUT
+    with pytest.raises(ValueError):
+        sut.set_value_from_chunks((2, 3), [np.zeros(4)])
+    with pytest.raises(ValueError):
+        sut.set_value_from_chunks((2, 3), [np.zeros(4), np.zeros(4)])
+
+
+def test_set_value_from_chunks_unsafe_cast(monkeypatch, engine, stub) -> None:
+    # Setup
+    monkeypatch_client_creation(monkeypatch, grpcmc.IntegerArrayDatapin, stub)
+    sut = grpcmc.IntegerArrayDatapin(ElementId(id_string="VAR"), engine)
+
+    # SUT
+    with pytest.raises(TypeError):
+        sut.set_value_from_chunks((2,), [np.array([1.5, 2.5])])
+
+
+def test_get_value_into_wrong_shape(monkeypatch, engine, stub) -> None:
+    # Setup
+    monkeypatch_client_creation(monkeypatch, grpcmc.RealArrayDatapin, stub)
+    sut = grpcmc.RealArrayDatapin(ElementId(id_string="VAR"), engine)
+    sut.set_value_from_chunks((2, 3), [np.zeros(6)])
+
+    # SUT
+    with pytest.raises(ValueError):
+        sut.get_value_into(np.empty((3, 2)))
+
+
+def test_iter_value_chunks_unknown_datapin(monkeypatch, engine, stub) -> None:
+    # Setup
+    monkeypatch_client_creation(monkeypatch, grpcmc.RealArrayDatapin, stub)
+    sut = grpcmc.RealArrayDatapin(ElementId(id_string="MISSING"), engine)
+
+    # SUT
+    with pytest.raises(grpcmc.InvalidInstanceError):
+        sut.iter_value_chunks()
@@ -704,3 +704,94 @@ def test_is_input_component(monkeypatch, engine, sut_type, flag_in_response):
 )
 def test_is_input_workflow(monkeypatch, engine, sut_type, flag_in_response):
     do_test_is_input_workflow(monkeypatch, engine, sut_type, flag_in_response)
+
+
+def test_metadata_cache_disabled_by_default(monkeypatch, engine) -> None:
+    # Set up
+    mock_client = MockWorkflowClientForDoubleVarTest()
+    with unittest.mock.patch.object(
+        mock_client, "DoubleVariableGetMetadata", return_value=DoubleVariableMetadata()
+    ) as mock_grpc_method:
+        monkeypatch_client_creation(monkeypatch, AbstractWorkflowElement, mock_client)
+        sut = RealDatapin(ElementId(id_string="VAR_UNDER_TEST_ID"), engine=engine)
+
+        # Execute
+        sut.get_metadata()
+        sut.get_metadata()
+
+        # Verify
+        assert mock_grpc_method.call_count == 2
+        assert len(engine.metadata_cache) == 0
+
+
+def test_metadata_cache_hits(monkeypatch, engine) -> None:
+    # Set up
+    mock_client = MockWorkflowClientForDoubleVarTest()
+    mock_response = DoubleVariableMetadata()
+    mock_response.base_metadata.description = "cached"
+    engine.metadata_cache.enabled = True
+    with unittest.mock.patch.object(
+        mock_client, "DoubleVariableGetMetadata", return_value=mock_response
+    ) as mock_grpc_method:
+        monkeypatch_client_creation(monkeypatch, AbstractWorkflowElement, mock_client)
+        sut = RealDatapin(ElementId(id_string="VAR_UNDER_TEST_ID"), engine=engine)
+
+        # Execute
+        first: atvi.RealMetadata = sut.get_metadata()
+        first.description = "modified by the caller"
+        second: atvi.RealMetadata = RealDatapin(
+            ElementId(id_string="VAR_UNDER_TEST_ID"), engine=engine
+        ).get_metadata()
+
+        # Verify
+        mock_grpc_method.assert_called_once()
+        assert second.description == "cached"
+        assert engine.metadata_cache.hits == 1
+        assert engine.metadata_cache.misses == 1
+
+
+def test_set_metadata_invalidates_cache(monkeypatch, engine) -> None:
+    # Set up
+    mock_client = MockWorkflowClientForDoubleVarTest()
+    engine.metadata_cache.enabled = True
+    with unittest.mock.patch.object(
+        mock_client, "DoubleVariableGetMetadata", return_value=DoubleVariableMetadata()
+    ) as mock_grpc_method:
+        monkeypatch_client_creation(monkeypatch, AbstractWorkflowElement, mock_client)
+        sut = RealDatapin(ElementId(id_string="VAR_UNDER_TEST_ID"), engine=engine)
+        sut.get_metadata()
+
+        # Execute
+        sut.set_metadata(atvi.RealMetadata())
+        sut.get_metadata()
+
+        # Verify
+        assert mock_grpc_method.call_count == 2
+
+
+def test_metadata_cache_evicts_least_recently_used(monkeypatch, engine) -> None:
+    # Set up
+    mock_client = MockWorkflowClientForDoubleVarTest()
+    engine.metadata_cache.enabled = True
+    engine.metadata_cache.max_size = 2
+    with unittest.mock.patch.object(
+        mock_client, "DoubleVariableGetMetadata", return_value=DoubleVariableMetadata()
+    ) as mock_grpc_method:
+        monkeypatch_client_creation(monkeypatch, AbstractWorkflowElement, mock_client)
+        first, second, third = (
+            RealDatapin(ElementId(id_string=name), engine=engine) for name in ("A", "B", "C")
+        )
+
+        # Execute
+        first.get_metadata()
+        second.get_metadata()
+        first.get_metadata()
+        third.get_metadata()
+        calls_before = mock_grpc_method.call_count
+        first.get_metadata()
+        second.get_metadata()
+
+        # Verify
+        assert calls_before == 3
+        assert mock_grpc_method.call_count == 4
+        assert len(engine.metadata_cache) == 2
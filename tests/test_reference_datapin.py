@@ -28,6 +28,8 @@ import ansys.api.modelcenter.v0.element_messages_pb2 as elem_msgs
 import ansys.api.modelcenter.v0.variable_value_messages_pb2 as var_msgs
 import ansys.api.modelcenter.v0.workflow_messages_pb2 as wkfl_msgs
 import ansys.tools.variableinterop as atvi
+import grpc
+import numpy
 import pytest
 
 from ansys.modelcenter.workflow.api import IReferenceArrayProperty, IReferenceProperty
@@ -36,9 +38,13 @@ from ansys.modelcenter.workflow.grpc_modelcenter import ReferenceArrayProperty,
 from ansys.modelcenter.workflow.grpc_modelcenter.abstract_workflow_element import (
     AbstractWorkflowElement,
 )
+from ansys.modelcenter.workflow.grpc_modelcenter.reference_datapin import (
+    ReferenceArrayDatapinElement,
+)
 
 from .grpc_server_test_utils.client_creation_monkeypatch import monkeypatch_client_creation
 from .grpc_server_test_utils.mock_file_value import MockFileValue
+from .grpc_server_test_utils.mock_grpc_exception import MockGrpcError
 from .test_datapin import do_get_state_test, do_get_state_test_with_hid
 
 
@@ -128,6 +134,36 @@ def test_set_reference_equation(monkeypatch, engine) -> None:
         mock_grpc_method.assert_called_once_with(expected_request)
 
 
+class MockFlakyEquationClient(MockWorkflowClientForRefVarTest):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def ReferenceVariableSetReferenceEquation(self, request):
+        self.calls += 1
+        raise MockGrpcError(grpc.StatusCode.UNAVAILABLE, "Simulated failure.")
+
+
+@pytest.mark.parametrize("is_array_element", [False, True])
+def test_set_reference_equation_is_not_retried(monkeypatch, engine, is_array_element) -> None:
+    # Arrange
+    engine._retry_policy = grpcmc.RetryPolicy(initial_backoff=0.001, max_backoff=0.001)
+    mock_client = MockFlakyEquationClient()
+    monkeypatch_client_creation(monkeypatch, AbstractWorkflowElement, mock_client)
+    sut_element_id = elem_msgs.ElementId(id_string="VAR_UNDER_TEST_ID")
+    if is_array_element:
+        sut = grpcmc.ReferenceArrayDatapin(sut_element_id, engine)[4]
+    else:
+        sut = grpcmc.ReferenceDatapin(sut_element_id, engine)
+
+    # Act
+    with pytest.raises(grpcmc.EngineDisconnectedError):
+        sut.equation = "ඞ"
+
+    # Assert
+    assert mock_client.calls == 1
+
+
 @pytest.mark.parametrize("is_direct", [True, False])
 def test_get_is_direct(monkeypatch, engine, is_direct) -> None:
     # Arrange
@@ -1051,3 +1087,130 @@ def test_array_extend(monkeypatch, engine) -> None:
                 target=sut_element_id, new_size=7
             )
             mock_grpc_method.assert_called_once_with(expected_length_request)
+
+
+class MockReferenceArrayClient(MockWorkflowClientForRefVarTest):
+    """Serves a reference array whose elements refer to stored values."""
+
+    def __init__(self, values):
+        super().__init__()
+        self.values = list(values)
+        self.length_requests = 0
+        self.get_requests = []
+        self.set_requests = []
+
+    def ReferenceArrayGetLength(self, request):
+        self.length_requests += 1
+        return var_msgs.IntegerValue(value=len(self.values))
+
+    def ReferenceVariableGetValue(self, request):
+        self.get_requests.append(request)
+        return var_msgs.VariableState(value=self.values[request.index], is_valid=request.index != 1)
+
+    def ReferenceVariableSetValue(self, request):
+        self.set_requests.append(request)
+        return var_msgs.SetVariableValueResponse(was_changed=True)
+
+
+@pytest.fixture
+def ref_array_client(monkeypatch) -> MockReferenceArrayClient:
+    mock_client = MockReferenceArrayClient(
+        var_msgs.VariableValue(double_value=float(value)) for value in range(5)
+    )
+    monkeypatch_client_creation(monkeypatch, AbstractWorkflowElement, mock_client)
+    return mock_client
+
+
+@pytest.mark.parametrize(
+    "index,expected",
+    [
+        pytest.param(slice(None), [0, 1, 2, 3, 4]),
+        pytest.param(slice(1, 3), [1, 2]),
+        pytest.param(slice(None, None, 2), [0, 2, 4]),
+        pytest.param(slice(-2, None), [3, 4]),
+        pytest.param(slice(3, 1), []),
+    ],
+)
+def test_array_slice(ref_array_client, engine, index, expected) -> None:
+    sut = grpcmc.ReferenceArrayDatapin(elem_msgs.ElementId(id_string="REF_ARRAY"), engine)
+
+    # Act
+    result = sut[index]
+
+    # Assert
+    assert all(isinstance(element, ReferenceArrayDatapinElement) for element in result)
+    assert [element._index for element in result] == expected
+    assert ref_array_client.length_requests == 1
+
+
+@pytest.mark.parametrize(
+    "indices,expected_indices,expected_length_requests",
+    [
+        pytest.param(None, [0, 1, 2, 3, 4], 1),
+        pytest.param(slice(2, None), [2, 3, 4], 1),
+        pytest.param([4, 0], [4, 0], 0),
+        pytest.param([-1], [4], 1),
+    ],
+)
+def test_array_get_states(
+    ref_array_client, engine, indices, expected_indices, expected_length_requests
+) -> None:
+    sut = grpcmc.ReferenceArrayDatapin(elem_msgs.ElementId(id_string="REF_ARRAY"), engine)
+
+    # Act
+    result = sut.get_states(indices)
+
+    # Assert
+    assert result.dtype == numpy.float64
+    assert result.data.tolist() == [float(index) for index in expected_indices]
+    assert result.mask.tolist() == [index == 1 for index in expected_indices]
+    assert [request.index for request in ref_array_client.get_requests] == expected_indices
+    assert ref_array_client.length_requests == expected_length_requests
+
+
+def test_array_get_states_mixed_types(ref_array_client, engine) -> None:
+    ref_array_client.values[2] = var_msgs.VariableValue(string_value="two")
+    sut = grpcmc.ReferenceArrayDatapin(elem_msgs.ElementId(id_string="REF_ARRAY"), engine)
+
+    # Act
+    result = sut.get_states([0, 2])
+
+    # Assert
+    assert result.dtype == object
+    assert result.tolist() == [atvi.RealValue(0.0), atvi.StringValue("two")]
+
+
+@pytest.mark.parametrize(
+    "values,indices,expected_indices",
+    [
+        pytest.param(numpy.array([1.5, 2.5]), None, [0, 1]),
+        pytest.param([atvi.RealValue(1.5), atvi.RealValue(2.5)], [3, 1], [3, 1]),
+        pytest.param([atvi.VariableState(atvi.RealValue(1.5), True), 2.5], slice(-2, None), [3, 4]),
+    ],
+)
+def test_array_set_states(ref_array_client, engine, values, indices, expected_indices) -> None:
+    sut = grpcmc.ReferenceArrayDatapin(elem_msgs.ElementId(id_string="REF_ARRAY"), engine)
+
+    # Act
+    sut.set_states(values, indices)
+
+    # Assert
+    assert ref_array_client.set_requests == [
+        var_msgs.SetReferenceValueRequest(
+            target=elem_msgs.ElementId(id_string="REF_ARRAY"),
+            index=index,
+            new_value=var_msgs.VariableValue(double_value=value),
+        )
+        for index, value in zip(expected_indices, [1.5, 2.5])
+    ]
+
+
+def test_array_set_states_disallowed(ref_array_client, engine) -> None:
+    sut = grpcmc.ReferenceArrayDatapin(elem_msgs.ElementId(id_string="REF_ARRAY"), engine)
+
+    # Act / Assert
+    with pytest.raises(atvi.IncompatibleTypesException):
+        sut.set_states([atvi.RealArrayValue(values=[1.0])])
+    with pytest.raises(ValueError, match="number of indices"):
+        sut.set_states([1.0, 2.0], [0])
+    assert ref_array_client.set_requests == []
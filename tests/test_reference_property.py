@@ -27,6 +27,7 @@ from unittest.mock import MagicMock
 import ansys.api.modelcenter.v0.element_messages_pb2 as elem_msgs
 import ansys.api.modelcenter.v0.variable_value_messages_pb2 as var_msgs
 import ansys.tools.variableinterop as atvi
+import numpy
 import pytest
 
 import ansys.modelcenter.workflow.grpc_modelcenter as grpcmc
@@ -588,3 +589,105 @@ def test_reference_array_property_get_type(
 
     # Assert: Result is properly converted
     assert result == expected_result
+
+
+class MockReferencePropertyClient:
+    """Serves a reference array property with one stored value per index."""
+
+    def __init__(self, values):
+        self.values = list(values)
+        self.length_requests = 0
+        self.get_requests = []
+        self.set_requests = []
+
+    def ReferenceArrayGetLength(self, request):
+        self.length_requests += 1
+        return var_msgs.IntegerValue(value=len(self.values))
+
+    def ReferencePropertyGetValue(self, request):
+        self.get_requests.append(request)
+        return var_msgs.VariableState(value=self.values[request.index], is_valid=request.index != 2)
+
+    def ReferencePropertySetValue(self, request):
+        self.set_requests.append(request)
+        return var_msgs.SetVariableValueResponse(was_changed=True)
+
+
+@pytest.fixture
+def property_client(monkeypatch) -> MockReferencePropertyClient:
+    mock_client = MockReferencePropertyClient(
+        var_msgs.VariableValue(int_value=10 * index) for index in range(4)
+    )
+    monkeypatch_client_creation(monkeypatch, ReferenceArrayProperty, mock_client)
+    return mock_client
+
+
+def _array_property(engine) -> ReferenceArrayProperty:
+    return grpcmc.ReferenceArrayProperty(
+        element_id=elem_msgs.ElementId(id_string="REF_ARRAY"), name="weight", engine=engine
+    )
+
+
+@pytest.mark.parametrize(
+    "indices,expected_indices,expected_length_requests",
+    [
+        pytest.param(None, [0, 1, 2, 3], 1),
+        pytest.param(range(1, 3), [1, 2], 0),
+        pytest.param(slice(None, None, -2), [3, 1], 1),
+        pytest.param(numpy.array([3, 0]), [3, 0], 0),
+        pytest.param(numpy.array([True, False, False, True]), [0, 3], 0),
+        pytest.param([-1, 0], [3, 0], 1),
+    ],
+)
+def test_get_states_at(
+    property_client, engine, indices, expected_indices, expected_length_requests
+) -> None:
+    sut = _array_property(engine)
+
+    # Act
+    result = sut.get_states_at(indices)
+
+    # Assert
+    assert result.dtype == numpy.int64
+    assert result.data.tolist() == [10 * index for index in expected_indices]
+    assert result.mask.tolist() == [index == 2 for index in expected_indices]
+    assert [request.index for request in property_client.get_requests] == expected_indices
+    assert all(
+        request.target_prop.prop_name == "weight" for request in property_client.get_requests
+    )
+    assert property_client.length_requests == expected_length_requests
+
+
+@pytest.mark.parametrize(
+    "indices,values,expected",
+    [
+        pytest.param([0, 2], numpy.array([1.5, 2.5]), [(0, 1.5), (2, 2.5)]),
+        pytest.param(slice(1, None), [atvi.RealValue(7.0)] * 3, [(1, 7.0), (2, 7.0), (3, 7.0)]),
+        pytest.param(numpy.array([False, True, True, False]), 0.5, [(1, 0.5), (2, 0.5)]),
+        pytest.param([3], [atvi.VariableState(atvi.RealValue(4.0), is_valid=True)], [(3, 4.0)]),
+    ],
+)
+def test_set_values_at(property_client, engine, indices, values, expected) -> None:
+    sut = _array_property(engine)
+
+    # Act
+    sut.set_values_at(indices, values)
+
+    # Assert
+    assert [
+        (request.target_prop.index, request.new_value.double_value)
+        for request in property_client.set_requests
+    ] == expected
+    assert all(
+        request.target_prop.target_prop.prop_name == "weight"
+        for request in property_client.set_requests
+    )
+
+
+def test_set_values_at_mismatched_lengths(property_client, engine) -> None:
+    sut = _array_property(engine)
+
+    # Act / Assert
+    with pytest.raises(ValueError, match="number of indices"):
+        sut.set_values_at([0, 1], [1.0])
+    assert property_client.set_requests == []
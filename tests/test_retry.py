@@ -0,0 +1,215 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import asyncio
+import time
+from typing import List, Optional
+
+import grpc
+import pytest
+
+import ansys.modelcenter.workflow.grpc_modelcenter as grpcmc
+from ansys.modelcenter.workflow.grpc_modelcenter.grpc_error_interpretation import (
+    WRAP_TARGET_NOT_FOUND,
+    interpret_rpc_error,
+)
+from tests.grpc_server_test_utils.mock_grpc_exception import MockGrpcError
+
+
+class MockEngine:
+    def __init__(self, retry_policy: Optional[grpcmc.RetryPolicy]) -> None:
+        self._retry_policy = retry_policy
+
+
+class FlakyElement:
+    """Element whose calls fail with the given codes before succeeding."""
+
+    def __init__(
+        self, engine: MockEngine, failures: List[grpc.StatusCode], delay: float = 0.0
+    ) -> None:
+        self._engine = engine
+        self.failures = failures
+        self.delay = delay
+        self.calls = 0
+
+    def _call(self) -> str:
+        self.calls += 1
+        time.sleep(self.delay)
+        if len(self.failures) > 0:
+            raise MockGrpcError(self.failures.pop(0), "Simulated failure.")
+        return "value"
+
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
+    def read(self) -> str:
+        return self._call()
+
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND)
+    def write(self) -> str:
+        return self._call()
+
+    @interpret_rpc_error(WRAP_TARGET_NOT_FOUND, idempotent=True)
+    async def read_async(self) -> str:
+        return self._call()
+
+
+def fast_policy(**kwargs) -> grpcmc.RetryPolicy:
+    return grpcmc.RetryPolicy(initial_backoff=0.001, max_backoff=0.001, **kwargs)
+
+
+def test_idempotent_call_is_retried() -> None:
+    # Setup
+    policy = fast_policy()
+    sut = FlakyElement(
+        MockEngine(policy), [grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.DEADLINE_EXCEEDED]
+    )
+
+    # SUT
+    result = sut.read()
+
+    # Verification
+    assert result == "value"
+    assert sut.calls == 3
+    assert policy.statistics == grpcmc.RetryStatistics(retries=2, recovered=1, exhausted=0)
+
+
+def test_idempotent_coroutine_is_retried() -> None:
+    # Setup
+    policy = fast_policy()
+    sut = FlakyElement(MockEngine(policy), [grpc.StatusCode.UNAVAILABLE])
+
+    # SUT
+    result = asyncio.run(sut.read_async())
+
+    # Verification
+    assert result == "value"
+    assert policy.statistics == grpcmc.RetryStatistics(retries=1, recovered=1, exhausted=0)
+
+
+def test_mutating_call_is_not_retried() -> None:
+    # Setup
+    policy = fast_policy()
+    sut = FlakyElement(MockEngine(policy), [grpc.StatusCode.UNAVAILABLE])
+
+    # SUT
+    with pytest.raises(grpcmc.EngineDisconnectedError):
+        sut.write()
+
+    # Verification
+    assert sut.calls == 1
+    assert policy.statistics == grpcmc.RetryStatistics(retries=0, recovered=0, exhausted=0)
+
+
+def test_call_is_not_retried_without_policy() -> None:
+    # Setup
+    sut = FlakyElement(MockEngine(None), [grpc.StatusCode.UNAVAILABLE])
+
+    # SUT
+    with pytest.raises(grpcmc.EngineDisconnectedError):
+        sut.read()
+
+    # Verification
+    assert sut.calls == 1
+
+
+def test_non_transient_error_is_not_retried() -> None:
+    # Setup
+    policy = fast_policy()
+    sut = FlakyElement(MockEngine(policy), [grpc.StatusCode.NOT_FOUND])
+
+    # SUT
+    with pytest.raises(grpcmc.InvalidInstanceError):
+        sut.read()
+
+    # Verification
+    assert sut.calls == 1
+
+
+def test_retries_stop_after_max_attempts() -> None:
+    # Setup
+    policy = fast_policy(max_attempts=3)
+    sut = FlakyElement(MockEngine(policy), [grpc.StatusCode.UNAVAILABLE] * 5)
+
+    # SUT
+    with pytest.raises(grpcmc.EngineDisconnectedError):
+        sut.read()
+
+    # Verification
+    assert sut.calls == 3
+    assert policy.statistics == grpcmc.RetryStatistics(retries=2, recovered=0, exhausted=1)
+
+
+def test_retries_stop_at_total_timeout() -> None:
+    # Setup
+    policy = grpcmc.RetryPolicy(initial_backoff=10, max_backoff=10, total_timeout=0)
+    sut = FlakyElement(MockEngine(policy), [grpc.StatusCode.UNAVAILABLE])
+
+    # SUT
+    with pytest.raises(grpcmc.EngineDisconnectedError):
+        sut.read()
+
+    # Verification
+    assert sut.calls == 1
+    assert policy.statistics.exhausted == 1
+
+
+def test_total_timeout_counts_first_attempt() -> None:
+    # Setup: the first attempt alone takes longer than the total timeout.
+    policy = fast_policy(total_timeout=0.05)
+    sut = FlakyElement(MockEngine(policy), [grpc.StatusCode.UNAVAILABLE], delay=0.1)
+
+    # SUT
+    with pytest.raises(grpcmc.EngineDisconnectedError):
+        sut.read()
+
+    # Verification
+    assert sut.calls == 1
+    assert policy.statistics == grpcmc.RetryStatistics(retries=0, recovered=0, exhausted=1)
+
+
+def test_backoff_is_jittered_below_exponential_limit() -> None:
+    # Setup
+    sut = grpcmc.RetryPolicy(initial_backoff=0.1, max_backoff=0.5, backoff_multiplier=2.0)
+
+    # SUT
+    backoffs = [[sut.get_backoff(retry_number) for _ in range(50)] for retry_number in range(4)]
+
+    # Verification
+    for retry_number, limit in enumerate([0.1, 0.2, 0.4, 0.5]):
+        assert all(0 <= backoff <= limit for backoff in backoffs[retry_number])
+        assert len(set(backoffs[retry_number])) > 1
+
+
+def test_reset_statistics() -> None:
+    # Setup
+    policy = fast_policy()
+    FlakyElement(MockEngine(policy), [grpc.StatusCode.UNAVAILABLE]).read()
+
+    # SUT
+    policy.reset_statistics()
+
+    # Verification
+    assert policy.statistics == grpcmc.RetryStatistics(retries=0, recovered=0, exhausted=0)
+
+
+def test_max_attempts_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        grpcmc.RetryPolicy(max_attempts=0)
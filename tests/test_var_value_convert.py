@@ -27,6 +27,7 @@ from typing import Optional
 
 import ansys.api.modelcenter.v0.variable_value_messages_pb2 as grpc_msg
 import ansys.tools.variableinterop as atvi
+import numpy as np
 import pytest
 
 import ansys.modelcenter.workflow.grpc_modelcenter as grpcmc
@@ -754,3 +755,74 @@ def test_file_array_value_atvi_to_grpc_multi_dimensional():
             ],
         )
         assert converted.file_array_value == expected_value
+
+
+@pytest.mark.parametrize(
+    "column,expected_type",
+    [
+        pytest.param(np.array([1.5, 2.5]), atvi.RealValue, id="real"),
+        pytest.param(np.array([1, 2], dtype=np.int32), atvi.IntegerValue, id="int"),
+        pytest.param(np.array([True, False]), atvi.BooleanValue, id="bool"),
+        pytest.param(np.array(["a", "b"]), atvi.StringValue, id="string"),
+        pytest.param(np.array([[1.0, 2.0], [3.0, 4.0]]), atvi.RealArrayValue, id="real array"),
+        pytest.param(np.array([[1, 2], [3, 4]]), atvi.IntegerArrayValue, id="int array"),
+    ],
+)
+def test_numpy_column_to_interop(column: np.ndarray, expected_type: type) -> None:
+    # Execute
+    converted = test_module.convert_numpy_column_to_interop(column)
+
+    # Verify
+    assert len(converted) == 2
+    assert all(type(value) == expected_type for value in converted)
+    for original, value in zip(column, converted):
+        np.testing.assert_array_equal(np.asarray(value), original)
+
+
+def test_numpy_object_column_to_interop() -> None:
+    # Setup
+    column = np.array([atvi.StringValue("x"), 3.0, 4], dtype=object)
+
+    # Execute
+    converted = test_module.convert_numpy_column_to_interop(column)
+
+    # Verify
+    assert converted == [atvi.StringValue("x"), atvi.RealValue(3.0), atvi.IntegerValue(4)]
+
+
+def test_numpy_column_to_interop_unsupported_dtype() -> None:
+    with pytest.raises(grpcmc.ValueTypeNotSupportedError):
+        test_module.convert_numpy_column_to_interop(np.array([1 + 2j]))
+
+
+def test_states_to_masked_column_typed() -> None:
+    # Setup
+    states = [
+        atvi.VariableState(atvi.RealValue(1.5), True),
+        atvi.VariableState(atvi.RealValue(2.5), False),
+        None,
+    ]
+
+    # Execute
+    column = test_module.convert_interop_states_to_masked_column(states)
+
+    # Verify
+    assert column.dtype == np.float64
+    np.testing.assert_array_equal(column.data, [1.5, 2.5, 0.0])
+    np.testing.assert_array_equal(column.mask, [False, True, True])
+
+
+def test_states_to_masked_column_mixed() -> None:
+    # Setup
+    states = [
+        atvi.VariableState(atvi.RealValue(1.5), True),
+        atvi.VariableState(atvi.RealArrayValue(values=[1.0, 2.0]), True),
+    ]
+
+    # Execute
+    column = test_module.convert_interop_states_to_masked_column(states)
+
+    # Verify
+    assert column.dtype == object
+    assert column[0] == atvi.RealValue(1.5)
+    np.testing.assert_array_equal(column[1], [1.0, 2.0])
@@ -25,11 +25,14 @@
 from typing import Iterable, List, Mapping, Type
 import unittest
 
+import ansys.api.modelcenter.v0.custom_metadata_messages_pb2 as meta_msgs
 import ansys.api.modelcenter.v0.element_messages_pb2 as elem_msgs  # noqa: 501
 import ansys.api.modelcenter.v0.variable_value_messages_pb2 as var_msgs  # noqa: 501
 import ansys.api.modelcenter.v0.workflow_messages_pb2 as wkf_msgs  # noqa: 501
 import ansys.engineeringworkflow.api as ewapi
 import ansys.tools.variableinterop as atvi
+import grpc
+import numpy
 import pytest
 
 import ansys.modelcenter.workflow.api as mcapi
@@ -37,6 +40,7 @@ import ansys.modelcenter.workflow.grpc_modelcenter as grpcmc
 
 from .grpc_server_test_utils.client_creation_monkeypatch import monkeypatch_client_creation
 from .grpc_server_test_utils.mock_file_value import MockFileValue
+from .grpc_server_test_utils.mock_grpc_exception import MockGrpcError
 
 
 class MockWorkflowClientForWorkflowTest:
@@ -48,6 +52,7 @@ class MockWorkflowClientForWorkflowTest:
         self.was_link_created: bool = False
         self.workflow_run_requests: List[wkf_msgs.WorkflowRunRequest] = []
         self.workflow_run_response = wkf_msgs.WorkflowRunResponse()
+        self.element_lookups: int = 0
 
     def AssemblyGetAssembliesAndComponents(
         self, request: elem_msgs.ElementId
@@ -148,6 +153,7 @@ class MockWorkflowClientForWorkflowTest:
         return response
 
     def WorkflowGetElementByName(self, request: elem_msgs.ElementName):
+        self.element_lookups += 1
         response = wkf_msgs.ElementInfo()
         response.id.id_string = request.element_full_name.name.replace(".", "_").upper()
         if request.element_full_name.name == "a.component":
@@ -230,6 +236,15 @@ class MockWorkflowClientForWorkflowTest:
         return response
 
     def VariableGetState(self, request: wkf_msgs.ElementIdOrName) -> var_msgs.VariableState:
+        if request.HasField("target_id"):
+            # Datapins created by WorkflowGetElementByName have upper-cased IDs.
+            request = wkf_msgs.ElementIdOrName(
+                target_name=wkf_msgs.NamedElementWorkflow(
+                    element_full_name=elem_msgs.ElementName(
+                        name=request.target_id.id_string.replace("_", ".").lower()
+                    )
+                )
+            )
         response = var_msgs.VariableState()
         if request.target_name.element_full_name.name == "model.boolean":
             response.value.bool_value = False
@@ -306,6 +321,18 @@ class MockWorkflowClientForWorkflowTest:
         self.workflow_run_requests.append(request)
         return wkf_msgs.WorkflowStartRunResponse()
 
+    def PropertyOwnerGetProperties(
+        self, request: elem_msgs.ElementId
+    ) -> meta_msgs.MetadataPropertyNamesResponse:
+        return meta_msgs.MetadataPropertyNamesResponse(names=["lowerBound", "upperBound"])
+
+    def PropertyOwnerGetPropertyValue(
+        self, request: meta_msgs.MetadataGetValueRequest
+    ) -> var_msgs.VariableValue:
+        return var_msgs.VariableValue(
+            string_value=request.id.id_string + "/" + request.property_name
+        )
+
     def ElementGetFullName(self, request: elem_msgs.ElementId) -> elem_msgs.ElementName:
         if request.id_string == "WORKFLOW_COMP_OUTPUT4":
             return elem_msgs.ElementName(name="Workflow.comp.output4")
@@ -341,6 +368,9 @@ class MockWorkflowClientForWorkflowTest:
     def FileArraySetValue(self, request):
         pass
 
+    def AssemblyRename(self, request: elem_msgs.RenameRequest) -> elem_msgs.RenameResponse:
+        return elem_msgs.RenameResponse()
+
     def WorkflowMoveComponent(
         self, request: wkf_msgs.MoveComponentRequest
     ) -> elem_msgs.ElementIndexParentResponse:
@@ -412,6 +442,18 @@ def test_workflow_close(setup_function) -> None:
     assert mock_client.was_closed
 
 
+def test_workflow_close_releases_workflow(setup_function, engine) -> None:
+    # Setup
+    other = grpcmc.Workflow("456", "C:\\asdf\\other.pxcz", engine=engine)
+    engine._loaded_workflows.extend([workflow, other])
+
+    # Execute
+    workflow.close_workflow()
+
+    # Verify
+    assert engine._loaded_workflows == [other]
+
+
 def test_workflow_auto_close(setup_function, engine) -> None:
     # Setup
     with unittest.mock.patch.object(
@@ -566,6 +608,93 @@ def test_set_value(
     assert mock_grpc_method.call_args[0][0].new_value == expected
 
 
+@pytest.mark.parametrize("request_method,name,expected_id,src,expected", set_value_tests)
+def test_set_values(
+    setup_function,
+    request_method: str,
+    name: str,
+    expected_id: str,
+    src: atvi.IVariableValue,
+    expected: str,
+):
+    # Setup
+    with unittest.mock.patch.object(
+        mock_client,
+        request_method,
+        autospec=True,
+        return_value=var_msgs.SetVariableValueResponse(was_changed=True),
+    ) as mock_grpc_method:
+        # SUT
+        workflow.set_values({name: src})
+
+    # Verify
+    mock_grpc_method.assert_called_once()
+    assert mock_grpc_method.call_args[0][0].target == elem_msgs.ElementId(id_string=expected_id)
+    assert mock_grpc_method.call_args[0][0].new_value == expected
+
+
+def test_set_values_resolves_names_once(setup_function):
+    # Setup
+    workflow.name_cache.enabled = True
+    workflow.get_datapin("model.double")
+    set_double = unittest.mock.patch.object(
+        mock_client,
+        "DoubleVariableSetValue",
+        autospec=True,
+        return_value=var_msgs.SetVariableValueResponse(was_changed=True),
+    )
+    set_string = unittest.mock.patch.object(
+        mock_client,
+        "StringVariableSetValue",
+        autospec=True,
+        return_value=var_msgs.SetVariableValueResponse(was_changed=True),
+    )
+    with set_double as mock_set_double, set_string as mock_set_string:
+        # SUT
+        workflow.set_values(
+            {"model.double": atvi.RealValue(1.5), "model.string": atvi.StringValue("strVal")}
+        )
+
+    # Verify
+    assert mock_client.element_lookups == 2
+    mock_set_double.assert_called_once()
+    mock_set_string.assert_called_once()
+
+
+def test_set_values_reports_all_failures(setup_function):
+    # Setup
+    def fail_for_doubles(request):
+        raise MockGrpcError(grpc.StatusCode.INVALID_ARGUMENT, "Value out of range.")
+
+    set_double = unittest.mock.patch.object(
+        mock_client, "DoubleVariableSetValue", autospec=True, side_effect=fail_for_doubles
+    )
+    set_string = unittest.mock.patch.object(
+        mock_client,
+        "StringVariableSetValue",
+        autospec=True,
+        return_value=var_msgs.SetVariableValueResponse(was_changed=True),
+    )
+    with set_double, set_string as mock_set_string:
+        # SUT
+        with pytest.raises(grpcmc.SetValuesError) as err:
+            workflow.set_values(
+                {
+                    "model.double": atvi.RealValue(1.5),
+                    "a.component": atvi.RealValue(2.5),
+                    "model.string": atvi.StringValue("strVal"),
+                    "model.boolean": atvi.RealArrayValue(values=[1.5]),
+                }
+            )
+
+    # Verify
+    assert set(err.value.errors.keys()) == {"model.double", "a.component", "model.boolean"}
+    assert isinstance(err.value.errors["model.double"], ValueError)
+    assert isinstance(err.value.errors["model.double"].__cause__, grpc.RpcError)
+    assert isinstance(err.value.errors["a.component"], ValueError)
+    mock_set_string.assert_called_once()
+
+
 get_value_tests = [
     pytest.param("model.boolean", atvi.BooleanValue(False), id="bool"),
     pytest.param("model.integer", atvi.IntegerValue(42), id="int"),
@@ -637,6 +766,81 @@ def test_remove_component(setup_function):
     assert mock_client.was_component_removed
 
 
+def test_name_cache_disabled_by_default(setup_function):
+    # SUT
+    workflow.get_datapin("model.double")
+    workflow.get_datapin("model.double")
+
+    # Verify
+    assert not workflow.name_cache.enabled
+    assert mock_client.element_lookups == 2
+    assert workflow.name_cache.hits == 0
+    assert workflow.name_cache.misses == 0
+
+
+def test_name_cache_hits(setup_function):
+    # Setup
+    workflow.name_cache.enabled = True
+
+    # SUT
+    first = workflow.get_datapin("model.double")
+    second = workflow.get_datapin("model.double")
+    metadata = workflow.get_datapin_meta_data("model.double")
+    component = workflow.get_component("a.component")
+
+    # Verify
+    assert first == second
+    assert isinstance(metadata, atvi.RealMetadata)
+    assert isinstance(component, grpcmc.Component)
+    assert mock_client.element_lookups == 2
+    assert workflow.name_cache.hits == 2
+    assert workflow.name_cache.misses == 2
+    assert len(workflow.name_cache) == 2
+
+
+def test_name_cache_explicit_invalidate(setup_function):
+    # Setup
+    workflow.name_cache.enabled = True
+    workflow.get_datapin("model.double")
+
+    # SUT
+    workflow.name_cache.invalidate()
+    workflow.get_datapin("model.double")
+
+    # Verify
+    assert mock_client.element_lookups == 2
+    assert workflow.name_cache.misses == 2
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        pytest.param(lambda: workflow.remove_component("a.component"), id="remove_component"),
+        pytest.param(
+            lambda: workflow.move_component("a.component", "a.assembly"), id="move_component"
+        ),
+        pytest.param(lambda: workflow.create_assembly("new", "Model"), id="create_assembly"),
+        pytest.param(lambda: workflow.get_assembly("a.assembly").rename("b"), id="rename"),
+        pytest.param(lambda: workflow.close_workflow(), id="close_workflow"),
+    ],
+)
+def test_name_cache_invalidated_by_mutation(setup_function, mutate):
+    # Setup
+    workflow.name_cache.enabled = True
+    workflow.get_datapin("model.double")
+    workflow.get_datapin("model.double")
+    lookups_before = mock_client.element_lookups
+
+    # SUT
+    mutate()
+    lookups_during = mock_client.element_lookups
+    workflow.get_datapin("model.double")
+
+    # Verify
+    assert mock_client.element_lookups == lookups_during + 1
+    assert lookups_during >= lookups_before
+
+
 @pytest.mark.parametrize("name", [pytest.param("a.assembly"), pytest.param(None)])
 def test_get_assembly(setup_function, name: str):
     # SUT
@@ -769,6 +973,41 @@ def test_get_links(setup_function, workflow_id: str, link_lhs_values: Iterable[s
     assert [link.lhs for link in links] == link_lhs_values
 
 
+def test_get_all_properties(setup_function, engine) -> None:
+    component = grpcmc.Component(elem_msgs.ElementId(id_string="OTHER_COMP"), engine)
+
+    # SUT
+    result = workflow.get_all_properties(["a.component", component])
+
+    # Verification
+    assert list(result) == ["a.component", "OTHER_COMP"]
+    assert result["a.component"] == {
+        name: ewapi.Property(
+            parent_element_id="A_COMPONENT",
+            property_name=name,
+            property_value=atvi.StringValue("A_COMPONENT/" + name),
+        )
+        for name in ["lowerBound", "upperBound"]
+    }
+    assert result["OTHER_COMP"]["upperBound"].property_value == atvi.StringValue(
+        "OTHER_COMP/upperBound"
+    )
+
+
+def test_get_all_properties_subset(setup_function) -> None:
+    # SUT
+    result = workflow.get_all_properties(["a.component", "a.assembly"], ["upperBound"])
+
+    # Verification
+    assert {name: list(properties) for name, properties in result.items()} == {
+        "a.component": ["upperBound"],
+        "a.assembly": ["upperBound"],
+    }
+    assert result["a.assembly"]["upperBound"].property_value == atvi.StringValue(
+        "A_ASSEMBLY/upperBound"
+    )
+
+
 def test_get_uuid(setup_function) -> None:
     # Execute
     result: str = workflow.get_workflow_uuid()
@@ -1490,6 +1729,194 @@ def test_get_state(setup_function, mock_state, expected_state):
     assert expected_state == response
 
 
+class _MockFuture:
+    def __init__(self, result) -> None:
+        self._result = result
+        self.was_cancelled = False
+
+    def result(self):
+        return self._result
+
+    def cancel(self) -> bool:
+        self.was_cancelled = True
+        return True
+
+
+class _MockPipelinedWorkflowRun:
+    """Stands in for a stub method, recording how many calls were outstanding."""
+
+    def __init__(self) -> None:
+        self.requests: List[wkf_msgs.WorkflowRunRequest] = []
+        self.max_outstanding = 0
+        self._outstanding = 0
+
+    def __call__(self, request: wkf_msgs.WorkflowRunRequest) -> wkf_msgs.WorkflowRunResponse:
+        raise AssertionError("Pipelined calls should use future().")
+
+    def future(self, request: wkf_msgs.WorkflowRunRequest) -> _MockFuture:
+        self.requests.append(request)
+        self._outstanding += 1
+        self.max_outstanding = max(self.max_outstanding, self._outstanding)
+        response = wkf_msgs.WorkflowRunResponse()
+        doubled = 2 * request.inputs["Model.x"].value.double_value
+        response.results["Model.y"].is_valid = doubled >= 0
+        response.results["Model.y"].value.double_value = doubled
+        future = _MockFuture(response)
+        original_result = future.result
+
+        def result():
+            self._outstanding -= 1
+            return original_result()
+
+        future.result = result
+        return future
+
+
+def test_run_many_with_columns(setup_function) -> None:
+    # Setup
+    mock_run = _MockPipelinedWorkflowRun()
+    mock_client.WorkflowRun = mock_run
+
+    # SUT
+    result = workflow.run_many(
+        {"Model.x": numpy.array([1.0, -2.0, 3.0, 4.5, 5.0])},
+        validation_names={"Model.y"},
+        max_in_flight=2,
+    )
+
+    # Verification
+    assert len(mock_run.requests) == 5
+    assert mock_run.max_outstanding == 2
+    assert [r.inputs["Model.x"].value.double_value for r in mock_run.requests] == [
+        1.0,
+        -2.0,
+        3.0,
+        4.5,
+        5.0,
+    ]
+    assert all(list(r.validation_names) == ["Model.y"] for r in mock_run.requests)
+    assert set(result.keys()) == {"Model.y"}
+    assert result["Model.y"].dtype == numpy.float64
+    numpy.testing.assert_array_equal(result["Model.y"].data, [2.0, -4.0, 6.0, 9.0, 10.0])
+    numpy.testing.assert_array_equal(result["Model.y"].mask, [False, True, False, False, False])
+
+
+def test_run_many_with_rows(setup_function) -> None:
+    # Setup
+    response = wkf_msgs.WorkflowRunResponse()
+    response.results["Model.out"].is_valid = True
+    response.results["Model.out"].value.int_value = 7
+    mock_client.workflow_run_response = response
+    rows = [
+        {"Model.in": atvi.VariableState(atvi.IntegerValue(1), True)},
+        {"Model.in": atvi.VariableState(atvi.IntegerValue(2), False)},
+    ]
+
+    # SUT
+    result = workflow.run_many(rows, reset=True)
+
+    # Verification
+    assert [r.inputs["Model.in"].value.int_value for r in mock_client.workflow_run_requests] == [
+        1,
+        2,
+    ]
+    assert [r.inputs["Model.in"].is_valid for r in mock_client.workflow_run_requests] == [
+        True,
+        False,
+    ]
+    assert all(r.reset for r in mock_client.workflow_run_requests)
+    numpy.testing.assert_array_equal(result["Model.out"], [7, 7])
+    assert result["Model.out"].dtype == numpy.int64
+
+
+def test_run_many_mismatched_columns(setup_function) -> None:
+    with pytest.raises(ValueError, match="same number of rows"):
+        workflow.run_many({"Model.a": numpy.array([1.0, 2.0]), "Model.b": numpy.array([1, 2, 3])})
+    assert mock_client.workflow_run_requests == []
+
+
+def test_run_many_array_column(setup_function) -> None:
+    # SUT
+    workflow.run_many({"Model.arr": numpy.array([[1, 2], [3, 4]])})
+
+    # Verification
+    sent = [r.inputs["Model.arr"].value for r in mock_client.workflow_run_requests]
+    assert [list(v.int_array_value.values) for v in sent] == [[1, 2], [3, 4]]
+    assert [list(v.int_array_value.dims.dims) for v in sent] == [[2], [2]]
+
+
+def test_get_datapin_states(setup_function) -> None:
+    # Execute
+    result = workflow.get_datapin_states(["model.double", "model.integer", "model.string"])
+
+    # Verify
+    assert result == {
+        "model.double": atvi.VariableState(atvi.RealValue(3.14), False),
+        "model.integer": atvi.VariableState(atvi.IntegerValue(42), False),
+        "model.string": atvi.VariableState(atvi.StringValue("sVal"), False),
+    }
+
+
+def test_get_datapin_states_from_datapins(setup_function) -> None:
+    # Setup
+    datapin = workflow.get_datapin("model.double")
+
+    # Execute
+    result = workflow.get_datapin_states([datapin, "model.integer"])
+
+    # Verify
+    assert list(result.keys()) == ["MODEL_DOUBLE", "model.integer"]
+    assert result["model.integer"].value == atvi.IntegerValue(42)
+
+
+def test_get_datapin_states_as_structured(setup_function) -> None:
+    # Execute
+    result = workflow.get_datapin_states(["model.double", "model.integer"], as_structured=True)
+
+    # Verify
+    assert result.dtype.names == ("model.double", "model.integer")
+    assert result.dtype["model.integer"] == numpy.int64
+    assert result.mask["model.double"]
+    assert result.data["model.double"] == 3.14
+
+
+def test_get_datapin_states_as_structured_non_numeric(setup_function) -> None:
+    # Execute / Verify
+    with pytest.raises(grpcmc.ValueTypeNotSupportedError):
+        workflow.get_datapin_states(["model.double", "model.string"], as_structured=True)
+
+
+def test_get_datapin_states_pipelined(setup_function, monkeypatch) -> None:
+    # Setup
+    class PipelinedGetState:
+        def __init__(self) -> None:
+            self.futures: List[_MockFuture] = []
+
+        def __call__(self, request):
+            raise AssertionError("Pipelined calls should use future().")
+
+        def future(self, request: wkf_msgs.ElementIdOrName) -> _MockFuture:
+            name = request.target_name.element_full_name.name
+            response = var_msgs.VariableState(is_valid=True)
+            response.value.double_value = float(name.split(".")[1])
+            self.futures.append(_MockFuture(response))
+            return self.futures[-1]
+
+    pipelined = PipelinedGetState()
+    monkeypatch.setattr(mock_client, "VariableGetState", pipelined, raising=False)
+    names = [f"Model.{index}" for index in range(40)]
+
+    # Execute
+    result = workflow.get_datapin_states(names, max_in_flight=8)
+
+    # Verify
+    assert len(pipelined.futures) == 40
+    assert [state.value for state in result.values()] == [
+        atvi.RealValue(index) for index in range(40)
+    ]
+    assert not any(future.was_cancelled for future in pipelined.futures)
+
+
 # @pytest.mark.parametrize(
 #     "variables",
 #     [
@@ -1564,3 +1991,24 @@ def test_get_state(setup_function, mock_state, expected_state):
 #     assert result is False
 #
 #
+
+
+def test_get_datapin_meta_data_uses_metadata_cache(setup_function, engine) -> None:
+    # Setup
+    engine.metadata_cache.enabled = True
+    workflow.name_cache.enabled = True
+
+    with unittest.mock.patch.object(
+        mock_client,
+        "DoubleVariableGetMetadata",
+        wraps=mock_client.DoubleVariableGetMetadata,
+    ) as mock_grpc_method:
+        # SUT
+        first = workflow.get_datapin_meta_data("model.double")
+        second = workflow.get_datapin_meta_data("model.double")
+        from_datapin = workflow.get_datapin("model.double").get_metadata()
+
+    # Verify
+    mock_grpc_method.assert_called_once()
+    assert mock_client.element_lookups == 1
+    assert first == second == from_datapin
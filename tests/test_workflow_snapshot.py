@@ -0,0 +1,291 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for WorkflowSnapshot."""
+
+from typing import Dict, List, Tuple
+
+import ansys.api.modelcenter.v0.element_messages_pb2 as elem_msgs
+import ansys.api.modelcenter.v0.variable_value_messages_pb2 as var_msgs
+import ansys.api.modelcenter.v0.workflow_messages_pb2 as wkf_msgs
+import ansys.tools.variableinterop as atvi
+import numpy
+import pytest
+
+import ansys.modelcenter.workflow.grpc_modelcenter as grpcmc
+
+from .grpc_server_test_utils.client_creation_monkeypatch import monkeypatch_client_creation
+
+ASSEMBLY = elem_msgs.ElementType.ELEMENT_TYPE_ASSEMBLY
+COMPONENT = elem_msgs.ElementType.ELEMENT_TYPE_COMPONENT
+GROUP = elem_msgs.ElementType.ELEMENT_TYPE_GROUP
+VARIABLE = elem_msgs.ElementType.ELEMENT_TYPE_VARIABLE
+
+
+class MockWorkflowClientForSnapshotTest:
+    """Serves a small workflow tree, keyed by element ID."""
+
+    def __init__(self) -> None:
+        # ID -> (full name, kind, value type)
+        self.elements: Dict[str, Tuple[str, int, int]] = {
+            "root": ("Model", ASSEMBLY, 0),
+            "sub": ("Model.sub", ASSEMBLY, 0),
+            "comp": ("Model.sub.comp", COMPONENT, 0),
+            "grp": ("Model.sub.comp.grp", GROUP, 0),
+            "x": ("Model.x", VARIABLE, var_msgs.VARIABLE_TYPE_REAL),
+            "y": ("Model.sub.comp.y", VARIABLE, var_msgs.VARIABLE_TYPE_INTEGER_ARRAY),
+            "z": ("Model.sub.comp.grp.z", VARIABLE, var_msgs.VARIABLE_TYPE_STRING),
+        }
+        self.children: Dict[str, List[str]] = {
+            "root": ["sub", "x"],
+            "sub": ["comp"],
+            "comp": ["grp", "y"],
+            "grp": ["z"],
+        }
+        # Variable ID -> (is input to component, is input to workflow)
+        self.inputs: Dict[str, Tuple[bool, bool]] = {
+            "x": (True, True),
+            "y": (False, False),
+            "z": (True, False),
+        }
+        # Variable ID -> IDs of its direct dependents
+        self.dependents: Dict[str, List[str]] = {"x": ["y"], "y": ["z"], "z": []}
+        self.dependency_requests: List[var_msgs.GetVariableDependenciesRequest] = []
+        self.calls: Dict[str, int] = {}
+
+    def _children_of(self, element_id: elem_msgs.ElementId, kinds: Tuple[int, ...]) -> List[str]:
+        return [
+            child
+            for child in self.children.get(element_id.id_string, [])
+            if self.elements[child][1] in kinds
+        ]
+
+    def _count(self, name: str) -> None:
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def WorkflowGetRoot(self, request: wkf_msgs.WorkflowId) -> wkf_msgs.WorkflowGetRootResponse:
+        self._count("WorkflowGetRoot")
+        return wkf_msgs.WorkflowGetRootResponse(id=elem_msgs.ElementId(id_string="root"))
+
+    def AssemblyGetAssembliesAndComponents(
+        self, request: elem_msgs.ElementId
+    ) -> wkf_msgs.ElementInfoCollection:
+        self._count("AssemblyGetAssembliesAndComponents")
+        return wkf_msgs.ElementInfoCollection(
+            elements=[
+                wkf_msgs.ElementInfo(
+                    id=elem_msgs.ElementId(id_string=child), type=self.elements[child][1]
+                )
+                for child in self._children_of(request, (ASSEMBLY, COMPONENT))
+            ]
+        )
+
+    def RegistryGetGroups(self, request: elem_msgs.ElementId) -> elem_msgs.ElementIdCollection:
+        self._count("RegistryGetGroups")
+        return elem_msgs.ElementIdCollection(
+            ids=[
+                elem_msgs.ElementId(id_string=child)
+                for child in self._children_of(request, (GROUP,))
+            ]
+        )
+
+    def RegistryGetVariables(self, request: elem_msgs.ElementId) -> var_msgs.VariableInfoCollection:
+        self._count("RegistryGetVariables")
+        return var_msgs.VariableInfoCollection(
+            variables=[
+                var_msgs.VariableInfo(
+                    id=elem_msgs.ElementId(id_string=child), value_type=self.elements[child][2]
+                )
+                for child in self._children_of(request, (VARIABLE,))
+            ]
+        )
+
+    def VariableGetIsInput(self, request: elem_msgs.ElementId) -> elem_msgs.VariableIsInputResponse:
+        self._count("VariableGetIsInput")
+        is_input_component, is_input_workflow = self.inputs[request.id_string]
+        return elem_msgs.VariableIsInputResponse(
+            is_input_component=is_input_component, is_input_workflow=is_input_workflow
+        )
+
+    def VariableGetDependents(
+        self, request: var_msgs.GetVariableDependenciesRequest
+    ) -> var_msgs.VariableInfoCollection:
+        self._count("VariableGetDependents")
+        self.dependency_requests.append(request)
+        return var_msgs.VariableInfoCollection(
+            variables=[
+                var_msgs.VariableInfo(
+                    id=elem_msgs.ElementId(id_string=child), value_type=self.elements[child][2]
+                )
+                for child in self.dependents[request.id.id_string]
+            ]
+        )
+
+    def WorkflowCreateLink(
+        self, request: wkf_msgs.WorkflowCreateLinkRequest
+    ) -> wkf_msgs.WorkflowCreateLinkResponse:
+        return wkf_msgs.WorkflowCreateLinkResponse()
+
+    def WorkflowBreakLink(
+        self, request: wkf_msgs.WorkflowBreakLinkRequest
+    ) -> wkf_msgs.WorkflowBreakLinkResponse:
+        return wkf_msgs.WorkflowBreakLinkResponse(existed=True)
+
+    def WorkflowSuspendOrResumeLink(
+        self, request: wkf_msgs.WorkflowSuspendOrResumeLinkRequest
+    ) -> wkf_msgs.WorkflowLinkSuspension:
+        return wkf_msgs.WorkflowLinkSuspension(is_suspended=request.suspend)
+
+    def ReferenceVariableSetReferenceEquation(
+        self, request: var_msgs.SetReferenceEquationRequest
+    ) -> var_msgs.SetReferenceEquationResponse:
+        return var_msgs.SetReferenceEquationResponse()
+
+    def ElementGetFullName(self, request: elem_msgs.ElementId) -> elem_msgs.ElementName:
+        self._count("ElementGetFullName")
+        return elem_msgs.ElementName(name=self.elements[request.id_string][0])
+
+
+mock_client: MockWorkflowClientForSnapshotTest
+
+
+@pytest.fixture
+def workflow(monkeypatch, engine) -> grpcmc.Workflow:
+    global mock_client
+    mock_client = MockWorkflowClientForSnapshotTest()
+    monkeypatch_client_creation(monkeypatch, grpcmc.Workflow, mock_client)
+    return grpcmc.Workflow(workflow_id="123", file_path="C:\\asdf\\qwerty.pxcz", engine=engine)
+
+
+def test_snapshot_indexes_every_element(workflow) -> None:
+    # SUT
+    snapshot = workflow.snapshot()
+
+    # Verification
+    assert len(snapshot) == 7
+    assert snapshot.names == (
+        "Model",
+        "Model.sub",
+        "Model.x",
+        "Model.sub.comp",
+        "Model.sub.comp.grp",
+        "Model.sub.comp.y",
+        "Model.sub.comp.grp.z",
+    )
+    assert list(snapshot.parents) == [-1, 0, 0, 1, 3, 3, 4]
+    assert snapshot.get_kind("Model.sub.comp.grp") == GROUP
+    assert snapshot.get_value_type("Model.sub.comp.y") == atvi.VariableType.INTEGER_ARRAY
+    assert snapshot.get_value_type("Model.sub") == atvi.VariableType.UNKNOWN
+    assert numpy.flatnonzero(snapshot.kinds == VARIABLE).tolist() == [2, 5, 6]
+
+
+def test_snapshot_calls_once_per_element(workflow) -> None:
+    # SUT
+    workflow.snapshot()
+
+    # Verification
+    assert mock_client.calls == {
+        "WorkflowGetRoot": 1,
+        "AssemblyGetAssembliesAndComponents": 2,
+        "RegistryGetGroups": 4,
+        "RegistryGetVariables": 4,
+        "ElementGetFullName": 7,
+    }
+
+
+def test_snapshot_lookup(workflow) -> None:
+    snapshot = workflow.snapshot()
+
+    # SUT / Verification
+    assert "Model.sub.comp" in snapshot
+    assert "Model.nope" not in snapshot
+    assert snapshot.index_of("Model.sub.comp") == 3
+    assert snapshot.index_of_id("comp") == 3
+    assert snapshot.get_id("Model.sub.comp.grp.z") == "z"
+    assert snapshot.get_name(3) == "Model.sub.comp"
+    assert snapshot.get_parent("Model.sub.comp.grp") == 3
+    with pytest.raises(KeyError):
+        snapshot.index_of("Model.nope")
+    with pytest.raises(KeyError):
+        snapshot.index_of_id("nope")
+    with pytest.raises(IndexError):
+        snapshot.get_name(7)
+
+
+def test_snapshot_children(workflow) -> None:
+    snapshot = workflow.snapshot()
+
+    # SUT / Verification
+    assert list(snapshot.iter_children("Model")) == ["Model.sub", "Model.x"]
+    assert list(snapshot.iter_children("Model.sub.comp")) == [
+        "Model.sub.comp.grp",
+        "Model.sub.comp.y",
+    ]
+    assert list(snapshot.get_children(0)) == [1, 2]
+    assert list(snapshot.get_children("Model.x")) == []
+    assert list(snapshot.get_children("Model.sub.comp.grp.z")) == []
+
+
+def test_snapshot_columns_are_read_only(workflow) -> None:
+    snapshot = workflow.snapshot()
+
+    # SUT / Verification
+    with pytest.raises(ValueError):
+        snapshot.kinds[0] = GROUP
+
+
+def test_snapshot_create_element(workflow, engine) -> None:
+    snapshot = workflow.snapshot()
+
+    # SUT
+    component = snapshot.create_element("Model.sub.comp", engine)
+    datapin = snapshot.create_element("Model.x", engine)
+
+    # Verification
+    assert isinstance(component, grpcmc.Component)
+    assert component.element_id == "comp"
+    assert isinstance(datapin, grpcmc.RealDatapin)
+    assert datapin.element_id == "x"
+
+
+def test_snapshot_save_and_load(workflow, tmp_path) -> None:
+    snapshot = workflow.snapshot()
+    path = tmp_path / "snapshot.npz"
+
+    # SUT
+    snapshot.save(path)
+    loaded = grpcmc.WorkflowSnapshot.load(path)
+
+    # Verification
+    assert loaded.ids == snapshot.ids
+    assert loaded.names == snapshot.names
+    numpy.testing.assert_array_equal(loaded.parents, snapshot.parents)
+    numpy.testing.assert_array_equal(loaded.kinds, snapshot.kinds)
+    numpy.testing.assert_array_equal(loaded.value_types, snapshot.value_types)
+    assert list(loaded.iter_children("Model.sub.comp")) == list(
+        snapshot.iter_children("Model.sub.comp")
+    )
+
+
+def test_snapshot_rejects_mismatched_columns() -> None:
+    with pytest.raises(ValueError):
+        grpcmc.WorkflowSnapshot(["a", "b"], ["A"], [-1, 0], [ASSEMBLY, VARIABLE], [0, 2])